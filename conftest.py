@@ -57,3 +57,53 @@ def test_client():
     from src.main import app
 
     return TestClient(app)
+
+
+@pytest.fixture(autouse=True)
+def isolated_result_store():
+    """Keep result snapshots in memory and per test"""
+    from src.database.result_store import ResultStore, set_result_store
+
+    store = ResultStore(":memory:")
+    previous = set_result_store(store)
+    yield store
+    set_result_store(previous)
+    store.close()
+
+
+@pytest.fixture(autouse=True)
+def isolated_metadata_writer():
+    """Queue analysis metadata into a per-test in-memory SQLite database"""
+    from sqlalchemy import create_engine
+    from sqlalchemy.pool import StaticPool
+
+    from src.database.metadata_writer import MetadataWriter, set_metadata_writer
+
+    engine = create_engine(
+        "sqlite://",
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
+    )
+    writer = MetadataWriter(engine, max_retries=1)
+    previous = set_metadata_writer(writer)
+    yield writer
+    writer.stop()
+    set_metadata_writer(previous)
+    engine.dispose()
+
+
+@pytest.fixture(autouse=True)
+def reset_feedback_cache():
+    """Don't let memoized feedback leak between tests"""
+    yield
+    from src.feedback.feedback_cache import invalidate_feedback_cache
+
+    invalidate_feedback_cache()
+
+
+@pytest.fixture(autouse=True)
+def isolated_trace_dir(tmp_path, monkeypatch):
+    """Write sampled job traces under the test's tmp dir"""
+    from src.utils.tracing import tracer
+
+    monkeypatch.setattr(tracer, "trace_dir", tmp_path / "traces")
@@ -0,0 +1,150 @@
+"""
+Admin API
+
+Operator-only endpoints, enabled by setting ADMIN_TOKEN and authenticated
+with the X-Admin-Token header:
+
+- GET /api/v1/admin/profile?seconds=10 samples every thread of this worker
+  for N seconds and returns the profile (collapsed stacks or speedscope)
+- GET /api/v1/admin/profiles lists recent per-request profiles; a request
+  sent with `X-Profile: 1` (plus the admin token) is profiled and answered
+  with an X-Profile-Id header
+- GET /api/v1/admin/profiles/{profile_id} downloads one of them
+- GET /api/v1/admin/memory shows RSS, memory tracking state and budget
+  alerts; POST /api/v1/admin/memory/tracking turns tracking on or off
+- GET /api/v1/admin/memory/top dumps the largest retained objects and
+  allocation sites
+"""
+
+import asyncio
+import os
+import secrets
+import uuid
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, status
+from fastapi.responses import JSONResponse, PlainTextResponse
+
+from src.utils.memory import (
+    largest_allocation_sites,
+    largest_objects,
+    memory_tracker,
+)
+from src.utils.profiler import (
+    PROFILE_MAX_SECONDS,
+    ProfilerBusyError,
+    StackSampler,
+    begin_profile,
+    end_profile,
+    profile_store,
+)
+
+ADMIN_TOKEN = os.getenv("ADMIN_TOKEN", "")
+
+router = APIRouter()
+
+FORMAT_PATTERN = "^(collapsed|speedscope)$"
+
+
+def is_admin(token: Optional[str]) -> bool:
+    return (
+        bool(ADMIN_TOKEN)
+        and bool(token)
+        and secrets.compare_digest(token.encode(), ADMIN_TOKEN.encode())
+    )
+
+
+def require_admin(x_admin_token: Optional[str] = Header(None)) -> None:
+    if not ADMIN_TOKEN:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin API is disabled (ADMIN_TOKEN not set)",
+        )
+    if not is_admin(x_admin_token):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid admin token"
+        )
+
+
+def profile_response(sampler: StackSampler, fmt: str, name: str, profile_id: str):
+    headers = {"X-Profile-Id": profile_id}
+    if fmt == "speedscope":
+        headers["Content-Disposition"] = (
+            f'attachment; filename="profile-{profile_id}.speedscope.json"'
+        )
+        return JSONResponse(sampler.speedscope(name), headers=headers)
+    return PlainTextResponse(sampler.collapsed(), headers=headers)
+
+
+@router.get("/admin/profile", dependencies=[Depends(require_admin)])
+async def sample_profile(
+    seconds: float = Query(10.0, gt=0),
+    interval_ms: float = Query(5.0, ge=1, le=1000),
+    format: str = Query("collapsed", pattern=FORMAT_PATTERN),
+):
+    """Sample all threads of this worker for `seconds` and return the profile."""
+    seconds = min(seconds, PROFILE_MAX_SECONDS)
+    try:
+        sampler = begin_profile(interval_ms / 1000)
+    except ProfilerBusyError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    try:
+        await asyncio.sleep(seconds)
+    finally:
+        end_profile(sampler)
+
+    profile_id = uuid.uuid4().hex
+    name = f"worker-{os.getpid()}"
+    profile_store.put(profile_id, name, sampler)
+    return profile_response(sampler, format, name, profile_id)
+
+
+@router.get("/admin/profiles", dependencies=[Depends(require_admin)])
+def list_profiles():
+    """Recent profiles of this worker, newest first."""
+    return {"profiles": profile_store.list()}
+
+
+@router.get("/admin/profiles/{profile_id}", dependencies=[Depends(require_admin)])
+def get_profile(
+    profile_id: str, format: str = Query("speedscope", pattern=FORMAT_PATTERN)
+):
+    """One stored profile (e.g. of a request sent with X-Profile)."""
+    stored = profile_store.get(profile_id)
+    if stored is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Profile not found"
+        )
+    name, sampler = stored
+    return profile_response(sampler, format, name, profile_id)
+
+
+@router.get("/admin/memory", dependencies=[Depends(require_admin)])
+def memory_status():
+    """RSS, tracemalloc state, per-stage budgets and recent budget alerts."""
+    from src.parser.analyzer import analysis_results
+
+    return {**memory_tracker.status(), "analysis_results_jobs": len(analysis_results)}
+
+
+@router.post("/admin/memory/tracking", dependencies=[Depends(require_admin)])
+def set_memory_tracking(enabled: bool = Query(...)):
+    """Turn per-stage memory accounting (tracemalloc) on or off."""
+    if enabled:
+        memory_tracker.start()
+    else:
+        memory_tracker.stop()
+    return {"tracking": memory_tracker.enabled}
+
+
+@router.get("/admin/memory/top", dependencies=[Depends(require_admin)])
+def memory_top(limit: int = Query(20, ge=1, le=200)):
+    """
+    Largest live objects and object types; with tracking on, also the
+    allocation sites holding the most memory.
+    """
+    return {
+        "tracking": memory_tracker.enabled,
+        "sites": largest_allocation_sites(limit),
+        **largest_objects(limit),
+    }
@@ -20,6 +20,8 @@ from pathlib import Path
 
 # [DRA-62 FIX] Step 1: Import the FeedbackGenerator
 from src.feedback.feedback_generator import FeedbackGenerator
+from src.feedback.feedback_cache import get_feedback_cache
+from src.utils.tracing import span, tracer
 
 logger = logging.getLogger(__name__)
 
@@ -31,7 +33,7 @@ jd_parser = JDParser()
 matcher = JDMatcher()
 
 # [DRA-62 FIX] Step 2: Initialize the FeedbackGenerator
-feedback_gen = FeedbackGenerator()
+feedback_gen = FeedbackGenerator(cache=get_feedback_cache())
 
 
 def convert_analyzer_results_to_standard_format(analysis_result: dict) -> dict:
@@ -120,6 +122,7 @@ async def compare_resume_with_jd(
 
     # Save file temporarily (unchanged)
     tmp_file_path = None
+    job_id = None
     try:
         with tempfile.NamedTemporaryFile(delete=False, suffix=f".{file_ext}") as tmp:
             content = await file.read()
@@ -136,11 +139,13 @@ async def compare_resume_with_jd(
 
         # Parse JD (unchanged)
         logger.info("Parsing job description")
-        jd_req = jd_parser.parse_job_description(job_description)
+        with span("jd_parsing", job_id, characters=len(job_description)):
+            jd_req = jd_parser.parse_job_description(job_description)
 
         # Match resume -> JD using JDMatcher (unchanged)
         logger.info("Matching resume against JD")
-        match_result = matcher.match_resume_to_jd(resume_data, job_description)
+        with span("jd_matching", job_id, skills=len(resume_data["skills"])):
+            match_result = matcher.match_resume_to_jd(resume_data, job_description)
 
         # -----------------------------------------------------------------
         # [DRA-62 FIX] Step 3: Call your NEW scoring logic
@@ -169,9 +174,14 @@ async def compare_resume_with_jd(
 
         # 3. Call the Feedback Generator to get the final combined score
         # This function runs all logic: grammar, verbs, and your new _calculate_final_score
-        final_report_data = feedback_gen.generate_comprehensive_feedback_with_grammar(
-            sections=sections_data, validation=validation_data, include_grammar=True
-        )
+        with span("feedback", job_id, sections=len(sections_data)):
+            final_report_data = (
+                feedback_gen.generate_comprehensive_feedback_with_grammar(
+                    sections=sections_data,
+                    validation=validation_data,
+                    include_grammar=True,
+                )
+            )
 
         # -----------------------------------------------------------------
         # [DRA-62 FIX] Step 4: Build the final response
@@ -223,6 +233,8 @@ async def compare_resume_with_jd(
         )
 
     finally:
+        if job_id:
+            tracer.export_job(job_id)
         if tmp_file_path and os.path.exists(tmp_file_path):
             try:
                 os.remove(tmp_file_path)
@@ -0,0 +1,62 @@
+"""
+Metadata Dashboard API (NFR-008)
+
+GET /api/v1/metadata/stats summarises the anonymous resume metadata for
+ops dashboards: volume, processing-time percentiles, file-type mix and the
+most often missing sections, plus a per-bucket series. It only reads the
+pre-aggregated rollups (src/database/metadata_rollup.py), never the raw
+resume_metadata rows.
+"""
+
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Optional
+
+from fastapi import APIRouter, HTTPException, Query, status
+from sqlalchemy.exc import SQLAlchemyError
+
+from src.database.metadata_rollup import query_rollups, utc_now
+from src.database.metadata_writer import get_metadata_writer
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+DEFAULT_RANGE = timedelta(hours=24)
+
+
+def _naive_utc(value: datetime) -> datetime:
+    # Rollup buckets are naive UTC, like log_timestamp
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+@router.get("/metadata/stats")
+def metadata_stats(
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    granularity: str = Query("auto", pattern="^(auto|minute|hour)$"),
+    file_type: Optional[str] = None,
+    top_sections: int = Query(10, ge=1, le=50),
+) -> Dict[str, Any]:
+    """Dashboard summary of resume metadata for [start, end) (default: last 24h)."""
+    end = _naive_utc(end) if end else utc_now()
+    start = _naive_utc(start) if start else end - DEFAULT_RANGE
+    if start >= end:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="'start' must be before 'end'",
+        )
+
+    writer = get_metadata_writer()
+    try:
+        writer.ensure_tables()
+        with writer.engine.connect() as conn:
+            return query_rollups(conn, start, end, granularity, file_type, top_sections)
+    except SQLAlchemyError as e:
+        logger.error(f"Metadata stats query failed: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Metadata store unavailable",
+        )
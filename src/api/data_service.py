@@ -4,25 +4,33 @@ Data Service for Resume Analysis
 This new file contains the core logic for fetching and processing
 resume analysis data. It is used by both the 'results' endpoint
 and the 'download' endpoint to fix the "mock data" bug.
+
+Once a job's background analysis has finished, its result is stored as an
+immutable snapshot (see src/database/result_store.py) and later requests
+are served from it until the feedback engine version changes.
 """
 
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+import os
 from pathlib import Path
 from fastapi import HTTPException, status
 import logging
 
 # Imports from your original results.py
-from src.parser.analyzer import analysis_results
+from src.parser.analyzer import analysis_finished, analysis_results
 from src.parser.section_detector import SectionDetector
 from src.feedback.feedback_generator import FeedbackGenerator
+from src.feedback.feedback_cache import get_feedback_cache, is_cacheable
 from src.mock_data import MOCK_ANALYSIS_REPORT
+from src.database.result_store import get_result_store, snapshot_version
+from src.utils.tracing import span
 
 # --- Define File Paths ---
-UPLOAD_DIR = Path("uploads")
+UPLOAD_DIR = Path(os.getenv("UPLOAD_DIR", "uploads"))
 
 # Initialize modules
 detector = SectionDetector()
-feedback_gen = FeedbackGenerator()
+feedback_gen = FeedbackGenerator(cache=get_feedback_cache())
 logging.basicConfig(level=logging.INFO)
 
 # --- Text Extraction (Copied from your original results.py) ---
@@ -131,6 +139,55 @@ def _get_mock_results(job_id: str) -> Dict:
     }
 
 
+# --- Result snapshots ---
+
+
+def load_result_snapshot(job_id: str, kind: str) -> Optional[Dict[str, Any]]:
+    """The stored result of `kind` for the current engine version, if any."""
+    store = get_result_store()
+    if store is None:
+        return None
+    try:
+        return store.get(job_id, kind, snapshot_version(feedback_gen.engine_versions()))
+    except Exception as e:
+        logging.error(f"Error reading result snapshot for {job_id}: {e}")
+        return None
+
+
+def save_result_snapshot(job_id: str, kind: str, result: Dict[str, Any]) -> bool:
+    """
+    Snapshot `result` once the job's background analysis has finished.
+    Results with degraded or failed grammar are not stored, like in the
+    feedback cache, so the next request recomputes them.
+    """
+    store = get_result_store()
+    if store is None or not analysis_finished(job_id):
+        return False
+    if not is_cacheable(result.get("feedback") or {}):
+        return False
+    try:
+        version = snapshot_version(feedback_gen.engine_versions())
+        return store.put(job_id, kind, version, result)
+    except Exception as e:
+        logging.error(f"Error writing result snapshot for {job_id}: {e}")
+        return False
+
+
+def prune_result_snapshots() -> int:
+    """Drop snapshots of older engine versions (called at startup)."""
+    store = get_result_store()
+    if store is None:
+        return 0
+    return store.prune(snapshot_version(feedback_gen.engine_versions()))
+
+
+def job_exists(job_id: str) -> bool:
+    """The job still has its upload or a stored report snapshot."""
+    if any(UPLOAD_DIR.glob(f"{job_id}.*")):
+        return True
+    return load_result_snapshot(job_id, "report") is not None
+
+
 # --- Core Data Logic (This is the important shared function) ---
 
 
@@ -144,6 +201,10 @@ def get_analysis_data(job_id: str) -> Dict[str, Any]:
             status_code=status.HTTP_404_NOT_FOUND, detail="Job ID not found"
         )
 
+    snapshot = load_result_snapshot(job_id, "report")
+    if snapshot is not None:
+        return snapshot
+
     uploaded_files = list(UPLOAD_DIR.glob(f"{job_id}.*"))
 
     if not uploaded_files:
@@ -153,23 +214,31 @@ def get_analysis_data(job_id: str) -> Dict[str, Any]:
     file_path = uploaded_files[0]
 
     try:
-        resume_text = extract_text_from_file(file_path)
-        if not resume_text:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Failed to extract text from resume",
-            )
-
-        sections = parse_sections_from_text(resume_text)
-        validation = detector.validate_resume_structure(resume_text)
-
-        # This is the "Analyze Resume" flow, so we hard-code
-        # the keyword match score to 0.
-        validation["keyword_match_score"] = 0
-
-        feedback_data = feedback_gen.generate_comprehensive_feedback_with_grammar(
-            sections=sections, validation=validation, include_grammar=True
-        )
+        with span("report", job_id):
+            with span("extract_text", file_bytes=file_path.stat().st_size) as current:
+                resume_text = extract_text_from_file(file_path)
+                current.set(characters=len(resume_text or ""))
+            if not resume_text:
+                raise HTTPException(
+                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    detail="Failed to extract text from resume",
+                )
+
+            with span("section_parsing", characters=len(resume_text)):
+                sections = parse_sections_from_text(resume_text)
+            with span("section_detection", characters=len(resume_text)):
+                validation = detector.validate_resume_structure(resume_text)
+
+            # This is the "Analyze Resume" flow, so we hard-code
+            # the keyword match score to 0.
+            validation["keyword_match_score"] = 0
+
+            with span("feedback", sections=len(sections)):
+                feedback_data = (
+                    feedback_gen.generate_comprehensive_feedback_with_grammar(
+                        sections=sections, validation=validation, include_grammar=True
+                    )
+                )
 
         # The score is now correctly calculated inside the feedback generator
         final_overall_score = feedback_data.get("overall_score", 0)
@@ -195,6 +264,7 @@ def get_analysis_data(job_id: str) -> Dict[str, Any]:
             "gap_count": fr009_data.get("gap_count", 0),
             "gap_feedback": fr009_data.get("gap_feedback", []),
         }
+        save_result_snapshot(job_id, "report", final_response_data)
         return final_response_data
 
     except HTTPException:
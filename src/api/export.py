@@ -0,0 +1,176 @@
+"""
+Batch Report Export API
+
+POST /api/v1/export renders the PDF reports of many jobs (a list of job ids
+or the batch id returned by /api/v1/parse/batch) and streams them back as a
+single ZIP archive.
+
+Reports are rendered in parallel through the shared PDF render pool (at most
+one render per pool worker at a time), and each PDF is written to the
+archive and flushed to the client as soon as it finishes. The archive is
+streamed with chunked transfer and never held in memory as a whole. A
+`manifest.json` entry at the end lists exported and failed jobs.
+"""
+
+import asyncio
+import io
+import json
+import logging
+import os
+import re
+import time
+import zipfile
+from typing import AsyncIterator, List, Optional, Tuple
+
+from fastapi import APIRouter, HTTPException, status
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+from starlette.concurrency import run_in_threadpool
+
+from src.api.data_service import get_analysis_data, job_exists
+from src.feedback.pdf_renderer import RenderQueueFullError, pdf_renderer
+from src.upload.service import get_batch_jobs
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+EXPORT_MAX_JOBS = int(os.getenv("EXPORT_MAX_JOBS", "500"))
+# Wait between retries while the shared render queue is full
+EXPORT_RETRY_DELAY = float(os.getenv("EXPORT_RETRY_DELAY", "0.2"))
+JOB_ID_PATTERN = re.compile(r"^[A-Za-z0-9_-]{1,64}$")
+
+
+class BatchExportRequest(BaseModel):
+    job_ids: List[str] = []
+    batch_id: Optional[str] = None
+
+
+class _ChunkBuffer(io.RawIOBase):
+    """Write-only, unseekable sink; the zip writer falls back to streaming mode."""
+
+    def __init__(self):
+        super().__init__()
+        self._chunks: List[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def resolve_job_ids(request: BatchExportRequest) -> List[str]:
+    """Validated, de-duplicated job ids of an export request."""
+    job_ids = list(request.job_ids)
+    if request.batch_id:
+        batch = get_batch_jobs(request.batch_id)
+        if batch is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Batch {request.batch_id} not found",
+            )
+        job_ids.extend(batch)
+
+    job_ids = list(dict.fromkeys(job_ids))
+    if not job_ids:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Provide job_ids or a batch_id to export",
+        )
+    if len(job_ids) > EXPORT_MAX_JOBS:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"At most {EXPORT_MAX_JOBS} reports per export",
+        )
+    invalid = [job_id for job_id in job_ids if not JOB_ID_PATTERN.match(job_id)]
+    if invalid:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid job id: {invalid[0]!r}",
+        )
+    return job_ids
+
+
+async def _render_when_queue_allows(report_data: dict, job_id: str) -> bytes:
+    """Render through the shared pool, waiting while its queue is full."""
+    deadline = time.monotonic() + pdf_renderer.timeout
+    while True:
+        try:
+            return await pdf_renderer.render(report_data, job_id=job_id)
+        except RenderQueueFullError:
+            if time.monotonic() >= deadline:
+                raise
+            await asyncio.sleep(EXPORT_RETRY_DELAY)
+
+
+async def _render_job(
+    job_id: str, slots: asyncio.Semaphore
+) -> Tuple[str, Optional[bytes], Optional[str]]:
+    async with slots:
+        try:
+            # get_analysis_data answers unknown ids with demo data
+            if not await run_in_threadpool(job_exists, job_id):
+                return job_id, None, "not found"
+            report_data = await run_in_threadpool(get_analysis_data, job_id)
+            pdf = await _render_when_queue_allows(report_data, job_id)
+            return job_id, pdf, None
+        except Exception as e:
+            detail = getattr(e, "detail", None) or str(e) or type(e).__name__
+            logger.warning("Export of job %s failed: %s", job_id, detail)
+            return job_id, None, detail
+
+
+def _zip_entry(name: str) -> zipfile.ZipInfo:
+    info = zipfile.ZipInfo(name, date_time=time.localtime()[:6])
+    # PDFs are already compressed
+    info.compress_type = zipfile.ZIP_STORED
+    return info
+
+
+async def stream_reports_zip(job_ids: List[str]) -> AsyncIterator[bytes]:
+    """Yield a ZIP archive of the jobs' reports, one PDF per chunk."""
+    buffer = _ChunkBuffer()
+    archive = zipfile.ZipFile(buffer, mode="w")
+    slots = asyncio.Semaphore(pdf_renderer.workers)
+    tasks = [asyncio.create_task(_render_job(job_id, slots)) for job_id in job_ids]
+    manifest = {"exported": [], "failed": {}}
+
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            job_id, pdf_bytes, error = await next_done
+            if error is not None:
+                manifest["failed"][job_id] = error
+                continue
+            archive.writestr(_zip_entry(f"Analysis_Report_{job_id}.pdf"), pdf_bytes)
+            manifest["exported"].append(job_id)
+            yield buffer.drain()
+
+        archive.writestr(_zip_entry("manifest.json"), json.dumps(manifest, indent=2))
+        archive.close()
+        yield buffer.drain()
+    finally:
+        # Client went away: stop rendering the rest of the batch
+        for task in tasks:
+            task.cancel()
+
+
+@router.post("/export")
+async def export_reports(request: BatchExportRequest):
+    """
+    Stream the PDF reports of `job_ids` and/or `batch_id` as a ZIP archive.
+    """
+    job_ids = resolve_job_ids(request)
+    name = request.batch_id or f"{len(job_ids)}_reports"
+    headers = {
+        "Content-Disposition": f'attachment; filename="Analysis_Reports_{name}.zip"'
+    }
+    return StreamingResponse(
+        stream_reports_zip(job_ids), media_type="application/zip", headers=headers
+    )
@@ -0,0 +1,196 @@
+"""
+Job Progress API (Server-Sent Events)
+
+GET /api/v1/jobs/{job_id}/events streams the stage events of a job's
+analysis (extracted, skills, structure, gaps, grammar, feedback, pdf) and
+closes after the final "result" event (or "failed"). The client keeps one
+long-lived connection instead of polling /results.
+
+Once both background stages (run_analysis and FR-009) have finished,
+`finalize_job` builds the report: grammar and feedback via
+`get_analysis_data` (which also stores the result snapshot), then the PDF
+pre-render when PDF_PRERENDER is on. The finished report is published as
+the "result" event. This runs only for jobs whose events are being
+streamed, or for every job with JOB_FINALIZE_EAGER=true; otherwise the
+report is built on its first request, as before.
+
+GET /api/v1/jobs/{job_id}/trace returns the job's timed pipeline spans
+(see src/utils/tracing.py).
+
+Reconnecting clients send the standard Last-Event-ID header and only get
+the events they missed. Comment lines keep idle connections alive every
+SSE_HEARTBEAT_SECONDS.
+"""
+
+import asyncio
+import json
+import logging
+import os
+from collections import Counter
+from typing import Any, AsyncIterator, Dict, Optional, Set
+
+from fastapi import APIRouter, Header, HTTPException, status
+from fastapi.responses import StreamingResponse
+
+from src.api.data_service import UPLOAD_DIR, get_analysis_data, load_result_snapshot
+from src.feedback.pdf_renderer import PDF_PRERENDER, pdf_renderer
+from src.parser.analyzer import analysis_finished
+from src.utils.job_events import job_events
+from src.utils.tracing import span, tracer
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+SSE_HEARTBEAT_SECONDS = float(os.getenv("SSE_HEARTBEAT_SECONDS", "15"))
+# Client reconnect delay announced at the start of each stream
+SSE_RETRY_MS = 3000
+# Finalize every finished job, not only those whose events are streamed
+JOB_FINALIZE_EAGER = os.getenv("JOB_FINALIZE_EAGER", "false").lower() == "true"
+
+_finalizing: Set[str] = set()
+# job_id -> open event streams
+_watchers: Counter = Counter()
+# The loop only keeps weak references to tasks
+_tasks: Set[asyncio.Task] = set()
+
+
+def schedule_finalize(job_id: str) -> Optional[asyncio.Task]:
+    """Run `finalize_job` in the background once per job (from the loop)."""
+    if job_id in _finalizing or job_events.is_finished(job_id):
+        return None
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+    _finalizing.add(job_id)
+    task = loop.create_task(finalize_job(job_id))
+    _tasks.add(task)
+    task.add_done_callback(_tasks.discard)
+    return task
+
+
+def on_analysis_finished(job_id: str) -> Optional[asyncio.Task]:
+    """
+    Both background stages are done: finalize if eager or streamed,
+    otherwise just export the trace of the stages so far.
+    """
+    if JOB_FINALIZE_EAGER or _watchers[job_id]:
+        return schedule_finalize(job_id)
+    tracer.export_job(job_id)
+    return None
+
+
+async def finalize_job(job_id: str) -> None:
+    """Grammar, feedback and PDF stages, then the terminal result event."""
+    try:
+        report = await asyncio.to_thread(get_analysis_data, job_id)
+        feedback = report.get("feedback") or {}
+
+        grammar = feedback.get("grammar") or {}
+        job_events.publish(
+            job_id,
+            "grammar",
+            status="degraded" if grammar.get("degraded") else "done",
+            data={
+                "score": grammar.get("score"),
+                "total_errors": grammar.get("total_errors"),
+            },
+        )
+        job_events.publish(
+            job_id, "feedback", data={"overall_score": report.get("overallScore")}
+        )
+
+        if PDF_PRERENDER:
+            try:
+                with span("pdf_render", job_id):
+                    await pdf_renderer.render(report, job_id=job_id)
+                job_events.publish(job_id, "pdf")
+            except Exception as e:
+                logger.warning("PDF pre-render for job %s failed: %s", job_id, e)
+                job_events.publish(
+                    job_id, "pdf", status="failed", data={"error": str(e)}
+                )
+        else:
+            job_events.publish(job_id, "pdf", status="skipped")
+
+        job_events.publish(job_id, "result", data=report)
+    except Exception as e:
+        detail = getattr(e, "detail", None) or str(e)
+        logger.error("Finalizing job %s failed: %s", job_id, detail)
+        job_events.publish(
+            job_id,
+            "failed",
+            status="failed",
+            data={"stage": "feedback", "error": detail},
+        )
+    finally:
+        _finalizing.discard(job_id)
+        tracer.export_job(job_id)
+
+
+def format_sse(event: Dict[str, Any]) -> str:
+    """One event in text/event-stream framing."""
+    data = json.dumps(event, default=str)
+    return f"id: {event['id']}\nevent: {event['stage']}\ndata: {data}\n\n"
+
+
+async def _event_stream(job_id: str, after: int) -> AsyncIterator[str]:
+    # Watching before the check: a job finishing later is finalized by
+    # on_analysis_finished, one finished already is finalized here
+    _watchers[job_id] += 1
+    try:
+        if analysis_finished(job_id):
+            schedule_finalize(job_id)
+        yield f"retry: {SSE_RETRY_MS}\n\n"
+        async for event in job_events.stream(job_id, after, SSE_HEARTBEAT_SECONDS):
+            yield ": keepalive\n\n" if event is None else format_sse(event)
+    finally:
+        _watchers[job_id] -= 1
+        if _watchers[job_id] <= 0:
+            del _watchers[job_id]
+
+
+def _parse_last_event_id(value: Optional[str]) -> int:
+    try:
+        return max(0, int(value)) if value else 0
+    except ValueError:
+        return 0
+
+
+@router.get("/jobs/{job_id}/events")
+async def job_event_stream(
+    job_id: str, last_event_id: Optional[str] = Header(None)
+) -> StreamingResponse:
+    """Stream the job's stage progress and final result as Server-Sent Events."""
+    if not job_events.knows(job_id):
+        snapshot = load_result_snapshot(job_id, "report")
+        if snapshot is not None:
+            # Finished before this process saw it (e.g. after a restart)
+            job_events.publish(job_id, "result", data=snapshot)
+        elif not any(UPLOAD_DIR.glob(f"{job_id}.*")):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="Job ID not found"
+            )
+
+    return StreamingResponse(
+        _event_stream(job_id, _parse_last_event_id(last_event_id)),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.get("/jobs/{job_id}/trace")
+def job_trace(job_id: str) -> Dict[str, Any]:
+    """The job's pipeline spans (duration, input size, outcome) in start order."""
+    spans = tracer.spans(job_id)
+    if not spans:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="No trace for this job"
+        )
+    return {
+        "jobId": job_id,
+        "sampled": tracer.is_sampled(job_id),
+        "total_ms": round(sum(s["duration_ms"] for s in spans if not s["parent"]), 3),
+        "spans": spans,
+    }
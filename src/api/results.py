@@ -7,11 +7,18 @@ Results API - Returns parsed resume with validation and feedback
 
 from src.parser.analyzer import analysis_results
 from typing import Dict, Any
+import os
 from pathlib import Path
 from fastapi import APIRouter, HTTPException, status
 
 # Import the new service function
-from src.api.data_service import get_analysis_data, UPLOAD_DIR, extract_text_from_file
+from src.api.data_service import (
+    get_analysis_data,
+    UPLOAD_DIR,
+    extract_text_from_file,
+    load_result_snapshot,
+    save_result_snapshot,
+)
 # Defensive imports: ensure names exist during pytest collection even if
 # the real implementations raise on import. Tests often patch these names.
 try:
@@ -31,7 +38,7 @@ detector = SectionDetector() if SectionDetector is not None else None
 feedback_gen = FeedbackGenerator() if FeedbackGenerator is not None else None
 
 # Upload directory (same as in service.py)
-UPLOAD_DIR = Path("uploads")
+UPLOAD_DIR = Path(os.getenv("UPLOAD_DIR", "uploads"))
 
 
 def extract_text_from_file(file_path: Path) -> str:
@@ -153,6 +160,11 @@ async def get_results(job_id: str) -> Dict[str, Any]:
             status_code=status.HTTP_404_NOT_FOUND, detail="Job ID not found"
         )
 
+    # Served from the stored snapshot once the analysis has finished
+    snapshot = load_result_snapshot(job_id, "results")
+    if snapshot is not None:
+        return snapshot
+
     # Find uploaded file by job_id
     uploaded_files = list(UPLOAD_DIR.glob(f"{job_id}.*"))
 
@@ -198,7 +210,7 @@ async def get_results(job_id: str) -> Dict[str, Any]:
         # ✅ Get FR-009 data
         fr009_data = analysis_results.get(job_id, {})
 
-        return {
+        result = {
             "status": "completed",
             "jobId": job_id,
             "sections": sections,
@@ -214,6 +226,8 @@ async def get_results(job_id: str) -> Dict[str, Any]:
             "gap_count": fr009_data.get("gap_count", 0),
             "gap_feedback": fr009_data.get("gap_feedback", []),
         }
+        save_result_snapshot(job_id, "results", result)
+        return result
 
     except HTTPException:
         raise
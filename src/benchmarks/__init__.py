@@ -0,0 +1,3 @@
+"""
+Benchmarks: synthetic resume corpus and end-to-end stage benchmarks
+"""
@@ -0,0 +1,295 @@
+"""
+Benchmark Regression Check
+
+Compares a benchmark run against a baseline, stage by stage. A stage
+regressed when its median latency grew by more than `threshold` AND the
+slowdown is statistically significant: a one-sided Mann-Whitney U test over
+the raw timings of both runs ("samples_ms") must give p < `alpha`. Noise
+from a handful of slow calls therefore does not fail the check, and neither
+does a significant but tiny slowdown. Peak memory growth beyond
+`memory_threshold` is flagged as well.
+
+Usage (before merging):
+    python -m src.benchmarks.suite --store            # on main, once
+    python -m src.benchmarks.compare --set-baseline latest
+    python -m src.benchmarks.compare --run            # on the branch
+
+    python -m src.benchmarks.compare old.json new.json --threshold 0.1
+
+Exits with status 1 when a stage regressed.
+"""
+
+import argparse
+import math
+import statistics
+import sys
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from src.benchmarks.store import ResultStore
+
+DEFAULT_THRESHOLD = 0.10
+DEFAULT_ALPHA = 0.05
+DEFAULT_MEMORY_THRESHOLD = 0.20
+
+REGRESSED = "regressed"
+IMPROVED = "improved"
+UNCHANGED = "unchanged"
+
+
+def _ranks(values: Sequence[float]) -> Tuple[List[float], float]:
+    """Average ranks (1-based) and the tie correction sum(t^3 - t)."""
+    order = sorted(range(len(values)), key=lambda i: values[i])
+    ranks = [0.0] * len(values)
+    ties = 0.0
+    i = 0
+    while i < len(order):
+        j = i
+        while j + 1 < len(order) and values[order[j + 1]] == values[order[i]]:
+            j += 1
+        for k in range(i, j + 1):
+            ranks[order[k]] = (i + j) / 2 + 1
+        t = j - i + 1
+        ties += t**3 - t
+        i = j + 1
+    return ranks, ties
+
+
+def mann_whitney_greater(current: Sequence[float], baseline: Sequence[float]) -> float:
+    """
+    One-sided p-value that `current` tends to be larger than `baseline`
+    (Mann-Whitney U, normal approximation with tie and continuity
+    correction).
+    """
+    n1, n2 = len(current), len(baseline)
+    if not n1 or not n2:
+        return 1.0
+    ranks, ties = _ranks(list(current) + list(baseline))
+    u = sum(ranks[:n1]) - n1 * (n1 + 1) / 2
+    mean = n1 * n2 / 2
+    n = n1 + n2
+    variance = n1 * n2 / 12 * ((n + 1) - ties / (n * (n - 1)))
+    if variance <= 0:
+        return 1.0
+    z = (u - mean - 0.5) / math.sqrt(variance)
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+def _change(before: Optional[float], after: Optional[float]) -> Optional[float]:
+    if not before or after is None:
+        return None
+    return (after - before) / before
+
+
+def compare_stage(
+    baseline: Dict[str, Any],
+    current: Dict[str, Any],
+    threshold: float = DEFAULT_THRESHOLD,
+    alpha: float = DEFAULT_ALPHA,
+    memory_threshold: float = DEFAULT_MEMORY_THRESHOLD,
+) -> Dict[str, Any]:
+    """Diff of one stage's results; "status" is regressed/improved/unchanged."""
+    before, after = baseline.get("samples_ms") or [], current.get("samples_ms") or []
+    base_median = statistics.median(before) if before else baseline.get("p50_ms")
+    cur_median = statistics.median(after) if after else current.get("p50_ms")
+    change = _change(base_median, cur_median)
+    p_slower = mann_whitney_greater(after, before)
+    p_faster = mann_whitney_greater(before, after)
+
+    status = UNCHANGED
+    if change is not None and change > threshold and p_slower < alpha:
+        status = REGRESSED
+    elif change is not None and change < -threshold and p_faster < alpha:
+        status = IMPROVED
+
+    memory_change = _change(baseline.get("peak_kib"), current.get("peak_kib"))
+    return {
+        "status": status,
+        "baseline_p50_ms": base_median,
+        "current_p50_ms": cur_median,
+        "change": change,
+        "baseline_p95_ms": baseline.get("p95_ms"),
+        "current_p95_ms": current.get("p95_ms"),
+        "p95_change": _change(baseline.get("p95_ms"), current.get("p95_ms")),
+        "p_value": p_slower if (change or 0) >= 0 else p_faster,
+        "samples": [len(before), len(after)],
+        "peak_kib": [baseline.get("peak_kib"), current.get("peak_kib")],
+        "memory_change": memory_change,
+        "memory_regressed": memory_change is not None
+        and memory_change > memory_threshold,
+    }
+
+
+def compare_runs(
+    baseline: Dict[str, Any],
+    current: Dict[str, Any],
+    threshold: float = DEFAULT_THRESHOLD,
+    alpha: float = DEFAULT_ALPHA,
+    memory_threshold: float = DEFAULT_MEMORY_THRESHOLD,
+) -> Dict[str, Any]:
+    """
+    Stage-by-stage comparison of two results documents.
+
+    Returns:
+        {"stages": {stage: diff}, "regressed": [stages], "warnings": [...]}.
+        Stages only in one run, or failed in either, get status "added",
+        "removed" or "error" and never count as regressions.
+    """
+    base_stages, cur_stages = baseline["stages"], current["stages"]
+    stages: Dict[str, Dict[str, Any]] = {}
+    for name in list(base_stages) + [s for s in cur_stages if s not in base_stages]:
+        before, after = base_stages.get(name), cur_stages.get(name)
+        if before is None:
+            stages[name] = {"status": "added"}
+        elif after is None:
+            stages[name] = {"status": "removed"}
+        elif "error" in before or "error" in after:
+            stages[name] = {
+                "status": "error",
+                "error": after.get("error") or before.get("error"),
+            }
+        else:
+            stages[name] = compare_stage(
+                before, after, threshold, alpha, memory_threshold
+            )
+
+    return {
+        "baseline": _describe(baseline),
+        "current": _describe(current),
+        "threshold": threshold,
+        "alpha": alpha,
+        "stages": stages,
+        "regressed": [n for n, d in stages.items() if d["status"] == REGRESSED],
+        "memory_regressed": [n for n, d in stages.items() if d.get("memory_regressed")],
+        "warnings": _warnings(baseline, current),
+    }
+
+
+def _describe(results: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "created_at": results.get("created_at"),
+        "commit": results.get("environment", {}).get("commit"),
+        "label": results.get("label"),
+    }
+
+
+def _warnings(baseline: Dict[str, Any], current: Dict[str, Any]) -> List[str]:
+    """Differences that make the comparison less meaningful."""
+    warnings = []
+    if baseline.get("config") != current.get("config"):
+        warnings.append("Runs used different benchmark settings (config)")
+    base_env, cur_env = baseline.get("environment", {}), current.get("environment", {})
+    for key in ("python", "machine", "cpus", "pdf_backend"):
+        if base_env.get(key) != cur_env.get(key):
+            warnings.append(
+                f"Environment differs: {key} {base_env.get(key)} -> {cur_env.get(key)}"
+            )
+    return warnings
+
+
+def _pct(value: Optional[float]) -> str:
+    return "-" if value is None else f"{value * 100:+.1f}%"
+
+
+def _ms(value: Optional[float]) -> str:
+    return "-" if value is None else f"{value:.2f}"
+
+
+def format_report(report: Dict[str, Any]) -> str:
+    """Per-stage diff table plus the verdict."""
+    lines = [
+        f"baseline: {report['baseline']['commit'] or '?'} "
+        f"({report['baseline']['created_at']})",
+        f"current:  {report['current']['commit'] or '?'} "
+        f"({report['current']['created_at']})",
+        "",
+        f"{'stage':<13} {'base p50':>9} {'cur p50':>9} {'change':>8} "
+        f"{'p95 chg':>8} {'p-value':>8} {'mem chg':>8}  status",
+    ]
+    for name, diff in report["stages"].items():
+        if "change" not in diff:
+            detail = f"  ({diff['error']})" if "error" in diff else ""
+            lines.append(f"{name:<13} {'':>55}  {diff['status']}{detail}")
+            continue
+        status = diff["status"]
+        if diff["memory_regressed"]:
+            status += ", memory"
+        lines.append(
+            f"{name:<13} {_ms(diff['baseline_p50_ms']):>9} "
+            f"{_ms(diff['current_p50_ms']):>9} {_pct(diff['change']):>8} "
+            f"{_pct(diff['p95_change']):>8} {diff['p_value']:>8.3f} "
+            f"{_pct(diff['memory_change']):>8}  {status}"
+        )
+    lines.append("")
+    lines.extend(f"warning: {w}" for w in report["warnings"])
+    if report["regressed"]:
+        lines.append(
+            f"REGRESSED (> {report['threshold'] * 100:g}% slower, "
+            f"p < {report['alpha']}): {', '.join(report['regressed'])}"
+        )
+    else:
+        lines.append("No latency regressions.")
+    if report["memory_regressed"]:
+        lines.append(f"Peak memory grew: {', '.join(report['memory_regressed'])}")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Compare benchmark runs and flag stages that regressed"
+    )
+    parser.add_argument("baseline", nargs="?", default="baseline")
+    parser.add_argument("current", nargs="?", default="latest")
+    parser.add_argument("--results-dir", help="default: BENCH_RESULTS_DIR")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument("--alpha", type=float, default=DEFAULT_ALPHA)
+    parser.add_argument(
+        "--memory-threshold", type=float, default=DEFAULT_MEMORY_THRESHOLD
+    )
+    parser.add_argument(
+        "--run",
+        action="store_true",
+        help="run the suite now (with the baseline's settings) and store it",
+    )
+    parser.add_argument("--set-baseline", metavar="RUN", help="then exit")
+    parser.add_argument("--history", action="store_true", help="list stored runs")
+    parser.add_argument(
+        "--memory-fails", action="store_true", help="exit 1 on memory growth too"
+    )
+    args = parser.parse_args(argv)
+
+    store = ResultStore(args.results_dir) if args.results_dir else ResultStore()
+    if args.history:
+        for entry in store.history():
+            print(
+                f"{entry['created_at']}  {entry['commit'] or '-':<10} "
+                f"{entry['label'] or '':<12} {entry['path']}"
+            )
+        return 0
+    if args.set_baseline:
+        path = store.set_baseline(args.set_baseline)
+        print(f"Baseline set from {store.resolve(args.set_baseline)} ({path})")
+        return 0
+
+    baseline = store.load(args.baseline)
+    if args.run:
+        from src.benchmarks.suite import run_suite
+
+        current = run_suite(
+            **baseline.get("config", {}), stages=list(baseline["stages"])
+        )
+        print(f"Stored run as {store.save(current)}", file=sys.stderr)
+    else:
+        current = store.load(args.current)
+
+    report = compare_runs(
+        baseline, current, args.threshold, args.alpha, args.memory_threshold
+    )
+    print(format_report(report))
+    failed = bool(report["regressed"]) or (
+        args.memory_fails and bool(report["memory_regressed"])
+    )
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
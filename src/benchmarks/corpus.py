@@ -0,0 +1,460 @@
+"""
+Synthetic Resume Corpus
+
+Seeded generator for realistic resumes (TXT, DOCX, PDF) of 1-20 pages and
+matching job descriptions. The same seed always yields the same corpus, so
+benchmark runs on different commits see identical input.
+
+Resumes vary in the things the pipeline is sensitive to: section headers
+(and missing sections), date formats ("Jan 2020", "03/2019", "2018",
+"Present"), employment gaps, skills, weak verbs and a few misspellings for
+the grammar checker to find.
+
+Usage:
+    python -m src.benchmarks.corpus --out bench_corpus --count 30 --seed 7
+"""
+
+import argparse
+import random
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+FORMATS = ("txt", "docx", "pdf")
+WORDS_PER_PAGE = 450
+
+FIRST_NAMES = [
+    "Aarav",
+    "Priya",
+    "Maria",
+    "James",
+    "Wei",
+    "Fatima",
+    "Lucas",
+    "Chen",
+    "Olivia",
+    "Rahul",
+    "Sofia",
+    "Daniel",
+    "Ananya",
+    "Kenji",
+    "Amara",
+    "Noah",
+]
+LAST_NAMES = [
+    "Sharma",
+    "Garcia",
+    "Smith",
+    "Zhang",
+    "Khan",
+    "Silva",
+    "Okafor",
+    "Tanaka",
+    "Müller",
+    "Iyer",
+    "Rossi",
+    "Johnson",
+    "Nguyen",
+    "Kowalski",
+    "Haddad",
+]
+CITIES = ["Bengaluru", "Austin", "Berlin", "Toronto", "Singapore", "London"]
+COMPANIES = [
+    "Northwind Analytics",
+    "Globex Systems",
+    "Initech",
+    "Umbrella Health",
+    "Stark Logistics",
+    "Wayne Fintech",
+    "Acme Cloud",
+    "Hooli",
+    "Vandelay Retail",
+    "Cyberdyne Robotics",
+    "Tyrell Bio",
+    "Soylent Foods",
+]
+TITLES = [
+    "Software Engineer",
+    "Senior Software Engineer",
+    "Data Analyst",
+    "Backend Developer",
+    "Full Stack Developer",
+    "DevOps Engineer",
+    "Machine Learning Engineer",
+    "Engineering Manager",
+    "QA Engineer",
+]
+TECH_SKILLS = [
+    "Python",
+    "JavaScript",
+    "React",
+    "AWS",
+    "Docker",
+    "Kubernetes",
+    "SQL",
+    "PostgreSQL",
+    "Java",
+    "Go",
+    "TypeScript",
+    "Flask",
+    "FastAPI",
+    "Terraform",
+    "Spark",
+    "Pandas",
+    "TensorFlow",
+    "Redis",
+    "Kafka",
+    "Linux",
+    "Git",
+]
+SOFT_SKILLS = [
+    "communication",
+    "leadership",
+    "problem solving",
+    "teamwork",
+    "mentoring",
+    "stakeholder management",
+    "public speaking",
+]
+DEGREES = [
+    "B.Tech in Computer Science",
+    "Bachelor of Science in Mathematics",
+    "Master of Science in Data Science",
+    "MBA",
+    "BE in Electronics",
+    "PhD in Computer Science",
+]
+UNIVERSITIES = [
+    "PES University",
+    "University of Texas",
+    "TU Munich",
+    "University of Toronto",
+    "National University of Singapore",
+    "Imperial College London",
+]
+
+# Strong and weak verbs (see src/core/action_verbs.py), misspellings the
+# LanguageTool stub flags (src/core/languagetool_stub.py)
+STRONG_VERBS = ["Led", "Designed", "Implemented", "Optimized", "Launched", "Automated"]
+WEAK_VERBS = ["Worked on", "Helped with", "Did", "Used", "Made", "Managed"]
+MISSPELLINGS = ["managment", "developement", "succesful", "recieved", "seperate"]
+OBJECTS = [
+    "the payment reconciliation service",
+    "a real-time analytics dashboard",
+    "the customer onboarding flow",
+    "CI/CD pipelines for {n} microservices",
+    "a data ingestion platform processing {n}M events per day",
+    "the internal reporting toolkit",
+    "an A/B testing framework",
+    "search relevance for the product catalogue",
+]
+OUTCOMES = [
+    "reducing latency by {n}%",
+    "cutting infrastructure cost by {n}%",
+    "improving conversion by {n}%",
+    "serving {n}k daily users",
+    "saving {n} engineering hours per month",
+    "",
+]
+
+SECTION_HEADERS = {
+    "summary": ["SUMMARY", "Professional Summary", "Profile", "Objective"],
+    "skills": ["SKILLS", "Technical Skills", "Technologies"],
+    "experience": ["EXPERIENCE", "Work Experience", "Professional Experience"],
+    "projects": ["PROJECTS", "Personal Projects", "Academic Projects"],
+    "education": ["EDUCATION", "Education", "Academic Background"],
+    "certifications": ["CERTIFICATIONS", "Certifications"],
+    "publications": ["PUBLICATIONS", "Publications"],
+}
+REQUIRED_SECTIONS = ("skills", "experience", "projects", "education")
+MONTHS = "Jan Feb Mar Apr May Jun Jul Aug Sep Oct Nov Dec".split()
+
+
+@dataclass
+class SyntheticResume:
+    """A generated resume: plain text plus the facts it was built from."""
+
+    name: str
+    pages: int
+    text: str
+    sections: List[str]
+    skills: List[str]
+    jobs: int
+    gaps: int
+
+
+@dataclass
+class CorpusFile:
+    """One resume file written to disk."""
+
+    path: Path
+    format: str
+    pages: int
+    resume: SyntheticResume = field(repr=False)
+
+    @property
+    def size(self) -> int:
+        return self.path.stat().st_size
+
+
+def _date(rng: random.Random, year: int, month: int) -> str:
+    style = rng.randrange(4)
+    if style == 0:
+        return f"{MONTHS[month - 1]} {year}"
+    if style == 1:
+        return f"{month:02d}/{year}"
+    if style == 2:
+        return f"{month}-{year}"
+    return str(year)
+
+
+def _bullet(rng: random.Random, typo_rate: float) -> str:
+    verb = rng.choice(WEAK_VERBS if rng.random() < 0.3 else STRONG_VERBS)
+    text = f"{verb} {rng.choice(OBJECTS)}"
+    outcome = rng.choice(OUTCOMES)
+    if outcome:
+        text += f", {outcome}"
+    text = text.format(n=rng.randint(2, 90)) + "."
+    if rng.random() < typo_rate:
+        words = text.split()
+        words.insert(rng.randrange(1, len(words)), rng.choice(MISSPELLINGS))
+        text = " ".join(words)
+    return text
+
+
+def _experience(
+    rng: random.Random, jobs: int, bullets: int, typo_rate: float
+) -> Tuple[List[str], int]:
+    """Most recent job first; returns the lines and the number of >6 month gaps."""
+    lines, gaps = [], 0
+    year, month = 2025, rng.randint(1, 12)
+    for index in range(jobs):
+        end = "Present" if index == 0 else _date(rng, year, month)
+        months = rng.randint(8, 48)
+        month -= months
+        while month < 1:
+            month += 12
+            year -= 1
+        start = _date(rng, year, month)
+        lines.append(rng.choice(TITLES))
+        lines.append(f"{rng.choice(COMPANIES)}, {rng.choice(CITIES)}")
+        lines.append(f"{start} - {end}")
+        lines.extend(f"- {_bullet(rng, typo_rate)}" for _ in range(bullets))
+        lines.append("")
+        gap = rng.choice([1, 1, 2, 3, 9, 14]) if rng.random() < 0.35 else 1
+        gaps += gap > 6
+        month -= gap
+        while month < 1:
+            month += 12
+            year -= 1
+    return lines, gaps
+
+
+def generate_resume(
+    rng: random.Random, pages: int, typo_rate: float = 0.05
+) -> SyntheticResume:
+    """One resume of roughly `pages` pages (WORDS_PER_PAGE words each)."""
+    name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+    skills = rng.sample(TECH_SKILLS, rng.randint(4, 12))
+    soft = rng.sample(SOFT_SKILLS, rng.randint(1, 3))
+
+    # Roughly one missing required section in five
+    included = [s for s in REQUIRED_SECTIONS if rng.random() > 0.05]
+    extras = [s for s in ("certifications", "publications") if rng.random() < 0.3]
+    if rng.random() < 0.8:
+        included.insert(0, "summary")
+
+    target_words = pages * WORDS_PER_PAGE
+    jobs = max(1, min(25, pages + rng.randint(0, 3)))
+    bullets = max(3, target_words // (jobs * 11))
+
+    body: Dict[str, List[str]] = {}
+    body["summary"] = [
+        f"{rng.choice(TITLES)} with {rng.randint(1, 25)} years of experience in "
+        f"{', '.join(skills[:3])}. {_bullet(rng, typo_rate)}"
+    ]
+    body["skills"] = [", ".join(skills), "Soft skills: " + ", ".join(soft)]
+    body["experience"], gaps = _experience(rng, jobs, bullets, typo_rate)
+    body["projects"] = []
+    for _ in range(max(1, pages // 2)):
+        body["projects"].append(
+            f"{rng.choice(['Open-source', 'Capstone', 'Hackathon'])} project: "
+            f"{rng.choice(OBJECTS).format(n=rng.randint(2, 50))}"
+        )
+        body["projects"].extend(f"- {_bullet(rng, typo_rate)}" for _ in range(2))
+    body["education"] = [
+        f"{rng.choice(DEGREES)}, {rng.choice(UNIVERSITIES)}, "
+        f"{rng.randint(2000, 2022)}"
+        for _ in range(rng.randint(1, 2))
+    ]
+    body["certifications"] = [
+        f"{rng.choice(['AWS Certified', 'CKA', 'PMP', 'GCP Professional'])} "
+        f"{rng.randint(2016, 2025)}"
+        for _ in range(rng.randint(1, 4))
+    ]
+    body["publications"] = [
+        f'"{rng.choice(OBJECTS).format(n=rng.randint(2, 50)).capitalize()}", '
+        f"Proceedings of {rng.choice(['ICSE', 'KDD', 'NeurIPS', 'VLDB'])} "
+        f"{rng.randint(2015, 2025)}"
+        for _ in range(rng.randint(1, pages + 1))
+    ]
+
+    lines = [
+        name,
+        f"{name.split()[0].lower()}.{rng.randint(1, 99)}@example.com | "
+        f"+1 555 {rng.randint(100, 999)} {rng.randint(1000, 9999)} | "
+        f"{rng.choice(CITIES)}",
+        "",
+    ]
+    for section in included + extras:
+        lines.append(rng.choice(SECTION_HEADERS[section]))
+        lines.extend(body[section])
+        lines.append("")
+    text = "\n".join(lines).strip() + "\n"
+
+    return SyntheticResume(
+        name=name,
+        pages=pages,
+        text=text,
+        sections=included + extras,
+        skills=skills,
+        jobs=jobs if "experience" in included else 0,
+        gaps=gaps if "experience" in included else 0,
+    )
+
+
+def generate_job_description(rng: random.Random) -> str:
+    """A job description naming skills, education and years of experience."""
+    title = rng.choice(TITLES)
+    skills = rng.sample(TECH_SKILLS, rng.randint(3, 8))
+    years = rng.randint(1, 10)
+    responsibilities = [
+        f"- {rng.choice(STRONG_VERBS)} {rng.choice(OBJECTS).format(n=10)}"
+        for _ in range(rng.randint(3, 8))
+    ]
+    return "\n".join(
+        [
+            f"{title} at {rng.choice(COMPANIES)}",
+            "",
+            "Responsibilities:",
+            *responsibilities,
+            "",
+            "Requirements:",
+            f"- At least {years} years of experience",
+            f"- Strong skills in {', '.join(skills)}",
+            f"- {rng.choice(['Bachelor', 'Master'])}'s degree in Computer Science",
+            f"- Excellent {rng.choice(SOFT_SKILLS)}",
+        ]
+    )
+
+
+def write_txt(resume: SyntheticResume, path: Path) -> None:
+    path.write_text(resume.text, encoding="utf-8")
+
+
+def write_docx(resume: SyntheticResume, path: Path) -> None:
+    import docx
+
+    document = docx.Document()
+    for line in resume.text.splitlines():
+        if line.startswith("- "):
+            document.add_paragraph(line[2:], style="List Bullet")
+        else:
+            document.add_paragraph(line)
+    document.save(str(path))
+
+
+def write_pdf(resume: SyntheticResume, path: Path) -> None:
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib.units import mm
+    from reportlab.lib.utils import simpleSplit
+    from reportlab.pdfgen.canvas import Canvas
+
+    width, height = A4
+    margin, leading, font = 20 * mm, 13, ("Helvetica", 10)
+    canvas = Canvas(str(path), pagesize=A4)
+    canvas.setFont(*font)
+    y = height - margin
+    for line in resume.text.splitlines():
+        for part in simpleSplit(line, *font, width - 2 * margin) or [""]:
+            if y < margin:
+                canvas.showPage()
+                canvas.setFont(*font)
+                y = height - margin
+            canvas.drawString(margin, y, part)
+            y -= leading
+    canvas.save()
+
+
+WRITERS = {"txt": write_txt, "docx": write_docx, "pdf": write_pdf}
+
+
+def generate_corpus(
+    out_dir: Path,
+    count: int = 12,
+    seed: int = 42,
+    formats: Sequence[str] = FORMATS,
+    min_pages: int = 1,
+    max_pages: int = 20,
+) -> List[CorpusFile]:
+    """
+    Write `count` resumes to `out_dir`, cycling through `formats`.
+
+    Page counts are spread over min_pages..max_pages, skewed towards short
+    resumes like real uploads, and always include both ends of the range.
+    """
+    unknown = set(formats) - set(FORMATS)
+    if unknown:
+        raise ValueError(f"Unknown formats {sorted(unknown)}; use {FORMATS}")
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    rng = random.Random(seed)
+
+    files = []
+    for index in range(count):
+        if index == 0:
+            pages = min_pages
+        elif index == 1:
+            pages = max_pages
+        else:
+            pages = min_pages + int((max_pages - min_pages) * rng.random() ** 2)
+        fmt = formats[index % len(formats)]
+        resume = generate_resume(rng, pages)
+        path = out_dir / f"resume_{index:03d}_{pages}p.{fmt}"
+        WRITERS[fmt](resume, path)
+        files.append(CorpusFile(path, fmt, pages, resume))
+    return files
+
+
+def generate_job_descriptions(count: int = 5, seed: int = 42) -> List[str]:
+    rng = random.Random(f"jd-{seed}")
+    return [generate_job_description(rng) for _ in range(count)]
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Generate a synthetic resume corpus")
+    parser.add_argument("--out", type=Path, default=Path("bench_corpus"))
+    parser.add_argument("--count", type=int, default=12)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--formats", nargs="+", default=list(FORMATS))
+    parser.add_argument("--min-pages", type=int, default=1)
+    parser.add_argument("--max-pages", type=int, default=20)
+    parser.add_argument("--jds", type=int, default=5, help="job descriptions")
+    args = parser.parse_args(argv)
+
+    files = generate_corpus(
+        args.out,
+        args.count,
+        args.seed,
+        args.formats,
+        args.min_pages,
+        args.max_pages,
+    )
+    for index, jd in enumerate(generate_job_descriptions(args.jds, args.seed)):
+        (args.out / f"jd_{index:03d}.txt").write_text(jd, encoding="utf-8")
+    for f in files:
+        print(f"{f.path}  {f.pages:>2} pages  {f.size:>8} bytes")
+
+
+if __name__ == "__main__":
+    main()
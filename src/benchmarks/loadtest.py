@@ -0,0 +1,645 @@
+"""
+HTTP Load Test Harness
+
+Drives a realistic traffic mix against the API at controlled request rates
+and reports, per rate step and per endpoint, throughput, latency
+percentiles and error rates. Stepping the rate up (--rates 1 2 4 8 16)
+shows where the service saturates: the first step whose achieved
+throughput falls behind the offered rate, or whose errors exceed the
+budget, is reported as the saturation point.
+
+Endpoints:
+    upload    POST /api/v1/parse/ with a synthetic resume (src/benchmarks/corpus.py)
+    poll      GET /api/v1/results/{job_id} of an uploaded job
+    compare   POST /api/v1/compare/ with a resume and a job description
+    download  GET /api/v1/download/{job_id} (PDF report)
+
+Requests arrive open-loop (Poisson arrivals at the step's rate), so a slow
+server sees a growing backlog instead of a politely slowed-down client.
+Requests beyond --max-in-flight are counted as dropped.
+
+By default the harness starts everything it needs locally (`LocalStack`):
+the LanguageTool stub with configurable latency
+(src/core/languagetool_stub.py), and the app under uvicorn with SQLite in
+place of Postgres. --target loads an already running deployment instead;
+--in-process drives the app through an ASGI transport without a server
+(smoke tests; latencies then include background analysis on the same loop).
+
+Usage:
+    python -m src.benchmarks.loadtest --rates 1 2 4 8 --duration 30
+    python -m src.benchmarks.loadtest --mix upload=1,poll=6,download=3 \\
+        --grammar-latency 0.3 --workers 2 --output load.json
+    python -m src.benchmarks.loadtest --target http://localhost:8000 --rates 5
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from collections import Counter
+from contextlib import ExitStack, asynccontextmanager, contextmanager
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import httpx
+
+from src.benchmarks.corpus import generate_corpus, generate_job_descriptions
+from src.benchmarks.suite import environment, summarize
+
+ENDPOINTS = ("upload", "poll", "compare", "download")
+DEFAULT_MIX = {"upload": 2.0, "poll": 5.0, "compare": 1.0, "download": 2.0}
+# A step is saturated when throughput falls below this share of the
+# offered rate or errors exceed MAX_ERROR_RATE
+MIN_EFFICIENCY = 0.9
+MAX_ERROR_RATE = 0.01
+
+CONTENT_TYPES = {
+    "txt": "text/plain",
+    "pdf": "application/pdf",
+    "docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+}
+
+
+@dataclass(frozen=True)
+class Payload:
+    filename: str
+    content: bytes
+    content_type: str
+
+
+def parse_mix(value: str) -> Dict[str, float]:
+    """ "upload=2,poll=5" -> {"upload": 2.0, "poll": 5.0}"""
+    mix = {}
+    for item in value.split(","):
+        name, _, weight = item.partition("=")
+        name = name.strip()
+        if name not in ENDPOINTS:
+            raise ValueError(f"Unknown endpoint {name!r}; use {ENDPOINTS}")
+        mix[name] = float(weight or 1)
+    if not any(weight > 0 for weight in mix.values()):
+        raise ValueError("The traffic mix needs at least one positive weight")
+    return mix
+
+
+def build_payloads(
+    corpus_dir: Path, count: int = 6, seed: int = 42, max_pages: int = 5
+) -> List[Payload]:
+    """Synthetic resumes to upload, in every supported format."""
+    return [
+        Payload(f.path.name, f.path.read_bytes(), CONTENT_TYPES[f.format])
+        for f in generate_corpus(corpus_dir, count, seed, max_pages=max_pages)
+    ]
+
+
+class Recorder:
+    """Outcomes of one rate step, per endpoint."""
+
+    def __init__(self):
+        self.timings: Dict[str, List[float]] = {name: [] for name in ENDPOINTS}
+        self.statuses: Dict[str, Counter] = {name: Counter() for name in ENDPOINTS}
+        self.errors: Dict[str, int] = Counter()
+        self.dropped: Dict[str, int] = Counter()
+
+    def record(self, endpoint: str, ms: float, outcome: str, failed: bool) -> None:
+        self.timings[endpoint].append(ms)
+        self.statuses[endpoint][outcome] += 1
+        if failed:
+            self.errors[endpoint] += 1
+
+    def drop(self, endpoint: str) -> None:
+        self.dropped[endpoint] += 1
+
+    def summary(self, rate: float, elapsed: float) -> Dict[str, Any]:
+        endpoints = {}
+        for name in ENDPOINTS:
+            timings = self.timings[name]
+            if not timings and not self.dropped[name]:
+                continue
+            entry: Dict[str, Any] = {
+                "requests": len(timings),
+                "errors": self.errors[name],
+                "error_rate": (
+                    round(self.errors[name] / len(timings), 4) if timings else 0.0
+                ),
+                "dropped": self.dropped[name],
+                "statuses": dict(self.statuses[name]),
+                "throughput_rps": round(
+                    (len(timings) - self.errors[name]) / elapsed, 3
+                ),
+            }
+            if timings:
+                entry.update(summarize(timings))
+            endpoints[name] = entry
+
+        requests = sum(len(t) for t in self.timings.values())
+        errors = sum(self.errors.values())
+        return {
+            "rate_rps": rate,
+            "elapsed_s": round(elapsed, 3),
+            "requests": requests,
+            "errors": errors,
+            "error_rate": round(errors / requests, 4) if requests else 0.0,
+            "dropped": sum(self.dropped.values()),
+            "throughput_rps": round((requests - errors) / elapsed, 3),
+            "endpoints": endpoints,
+        }
+
+
+class LoadGenerator:
+    """
+    Open-loop traffic against one API.
+
+    Args:
+        client: httpx client with base_url set to the API root.
+        payloads: Resumes to upload (cycled).
+        job_descriptions: Texts for compare requests.
+        mix: Endpoint -> relative weight.
+        max_in_flight: Outstanding requests before new ones are dropped.
+        poisson: Exponential inter-arrival times (else a fixed interval).
+    """
+
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        payloads: Sequence[Payload],
+        job_descriptions: Sequence[str],
+        mix: Optional[Dict[str, float]] = None,
+        seed: int = 42,
+        max_in_flight: int = 256,
+        poisson: bool = True,
+    ):
+        self.client = client
+        self.payloads = list(payloads)
+        self.job_descriptions = list(job_descriptions)
+        self.mix = dict(mix or DEFAULT_MIX)
+        self.max_in_flight = max_in_flight
+        self.poisson = poisson
+        self.jobs: List[str] = []
+        self._random = random.Random(seed)
+        self._uploads = 0
+
+    def _payload(self) -> Payload:
+        payload = self.payloads[self._uploads % len(self.payloads)]
+        self._uploads += 1
+        return payload
+
+    def _files(self) -> Dict[str, Tuple[str, bytes, str]]:
+        payload = self._payload()
+        return {"file": (payload.filename, payload.content, payload.content_type)}
+
+    async def upload(self) -> httpx.Response:
+        response = await self.client.post("/api/v1/parse/", files=self._files())
+        if response.status_code == 202:
+            self.jobs.append(response.json()["jobId"])
+        return response
+
+    async def poll(self) -> httpx.Response:
+        return await self.client.get(f"/api/v1/results/{self._job()}")
+
+    async def compare(self) -> httpx.Response:
+        return await self.client.post(
+            "/api/v1/compare/",
+            files=self._files(),
+            data={"job_description": self._random.choice(self.job_descriptions)},
+        )
+
+    async def download(self) -> httpx.Response:
+        return await self.client.get(f"/api/v1/download/{self._job()}")
+
+    def _job(self) -> str:
+        # Mostly recent uploads, like users waiting on their own job
+        recent = self.jobs[-20:]
+        return self._random.choice(recent)
+
+    async def seed_jobs(self, count: int, settle: float = 0.0) -> None:
+        """Upload `count` resumes (not measured) so poll/download have jobs."""
+        for _ in range(count):
+            response = await self.upload()
+            response.raise_for_status()
+        if settle > 0:
+            await asyncio.sleep(settle)
+
+    async def _request(self, endpoint: str, recorder: Recorder) -> None:
+        started = time.perf_counter()
+        try:
+            response = await getattr(self, endpoint)()
+            outcome, failed = str(response.status_code), response.status_code >= 400
+        except httpx.HTTPError as e:
+            outcome, failed = type(e).__name__, True
+        recorder.record(
+            endpoint, (time.perf_counter() - started) * 1000, outcome, failed
+        )
+
+    def _choose(self) -> str:
+        names = [n for n in self.mix if n == "upload" or n == "compare" or self.jobs]
+        weights = [self.mix[n] for n in names]
+        return self._random.choices(names, weights)[0]
+
+    async def run_step(
+        self, rate: float, duration: float, drain_timeout: float = 60.0
+    ) -> Dict[str, Any]:
+        """Offer `rate` requests/second for `duration` seconds, then drain."""
+        recorder = Recorder()
+        in_flight: set = set()
+        loop = asyncio.get_running_loop()
+        start = next_at = loop.time()
+        while True:
+            gap = self._random.expovariate(rate) if self.poisson else 1 / rate
+            next_at += gap
+            if next_at - start >= duration:
+                break
+            await asyncio.sleep(max(0.0, next_at - loop.time()))
+            endpoint = self._choose()
+            if len(in_flight) >= self.max_in_flight:
+                recorder.drop(endpoint)
+                continue
+            task = asyncio.create_task(self._request(endpoint, recorder))
+            in_flight.add(task)
+            task.add_done_callback(in_flight.discard)
+
+        if in_flight:
+            _, pending = await asyncio.wait(in_flight, timeout=drain_timeout)
+            for task in pending:
+                task.cancel()
+        return recorder.summary(rate, max(loop.time() - start, duration))
+
+
+def find_saturation(
+    steps: Sequence[Dict[str, Any]],
+    min_efficiency: float = MIN_EFFICIENCY,
+    max_error_rate: float = MAX_ERROR_RATE,
+) -> Dict[str, Any]:
+    """
+    First step that could not keep up with its offered rate, and the best
+    throughput sustained before it.
+    """
+    sustained = None
+    for step in steps:
+        offered = step["rate_rps"]
+        kept_up = step["throughput_rps"] >= min_efficiency * offered
+        if not kept_up or step["dropped"] or step["error_rate"] > max_error_rate:
+            reason = (
+                "errors"
+                if step["error_rate"] > max_error_rate
+                else "dropped requests" if step["dropped"] else "throughput"
+            )
+            return {
+                "saturated_at_rps": offered,
+                "reason": reason,
+                "max_sustained_rps": sustained,
+            }
+        sustained = step["throughput_rps"]
+    return {"saturated_at_rps": None, "reason": None, "max_sustained_rps": sustained}
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+class LocalStack:
+    """
+    LanguageTool stub plus the app under uvicorn, on SQLite.
+
+    Args:
+        grammar_latency: Seconds the stub sleeps per check.
+        workers: uvicorn worker processes.
+        startup_timeout: Seconds to wait for /api/v1/health.
+        env: Extra environment for the app (e.g. PDF_RENDER_WORKERS).
+    """
+
+    def __init__(
+        self,
+        grammar_latency: float = 0.0,
+        workers: int = 1,
+        startup_timeout: float = 60.0,
+        env: Optional[Dict[str, str]] = None,
+    ):
+        self.grammar_latency = grammar_latency
+        self.workers = workers
+        self.startup_timeout = startup_timeout
+        self.extra_env = dict(env or {})
+        self.port = _free_port()
+        self._stack = ExitStack()
+        self._process: Optional[subprocess.Popen] = None
+        self._tmp: Optional[Path] = None
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.port}"
+
+    def __enter__(self) -> "LocalStack":
+        from src.core.languagetool_stub import LanguageToolStub
+
+        try:
+            stub = self._stack.enter_context(
+                LanguageToolStub(latency=self.grammar_latency, seed=0)
+            )
+            self._tmp = Path(tempfile.mkdtemp(prefix="loadtest-"))
+            self._stack.callback(shutil.rmtree, self._tmp, True)
+            env = {
+                **os.environ,
+                "DATABASE_URL": f"sqlite:///{self._tmp / 'metadata.db'}",
+                "RESULT_STORE_PATH": str(self._tmp / "results.db"),
+                "UPLOAD_DIR": str(self._tmp / "uploads"),
+                "PDF_PRERENDER_DIR": str(self._tmp / "prerendered"),
+                "LT_REMOTE_URL": stub.url,
+                "USE_REAL_GRAMMAR": "true",
+                "USE_REMOTE_LT": "true",
+                "GRAMMAR_BACKEND": "languagetool",
+                "TRACE_DIR": str(self._tmp / "traces"),
+                "ENFORCE_HTTPS": "false",
+                **self.extra_env,
+            }
+            log = open(self._tmp / "server.log", "wb")
+            self._stack.callback(log.close)
+            self._process = subprocess.Popen(
+                [
+                    sys.executable,
+                    "-m",
+                    "uvicorn",
+                    "src.main:app",
+                    "--host",
+                    "127.0.0.1",
+                    "--port",
+                    str(self.port),
+                    "--workers",
+                    str(self.workers),
+                    "--log-level",
+                    "warning",
+                ],
+                env=env,
+                stdout=log,
+                stderr=subprocess.STDOUT,
+            )
+            self._stack.callback(self._terminate)
+            self._wait_ready()
+        except BaseException:
+            self._stack.close()
+            raise
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._stack.close()
+
+    def _wait_ready(self) -> None:
+        deadline = time.monotonic() + self.startup_timeout
+        while time.monotonic() < deadline:
+            if self._process.poll() is not None:
+                raise RuntimeError(f"App exited on startup:\n{self.server_log()}")
+            try:
+                if httpx.get(f"{self.url}/api/v1/health", timeout=2).is_success:
+                    return
+            except httpx.HTTPError:
+                pass
+            time.sleep(0.25)
+        raise RuntimeError(f"App not ready after {self.startup_timeout}s")
+
+    def _terminate(self) -> None:
+        if self._process is None or self._process.poll() is not None:
+            return
+        self._process.terminate()
+        try:
+            self._process.wait(timeout=15)
+        except subprocess.TimeoutExpired:
+            self._process.kill()
+            self._process.wait()
+
+    def server_log(self, lines: int = 40) -> str:
+        try:
+            text = (self._tmp / "server.log").read_text(errors="replace")
+        except (OSError, TypeError):
+            return ""
+        return "\n".join(text.splitlines()[-lines:])
+
+
+@contextmanager
+def isolated_state(root: Path) -> Iterator[None]:
+    """
+    Keep the in-process app's files under `root`: uploads, result
+    snapshots, analysis metadata, job traces and pre-rendered PDFs.
+    """
+    from sqlalchemy import create_engine
+
+    from src.api import data_service, jobs, results
+    from src.database.metadata_writer import MetadataWriter, set_metadata_writer
+    from src.database.result_store import ResultStore, set_result_store
+    from src.feedback.pdf_renderer import pdf_renderer
+    from src.upload import service
+    from src.utils.tracing import tracer
+
+    uploads = root / "uploads"
+    uploads.mkdir(parents=True, exist_ok=True)
+    patches = [
+        (m, "UPLOAD_DIR", uploads) for m in (service, data_service, results, jobs)
+    ]
+    patches.append((tracer, "trace_dir", root / "traces"))
+    if pdf_renderer.store_dir is not None:
+        patches.append((pdf_renderer, "store_dir", root / "prerendered"))
+    originals = [(obj, name, getattr(obj, name)) for obj, name, _ in patches]
+    store = ResultStore(str(root / "results.db"))
+    previous = set_result_store(store)
+    engine = create_engine(f"sqlite:///{root / 'metadata.db'}")
+    writer = MetadataWriter(engine)
+    previous_writer = set_metadata_writer(writer)
+    try:
+        for obj, name, value in patches:
+            setattr(obj, name, value)
+        yield
+    finally:
+        for obj, name, value in originals:
+            setattr(obj, name, value)
+        set_result_store(previous)
+        store.close()
+        writer.stop()
+        set_metadata_writer(previous_writer)
+        engine.dispose()
+
+
+@asynccontextmanager
+async def in_process_client(
+    grammar_latency: float = 0.0,
+) -> AsyncIterator[httpx.AsyncClient]:
+    """
+    The app in this process behind an ASGI transport, grammar on the stub
+    and every file it writes in a temporary directory.
+    """
+    from src.benchmarks.suite import stub_grammar
+    from src.main import app
+
+    with ExitStack() as stack:
+        tmp = stack.enter_context(tempfile.TemporaryDirectory(prefix="loadtest-"))
+        stack.enter_context(isolated_state(Path(tmp)))
+        stack.enter_context(stub_grammar(grammar_latency))
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="https://loadtest"
+        ) as client:
+            yield client
+
+
+async def run_load(
+    client: httpx.AsyncClient,
+    rates: Sequence[float],
+    duration: float,
+    mix: Optional[Dict[str, float]] = None,
+    payloads: Optional[Sequence[Payload]] = None,
+    seed: int = 42,
+    seed_jobs: int = 3,
+    max_in_flight: int = 256,
+) -> Tuple[Dict[str, Any], List[str]]:
+    """
+    Run one step per rate against `client`.
+
+    Returns:
+        The results document and the ids of every job uploaded.
+    """
+    with tempfile.TemporaryDirectory(prefix="loadtest-corpus-") as tmp:
+        payloads = payloads or build_payloads(Path(tmp), seed=seed)
+    generator = LoadGenerator(
+        client,
+        payloads,
+        generate_job_descriptions(3, seed),
+        mix,
+        seed,
+        max_in_flight,
+    )
+    await generator.seed_jobs(seed_jobs, settle=1.0 if seed_jobs else 0.0)
+
+    steps = []
+    for rate in rates:
+        steps.append(await generator.run_step(rate, duration))
+
+    return (
+        {
+            "schema": 1,
+            "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "environment": environment(),
+            "config": {
+                "rates": list(rates),
+                "duration_s": duration,
+                "mix": generator.mix,
+                "seed": seed,
+                "max_in_flight": max_in_flight,
+            },
+            "steps": steps,
+            "saturation": find_saturation(steps),
+        },
+        generator.jobs,
+    )
+
+
+def format_report(results: Dict[str, Any]) -> str:
+    lines = []
+    for step in results["steps"]:
+        lines.append(
+            f"rate {step['rate_rps']:g}/s: {step['throughput_rps']} ok/s, "
+            f"{step['requests']} requests, {step['error_rate'] * 100:.1f}% errors, "
+            f"{step['dropped']} dropped"
+        )
+        lines.append(
+            f"  {'endpoint':<9} {'n':>5} {'err%':>6} {'p50 ms':>9} {'p95 ms':>9} "
+            f"{'p99 ms':>9} {'max ms':>9}  statuses"
+        )
+        for name, e in step["endpoints"].items():
+            if not e["requests"]:
+                lines.append(f"  {name:<9} {0:>5}  (all {e['dropped']} dropped)")
+                continue
+            lines.append(
+                f"  {name:<9} {e['requests']:>5} {e['error_rate'] * 100:>6.1f} "
+                f"{e['p50_ms']:>9.1f} {e['p95_ms']:>9.1f} {e['p99_ms']:>9.1f} "
+                f"{e['max_ms']:>9.1f}  {e['statuses']}"
+            )
+    saturation = results["saturation"]
+    if saturation["saturated_at_rps"] is None:
+        lines.append(
+            f"Not saturated; sustained {saturation['max_sustained_rps']} ok/s."
+        )
+    else:
+        lines.append(
+            f"Saturated at {saturation['saturated_at_rps']:g}/s "
+            f"({saturation['reason']}); max sustained "
+            f"{saturation['max_sustained_rps']} ok/s."
+        )
+    return "\n".join(lines)
+
+
+async def _main(args: argparse.Namespace) -> Dict[str, Any]:
+    mix = parse_mix(args.mix) if args.mix else None
+    timeout = httpx.Timeout(args.timeout)
+    limits = httpx.Limits(max_connections=args.max_in_flight)
+
+    async def load(client: httpx.AsyncClient) -> Tuple[Dict[str, Any], List[str]]:
+        return await run_load(
+            client,
+            args.rates,
+            args.duration,
+            mix,
+            seed=args.seed,
+            seed_jobs=args.seed_jobs,
+            max_in_flight=args.max_in_flight,
+        )
+
+    if args.in_process:
+        async with in_process_client(args.grammar_latency) as client:
+            results, _ = await load(client)
+        return results
+
+    if args.target:
+        async with httpx.AsyncClient(
+            base_url=args.target, timeout=timeout, limits=limits
+        ) as client:
+            results, _ = await load(client)
+        return results
+
+    with LocalStack(args.grammar_latency, args.workers) as stack:
+        async with httpx.AsyncClient(
+            base_url=stack.url, timeout=timeout, limits=limits
+        ) as client:
+            results, _ = await load(client)
+        results["server_log_tail"] = stack.server_log(20)
+    return results
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="HTTP load test of the API")
+    parser.add_argument("--rates", type=float, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--duration", type=float, default=30, help="seconds per rate")
+    parser.add_argument("--mix", help="e.g. upload=2,poll=5,compare=1,download=2")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--seed-jobs", type=int, default=3, help="uploads first")
+    parser.add_argument("--max-in-flight", type=int, default=256)
+    parser.add_argument("--timeout", type=float, default=60, help="per request")
+    parser.add_argument(
+        "--grammar-latency", type=float, default=0.0, help="stub seconds per check"
+    )
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn workers")
+    parser.add_argument("--target", help="load a running server instead")
+    parser.add_argument("--in-process", action="store_true", help="no server")
+    parser.add_argument("--output", type=Path, help="write JSON results here")
+    parser.add_argument("--json", action="store_true", help="print JSON results")
+    args = parser.parse_args(argv)
+
+    results = asyncio.run(_main(args))
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(results, indent=2))
+        print(f"Results written to {args.output}", file=sys.stderr)
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print(format_report(results))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""
+Benchmark Result Store
+
+Keeps the JSON documents of `src.benchmarks.suite` runs under
+BENCH_RESULTS_DIR (default reports/benchmarks), one file per run named
+after its time and commit, plus the run chosen as the baseline
+(baseline.json). Runs are looked up by path, "latest", "baseline", file
+name or commit prefix.
+"""
+
+import json
+import os
+import re
+import shutil
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+BENCH_RESULTS_DIR = Path(os.getenv("BENCH_RESULTS_DIR", "reports/benchmarks"))
+BASELINE_FILE = "baseline.json"
+
+_UNSAFE = re.compile(r"[^A-Za-z0-9_.-]+")
+
+
+class ResultStore:
+    """Historical benchmark results in a directory."""
+
+    def __init__(self, root: Path = BENCH_RESULTS_DIR):
+        self.root = Path(root)
+
+    @property
+    def baseline_path(self) -> Path:
+        return self.root / BASELINE_FILE
+
+    def save(self, results: Dict[str, Any], label: Optional[str] = None) -> Path:
+        """Store one run; returns its path."""
+        self.root.mkdir(parents=True, exist_ok=True)
+        stamp = results.get("created_at", "").replace(":", "").replace("+0000", "Z")
+        parts = [stamp or "run", results.get("environment", {}).get("commit"), label]
+        name = _UNSAFE.sub("-", "_".join(p for p in parts if p))
+        path = self.root / f"{name}.json"
+        suffix = 1
+        while path.exists():
+            suffix += 1
+            path = self.root / f"{name}-{suffix}.json"
+        if label:
+            results = {**results, "label": label}
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(results, indent=2))
+        tmp.replace(path)
+        return path
+
+    def runs(self) -> List[Path]:
+        """Stored runs, oldest first (the baseline copy is not listed)."""
+        if not self.root.is_dir():
+            return []
+        return sorted(p for p in self.root.glob("*.json") if p.name != BASELINE_FILE)
+
+    def history(self) -> List[Dict[str, Any]]:
+        """One line of metadata per stored run, oldest first."""
+        entries = []
+        for path in self.runs():
+            try:
+                results = load_results(path)
+            except (OSError, ValueError):
+                continue
+            entries.append(
+                {
+                    "path": str(path),
+                    "created_at": results.get("created_at"),
+                    "commit": results.get("environment", {}).get("commit"),
+                    "label": results.get("label"),
+                    "stages": len(results.get("stages", {})),
+                }
+            )
+        return entries
+
+    def resolve(self, ref: str) -> Path:
+        """
+        Find a run by path, "latest", "baseline", file name or commit prefix.
+
+        Raises:
+            FileNotFoundError: If nothing matches.
+        """
+        if ref == "baseline":
+            if self.baseline_path.exists():
+                return self.baseline_path
+            raise FileNotFoundError(f"No baseline set in {self.root}")
+        runs = self.runs()
+        if ref == "latest":
+            if runs:
+                return runs[-1]
+            raise FileNotFoundError(f"No benchmark results in {self.root}")
+        direct = Path(ref)
+        if direct.is_file():
+            return direct
+        matches = [p for p in runs if p.stem == ref or p.name == ref]
+        if not matches:
+            matches = [
+                p for p in runs if _commit_of(p) and _commit_of(p).startswith(ref)
+            ]
+        if not matches:
+            raise FileNotFoundError(f"No benchmark results match {ref!r}")
+        return matches[-1]
+
+    def load(self, ref: str) -> Dict[str, Any]:
+        return load_results(self.resolve(ref))
+
+    def set_baseline(self, ref: str) -> Path:
+        """Make the run `ref` the baseline later runs are compared against."""
+        source = self.resolve(ref)
+        self.root.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(source, self.baseline_path)
+        return self.baseline_path
+
+
+def _commit_of(path: Path) -> Optional[str]:
+    try:
+        return load_results(path).get("environment", {}).get("commit")
+    except (OSError, ValueError):
+        return None
+
+
+def load_results(path: Path) -> Dict[str, Any]:
+    """Read one results document; ValueError if it is not one."""
+    results = json.loads(Path(path).read_text())
+    if not isinstance(results, dict) or "stages" not in results:
+        raise ValueError(f"{path} is not a benchmark results file")
+    return results
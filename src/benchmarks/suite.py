@@ -0,0 +1,440 @@
+"""
+End-to-end Benchmark Suite
+
+Runs every pipeline stage over a seeded synthetic corpus
+(src/benchmarks/corpus.py) and reports, per stage, latency percentiles,
+throughput and peak memory as JSON:
+
+    extract_txt, extract_docx, extract_pdf  text extraction (analyzer path)
+    skills       skill extraction
+    sections     section detection and validation
+    experience   experience parsing
+    gaps         word count and employment gap detection
+    grammar      grammar engine without its cache, against the LanguageTool
+                 stub over HTTP (src/core/languagetool_stub.py)
+    verbs        action verb analysis of experience and projects
+    jd_matching  resume against a generated job description
+    feedback     full feedback generation; grammar goes to the stub through
+                 the grammar service and its shared sentence cache
+    pdf          PDF report rendering (PDF_BACKEND), bypassing the PDF cache
+
+Inputs of every stage are prepared up front, so a stage times only its own
+work. Each sample runs `repeat` times; the raw timings are kept in the
+output ("samples_ms") so runs can be compared statistically. Peak memory is
+measured in separate runs over the largest samples: tracemalloc slows
+allocation-heavy code down.
+
+Usage:
+    python -m src.benchmarks.suite --count 12 --repeat 3 --output bench.json
+    python -m src.benchmarks.suite --stages skills sections --max-pages 5 --json
+    python -m src.benchmarks.suite --store    # keep it for src.benchmarks.compare
+"""
+
+import argparse
+import json
+import logging
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from src.benchmarks.corpus import (
+    FORMATS,
+    CorpusFile,
+    generate_corpus,
+    generate_job_descriptions,
+)
+from src.benchmarks.store import ResultStore
+
+logger = logging.getLogger(__name__)
+
+SCHEMA_VERSION = 1
+PERCENTILES = (50, 90, 95, 99)
+VERB_SECTIONS = ("experience", "projects")
+
+
+@dataclass
+class Sample:
+    """One corpus file with the inputs of every stage prepared."""
+
+    file: CorpusFile
+    text: str
+    sections: Dict[str, str]
+    validation: Dict[str, Any]
+    experience: List[Dict]
+    resume_data: Dict[str, Any]
+    jd: str
+    report: Dict[str, Any]
+
+
+@dataclass(frozen=True)
+class Stage:
+    name: str
+    run: Callable[[Sample], Any]
+    formats: Tuple[str, ...] = FORMATS
+
+
+def percentile(values: Sequence[float], pct: float) -> float:
+    """Nearest-rank percentile of `values` (non-empty)."""
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, round(pct / 100 * (len(ordered) - 1)))
+    return ordered[index]
+
+
+def summarize(timings_ms: Sequence[float]) -> Dict[str, float]:
+    """Latency summary (ms) of one stage's timings."""
+    summary = {
+        "count": len(timings_ms),
+        "mean_ms": round(statistics.mean(timings_ms), 3),
+        "stdev_ms": (
+            round(statistics.stdev(timings_ms), 3) if len(timings_ms) > 1 else 0.0
+        ),
+        "min_ms": round(min(timings_ms), 3),
+        "max_ms": round(max(timings_ms), 3),
+    }
+    for pct in PERCENTILES:
+        summary[f"p{pct}_ms"] = round(percentile(timings_ms, pct), 3)
+    return summary
+
+
+def peak_kib(fn: Callable[[], Any]) -> float:
+    """Peak traced allocation (KiB) above the starting level while `fn` runs."""
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    start = tracemalloc.get_traced_memory()[0]
+    try:
+        fn()
+    finally:
+        peak = tracemalloc.get_traced_memory()[1]
+        if not was_tracing:
+            tracemalloc.stop()
+    return round((peak - start) / 1024, 1)
+
+
+@contextmanager
+def stub_grammar(latency: float = 0.0) -> Iterator[str]:
+    """
+    Start the LanguageTool stub and point the process-wide grammar tool at
+    it; yields the stub URL. The grammar service is stopped on exit, so the
+    next user gets a fresh tool.
+    """
+    from src.core import grammar_engine
+    from src.core.grammar_client import HttpGrammarTool
+    from src.core.grammar_service import grammar_service
+    from src.core.languagetool_stub import LanguageToolStub
+
+    with LanguageToolStub(latency=latency, seed=0) as stub:
+        grammar_service.stop()
+        grammar_engine._language_tool = HttpGrammarTool(stub.url)
+        try:
+            yield stub.url
+        finally:
+            grammar_service.stop()
+
+
+def prepare_samples(files: Sequence[CorpusFile], jds: Sequence[str]) -> List[Sample]:
+    """Run the pipeline once per file to build every stage's input."""
+    from src.api.compare import convert_analyzer_results_to_standard_format
+    from src.api.data_service import parse_sections_from_text
+    from src.feedback.feedback_generator import FeedbackGenerator
+    from src.parser.experience_parser import ExperienceParser
+    from src.parser.section_detector import SectionDetector
+    from src.parser.skill_parser import extract_skills, get_text_from_parser
+
+    detector = SectionDetector()
+    feedback_gen = FeedbackGenerator()
+    samples = []
+    for index, corpus_file in enumerate(files):
+        text = get_text_from_parser(corpus_file.path)
+        sections = parse_sections_from_text(text)
+        validation = detector.validate_resume_structure(text)
+        validation["keyword_match_score"] = 0
+        feedback = feedback_gen.generate_comprehensive_feedback(sections, validation)
+        resume_data = convert_analyzer_results_to_standard_format(
+            {
+                "status": "complete",
+                "analysis": {"skills": extract_skills(text), "structure": validation},
+            }
+        )
+        samples.append(
+            Sample(
+                file=corpus_file,
+                text=text,
+                sections=sections,
+                validation=validation,
+                experience=ExperienceParser().parse_experience_section(text),
+                resume_data=resume_data,
+                jd=jds[index % len(jds)],
+                report={
+                    "name": corpus_file.resume.name,
+                    "overallScore": feedback.get("overall_score", 0),
+                    "validation": validation,
+                    "feedback": feedback,
+                    "improvements": feedback.get("suggestions", []),
+                },
+            )
+        )
+    return samples
+
+
+def build_stages(grammar_url: str) -> Dict[str, Stage]:
+    """Every benchmarked stage, by name, in pipeline order."""
+    from src.core.action_verbs import get_action_verb_engine
+    from src.core.grammar_client import HttpGrammarTool
+    from src.core.grammar_engine import GrammarEngine
+    from src.feedback.feedback_generator import FeedbackGenerator, render_pdf_bytes
+    from src.parser.experience_parser import ExperienceParser
+    from src.parser.gap_detector import GapDetector
+    from src.parser.jd_matcher import JDMatcher
+    from src.parser.section_detector import SectionDetector
+    from src.parser.skill_parser import extract_skills, get_text_from_parser
+
+    detector = SectionDetector()
+    experience_parser = ExperienceParser()
+    gap_detector = GapDetector()
+    grammar = GrammarEngine()
+    grammar._tool = HttpGrammarTool(grammar_url)
+    matcher = JDMatcher()
+    feedback_gen = FeedbackGenerator()  # no feedback cache: always the full work
+
+    def verb_sections(sample: Sample) -> Dict[str, str]:
+        return {name: sample.sections.get(name, "") for name in VERB_SECTIONS}
+
+    stages = [
+        *(
+            Stage(f"extract_{fmt}", lambda s: get_text_from_parser(s.file.path), (fmt,))
+            for fmt in FORMATS
+        ),
+        Stage("skills", lambda s: extract_skills(s.text)),
+        Stage("sections", lambda s: detector.validate_resume_structure(s.text)),
+        Stage(
+            "experience", lambda s: experience_parser.parse_experience_section(s.text)
+        ),
+        Stage("gaps", lambda s: gap_detector.analyze_resume(s.text, s.experience)),
+        Stage("grammar", lambda s: grammar.analyze_sections(s.sections)),
+        Stage(
+            "verbs",
+            lambda s: get_action_verb_engine().analyze_sections(verb_sections(s)),
+        ),
+        Stage("jd_matching", lambda s: matcher.match_resume_to_jd(s.resume_data, s.jd)),
+        Stage(
+            "feedback",
+            lambda s: feedback_gen.generate_comprehensive_feedback_with_grammar(
+                s.sections, s.validation
+            ),
+        ),
+        Stage("pdf", lambda s: render_pdf_bytes(s.report)),
+    ]
+    return {stage.name: stage for stage in stages}
+
+
+def benchmark_stage(
+    stage: Stage, samples: Sequence[Sample], repeat: int = 3, memory_runs: int = 3
+) -> Optional[Dict[str, Any]]:
+    """
+    Time `stage` over every sample it applies to, `repeat` times.
+
+    Returns:
+        Latency summary, throughput (calls and characters per second), peak
+        memory (KiB) and the raw timings; None if no sample applies.
+    """
+    applicable = [s for s in samples if s.file.format in stage.formats]
+    if not applicable:
+        return None
+    stage.run(applicable[0])  # warm-up: lazy models, templates, connections
+
+    timings = []
+    for _ in range(repeat):
+        for sample in applicable:
+            started = time.perf_counter_ns()
+            stage.run(sample)
+            timings.append((time.perf_counter_ns() - started) / 1e6)
+
+    total_s = sum(timings) / 1000
+    characters = sum(len(s.text) for s in applicable) * repeat
+    largest = sorted(applicable, key=lambda s: len(s.text), reverse=True)
+    peaks = [peak_kib(lambda: stage.run(s)) for s in largest[:memory_runs]]
+
+    return {
+        **summarize(timings),
+        "items": len(applicable),
+        "repeat": repeat,
+        "throughput_per_s": round(len(timings) / total_s, 3) if total_s else None,
+        "chars_per_s": round(characters / total_s) if total_s else None,
+        "peak_kib": max(peaks),
+        "samples_ms": [round(t, 3) for t in timings],
+    }
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            timeout=5,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def environment() -> Dict[str, Any]:
+    from src.feedback.feedback_generator import PDF_BACKEND
+
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpus": os.cpu_count(),
+        "commit": git_commit(),
+        "pdf_backend": PDF_BACKEND,
+    }
+
+
+def describe_corpus(files: Sequence[CorpusFile]) -> Dict[str, Any]:
+    pages = [f.pages for f in files]
+    return {
+        "files": len(files),
+        "by_format": dict(Counter(f.format for f in files)),
+        "pages": {"min": min(pages), "max": max(pages), "total": sum(pages)},
+        "bytes": sum(f.size for f in files),
+        "words": sum(len(f.resume.text.split()) for f in files),
+    }
+
+
+def run_suite(
+    count: int = 12,
+    seed: int = 42,
+    formats: Sequence[str] = FORMATS,
+    min_pages: int = 1,
+    max_pages: int = 20,
+    repeat: int = 3,
+    stages: Optional[Sequence[str]] = None,
+    grammar_latency: float = 0.0,
+    corpus_dir: Optional[Path] = None,
+) -> Dict[str, Any]:
+    """
+    Generate the corpus, benchmark the selected stages (default: all) and
+    return the JSON-ready results document.
+    """
+    with tempfile.TemporaryDirectory(prefix="bench-corpus-") as tmp:
+        files = generate_corpus(
+            corpus_dir or Path(tmp), count, seed, formats, min_pages, max_pages
+        )
+        jds = generate_job_descriptions(max(1, count // 3), seed)
+        samples = prepare_samples(files, jds)
+
+        with stub_grammar(grammar_latency) as grammar_url:
+            available = build_stages(grammar_url)
+            unknown = set(stages or ()) - set(available)
+            if unknown:
+                raise ValueError(
+                    f"Unknown stages {sorted(unknown)}; use {list(available)}"
+                )
+            results = {}
+            for name, stage in available.items():
+                if stages and name not in stages:
+                    continue
+                try:
+                    result = benchmark_stage(stage, samples, repeat)
+                except Exception as e:
+                    logger.error(f"Benchmark stage {name} failed: {e}")
+                    result = {"error": str(e) or type(e).__name__}
+                if result is not None:
+                    results[name] = result
+
+        return {
+            "schema": SCHEMA_VERSION,
+            "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "environment": environment(),
+            "config": {
+                "count": count,
+                "seed": seed,
+                "formats": list(formats),
+                "min_pages": min_pages,
+                "max_pages": max_pages,
+                "repeat": repeat,
+                "grammar_latency": grammar_latency,
+            },
+            "corpus": describe_corpus(files),
+            "stages": results,
+        }
+
+
+def format_table(results: Dict[str, Any]) -> str:
+    lines = [
+        f"{'stage':<13} {'n':>5} {'mean ms':>9} {'p50 ms':>9} {'p95 ms':>9} "
+        f"{'p99 ms':>9} {'ops/s':>9} {'peak KiB':>10}"
+    ]
+    for name, r in results["stages"].items():
+        if "error" in r:
+            lines.append(f"{name:<13} failed: {r['error']}")
+            continue
+        lines.append(
+            f"{name:<13} {r['count']:>5} {r['mean_ms']:>9} {r['p50_ms']:>9} "
+            f"{r['p95_ms']:>9} {r['p99_ms']:>9} {r['throughput_per_s']:>9} "
+            f"{r['peak_kib']:>10}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Benchmark every pipeline stage")
+    parser.add_argument("--count", type=int, default=12, help="resumes")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--formats", nargs="+", default=list(FORMATS))
+    parser.add_argument("--min-pages", type=int, default=1)
+    parser.add_argument("--max-pages", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--stages", nargs="+", help="default: all stages")
+    parser.add_argument(
+        "--grammar-latency", type=float, default=0.0, help="stub seconds per check"
+    )
+    parser.add_argument("--corpus-dir", type=Path, help="keep the corpus here")
+    parser.add_argument("--output", type=Path, help="write JSON results here")
+    parser.add_argument("--json", action="store_true", help="print JSON results")
+    parser.add_argument(
+        "--store", action="store_true", help="keep the run in BENCH_RESULTS_DIR"
+    )
+    parser.add_argument("--label", help="name for the stored run")
+    args = parser.parse_args(argv)
+
+    results = run_suite(
+        args.count,
+        args.seed,
+        args.formats,
+        args.min_pages,
+        args.max_pages,
+        args.repeat,
+        args.stages,
+        args.grammar_latency,
+        args.corpus_dir,
+    )
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(results, indent=2))
+        print(f"Results written to {args.output}", file=sys.stderr)
+    if args.store:
+        path = ResultStore().save(results, args.label)
+        print(f"Results stored as {path}", file=sys.stderr)
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print(format_table(results))
+
+
+if __name__ == "__main__":
+    main()
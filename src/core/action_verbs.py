@@ -2,51 +2,83 @@
 Action Verb Engine (Final - Test Compatible)
 Detects weak verbs and suggests stronger alternatives using spaCy lemmatization.
 Handles verbs and auxiliaries robustly for resume analysis.
+
+`analyze_sections` runs every section through a single `nlp.pipe` pass and
+analyzes each resulting Doc with the same token-level lookup as `suggest`,
+so batched and per-section results are identical.
 """
 
+from typing import Dict
+
 import spacy
 
+_shared_engine = None
+
+# Comprehensive weak → strong verb mapping
+WEAK_TO_STRONG = {
+    "did": "executed",
+    "do": "execute",
+    "done": "implemented",
+    "work": "developed",
+    "worked": "engineered",
+    "help": "assist",
+    "helped": "supported",
+    "helping": "collaborating",
+    "build": "construct",
+    "built": "architected",
+    "make": "create",
+    "made": "developed",
+    "use": "utilize",
+    "used": "leveraged",
+    "manage": "lead",
+    "managed": "supervised",
+    "create": "design",
+    "created": "engineered",
+}
+
 
 class ActionVerbEngine:
     """Analyzes resume text for weak verbs and suggests stronger replacements."""
 
-    def __init__(self):
-        try:
-            self.nlp = spacy.load("en_core_web_sm")
-        except Exception:
-            import spacy.cli
-
-            spacy.cli.download("en_core_web_sm")
-            self.nlp = spacy.load("en_core_web_sm")
-
-        # Comprehensive weak → strong verb mapping
-        self.weak_to_strong = {
-            "did": "executed",
-            "do": "execute",
-            "done": "implemented",
-            "work": "developed",
-            "worked": "engineered",
-            "help": "assist",
-            "helped": "supported",
-            "helping": "collaborating",
-            "build": "construct",
-            "built": "architected",
-            "make": "create",
-            "made": "developed",
-            "use": "utilize",
-            "used": "leveraged",
-            "manage": "lead",
-            "managed": "supervised",
-            "create": "design",
-            "created": "engineered",
-        }
+    def __init__(self, nlp=None):
+        if nlp is not None:
+            self.nlp = nlp
+        else:
+            try:
+                self.nlp = spacy.load("en_core_web_sm")
+            except Exception:
+                import spacy.cli
+
+                spacy.cli.download("en_core_web_sm")
+                self.nlp = spacy.load("en_core_web_sm")
+
+        self.weak_to_strong = dict(WEAK_TO_STRONG)
 
     def suggest(self, text: str):
         """Detect weak verbs and recommend stronger ones."""
-        doc = self.nlp(text)
+        return self._analyze_doc(self.nlp(text))
+
+    def analyze_sections(
+        self, sections: Dict[str, str], batch_size: int = 8
+    ) -> Dict[str, dict]:
+        """
+        Run `suggest` over several sections with one `nlp.pipe` pass.
+
+        Returns:
+            Section name -> the same result dictionary `suggest` returns.
+        """
+        names = list(sections)
+        docs = self.nlp.pipe(
+            (sections[name] or "" for name in names), batch_size=batch_size
+        )
+        return {name: self._analyze_doc(doc) for name, doc in zip(names, docs)}
+
+    def _analyze_doc(self, doc):
+        """Weak-verb analysis of one parsed Doc."""
         found, suggestions = [], []
         weak_count, total_verbs = 0, 0
-        lower_text = text.lower()
+        # Whole-token lookup: "used" must not match inside "focused"
+        doc_words = {token.lower_ for token in doc}
 
         for token in doc:
             # ✅ Include both VERB and AUX to cover “did”, “helped”, etc.
@@ -68,7 +100,7 @@ class ActionVerbEngine:
 
         # ✅ Secondary fallback: if spaCy missed verbs, check direct word matches
         for weak in self.weak_to_strong.keys():
-            if weak in lower_text and weak not in found:
+            if weak in doc_words and weak not in found:
                 found.append(weak)
                 suggestions.append(self.weak_to_strong[weak])
                 weak_count += 1
@@ -90,3 +122,11 @@ class ActionVerbEngine:
         penalty = (weak / total) * 100
         score = max(0.0, 100.0 - penalty * 1.2)
         return round(score, 2)
+
+
+def get_action_verb_engine() -> ActionVerbEngine:
+    """Process-wide engine, so the spaCy model is loaded once."""
+    global _shared_engine
+    if _shared_engine is None:
+        _shared_engine = ActionVerbEngine()
+    return _shared_engine
@@ -0,0 +1,201 @@
+"""
+Sentence-level Grammar Cache (DRA-60 performance)
+
+Resumes share a lot of boilerplate ("Responsible for...", template headers)
+and re-uploads re-check identical text. This cache stores LanguageTool
+matches per normalized sentence, with offsets relative to that sentence,
+so only sentences that were never seen before are sent to LanguageTool.
+
+Tiers:
+    1. In-memory LRU, bounded by entry count (GRAMMAR_CACHE_SIZE)
+    2. Optional SQLite file shared across restarts (GRAMMAR_CACHE_DB)
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+from collections import OrderedDict
+from dataclasses import asdict
+from typing import Dict, List, Optional, Tuple
+
+from src.core.grammar_client import GrammarMatch
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_SIZE = int(os.getenv("GRAMMAR_CACHE_SIZE", "4096"))
+DEFAULT_CACHE_DB = os.getenv("GRAMMAR_CACHE_DB") or None
+
+# A sentence ends at ., ! or ? followed by whitespace, or at a line break.
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+|\n+")
+_WHITESPACE_RUN = re.compile(r"\s+")
+
+
+def split_sentences(text: str) -> List[Tuple[int, int]]:
+    """Return [start, end) offsets of the non-blank sentences in `text`."""
+    spans = []
+    cursor = 0
+    for boundary in _SENTENCE_END.finditer(text):
+        if text[cursor : boundary.start()].strip():
+            spans.append((cursor, boundary.start()))
+        cursor = boundary.end()
+    if text[cursor:].strip():
+        spans.append((cursor, len(text)))
+    return spans
+
+
+def normalize_sentence(sentence: str) -> Tuple[str, List[int]]:
+    """
+    Strip and collapse whitespace runs to a single space.
+
+    Returns:
+        (normalized, index_map) where index_map[i] is the offset in
+        `sentence` of character i of `normalized` (plus one sentinel entry
+        for the end position).
+    """
+    normalized: List[str] = []
+    index_map: List[int] = []
+    stripped_start = len(sentence) - len(sentence.lstrip())
+    body = sentence.strip()
+    cursor = 0
+    for run in _WHITESPACE_RUN.finditer(body):
+        for i in range(cursor, run.start()):
+            normalized.append(body[i])
+            index_map.append(stripped_start + i)
+        normalized.append(" ")
+        index_map.append(stripped_start + run.start())
+        cursor = run.end()
+    for i in range(cursor, len(body)):
+        normalized.append(body[i])
+        index_map.append(stripped_start + i)
+    index_map.append(stripped_start + len(body))
+    return "".join(normalized), index_map
+
+
+def sentence_key(normalized: str, namespace: str = "") -> str:
+    """Stable cache key for a normalized sentence."""
+    return hashlib.sha256(f"{namespace}\x00{normalized}".encode("utf-8")).hexdigest()
+
+
+class GrammarCache:
+    """
+    Thread-safe LRU of sentence key -> list of GrammarMatch, with an
+    optional SQLite second tier.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_CACHE_SIZE, db_path: Optional[str] = None):
+        self.max_entries = max_entries
+        self.db_path = db_path
+        self._entries: "OrderedDict[str, List[GrammarMatch]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+        self.hits = 0
+        self.misses = 0
+        if db_path:
+            self._open_db(db_path)
+
+    def _open_db(self, db_path: str) -> None:
+        try:
+            self._db = sqlite3.connect(db_path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS grammar_cache "
+                "(key TEXT PRIMARY KEY, matches TEXT NOT NULL)"
+            )
+            self._db.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Grammar cache SQLite tier disabled: {e}")
+            self._db = None
+
+    def get(self, key: str) -> Optional[List[GrammarMatch]]:
+        """Return cached matches for `key`, or None on a miss."""
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+
+            matches = self._db_get(key)
+            if matches is None:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            self._remember(key, matches)
+            return matches
+
+    def put(self, key: str, matches: List[GrammarMatch]) -> None:
+        """Store matches (offsets relative to the normalized sentence)."""
+        with self._lock:
+            self._remember(key, matches)
+            self._db_put(key, matches)
+
+    def _remember(self, key: str, matches: List[GrammarMatch]) -> None:
+        self._entries[key] = matches
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _db_get(self, key: str) -> Optional[List[GrammarMatch]]:
+        if self._db is None:
+            return None
+        try:
+            row = self._db.execute(
+                "SELECT matches FROM grammar_cache WHERE key = ?", (key,)
+            ).fetchone()
+        except sqlite3.Error:
+            return None
+        if row is None:
+            return None
+        return [GrammarMatch(**m) for m in json.loads(row[0])]
+
+    def _db_put(self, key: str, matches: List[GrammarMatch]) -> None:
+        if self._db is None:
+            return
+        try:
+            self._db.execute(
+                "INSERT OR REPLACE INTO grammar_cache (key, matches) VALUES (?, ?)",
+                (key, json.dumps([asdict(m) for m in matches])),
+            )
+            self._db.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Grammar cache write failed: {e}")
+
+    def stats(self) -> Dict[str, float]:
+        """Hit/miss counters since creation (or the last `clear`)."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": len(self._entries),
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+    def clear(self) -> None:
+        """Drop every in-memory entry, the SQLite tier, and the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+            if self._db is not None:
+                self._db.execute("DELETE FROM grammar_cache")
+                self._db.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+
+_shared_cache: Optional[GrammarCache] = None
+
+
+def get_shared_cache() -> GrammarCache:
+    """Process-wide cache configured from GRAMMAR_CACHE_SIZE / GRAMMAR_CACHE_DB."""
+    global _shared_cache
+    if _shared_cache is None:
+        _shared_cache = GrammarCache(DEFAULT_CACHE_SIZE, DEFAULT_CACHE_DB)
+    return _shared_cache
@@ -0,0 +1,351 @@
+"""
+Batched Grammar Client (DRA-60 performance)
+
+Grammar checking used to send one LanguageTool request per resume section.
+This module joins all sections into a single request with a paragraph
+separator and maps every match offset back to the section it belongs to,
+so a whole resume costs one round trip.
+
+For large documents `AsyncGrammarClient` splits the joined text into a few
+size-bounded chunks and dispatches them concurrently over a pooled
+`httpx.AsyncClient`, bounded by a per-request time budget.
+`HttpGrammarTool` is the synchronous counterpart with LanguageTool's
+`check(text)` API, usable as a GrammarEngine tool.
+"""
+
+import asyncio
+import os
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+import httpx
+
+# Paragraph break: LanguageTool resets sentence context on blank lines.
+SECTION_SEPARATOR = "\n\n"
+
+LT_REMOTE_URL = os.getenv("LT_REMOTE_URL", "https://api.languagetool.org/")
+
+# api.languagetool.org rejects free requests above ~20KB of text
+DEFAULT_CHUNK_CHARS = int(os.getenv("LT_CHUNK_CHARS", "15000"))
+DEFAULT_BUDGET_SECONDS = float(os.getenv("LT_BUDGET_SECONDS", "8"))
+
+
+@dataclass
+class GrammarMatch:
+    """
+    LanguageTool-shaped match, normalized from either a
+    `language_tool_python.Match` or a `/v2/check` JSON match.
+
+    Attribute names follow `language_tool_python.Match` so code that reads
+    matches with getattr (GrammarEngine) works on both.
+    """
+
+    offset: int
+    errorLength: int
+    message: str = ""
+    replacements: List[str] = field(default_factory=list)
+    ruleIssueType: str = "grammar"
+    ruleId: str = ""
+    context: str = ""
+    sentence: str = ""
+
+    @classmethod
+    def from_tool_match(cls, match: Any) -> "GrammarMatch":
+        """Build from a language_tool_python Match (or any look-alike)."""
+        offset = getattr(match, "offset", None)
+        if offset is None:
+            offset = getattr(match, "fromPos", None) or 0
+        length = getattr(match, "errorLength", None)
+        if length is None:
+            # toPos is the end offset, not a length
+            to_pos = getattr(match, "toPos", None)
+            length = max(0, int(to_pos) - int(offset)) if to_pos is not None else 0
+        return cls(
+            offset=int(offset),
+            errorLength=int(length),
+            message=getattr(match, "message", None) or "",
+            replacements=list(getattr(match, "replacements", None) or []),
+            ruleIssueType=(
+                getattr(match, "ruleIssueType", None)
+                or getattr(match, "issueType", None)
+                or "grammar"
+            ),
+            ruleId=getattr(match, "ruleId", None) or "",
+            context=getattr(match, "context", None) or "",
+            sentence=getattr(match, "sentence", None) or "",
+        )
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> "GrammarMatch":
+        """Build from one entry of a LanguageTool `/v2/check` response."""
+        rule = data.get("rule") or {}
+        context = data.get("context") or {}
+        return cls(
+            offset=int(data.get("offset", 0)),
+            errorLength=int(data.get("length", 0)),
+            message=data.get("message", ""),
+            replacements=[r.get("value", "") for r in data.get("replacements", [])],
+            ruleIssueType=rule.get("issueType") or "grammar",
+            ruleId=rule.get("id", ""),
+            context=context.get("text", "") if isinstance(context, dict) else "",
+            sentence=data.get("sentence", ""),
+        )
+
+    def shifted(self, delta: int) -> "GrammarMatch":
+        """Copy of this match with its offset moved by `delta`."""
+        return GrammarMatch(
+            offset=self.offset + delta,
+            errorLength=self.errorLength,
+            message=self.message,
+            replacements=list(self.replacements),
+            ruleIssueType=self.ruleIssueType,
+            ruleId=self.ruleId,
+            context=self.context,
+            sentence=self.sentence,
+        )
+
+
+# (section name, start offset, end offset) inside a joined text
+Segment = Tuple[str, int, int]
+
+
+def join_sections(
+    sections: Dict[str, str], separator: str = SECTION_SEPARATOR
+) -> Tuple[str, List[Segment]]:
+    """
+    Join section texts into one document.
+
+    Returns:
+        (joined_text, segments) where each segment records the section name
+        and its [start, end) offsets in joined_text.
+    """
+    parts: List[str] = []
+    segments: List[Segment] = []
+    cursor = 0
+    for name, text in sections.items():
+        if parts:
+            parts.append(separator)
+            cursor += len(separator)
+        parts.append(text)
+        segments.append((name, cursor, cursor + len(text)))
+        cursor += len(text)
+    return "".join(parts), segments
+
+
+def remap_matches(
+    matches: List[Any], segments: List[Segment]
+) -> Dict[str, List[GrammarMatch]]:
+    """
+    Assign matches from a joined-text check to their sections.
+
+    Offsets are rebased to the start of the section. Matches that fall in
+    a separator or straddle two sections are dropped.
+    """
+    remapped: Dict[str, List[GrammarMatch]] = {name: [] for name, _, _ in segments}
+    if not segments:
+        return remapped
+
+    starts = [start for _, start, _ in segments]
+    for raw in matches:
+        match = raw if isinstance(raw, GrammarMatch) else GrammarMatch.from_tool_match(raw)
+        position = _segment_index(starts, match.offset)
+        if position < 0:
+            continue
+        name, start, end = segments[position]
+        if match.offset + match.errorLength > end:
+            continue
+        remapped[name].append(match.shifted(-start))
+    return remapped
+
+
+def _segment_index(starts: List[int], offset: int) -> int:
+    """Index of the last segment starting at or before `offset` (binary search)."""
+    lo, hi = 0, len(starts)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if starts[mid] <= offset:
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo - 1
+
+
+def check_sections(tool: Any, sections: Dict[str, str]) -> Dict[str, List[GrammarMatch]]:
+    """
+    Check all sections with a single `tool.check` call.
+
+    `tool` is anything with LanguageTool's `check(text) -> matches` API.
+    """
+    if not sections:
+        return {}
+    joined, segments = join_sections(sections)
+    return remap_matches(tool.check(joined), segments)
+
+
+def chunk_sections(
+    sections: Dict[str, str], max_chars: int = DEFAULT_CHUNK_CHARS
+) -> List[Dict[str, str]]:
+    """
+    Group sections into chunks whose joined length stays under `max_chars`.
+    A single section longer than `max_chars` becomes a chunk of its own.
+    """
+    chunks: List[Dict[str, str]] = []
+    current: Dict[str, str] = {}
+    size = 0
+    for name, text in sections.items():
+        extra = len(text) + (len(SECTION_SEPARATOR) if current else 0)
+        if current and size + extra > max_chars:
+            chunks.append(current)
+            current, size = {}, 0
+            extra = len(text)
+        current[name] = text
+        size += extra
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+class HttpGrammarTool:
+    """
+    Minimal synchronous `/v2/check` client with LanguageTool's
+    `check(text) -> matches` API over a pooled `httpx.Client`.
+    """
+
+    def __init__(
+        self,
+        base_url: str = LT_REMOTE_URL,
+        language: str = "en-US",
+        timeout: float = 10.0,
+        http_client: Optional[httpx.Client] = None,
+    ):
+        self.base_url = base_url.rstrip("/")
+        self.language = language
+        self._client = http_client or httpx.Client(timeout=timeout)
+
+    def check(self, text: str) -> List[GrammarMatch]:
+        response = self._client.post(
+            f"{self.base_url}/v2/check",
+            data={"text": text, "language": self.language},
+        )
+        response.raise_for_status()
+        return [GrammarMatch.from_json(m) for m in response.json().get("matches", [])]
+
+    def close(self) -> None:
+        self._client.close()
+
+
+@dataclass
+class BatchCheckResult:
+    """Per-section matches plus bookkeeping for a batched check."""
+
+    matches: Dict[str, List[GrammarMatch]]
+    requests: int = 0
+    timed_out_sections: List[str] = field(default_factory=list)
+    failed_sections: List[str] = field(default_factory=list)
+    elapsed_ms: float = 0.0
+
+    @property
+    def complete(self) -> bool:
+        return not self.timed_out_sections and not self.failed_sections
+
+
+class AsyncGrammarClient:
+    """
+    Concurrent LanguageTool HTTP client with a shared connection pool.
+
+    Usage:
+        async with AsyncGrammarClient() as client:
+            result = await client.check_sections(sections)
+    """
+
+    def __init__(
+        self,
+        base_url: str = LT_REMOTE_URL,
+        language: str = "en-US",
+        max_connections: int = 4,
+        chunk_chars: int = DEFAULT_CHUNK_CHARS,
+        request_timeout: float = 10.0,
+        budget_seconds: float = DEFAULT_BUDGET_SECONDS,
+        http_client: Optional[httpx.AsyncClient] = None,
+    ):
+        self.base_url = base_url.rstrip("/")
+        self.language = language
+        self.max_connections = max_connections
+        self.chunk_chars = chunk_chars
+        self.request_timeout = request_timeout
+        self.budget_seconds = budget_seconds
+        self._client = http_client
+        self._owns_client = http_client is None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=self.request_timeout,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections,
+                ),
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        if self._client is not None and self._owns_client:
+            await self._client.aclose()
+        self._client = None
+
+    async def __aenter__(self):
+        self._get_client()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+
+    async def check_text(self, text: str) -> List[GrammarMatch]:
+        """POST one text to `/v2/check` and return normalized matches."""
+        response = await self._get_client().post(
+            f"{self.base_url}/v2/check",
+            data={"text": text, "language": self.language},
+        )
+        response.raise_for_status()
+        return [GrammarMatch.from_json(m) for m in response.json().get("matches", [])]
+
+    async def check_sections(
+        self,
+        sections: Dict[str, str],
+        budget_seconds: Optional[float] = None,
+    ) -> BatchCheckResult:
+        """
+        Check all sections, one request per chunk, chunks in parallel.
+
+        Sections whose chunk has not finished when the time budget runs out
+        are listed in `timed_out_sections`; sections whose request failed
+        are listed in `failed_sections`. Both get no matches.
+        """
+        budget = self.budget_seconds if budget_seconds is None else budget_seconds
+        started = time.perf_counter()
+        chunks = chunk_sections(sections, self.chunk_chars)
+        result = BatchCheckResult(
+            matches={name: [] for name in sections}, requests=len(chunks)
+        )
+        if not chunks:
+            return result
+
+        async def run(chunk: Dict[str, str]) -> Dict[str, List[GrammarMatch]]:
+            joined, segments = join_sections(chunk)
+            return remap_matches(await self.check_text(joined), segments)
+
+        tasks = {asyncio.ensure_future(run(chunk)): chunk for chunk in chunks}
+        done, pending = await asyncio.wait(tasks, timeout=budget)
+
+        for task in pending:
+            task.cancel()
+            result.timed_out_sections.extend(tasks[task])
+        for task in done:
+            if task.exception() is not None:
+                result.failed_sections.extend(tasks[task])
+                continue
+            result.matches.update(task.result())
+
+        result.elapsed_ms = round((time.perf_counter() - started) * 1000, 2)
+        return result
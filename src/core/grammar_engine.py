@@ -1,10 +1,40 @@
 """
 Grammar Engine using LanguageTool (remote by default) with CI-safe mocking.
 Implements DRA-60: Grammar and spelling analysis.
+
+When a CircuitBreaker is attached, every LanguageTool call is bounded by the
+breaker timeout and skipped while the breaker is open. Results produced
+without a complete check are marked "degraded" (with "degraded_reason");
+with a sentence cache they still carry the matches of cached sentences.
+Sections that were not (fully) checked are listed in "unchecked_sections"
+and left unscored (score None) instead of counting as error-free.
+
+Backends (GRAMMAR_BACKEND): "languagetool" (default; remote API or a local
+Java server per USE_REMOTE_LT) or "local" (the in-process rule-based
+checker in src.core.local_grammar). With a `fallback` tool, sentences the
+primary backend could not check are checked by the fallback instead of
+being left unscored.
 """
 
+import asyncio
+import dataclasses
 import os
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Sequence, Tuple
+
+from src.core.grammar_client import (
+    LT_REMOTE_URL,
+    AsyncGrammarClient,
+    GrammarMatch,
+    check_sections,
+)
+from src.core.grammar_cache import (
+    GrammarCache,
+    normalize_sentence,
+    sentence_key,
+    split_sentences,
+)
+from src.core.local_grammar import get_local_tool
+from src.utils.circuit_breaker import CallTimeoutError, CircuitBreaker, CircuitOpenError
 
 _language_tool = None
 
@@ -18,6 +48,8 @@ IS_CI = (
 if IS_CI:
     USE_REAL_GRAMMAR = os.getenv("USE_REAL_GRAMMAR", "false").lower() == "true"
 
+GRAMMAR_BACKEND = os.getenv("GRAMMAR_BACKEND", "languagetool").lower()
+
 
 class _MockTool:
     """Fast mock for CI runs (no API calls)."""
@@ -39,28 +71,77 @@ def _get_tool():
         _language_tool = _MockTool()
         return _language_tool
 
+    if GRAMMAR_BACKEND == "local":
+        _language_tool = get_local_tool()
+        return _language_tool
+
     try:
         import language_tool_python
 
         remote = os.getenv("USE_REMOTE_LT", "true").lower() == "true"
         if remote:
             _language_tool = language_tool_python.LanguageTool(
-                "en-US", remote_server="https://api.languagetool.org/"
+                "en-US", remote_server=LT_REMOTE_URL
             )
         else:
             _language_tool = language_tool_python.LanguageTool("en-US")
 
     except Exception:
-        _language_tool = _MockTool()
+        # No network/JVM: score with the local checker rather than zero errors
+        _language_tool = get_local_tool()
 
     return _language_tool
 
 
+def shutdown_tool():
+    """
+    Close the shared grammar tool (stops a local LanguageTool server) and
+    forget it, so the next `_get_tool()` call starts a fresh one.
+    Only the managed grammar service should call this.
+    """
+    global _language_tool
+    tool, _language_tool = _language_tool, None
+    if tool is not None:
+        try:
+            tool.close()
+        except Exception:
+            pass
+
+
+def degraded_reason(error: Exception) -> str:
+    """Short label for why a grammar check did not complete."""
+    if isinstance(error, CircuitOpenError):
+        return "circuit_open"
+    if isinstance(error, CallTimeoutError):
+        return "timeout"
+    return "error"
+
+
+class _GuardedTool:
+    """Routes `check` calls of a grammar tool through a circuit breaker."""
+
+    def __init__(self, tool, breaker: CircuitBreaker):
+        self._tool = tool
+        self._breaker = breaker
+
+    def check(self, text: str):
+        return self._breaker.call(self._tool.check, text)
+
+
 class GrammarEngine:
     """Lightweight grammar and spelling checker."""
 
-    def __init__(self, language: str = "en-US"):
+    def __init__(
+        self,
+        language: str = "en-US",
+        cache: Optional[GrammarCache] = None,
+        breaker: Optional[CircuitBreaker] = None,
+        fallback=None,
+    ):
         self.language = language
+        self.cache = cache
+        self.breaker = breaker
+        self.fallback = fallback
         self._tool = None
 
     @property
@@ -69,6 +150,12 @@ class GrammarEngine:
             self._tool = _get_tool()
         return self._tool
 
+    def _checker(self):
+        """The tool to send checks to (guarded by the breaker if attached)."""
+        if self.breaker is None:
+            return self.tool
+        return _GuardedTool(self.tool, self.breaker)
+
     def analyze_text(self, text: str, max_errors: int = 10) -> Dict[str, Any]:
         """
         Analyze text for grammar and spelling issues.
@@ -79,11 +166,137 @@ class GrammarEngine:
         if not isinstance(text, str) or not text.strip():
             raise ValueError("Text cannot be empty")
 
+        section_matches, cache_stats, degraded, unchecked = self._check_matches(
+            {"text": text}
+        )
+        result = self._build_result(text, section_matches.get("text", []), max_errors)
+        if unchecked:
+            result["score"] = None
+            result["unchecked"] = True
+        return self._annotate(result, cache_stats, degraded)
+
+    def _check_matches(
+        self, texts: Dict[str, str]
+    ) -> Tuple[
+        Dict[str, List[Any]], Optional[Dict[str, Any]], Optional[str], List[str]
+    ]:
+        """
+        Per-section matches for `texts`, through the sentence cache if enabled.
+
+        Never raises for backend failures. Returns
+        (matches, cache_stats, degraded_reason, unchecked); degraded_reason is
+        None when every text was fully checked, `unchecked` names the texts
+        that neither the backend nor the fallback checked completely.
+        """
+        if self.cache is not None:
+            return self._check_cached(texts)
+        try:
+            return check_sections(self._checker(), texts), None, None, []
+        except Exception as e:
+            matches = self._check_fallback(texts)
+            if matches is None:
+                return {}, None, degraded_reason(e), list(texts)
+            return matches, None, degraded_reason(e), []
+
+    def _check_fallback(
+        self, texts: Dict[str, str]
+    ) -> Optional[Dict[str, List[GrammarMatch]]]:
+        """Matches from the fallback tool, or None if there is no usable one."""
+        if self.fallback is None:
+            return None
         try:
-            matches = self.tool.check(text)
+            return check_sections(self.fallback, texts)
         except Exception:
-            matches = []
+            return None
+
+    def _annotate(
+        self,
+        result: Dict[str, Any],
+        cache_stats: Optional[Dict[str, Any]],
+        degraded: Optional[str],
+    ) -> Dict[str, Any]:
+        if cache_stats is not None:
+            result["cache"] = cache_stats
+        if degraded is not None:
+            result["degraded"] = True
+            result["degraded_reason"] = degraded
+            if self.fallback is not None:
+                result["fallback"] = type(self.fallback).__name__
+        return result
+
+    def _check_cached(
+        self, texts: Dict[str, str]
+    ) -> Tuple[Dict[str, List[GrammarMatch]], Dict[str, Any], Optional[str], List[str]]:
+        """
+        Check `texts` sentence by sentence, sending only uncached sentences.
 
+        Cached matches are stored relative to the normalized sentence and
+        mapped back to offsets in the original section text here. Uncached
+        sentences go to LanguageTool in a single joined request; if that
+        request fails, the cached sentences are still returned (partial).
+        """
+        namespace = f"{self.language}:{type(self.tool).__name__}"
+        plan = []  # (section name, sentence start, index_map, key)
+        resolved: Dict[str, List[GrammarMatch]] = {}
+        pending: Dict[str, str] = {}
+        hits = misses = 0
+
+        for name, text in texts.items():
+            for start, end in split_sentences(text):
+                normalized, index_map = normalize_sentence(text[start:end])
+                key = sentence_key(normalized, namespace)
+                plan.append((name, start, index_map, key))
+                if key in resolved or key in pending:
+                    hits += 1
+                    continue
+                cached = self.cache.get(key)
+                if cached is None:
+                    pending[key] = normalized
+                    misses += 1
+                else:
+                    resolved[key] = cached
+                    hits += 1
+
+        degraded = None
+        if pending:
+            try:
+                checked = check_sections(self._checker(), pending)
+            except Exception as e:
+                degraded = degraded_reason(e)
+                # Fallback matches are not cached under this backend's namespace
+                resolved.update(self._check_fallback(pending) or {})
+            else:
+                for key, matches in checked.items():
+                    self.cache.put(key, matches)
+                    resolved[key] = matches
+
+        results: Dict[str, List[GrammarMatch]] = {name: [] for name in texts}
+        for name, start, index_map, key in plan:
+            last = len(index_map) - 1
+            for m in resolved.get(key, []):
+                begin = index_map[min(m.offset, last)]
+                stop_norm = min(m.offset + m.errorLength, last)
+                stop = index_map[stop_norm - 1] + 1 if stop_norm > m.offset else begin
+                results[name].append(
+                    dataclasses.replace(m, offset=start + begin, errorLength=stop - begin)
+                )
+
+        lookups = hits + misses
+        stats = {
+            "sentences": lookups,
+            "hits": hits,
+            "misses": misses,
+            "hit_ratio": round(hits / lookups, 4) if lookups else 0.0,
+        }
+        unchecked = sorted({name for name, _, _, key in plan if key not in resolved})
+        if degraded is not None:
+            stats["unchecked"] = sum(1 for key in pending if key not in resolved)
+        return results, stats, degraded, unchecked
+
+    def _build_result(
+        self, text: str, matches: List[Any], max_errors: int = 10
+    ) -> Dict[str, Any]:
+        """Turn LanguageTool matches for `text` into the analysis dictionary."""
         total_errors = len(matches)
         limited = matches[:max_errors]
 
@@ -96,7 +309,9 @@ class GrammarEngine:
                 or getattr(m, "issueType", None)
                 or "grammar"
             )
-            offset = getattr(m, "offset", None) or getattr(m, "fromPos", None)
+            offset = getattr(m, "offset", None)
+            if offset is None:
+                offset = getattr(m, "fromPos", None)
             length = getattr(m, "errorLength", None) or getattr(m, "toPos", None) or 0
             message = getattr(m, "message", None) or ""
 
@@ -126,10 +341,83 @@ class GrammarEngine:
     def analyze_sections(self, sections: dict, max_errors: int = 10) -> dict:
         """
         Analyze multiple resume sections and combine results.
+
+        All non-empty sections are sent to LanguageTool as one joined text
+        (one round trip); match offsets are mapped back per section.
+        """
+        texts = self._checkable_sections(sections)
+        matches, cache_stats, degraded, unchecked = self._check_matches(texts)
+        result = self._combine_sections(sections, matches, max_errors, unchecked)
+        return self._annotate(result, cache_stats, degraded)
+
+    async def analyze_sections_async(
+        self,
+        sections: dict,
+        max_errors: int = 10,
+        client: Optional[AsyncGrammarClient] = None,
+        budget_seconds: Optional[float] = None,
+    ) -> dict:
+        """
+        Async variant of `analyze_sections` bounded by a time budget.
+
+        With `client` the sections are dispatched as concurrent HTTP chunks
+        over its connection pool; otherwise the single batched check runs
+        in a worker thread. Sections not checked within the budget are
+        listed under "timed_out_sections" and left unscored.
+        """
+        texts = self._checkable_sections(sections)
+        timed_out: List[str] = []
+        unchecked: List[str] = []
+        cache_stats = degraded = None
+
+        if client is not None:
+            batch = await client.check_sections(texts, budget_seconds=budget_seconds)
+            matches = batch.matches
+            timed_out = batch.timed_out_sections + batch.failed_sections
+            if batch.timed_out_sections:
+                degraded = "timeout"
+            elif batch.failed_sections:
+                degraded = "error"
+        else:
+            try:
+                matches, cache_stats, degraded, unchecked = await asyncio.wait_for(
+                    asyncio.to_thread(self._check_matches, texts),
+                    timeout=budget_seconds,
+                )
+            except asyncio.TimeoutError:
+                matches, timed_out, degraded = {}, list(texts), "timeout"
+
+        result = self._combine_sections(
+            sections, matches, max_errors, sorted(set(unchecked) | set(timed_out))
+        )
+        result["timed_out_sections"] = timed_out
+        return self._annotate(result, cache_stats, degraded)
+
+    def _checkable_sections(self, sections: dict) -> Dict[str, str]:
+        """Sections that have text worth sending to LanguageTool."""
+        return {
+            name: text
+            for name, text in sections.items()
+            if isinstance(text, str) and text.strip()
+        }
+
+    def _combine_sections(
+        self,
+        sections: dict,
+        matches: Dict[str, List[Any]],
+        max_errors: int,
+        unchecked: Sequence[str] = (),
+    ) -> dict:
+        """
+        Build per-section results and the overall score from matches.
+
+        `unchecked` sections keep whatever matches they have but are not
+        scored; the overall score is None when no section was checked.
         """
         section_results = {}
         total_errors = 0
         weighted_scores = []
+        checked = 0
 
         for name, text in sections.items():
             if not isinstance(text, str) or not text.strip():
@@ -137,20 +425,33 @@ class GrammarEngine:
                 weighted_scores.append(0)
                 continue
 
-            res = self.analyze_text(text, max_errors=max_errors)
+            res = self._build_result(text, matches.get(name, []), max_errors)
             section_results[name] = res
             total_errors += res["total_errors"]
+            if name in unchecked:
+                res["score"] = None
+                res["unchecked"] = True
+                continue
+            checked += 1
             weighted_scores.append(res["score"])
 
-        overall_score = (
-            int(sum(weighted_scores) / len(weighted_scores)) if weighted_scores else 0
-        )
+        if unchecked and not checked:
+            overall_score = None
+        else:
+            overall_score = (
+                int(sum(weighted_scores) / len(weighted_scores))
+                if weighted_scores
+                else 0
+            )
 
-        return {
+        result = {
             "overall_score": overall_score,
             "section_results": section_results,
             "total_errors": total_errors,
         }
+        if unchecked:
+            result["unchecked_sections"] = list(unchecked)
+        return result
 
     def _calculate_score(self, total_errors: int, word_count: int) -> float:
         """
@@ -164,11 +465,14 @@ class GrammarEngine:
         return round(score, 2)
 
     def close(self):
-        try:
-            if self._tool is not None:
-                self._tool.close()
-        except Exception:
-            pass
+        """
+        Release this engine's reference to the grammar tool.
+
+        The tool itself is shared by every engine in the process (and may be
+        a local Java server), so it is not shut down here; see
+        `shutdown_tool` / `GrammarService.stop`.
+        """
+        self._tool = None
 
     def __enter__(self):
         return self
@@ -1,14 +1,54 @@
 """
 Integrates grammar analysis into feedback pipeline (CI-safe and backward-compatible).
+
+Grammar analysis runs under a hard per-request latency budget
+(FEEDBACK_GRAMMAR_BUDGET_SECONDS, 0 disables it): if it has not finished in
+time the feedback is returned with a degraded grammar block instead of
+waiting for LanguageTool.
+
+A degraded grammar result (budget exceeded, breaker open, backend failure)
+is not blended into the overall score: the base score is kept, and
+sections that were not checked are reported unscored.
 """
 
-from typing import Dict, Any
-from src.core.grammar_engine import GrammarEngine
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Dict, Any, Optional
+from src.core.grammar_service import grammar_service
+
+logger = logging.getLogger(__name__)
+
+GRAMMAR_BUDGET_SECONDS = float(os.getenv("FEEDBACK_GRAMMAR_BUDGET_SECONDS", "5"))
+
+_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="grammar-budget")
+
+
+def _analyze_sections(sections: Dict[str, str]) -> Dict[str, Any]:
+    # Borrow the process-wide engine; its lifecycle belongs to the service
+    with grammar_service.borrow() as engine:
+        return engine.analyze_sections(sections)
+
+
+def _analyze_within_budget(
+    sections: Dict[str, str], budget_seconds: float
+) -> Optional[Dict[str, Any]]:
+    """Run the analysis, giving up after `budget_seconds` (None on timeout)."""
+    if budget_seconds <= 0:
+        return _analyze_sections(sections)
+    future = _executor.submit(_analyze_sections, sections)
+    try:
+        return future.result(timeout=budget_seconds)
+    except FutureTimeoutError:
+        logger.warning(f"Grammar analysis exceeded {budget_seconds}s budget")
+        return None
 
 
 def enhance_feedback_with_grammar(
     sections: Dict[str, str] = None,
     base_feedback: Dict[str, Any] = None,
+    budget_seconds: Optional[float] = None,
     **kwargs,
 ) -> Dict[str, Any]:
     """
@@ -16,7 +56,9 @@ def enhance_feedback_with_grammar(
 
     Supports both `sections` and `parsed_sections` naming for backward compatibility.
     Safely handles missing keys like `suggestions`.
+    `budget_seconds` overrides GRAMMAR_BUDGET_SECONDS for this call.
     """
+    budget = GRAMMAR_BUDGET_SECONDS if budget_seconds is None else budget_seconds
     sections = sections or kwargs.get("parsed_sections") or {}
     base_feedback = (
         base_feedback or kwargs.get("feedback") or kwargs.get("existing_feedback") or {}
@@ -29,15 +71,35 @@ def enhance_feedback_with_grammar(
     }
 
     try:
-        engine = GrammarEngine()
-        analysis = engine.analyze_sections(sections)
+        analysis = _analyze_within_budget(sections, budget)
+        if analysis is None:
+            enhanced["grammar"] = {
+                "score": None,
+                "total_errors": 0,
+                "unchecked_sections": [
+                    name
+                    for name, text in sections.items()
+                    if isinstance(text, str) and text.strip()
+                ],
+                "degraded": True,
+                "degraded_reason": "budget_exceeded",
+                "message": "Grammar analysis skipped: latency budget exceeded",
+            }
+            return enhanced
 
         grammar_block = {
-            "score": analysis.get("overall_score", 0),
+            "score": analysis.get("overall_score"),
             "total_errors": analysis.get("total_errors", 0),
             "section_analysis": analysis.get("section_results", {}),
             "top_errors": [],
         }
+        if analysis.get("cache"):
+            grammar_block["cache"] = analysis["cache"]
+        if analysis.get("degraded"):
+            grammar_block["degraded"] = True
+            grammar_block["degraded_reason"] = analysis.get("degraded_reason")
+        if analysis.get("unchecked_sections"):
+            grammar_block["unchecked_sections"] = analysis["unchecked_sections"]
 
         # Flatten top 5 errors from all sections
         top = []
@@ -53,16 +115,13 @@ def enhance_feedback_with_grammar(
                 )
         grammar_block["top_errors"] = top[:5]
 
-        # ✅ Weighted average for final score
-        base_score = int(enhanced.get("overall_score", 0))
-        combined_score = int(base_score * 0.7 + grammar_block["score"] * 0.3)
-
-        enhanced.update(
-            {
-                "grammar": grammar_block,
-                "overall_score": combined_score,
-            }
-        )
+        enhanced["grammar"] = grammar_block
+        # ✅ Weighted average for final score (a degraded check keeps the base)
+        if not grammar_block.get("degraded") and grammar_block["score"] is not None:
+            base_score = int(enhanced.get("overall_score", 0))
+            enhanced["overall_score"] = int(
+                base_score * 0.7 + grammar_block["score"] * 0.3
+            )
 
     except Exception as exc:
         enhanced["grammar"] = {
@@ -72,10 +131,4 @@ def enhance_feedback_with_grammar(
             "message": "Grammar analysis unavailable",
         }
 
-    finally:
-        try:
-            engine.close()
-        except Exception:
-            pass
-
     return enhanced
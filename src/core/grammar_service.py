@@ -0,0 +1,178 @@
+"""
+Managed Grammar Service (DRA-60 lifecycle)
+
+Owns the single GrammarEngine of the process. The service is started once at
+app startup, health-checked in the background, restarted automatically when
+the grammar backend stops answering, and shut down once at app shutdown.
+Request code only borrows the engine:
+
+    with grammar_service.borrow() as engine:
+        engine.analyze_sections(sections)
+
+This keeps a local LanguageTool (Java) server alive across requests instead
+of starting and killing it for every feedback call.
+
+Grammar checks go through one CircuitBreaker shared by every engine the
+service creates, configured from GRAMMAR_BREAKER_TIMEOUT, _ERROR_RATE,
+_MIN_CALLS, _WINDOW and _COOLDOWN. While the breaker is open or a check
+fails, the in-process rule-based checker scores the text instead
+(GRAMMAR_FALLBACK=none disables this).
+"""
+
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Optional
+
+from src.core import grammar_engine
+from src.core.grammar_cache import get_shared_cache
+from src.core.grammar_engine import GrammarEngine
+from src.core.local_grammar import get_local_tool
+from src.utils.circuit_breaker import CircuitBreaker, breaker_from_env
+
+logger = logging.getLogger(__name__)
+
+HEALTH_CHECK_INTERVAL = float(os.getenv("GRAMMAR_HEALTH_INTERVAL", "60"))
+HEALTH_PROBE_TEXT = "This is a simple sentence."
+USE_LOCAL_FALLBACK = os.getenv("GRAMMAR_FALLBACK", "local").lower() == "local"
+
+
+class GrammarService:
+    """Start/stop, health-check and restart the shared GrammarEngine."""
+
+    def __init__(
+        self,
+        language: str = "en-US",
+        health_interval: float = HEALTH_CHECK_INTERVAL,
+        max_failures: int = 1,
+        breaker: Optional[CircuitBreaker] = None,
+    ):
+        self.language = language
+        self.breaker = breaker or breaker_from_env("GRAMMAR_BREAKER", "languagetool")
+        self.health_interval = health_interval
+        self.max_failures = max_failures
+        self._engine: Optional[GrammarEngine] = None
+        self._lock = threading.RLock()
+        self._stop_event = threading.Event()
+        self._health_thread: Optional[threading.Thread] = None
+        self._consecutive_failures = 0
+        self.restarts = 0
+        self.last_error: Optional[str] = None
+        self.last_check: Optional[float] = None
+
+    @property
+    def running(self) -> bool:
+        return self._engine is not None
+
+    def start(self) -> GrammarEngine:
+        """Create the engine and warm up the grammar tool (idempotent)."""
+        with self._lock:
+            if self._engine is None:
+                engine = self._new_engine()
+                _ = engine.tool  # starts the local server / remote client now
+                self._engine = engine
+                logger.info("Grammar service started (%s)", type(engine.tool).__name__)
+            self._start_health_thread()
+            return self._engine
+
+    def stop(self) -> None:
+        """Stop health checks and shut the grammar tool down (idempotent)."""
+        self._stop_event.set()
+        thread = self._health_thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=5)
+        self._health_thread = None
+        with self._lock:
+            if self._engine is not None:
+                self._engine.close()
+                self._engine = None
+            grammar_engine.shutdown_tool()
+        logger.info("Grammar service stopped")
+
+    def restart(self, reason: str = "") -> GrammarEngine:
+        """Replace the grammar tool with a fresh one."""
+        with self._lock:
+            logger.warning("Restarting grammar service: %s", reason or "requested")
+            if self._engine is not None:
+                self._engine.close()
+                self._engine = None
+            grammar_engine.shutdown_tool()
+            self.restarts += 1
+            self._consecutive_failures = 0
+            engine = self._new_engine()
+            _ = engine.tool
+            self._engine = engine
+            return engine
+
+    def _new_engine(self) -> GrammarEngine:
+        return GrammarEngine(
+            self.language,
+            cache=get_shared_cache(),
+            breaker=self.breaker,
+            fallback=get_local_tool() if USE_LOCAL_FALLBACK else None,
+        )
+
+    @contextmanager
+    def borrow(self):
+        """
+        Lend the shared engine to a caller. Starts the service lazily when
+        used outside the app lifecycle (scripts, tests). Never closes it.
+        """
+        engine = self._engine or self.start()
+        yield engine
+
+    def health_check(self) -> bool:
+        """Probe the grammar tool once; restart it after repeated failures."""
+        self.last_check = time.time()
+        try:
+            with self.borrow() as engine:
+                # Through the breaker so a hung backend times out instead of
+                # blocking this thread (and with it the restart) forever
+                engine._checker().check(HEALTH_PROBE_TEXT)
+        except Exception as e:
+            self._consecutive_failures += 1
+            self.last_error = str(e)
+            logger.error(f"Grammar health check failed: {e}")
+            if self._consecutive_failures >= self.max_failures:
+                try:
+                    self.restart(reason=str(e))
+                except Exception as restart_error:
+                    self.last_error = str(restart_error)
+                    logger.error(f"Grammar service restart failed: {restart_error}")
+            return False
+
+        self._consecutive_failures = 0
+        return True
+
+    def status(self) -> Dict[str, Any]:
+        engine = self._engine
+        return {
+            "running": engine is not None,
+            "backend": type(engine.tool).__name__ if engine is not None else None,
+            "restarts": self.restarts,
+            "consecutive_failures": self._consecutive_failures,
+            "last_error": self.last_error,
+            "last_check": self.last_check,
+            "breaker": self.breaker.status(),
+        }
+
+    def _start_health_thread(self) -> None:
+        if self.health_interval <= 0:
+            return
+        if self._health_thread is not None and self._health_thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._health_thread = threading.Thread(
+            target=self._health_loop, name="grammar-health", daemon=True
+        )
+        self._health_thread.start()
+
+    def _health_loop(self) -> None:
+        while not self._stop_event.wait(self.health_interval):
+            self.health_check()
+
+
+# The one service instance per process, started/stopped by src.main
+grammar_service = GrammarService()
@@ -0,0 +1,260 @@
+"""
+Local LanguageTool Stub Server (DRA-60 testing)
+
+A tiny HTTP server speaking the LanguageTool `/v2/check` protocol, for
+exercising the grammar path offline: slow responses, rate limiting, server
+errors and dropped connections can all be switched on at runtime.
+
+The stub flags a handful of common misspellings and repeated words, so
+responses carry realistic matches without a Java server.
+
+Usage (tests):
+    with LanguageToolStub(latency=0.5) as stub:
+        tool = HttpGrammarTool(stub.url)
+
+Usage (manual):
+    python -m src.core.languagetool_stub --port 8081 --latency 0.2
+"""
+
+import argparse
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional
+from urllib.parse import parse_qs
+
+# Misspelling -> suggested replacement
+COMMON_MISSPELLINGS = {
+    "teh": "the",
+    "recieve": "receive",
+    "recieved": "received",
+    "acheive": "achieve",
+    "acheived": "achieved",
+    "managment": "management",
+    "responsable": "responsible",
+    "succesful": "successful",
+    "developement": "development",
+    "experiance": "experience",
+    "seperate": "separate",
+    "occured": "occurred",
+}
+
+# Rule id -> LanguageTool category id (language_tool_python requires one)
+RULE_CATEGORIES = {
+    "MORFOLOGIK_RULE_EN_US": "TYPOS",
+    "ENGLISH_WORD_REPEAT_RULE": "MISC",
+}
+
+_WORD = re.compile(r"[A-Za-z']+")
+
+
+def stub_matches(text: str) -> List[Dict[str, Any]]:
+    """LanguageTool-shaped JSON matches for `text`."""
+    matches = []
+    previous = None
+    for word in _WORD.finditer(text):
+        lower = word.group(0).lower()
+        if lower in COMMON_MISSPELLINGS:
+            matches.append(
+                _match(
+                    text,
+                    word.start(),
+                    word.end(),
+                    "Possible spelling mistake found.",
+                    [COMMON_MISSPELLINGS[lower]],
+                    "MORFOLOGIK_RULE_EN_US",
+                    "misspelling",
+                )
+            )
+        elif previous is not None and lower == previous.group(0).lower():
+            matches.append(
+                _match(
+                    text,
+                    previous.start(),
+                    word.end(),
+                    "Possible typo: you repeated a word.",
+                    [word.group(0)],
+                    "ENGLISH_WORD_REPEAT_RULE",
+                    "duplication",
+                )
+            )
+        previous = word
+    return matches
+
+
+def _match(
+    text: str,
+    start: int,
+    end: int,
+    message: str,
+    replacements: List[str],
+    rule_id: str,
+    issue_type: str,
+) -> Dict[str, Any]:
+    context_start = max(0, start - 20)
+    return {
+        "message": message,
+        "offset": start,
+        "length": end - start,
+        "replacements": [{"value": r} for r in replacements],
+        "context": {
+            "text": text[context_start : end + 20],
+            "offset": start - context_start,
+            "length": end - start,
+        },
+        "sentence": text,
+        "rule": {
+            "id": rule_id,
+            "issueType": issue_type,
+            "category": {"id": RULE_CATEGORIES[rule_id], "name": "Stub"},
+        },
+    }
+
+
+class LanguageToolStub:
+    """
+    Threaded stub server. Failure knobs can be changed while it runs:
+
+    Attributes:
+        latency: Seconds to sleep before answering each check.
+        failure_rate: Probability (0..1) that a check fails with `fail_status`.
+        fail_status: HTTP status used for injected failures (e.g. 429, 503).
+        drop_connections: Close the socket without any response.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0.0,
+        failure_rate: float = 0.0,
+        fail_status: int = 503,
+        seed: Optional[int] = None,
+    ):
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self.fail_status = fail_status
+        self.drop_connections = False
+        self.requests = 0
+        self.failures = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "LanguageToolStub":
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._server.serve_forever, name="lt-stub", daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join(timeout=5)
+            self._thread = None
+        self._server.server_close()
+
+    def __enter__(self) -> "LanguageToolStub":
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+    def _should_fail(self) -> bool:
+        with self._lock:
+            self.requests += 1
+            failed = self._random.random() < self.failure_rate
+            if failed:
+                self.failures += 1
+            return failed
+
+    def _handler_class(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format, *args):  # keep test output quiet
+                return
+
+            def _send_json(self, status: int, payload: Any) -> None:
+                body = json.dumps(payload).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_GET(self):
+                if self.path.rstrip("/") == "/v2/languages":
+                    self._send_json(
+                        200,
+                        [{"name": "English (US)", "code": "en", "longCode": "en-US"}],
+                    )
+                else:
+                    self._send_json(404, {"error": "not found"})
+
+            def do_POST(self):
+                if self.path.rstrip("/") != "/v2/check":
+                    self._send_json(404, {"error": "not found"})
+                    return
+
+                length = int(self.headers.get("Content-Length") or 0)
+                form = parse_qs(self.rfile.read(length).decode("utf-8"))
+                text = (form.get("text") or [""])[0]
+
+                if stub.latency > 0:
+                    time.sleep(stub.latency)
+                if stub.drop_connections:
+                    self.close_connection = True
+                    self.connection.close()
+                    return
+                if stub._should_fail():
+                    self._send_json(stub.fail_status, {"error": "injected failure"})
+                    return
+
+                self._send_json(
+                    200,
+                    {
+                        "software": {"name": "LanguageToolStub"},
+                        "language": {"code": (form.get("language") or ["en-US"])[0]},
+                        "matches": stub_matches(text),
+                    },
+                )
+
+        return Handler
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Local LanguageTool stub server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8081)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--failure-rate", type=float, default=0.0)
+    parser.add_argument("--fail-status", type=int, default=503)
+    args = parser.parse_args()
+
+    stub = LanguageToolStub(
+        args.host, args.port, args.latency, args.failure_rate, args.fail_status
+    )
+    print(f"LanguageTool stub listening on {stub.url}")
+    try:
+        stub._server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        stub._server.server_close()
+
+
+if __name__ == "__main__":
+    main()
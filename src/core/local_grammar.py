@@ -0,0 +1,585 @@
+"""
+Local Rule-Based Grammar Checker (DRA-60 offline backend)
+
+An in-process replacement for LanguageTool when the remote API or a local
+Java server is not available. It combines:
+
+    1. A symmetric-delete spell checker over a bundled wordlist
+       (wordlists/en_common.txt plus the skill lists), compiled once per
+       process into a delete -> words index.
+    2. A few regex rules for mistakes that show up in resumes
+       (repeated words, a/an, lowercase "i", "could of", stray spaces
+       before punctuation, doubled punctuation).
+
+`LocalGrammarTool.check(text)` returns LanguageTool-shaped `GrammarMatch`
+objects, so it plugs into GrammarEngine like any other tool. The checker
+favours precision: unknown words with no close dictionary neighbour
+(product names, surnames, jargon) are not flagged.
+"""
+
+import json
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from src.core.grammar_client import GrammarMatch
+from src.parser.entity_scanner import scan_entities
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+DEFAULT_WORDLIST = PROJECT_ROOT / "wordlists" / "en_common.txt"
+SKILL_LISTS_DIR = PROJECT_ROOT / "skill_lists"
+
+# Extra wordlists (os.pathsep separated), e.g. /usr/share/dict/words
+EXTRA_WORDLISTS = os.getenv("LOCAL_GRAMMAR_WORDLISTS", "")
+
+MAX_EDIT_DISTANCE = 2
+PREFIX_LENGTH = 7
+
+# High-confidence corrections checked before the dictionary
+KNOWN_MISSPELLINGS = {
+    "teh": "the",
+    "alot": "a lot",
+    "recieve": "receive",
+    "recieved": "received",
+    "acheive": "achieve",
+    "acheived": "achieved",
+    "acheivement": "achievement",
+    "managment": "management",
+    "responsable": "responsible",
+    "succesful": "successful",
+    "succesfully": "successfully",
+    "developement": "development",
+    "experiance": "experience",
+    "seperate": "separate",
+    "occured": "occurred",
+    "untill": "until",
+    "definately": "definitely",
+    "accomodate": "accommodate",
+    "begining": "beginning",
+    "buisness": "business",
+    "collegue": "colleague",
+    "comittee": "committee",
+    "enviroment": "environment",
+    "goverment": "government",
+    "independant": "independent",
+    "knowledgable": "knowledgeable",
+    "liason": "liaison",
+    "maintainance": "maintenance",
+    "occassion": "occasion",
+    "proffesional": "professional",
+    "recomend": "recommend",
+    "refered": "referred",
+    "relevent": "relevant",
+    "wich": "which",
+}
+
+# Suffix rewrites used to find the base form of an inflected word
+_SUFFIX_RULES = [
+    ("ies", "y"),
+    ("ied", "y"),
+    ("ier", "y"),
+    ("iest", "y"),
+    ("ily", "y"),
+    ("ing", ""),
+    ("ing", "e"),
+    ("ed", ""),
+    ("ed", "e"),
+    ("es", ""),
+    ("s", ""),
+    ("ly", ""),
+    ("er", ""),
+    ("er", "e"),
+    ("ers", ""),
+    ("ers", "e"),
+    ("est", ""),
+    ("ment", ""),
+    ("ments", ""),
+    ("ness", ""),
+    ("ful", ""),
+    ("able", ""),
+    ("able", "e"),
+    ("ation", "ate"),
+    ("ations", "ate"),
+    ("ation", "e"),
+    ("ation", ""),
+    ("ion", ""),
+    ("ions", ""),
+    ("ion", "e"),
+    ("ive", ""),
+    ("ive", "e"),
+    ("al", ""),
+    ("ally", ""),
+    ("ity", ""),
+    ("ize", ""),
+    ("ise", ""),
+    ("ized", ""),
+    ("ised", ""),
+    ("izing", ""),
+]
+_INFLECTIONS = ("ments", "ment", "ing", "ers", "ed", "er", "es", "ly", "s")
+_PREFIXES = (
+    "re",
+    "un",
+    "co",
+    "pre",
+    "non",
+    "over",
+    "under",
+    "mis",
+    "sub",
+    "multi",
+    "cross",
+    "self",
+    "inter",
+    "de",
+    "dis",
+    "out",
+    "up",
+)
+
+_WORD = re.compile(r"[A-Za-z]+(?:'[A-Za-z]+)?")
+
+# Vowel-initial words read with a consonant sound ("a university")
+_A_BEFORE_VOWEL = (
+    "uni",
+    "use",
+    "usa",
+    "usu",
+    "uti",
+    "uro",
+    "eu",
+    "one",
+    "once",
+    "ubi",
+)
+# Consonant-initial words read with a vowel sound ("an hour")
+_AN_BEFORE_CONSONANT = ("hour", "honest", "honor", "honour", "heir")
+# Letters whose spoken name starts with a vowel sound ("an SQL", "an MBA")
+_VOWEL_SOUND_LETTERS = set("AEFHILMNORSX")
+
+
+class SymSpellIndex:
+    """
+    Symmetric-delete spelling index.
+
+    Every dictionary word's prefix is expanded into all strings reachable by
+    deleting up to `max_distance` characters; a lookup expands the query the
+    same way, so candidate corrections are found by hashing instead of
+    comparing against the whole dictionary.
+    """
+
+    def __init__(
+        self,
+        words: Iterable[str],
+        max_distance: int = MAX_EDIT_DISTANCE,
+        prefix_length: int = PREFIX_LENGTH,
+    ):
+        self.max_distance = max_distance
+        self.prefix_length = prefix_length
+        self.words: Dict[str, int] = {}  # word -> rank (lower is more common)
+        self._deletes: Dict[str, List[str]] = {}
+        for word in words:
+            self.add(word)
+
+    def __contains__(self, word: str) -> bool:
+        return word in self.words
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    def add(self, word: str) -> None:
+        if not word or word in self.words:
+            return
+        self.words[word] = len(self.words)
+        for variant in self._edits(word[: self.prefix_length]):
+            self._deletes.setdefault(variant, []).append(word)
+
+    def _edits(self, word: str) -> Set[str]:
+        """`word` plus every string reachable by up to max_distance deletes."""
+        found = {word}
+        frontier = {word}
+        for _ in range(self.max_distance):
+            next_frontier = set()
+            for item in frontier:
+                if len(item) <= 1:
+                    continue
+                for i in range(len(item)):
+                    next_frontier.add(item[:i] + item[i + 1 :])
+            next_frontier -= found
+            found |= next_frontier
+            frontier = next_frontier
+        return found
+
+    def lookup(self, word: str, max_distance: Optional[int] = None) -> Optional[str]:
+        """Closest dictionary word within `max_distance`, most common first."""
+        limit = self.max_distance if max_distance is None else max_distance
+        best: Optional[Tuple[int, int, str]] = None
+        seen: Set[str] = set()
+        for variant in self._edits(word[: self.prefix_length]):
+            for candidate in self._deletes.get(variant, ()):
+                if candidate in seen or abs(len(candidate) - len(word)) > limit:
+                    continue
+                seen.add(candidate)
+                distance = edit_distance(word, candidate, limit)
+                if distance > limit:
+                    continue
+                key = (distance, self.words[candidate], candidate)
+                if best is None or key < best:
+                    best = key
+        return best[2] if best else None
+
+
+def edit_distance(a: str, b: str, limit: int) -> int:
+    """Optimal string alignment distance (adjacent swaps cost 1), capped at limit+1."""
+    if a == b:
+        return 0
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    previous = None
+    current = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        before, previous = previous, current
+        current = [i] + [0] * len(b)
+        row_min = i
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            value = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if (
+                before is not None
+                and j > 1
+                and a[i - 1] == b[j - 2]
+                and a[i - 2] == b[j - 1]
+            ):
+                value = min(value, before[j - 2] + 1)
+            current[j] = value
+            row_min = min(row_min, value)
+        if row_min > limit:
+            return limit + 1
+    return current[-1]
+
+
+def load_wordlist(path: Path) -> List[str]:
+    """Lowercased words from a one-word-per-line file ('#' starts a comment)."""
+    words = []
+    with open(path, encoding="utf-8", errors="ignore") as handle:
+        for line in handle:
+            word = line.strip().lower()
+            if word and not word.startswith("#") and word.isalpha():
+                words.append(word)
+    return words
+
+
+def _skill_words(folder: Path) -> List[str]:
+    """Single words from the skill list JSON files (names and aliases)."""
+    words = []
+    for path in sorted(folder.glob("*.json")):
+        try:
+            with open(path, encoding="utf-8") as handle:
+                data = json.load(handle)
+        except (OSError, ValueError):
+            continue
+        for name, aliases in data.items():
+            for phrase in [name, *aliases]:
+                words.extend(w.lower() for w in _WORD.findall(phrase))
+    return words
+
+
+def build_default_index() -> SymSpellIndex:
+    """Index over the bundled wordlist, skill lists and LOCAL_GRAMMAR_WORDLISTS."""
+    words = load_wordlist(DEFAULT_WORDLIST)
+    if SKILL_LISTS_DIR.is_dir():
+        words.extend(_skill_words(SKILL_LISTS_DIR))
+    for extra in filter(None, EXTRA_WORDLISTS.split(os.pathsep)):
+        if os.path.exists(extra):
+            words.extend(load_wordlist(Path(extra)))
+    return SymSpellIndex(words)
+
+
+class LocalGrammarTool:
+    """In-process grammar tool with LanguageTool's `check(text)` API."""
+
+    def __init__(self, index: Optional[SymSpellIndex] = None):
+        self.index = index if index is not None else build_default_index()
+
+    def check(self, text: str) -> List[GrammarMatch]:
+        if not text:
+            return []
+        matches = self._spelling_matches(text) + self._rule_matches(text)
+        matches.sort(key=lambda m: m.offset)
+        return matches
+
+    def close(self) -> None:
+        return None
+
+    # --- Spelling ---
+
+    def _spelling_matches(self, text: str) -> List[GrammarMatch]:
+        skip = [
+            (s.start, s.end) for s in scan_entities(text) if s.kind in ("url", "email")
+        ]
+        matches = []
+        for word in _WORD.finditer(text):
+            token = word.group(0)
+            if "'" in token or len(token) < 3 or _inside(skip, word.start()):
+                continue
+            suggestion = self._suggest(token)
+            if suggestion is not None:
+                matches.append(
+                    _build_match(
+                        text,
+                        word.start(),
+                        word.end(),
+                        "Possible spelling mistake found.",
+                        [suggestion],
+                        "MORFOLOGIK_RULE_EN_US",
+                        "misspelling",
+                    )
+                )
+        return matches
+
+    def _suggest(self, token: str) -> Optional[str]:
+        """Correction for a misspelled token, or None if it looks fine/unknown."""
+        if any(c.isupper() for c in token[1:]):
+            return None  # acronyms, CamelCase product names
+        lower = token.lower()
+        if lower in KNOWN_MISSPELLINGS:
+            return _match_case(KNOWN_MISSPELLINGS[lower], token)
+        if self.is_known(lower):
+            return None
+
+        if len(token) < 5:
+            return None  # short words have too many one-edit neighbours
+        capitalized = token[0].isupper()
+        limit = 1 if capitalized or len(lower) < 8 else 2
+        suggestion = self.index.lookup(lower, limit)
+        if suggestion is None:
+            suggestion = self._suggest_inflected(lower)
+        return _match_case(suggestion, token) if suggestion else None
+
+    def _suggest_inflected(self, word: str) -> Optional[str]:
+        """Correct the stem of an inflected word: implmented -> implemented."""
+        for suffix in _INFLECTIONS:
+            stem = word[: -len(suffix)]
+            if word.endswith(suffix) and len(stem) >= 4:
+                corrected = self.index.lookup(stem, 1)
+                if corrected is not None:
+                    if corrected.endswith("e") and suffix[0] in "ei":
+                        corrected = corrected[:-1]
+                    return corrected + suffix
+        return None
+
+    def is_known(self, word: str) -> bool:
+        """Dictionary word, or an inflected / prefixed form of one."""
+        if word in self.index:
+            return True
+        if self._known_stem(word):
+            return True
+        for prefix in _PREFIXES:
+            if word.startswith(prefix) and len(word) - len(prefix) >= 3:
+                rest = word[len(prefix) :].lstrip("-")
+                if rest in self.index or self._known_stem(rest):
+                    return True
+        return False
+
+    def _known_stem(self, word: str) -> bool:
+        for suffix, replacement in _SUFFIX_RULES:
+            if not word.endswith(suffix) or len(word) - len(suffix) < 2:
+                continue
+            stem = word[: -len(suffix)] + replacement
+            if stem in self.index:
+                return True
+            # planned -> plann -> plan
+            if not replacement and len(stem) > 2 and stem[-1] == stem[-2]:
+                if stem[:-1] in self.index:
+                    return True
+        return False
+
+    # --- Rules ---
+
+    def _rule_matches(self, text: str) -> List[GrammarMatch]:
+        matches = []
+        for rule in _RULES:
+            matches.extend(rule(text))
+        return matches
+
+
+def _inside(ranges: List[Tuple[int, int]], position: int) -> bool:
+    return any(start <= position < end for start, end in ranges)
+
+
+def _match_case(suggestion: str, token: str) -> str:
+    if token[0].isupper():
+        return suggestion[0].upper() + suggestion[1:]
+    return suggestion
+
+
+def _sentence_bounds(text: str, start: int, end: int) -> Tuple[int, int]:
+    left = max(text.rfind(c, 0, start) for c in ".!?\n") + 1
+    rights = [p for p in (text.find(c, end) for c in ".!?\n") if p != -1]
+    right = min(rights) + 1 if rights else len(text)
+    return left, right
+
+
+def _build_match(
+    text: str,
+    start: int,
+    end: int,
+    message: str,
+    replacements: List[str],
+    rule_id: str,
+    issue_type: str,
+) -> GrammarMatch:
+    left, right = _sentence_bounds(text, start, end)
+    return GrammarMatch(
+        offset=start,
+        errorLength=end - start,
+        message=message,
+        replacements=replacements,
+        ruleIssueType=issue_type,
+        ruleId=rule_id,
+        context=text[max(0, start - 20) : end + 20],
+        sentence=text[left:right].strip(),
+    )
+
+
+_REPEATED_WORD = re.compile(r"\b([A-Za-z]+)\s+\1\b", re.IGNORECASE)
+_ARTICLE = re.compile(r"\b(a|an|A|An)\s+([A-Za-z][A-Za-z0-9]*)")
+_LOWERCASE_I = re.compile(r"(?<![\w.'])i(?=\s|'m|'ve|'d|'ll|,|$)")
+_MODAL_OF = re.compile(r"\b(could|would|should|must|might)\s+of\b", re.IGNORECASE)
+_SPACE_BEFORE_PUNCT = re.compile(r"(?<=\w)[ \t]+(?=[,.;:!?](?:\s|$))")
+_DOUBLE_PUNCT = re.compile(r"(?<!\.)(,,|;;|::|\.\.)(?!\.)")
+
+
+def _repeated_words(text: str) -> List[GrammarMatch]:
+    return [
+        _build_match(
+            text,
+            m.start(),
+            m.end(),
+            "Possible typo: you repeated a word.",
+            [m.group(1)],
+            "ENGLISH_WORD_REPEAT_RULE",
+            "duplication",
+        )
+        for m in _REPEATED_WORD.finditer(text)
+    ]
+
+
+def _wants_an(word: str) -> bool:
+    if word.isupper() and len(word) > 1:
+        return word[0] in _VOWEL_SOUND_LETTERS
+    lower = word.lower()
+    if lower.startswith(_AN_BEFORE_CONSONANT):
+        return True
+    if lower.startswith(_A_BEFORE_VOWEL):
+        return False
+    return lower[0] in "aeiou"
+
+
+def _articles(text: str) -> List[GrammarMatch]:
+    matches = []
+    for m in _ARTICLE.finditer(text):
+        article, word = m.group(1), m.group(2)
+        if word[0].isdigit():
+            continue
+        wants_an = _wants_an(word)
+        if wants_an == (article.lower() == "an"):
+            continue
+        correct = "an" if wants_an else "a"
+        matches.append(
+            _build_match(
+                text,
+                m.start(1),
+                m.end(1),
+                f"Use “{correct}” instead of “{article}” before “{word}”.",
+                [_match_case(correct, article)],
+                "EN_A_VS_AN",
+                "misspelling",
+            )
+        )
+    return matches
+
+
+def _lowercase_i(text: str) -> List[GrammarMatch]:
+    return [
+        _build_match(
+            text,
+            m.start(),
+            m.end(),
+            "The pronoun “I” is always capitalized.",
+            ["I"],
+            "I_LOWERCASE",
+            "misspelling",
+        )
+        for m in _LOWERCASE_I.finditer(text)
+    ]
+
+
+def _modal_of(text: str) -> List[GrammarMatch]:
+    return [
+        _build_match(
+            text,
+            m.start(),
+            m.end(),
+            f"Did you mean “{m.group(1)} have”?",
+            [f"{m.group(1)} have"],
+            "COULD_OF",
+            "grammar",
+        )
+        for m in _MODAL_OF.finditer(text)
+    ]
+
+
+def _space_before_punctuation(text: str) -> List[GrammarMatch]:
+    return [
+        _build_match(
+            text,
+            m.start(),
+            m.end() + 1,
+            "Don't put a space before punctuation.",
+            [text[m.end()]],
+            "COMMA_PARENTHESIS_WHITESPACE",
+            "whitespace",
+        )
+        for m in _SPACE_BEFORE_PUNCT.finditer(text)
+    ]
+
+
+def _double_punctuation(text: str) -> List[GrammarMatch]:
+    return [
+        _build_match(
+            text,
+            m.start(),
+            m.end(),
+            "Two consecutive punctuation marks.",
+            [m.group(1)[0]],
+            "DOUBLE_PUNCTUATION",
+            "typographical",
+        )
+        for m in _DOUBLE_PUNCT.finditer(text)
+    ]
+
+
+_RULES = [
+    _repeated_words,
+    _articles,
+    _lowercase_i,
+    _modal_of,
+    _space_before_punctuation,
+    _double_punctuation,
+]
+
+
+_local_tool: Optional[LocalGrammarTool] = None
+_local_tool_lock = threading.Lock()
+
+
+def get_local_tool() -> LocalGrammarTool:
+    """Process-wide LocalGrammarTool (the index is compiled on first use)."""
+    global _local_tool
+    with _local_tool_lock:
+        if _local_tool is None:
+            _local_tool = LocalGrammarTool()
+        return _local_tool
@@ -2,10 +2,18 @@
 
 import os
 import logging
-from sqlalchemy import create_engine
+import threading
+import time
+from collections import deque
+from typing import Any, Dict
+from sqlalchemy import create_engine, event, exc
+from sqlalchemy.engine import make_url
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import QueuePool
 from contextlib import contextmanager
 
+from src.utils.metrics import REGISTRY
+
 logger = logging.getLogger(__name__)
 
 # --- Configuration (Load from Environment) ---
@@ -15,18 +23,262 @@ POSTGRES_HOST = os.environ.get("POSTGRES_HOST", "localhost")
 POSTGRES_PORT = os.environ.get("POSTGRES_PORT", "5432")
 POSTGRES_DB = os.environ.get("POSTGRES_DB", "resume_parser_db")
 
-# Construct the database URL
-DATABASE_URL = (
+# Construct the database URL. DATABASE_URL overrides it, e.g.
+# "sqlite:///data/metadata.db" as a local stand-in for Postgres.
+DATABASE_URL = os.environ.get("DATABASE_URL") or (
     f"postgresql://{POSTGRES_USER}:{POSTGRES_PASSWORD}@"
     f"{POSTGRES_HOST}:{POSTGRES_PORT}/{POSTGRES_DB}"
 )
 
+# --- Connection Pool Tuning ---
+DB_POOL_SIZE = int(os.environ.get("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.environ.get("DB_MAX_OVERFLOW", "10"))
+# Seconds before a pooled connection is replaced (-1: never)
+DB_POOL_RECYCLE = int(os.environ.get("DB_POOL_RECYCLE", "1800"))
+# Seconds a checkout waits for a free connection before TimeoutError
+DB_POOL_TIMEOUT = float(os.environ.get("DB_POOL_TIMEOUT", "30"))
+DB_POOL_PRE_PING = os.environ.get("DB_POOL_PRE_PING", "true").lower() == "true"
+
+
+DB_CHECKOUT_SECONDS = REGISTRY.histogram(
+    "db_pool_checkout_seconds", "Time spent waiting for a pooled DB connection"
+)
+DB_POOL_EVENTS = REGISTRY.counter(
+    "db_pool_events_total",
+    "DB pool events (connect, overflow_connect, timeout, invalidate)",
+    ["event"],
+)
+DB_POOL_CONNECTIONS = REGISTRY.gauge(
+    "db_pool_connections", "DB connections by state", ["state"]
+)
+
+
+class PoolMetrics:
+    """
+    Pool counters fed by pool events (checkout, checkin, connect,
+    invalidate) and by `TimedQueuePool.connect()`, which times the wait for
+    a connection: checkout latency, time connections are held, connections
+    opened, overflow connections and checkout timeouts.
+    """
+
+    def __init__(self, window: int = 1000):
+        self._lock = threading.Lock()
+        self._latencies = deque(maxlen=window)
+        self.checkouts = 0
+        self.checkins = 0
+        self.waits = 0
+        self.checkout_seconds_total = 0.0
+        self.checkout_seconds_max = 0.0
+        self.held_seconds_max = 0.0
+        self.connects = 0
+        self.overflow_connects = 0
+        self.invalidations = 0
+        self.timeouts = 0
+
+    def record_checkout(self) -> None:
+        with self._lock:
+            self.checkouts += 1
+
+    def record_checkin(self, held_seconds: float) -> None:
+        with self._lock:
+            self.checkins += 1
+            self.held_seconds_max = max(self.held_seconds_max, held_seconds)
+
+    def record_wait(self, seconds: float) -> None:
+        with self._lock:
+            self.waits += 1
+            self.checkout_seconds_total += seconds
+            self.checkout_seconds_max = max(self.checkout_seconds_max, seconds)
+            self._latencies.append(seconds)
+        DB_CHECKOUT_SECONDS.observe(seconds)
+
+    def record_timeout(self) -> None:
+        with self._lock:
+            self.timeouts += 1
+        DB_POOL_EVENTS.labels("timeout").inc()
+
+    def record_connect(self, overflow: bool = False) -> None:
+        with self._lock:
+            self.connects += 1
+            if overflow:
+                self.overflow_connects += 1
+        DB_POOL_EVENTS.labels("connect").inc()
+        if overflow:
+            DB_POOL_EVENTS.labels("overflow_connect").inc()
+
+    def record_invalidation(self) -> None:
+        with self._lock:
+            self.invalidations += 1
+        DB_POOL_EVENTS.labels("invalidate").inc()
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            recent = sorted(self._latencies)
+            p95 = recent[int(0.95 * (len(recent) - 1))] if recent else 0.0
+            return {
+                "checkouts": self.checkouts,
+                "checkins": self.checkins,
+                "checkout_ms_avg": round(
+                    1000 * self.checkout_seconds_total / max(1, self.waits), 3
+                ),
+                "checkout_ms_p95": round(1000 * p95, 3),
+                "checkout_ms_max": round(1000 * self.checkout_seconds_max, 3),
+                "held_ms_max": round(1000 * self.held_seconds_max, 3),
+                "connects": self.connects,
+                "overflow_connects": self.overflow_connects,
+                "invalidations": self.invalidations,
+                "timeouts": self.timeouts,
+            }
+
+
+pool_metrics = PoolMetrics()
+
+
+class TimedQueuePool(QueuePool):
+    """
+    QueuePool that times every checkout and counts checkout timeouts.
+    Engine.connect(), Engine.begin() and sessions all check out through the
+    public `Pool.connect()`, so every user of the engine is measured.
+    """
+
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            pool_metrics.record_timeout()
+            raise
+        pool_metrics.record_wait(time.perf_counter() - started)
+        return connection
+
+
+def _on_connect(pool, dbapi_connection, connection_record) -> None:
+    # A QueuePool counts the new connection before opening it, so a
+    # positive overflow means it is beyond pool_size
+    overflow = isinstance(pool, QueuePool) and pool.overflow() > 0
+    pool_metrics.record_connect(overflow)
+
+
+def _on_checkout(dbapi_connection, connection_record, connection_proxy) -> None:
+    connection_record.info["checked_out_at"] = time.perf_counter()
+    pool_metrics.record_checkout()
+
+
+def _on_checkin(dbapi_connection, connection_record) -> None:
+    started = connection_record.info.pop("checked_out_at", None)
+    if started is not None:
+        pool_metrics.record_checkin(time.perf_counter() - started)
+
+
+def _instrument(engine) -> None:
+    pool = engine.pool
+    event.listen(pool, "connect", lambda *args: _on_connect(pool, *args))
+    event.listen(pool, "checkout", _on_checkout)
+    event.listen(pool, "checkin", _on_checkin)
+    event.listen(pool, "invalidate", lambda *args: pool_metrics.record_invalidation())
+
+
+def _is_memory_sqlite(url: str) -> bool:
+    parsed = make_url(url)
+    return parsed.get_backend_name() == "sqlite" and parsed.database in (
+        None,
+        "",
+        ":memory:",
+    )
+
+
+def _create_engine(url: str):
+    options: Dict[str, Any] = {"pool_pre_ping": DB_POOL_PRE_PING}
+    # In-memory SQLite must stay on its single-connection pool
+    if not _is_memory_sqlite(url):
+        options.update(
+            poolclass=TimedQueuePool,
+            pool_size=DB_POOL_SIZE,
+            max_overflow=DB_MAX_OVERFLOW,
+            pool_recycle=DB_POOL_RECYCLE,
+            pool_timeout=DB_POOL_TIMEOUT,
+        )
+    engine = create_engine(url, **options)
+    _instrument(engine)
+    return engine
+
+
 # --- SQLAlchemy Engine and Session ---
-# The Engine is the starting point for all SQLAlchemy applications
-Engine = create_engine(DATABASE_URL, pool_pre_ping=True)
+# The Engine is created on first use, so importing this module never
+# touches the database
+_engine = None
+_engine_lock = threading.Lock()
+
+# SessionLocal is a class used to create a database session (bound per call)
+SessionLocal = sessionmaker(autocommit=False, autoflush=False)
+
+
+def get_engine():
+    """The process-wide Engine, created on first call."""
+    global _engine
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                _engine = _create_engine(DATABASE_URL)
+    return _engine
+
+
+def connect():
+    """A connection from the app engine's pool (checkout timed by the pool)."""
+    return get_engine().connect()
+
+
+def dispose_engine() -> None:
+    """Close all pooled connections (app shutdown); the next use reconnects."""
+    global _engine
+    with _engine_lock:
+        engine, _engine = _engine, None
+    if engine is not None:
+        engine.dispose()
+
+
+def db_pool_status() -> Dict[str, Any]:
+    """Pool occupancy plus checkout metrics, without creating the engine."""
+    status: Dict[str, Any] = {
+        "initialized": _engine is not None,
+        "pool_size": DB_POOL_SIZE,
+        "max_overflow": DB_MAX_OVERFLOW,
+        "recycle_seconds": DB_POOL_RECYCLE,
+        "timeout_seconds": DB_POOL_TIMEOUT,
+    }
+    engine = _engine
+    if engine is not None and isinstance(engine.pool, QueuePool):
+        status.update(
+            in_use=engine.pool.checkedout(),
+            idle=engine.pool.checkedin(),
+            overflow=max(0, engine.pool.overflow()),
+        )
+    status.update(pool_metrics.snapshot())
+    return status
+
+
+def _pool_connections(state: str) -> float:
+    engine = _engine
+    if engine is None or not isinstance(engine.pool, QueuePool):
+        return 0
+    if state == "in_use":
+        return engine.pool.checkedout()
+    if state == "idle":
+        return engine.pool.checkedin()
+    return max(0, engine.pool.overflow())
+
+
+for _state in ("in_use", "idle", "overflow"):
+    DB_POOL_CONNECTIONS.labels(_state).set_function(
+        lambda state=_state: _pool_connections(state)
+    )
+
 
-# SessionLocal is a class used to create a database session
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=Engine)
+def __getattr__(name: str):
+    # `Engine` used to be created at import time; keep the name working
+    if name == "Engine":
+        return get_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 @contextmanager
@@ -35,7 +287,8 @@ def get_db_session():
     Context manager to provide a transactional database session.
     Automatically handles commit/rollback and closing the session.
     """
-    db = SessionLocal()
+    connection = connect()
+    db = SessionLocal(bind=connection)
     try:
         yield db
         db.commit()
@@ -46,6 +299,7 @@ def get_db_session():
         raise
     finally:
         db.close()
+        connection.close()
 
 
 def init_db(base_class):
@@ -57,7 +311,7 @@ def init_db(base_class):
     #     import src.database.metadata_model
 
     #     # Create all defined tables in the database
-    #     base_class.metadata.create_all(bind=Engine)
+    #     base_class.metadata.create_all(bind=get_engine())
     #     print(f"📦 Database tables created successfully for {POSTGRES_DB}")
     #     return True
     # except Exception:
@@ -2,12 +2,11 @@
 
 import logging
 import json
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Dict, Any, List
 
 from sqlalchemy import Column, Integer, String, DateTime
 from sqlalchemy.ext.declarative import declarative_base
-from src.database.connection import get_db_session
 
 logger = logging.getLogger(__name__)
 
@@ -33,7 +32,11 @@ class MetadataModel(Base):
 
 def log_metadata(metadata_payload: Dict[str, Any]) -> bool:
     """
-    Logs anonymous, aggregated metadata using the SQLAlchemy ORM session.
+    Logs anonymous, aggregated metadata through the batched metadata writer.
+
+    The row is queued and inserted in bulk by a background thread (see
+    src/database/metadata_writer.py), so the caller never waits on a
+    per-row commit.
 
     Args:
         metadata_payload: Dictionary containing anonymous data:
@@ -43,7 +46,8 @@ def log_metadata(metadata_payload: Dict[str, Any]) -> bool:
             - 'file_size_bytes': int
 
     Returns:
-        True if the log was successful, False otherwise.
+        True if the row was queued, False if it was invalid, dropped or
+        metadata logging is disabled.
     """
 
     required_keys = [
@@ -60,27 +64,22 @@ def log_metadata(metadata_payload: Dict[str, Any]) -> bool:
             return False
 
     try:
-        # Convert list of sections to JSON string for storage
-        missing_sections_json = json.dumps(metadata_payload["missing_sections"])
-
-        new_entry = MetadataModel(
-            file_type=metadata_payload["file_type"],
-            processing_time_ms=metadata_payload["processing_time_ms"],
-            missing_sections=missing_sections_json,
-            file_size_bytes=metadata_payload["file_size_bytes"],
-            # log_timestamp is handled by the default
-        )
-
-        # 2. Database Insertion
-        with get_db_session() as db:
-            db.add(new_entry)
-            # The commit is handled by the get_db_session context manager
-            logger.info(
-                f"Metadata logged successfully: {new_entry.file_type}, {new_entry.processing_time_ms}ms."
-            )
-
-        return True
+        row = {
+            "file_type": metadata_payload["file_type"],
+            "processing_time_ms": metadata_payload["processing_time_ms"],
+            # Convert list of sections to JSON string for storage
+            "missing_sections": json.dumps(metadata_payload["missing_sections"]),
+            "file_size_bytes": metadata_payload["file_size_bytes"],
+            # Stamped now rather than when the batch is written
+            "log_timestamp": datetime.now(timezone.utc).replace(tzinfo=None),
+        }
+
+        # 2. Queue for the next bulk insert (imported here: the writer
+        # module imports this one)
+        from src.database.metadata_writer import get_metadata_writer
+
+        return get_metadata_writer().submit(row)
 
     except Exception as e:
-        logger.error(f"Failed to insert metadata into resume_metadata: {e}")
+        logger.error(f"Failed to queue metadata for resume_metadata: {e}")
         return False
@@ -0,0 +1,457 @@
+"""
+Metadata Rollups (NFR-008)
+
+Dashboards ask for processing-time percentiles, the file-type mix and the
+most often missing sections over time. Answering that from
+`resume_metadata` means a full scan plus JSON parsing of every row, so the
+metadata writer also maintains three small rollup tables, in the same
+transaction as each batch insert:
+
+- resume_metadata_rollup: count, total/max processing time and total file
+  size per (granularity, bucket_start, file_type)
+- resume_metadata_latency_hist: row counts per processing-time bucket
+  (upper bound `le_ms`, LATENCY_BUCKETS_MS)
+- resume_metadata_missing_rollup: how often each section was missing
+
+Buckets are per minute and per hour (naive UTC, like log_timestamp).
+Counters are incremented with INSERT ... ON CONFLICT DO UPDATE on Postgres
+and SQLite. Minute buckets are kept ROLLUP_MINUTE_RETENTION_HOURS and hour
+buckets ROLLUP_HOUR_RETENTION_DAYS.
+
+`query_rollups` answers a dashboard request from the rollups alone;
+percentiles are interpolated from the histogram.
+"""
+
+import json
+import os
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import (
+    BigInteger,
+    Column,
+    DateTime,
+    Integer,
+    String,
+    and_,
+    case,
+    func,
+    select,
+)
+from sqlalchemy.engine import Connection, Engine
+
+from src.database.metadata_model import Base, MetadataModel
+
+# Upper bounds (ms) of the latency histogram buckets; slower rows land in
+# the overflow bucket
+LATENCY_BUCKETS_MS = (50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000, 60000)
+OVERFLOW_BUCKET_MS = 2**31 - 1
+
+GRANULARITIES = ("minute", "hour")
+# "auto" queries use minute buckets up to this span
+MINUTE_QUERY_MAX_SPAN = timedelta(hours=6)
+
+ROLLUP_MINUTE_RETENTION_HOURS = int(os.getenv("ROLLUP_MINUTE_RETENTION_HOURS", "48"))
+ROLLUP_HOUR_RETENTION_DAYS = int(os.getenv("ROLLUP_HOUR_RETENTION_DAYS", "90"))
+
+
+class MetadataRollup(Base):
+    """Per-bucket totals of resume_metadata rows."""
+
+    __tablename__ = "resume_metadata_rollup"
+
+    granularity = Column(String(6), primary_key=True)
+    bucket_start = Column(DateTime, primary_key=True)
+    file_type = Column(String(10), primary_key=True)
+    count = Column(Integer, nullable=False)
+    total_processing_ms = Column(BigInteger, nullable=False)
+    max_processing_ms = Column(Integer, nullable=False)
+    total_file_size_bytes = Column(BigInteger, nullable=False)
+
+
+class MetadataLatencyHistogram(Base):
+    """Per-bucket processing-time histogram."""
+
+    __tablename__ = "resume_metadata_latency_hist"
+
+    granularity = Column(String(6), primary_key=True)
+    bucket_start = Column(DateTime, primary_key=True)
+    file_type = Column(String(10), primary_key=True)
+    le_ms = Column(Integer, primary_key=True)
+    count = Column(Integer, nullable=False)
+
+
+class MetadataMissingSection(Base):
+    """Per-bucket counts of missing sections."""
+
+    __tablename__ = "resume_metadata_missing_rollup"
+
+    granularity = Column(String(6), primary_key=True)
+    bucket_start = Column(DateTime, primary_key=True)
+    file_type = Column(String(10), primary_key=True)
+    section = Column(String(50), primary_key=True)
+    count = Column(Integer, nullable=False)
+
+
+ROLLUP_TABLES = [
+    MetadataRollup.__table__,
+    MetadataLatencyHistogram.__table__,
+    MetadataMissingSection.__table__,
+]
+
+_KEY_COLUMNS = {
+    MetadataRollup.__table__: ("granularity", "bucket_start", "file_type"),
+    MetadataLatencyHistogram.__table__: (
+        "granularity",
+        "bucket_start",
+        "file_type",
+        "le_ms",
+    ),
+    MetadataMissingSection.__table__: (
+        "granularity",
+        "bucket_start",
+        "file_type",
+        "section",
+    ),
+}
+# Columns merged with max() instead of added
+_MAX_COLUMNS = {"max_processing_ms"}
+
+
+def create_rollup_tables(engine: Engine) -> None:
+    Base.metadata.create_all(engine, tables=[MetadataModel.__table__, *ROLLUP_TABLES])
+
+
+def utc_now() -> datetime:
+    """Current time as naive UTC, like log_timestamp and the bucket starts."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def bucket_start(ts: datetime, granularity: str) -> datetime:
+    if granularity == "minute":
+        return ts.replace(second=0, microsecond=0)
+    return ts.replace(minute=0, second=0, microsecond=0)
+
+
+def latency_bucket(processing_ms: int) -> int:
+    for bound in LATENCY_BUCKETS_MS:
+        if processing_ms <= bound:
+            return bound
+    return OVERFLOW_BUCKET_MS
+
+
+def _sections(value: Any) -> List[str]:
+    if isinstance(value, str):
+        try:
+            value = json.loads(value)
+        except ValueError:
+            return []
+    return [str(s)[:50] for s in value or ()]
+
+
+def aggregate_rows(
+    rows: Iterable[Dict[str, Any]],
+) -> Dict[Any, List[Dict[str, Any]]]:
+    """Turn raw metadata rows into per-table lists of counter increments."""
+    totals: Dict[Tuple, Dict[str, int]] = {}
+    histogram: Dict[Tuple, int] = defaultdict(int)
+    missing: Dict[Tuple, int] = defaultdict(int)
+
+    for row in rows:
+        ts = row.get("log_timestamp") or utc_now()
+        processing_ms = int(row["processing_time_ms"])
+        file_type = row["file_type"]
+        sections = _sections(row.get("missing_sections"))
+        for granularity in GRANULARITIES:
+            key = (granularity, bucket_start(ts, granularity), file_type)
+            entry = totals.setdefault(
+                key,
+                {
+                    "count": 0,
+                    "total_processing_ms": 0,
+                    "max_processing_ms": 0,
+                    "total_file_size_bytes": 0,
+                },
+            )
+            entry["count"] += 1
+            entry["total_processing_ms"] += processing_ms
+            entry["max_processing_ms"] = max(entry["max_processing_ms"], processing_ms)
+            entry["total_file_size_bytes"] += int(row["file_size_bytes"])
+            histogram[key + (latency_bucket(processing_ms),)] += 1
+            for section in sections:
+                missing[key + (section,)] += 1
+
+    keys = ("granularity", "bucket_start", "file_type")
+    return {
+        MetadataRollup.__table__: [
+            {**dict(zip(keys, key)), **entry} for key, entry in totals.items()
+        ],
+        MetadataLatencyHistogram.__table__: [
+            {**dict(zip(keys + ("le_ms",), key)), "count": n}
+            for key, n in histogram.items()
+        ],
+        MetadataMissingSection.__table__: [
+            {**dict(zip(keys + ("section",), key)), "count": n}
+            for key, n in missing.items()
+        ],
+    }
+
+
+def _merged(table, column: str, new):
+    if column in _MAX_COLUMNS:
+        return case((table.c[column] < new, new), else_=table.c[column])
+    return table.c[column] + new
+
+
+def _upsert(conn: Connection, table, rows: List[Dict[str, Any]]) -> None:
+    if not rows:
+        return
+    keys = _KEY_COLUMNS[table]
+    counters = [c.name for c in table.columns if c.name not in keys]
+    dialect = conn.dialect.name
+
+    if dialect in ("postgresql", "sqlite"):
+        if dialect == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert
+        else:
+            from sqlalchemy.dialects.sqlite import insert
+        stmt = insert(table)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=list(keys),
+            set_={c: _merged(table, c, stmt.excluded[c]) for c in counters},
+        )
+        conn.execute(stmt, rows)
+        return
+
+    # Other dialects: update, insert when the bucket does not exist yet
+    for row in rows:
+        update = (
+            table.update()
+            .where(and_(*(table.c[k] == row[k] for k in keys)))
+            .values({c: _merged(table, c, row[c]) for c in counters})
+        )
+        if conn.execute(update).rowcount == 0:
+            conn.execute(table.insert(), row)
+
+
+def apply_rollups(conn: Connection, rows: Iterable[Dict[str, Any]]) -> None:
+    """Add `rows` to the rollups (run in the transaction that inserts them)."""
+    for table, increments in aggregate_rows(rows).items():
+        _upsert(conn, table, increments)
+
+
+def prune_rollups(conn: Connection, now: Optional[datetime] = None) -> int:
+    """Delete buckets past their retention; returns the rows deleted."""
+    now = now or utc_now()
+    cutoffs = {
+        "minute": now - timedelta(hours=ROLLUP_MINUTE_RETENTION_HOURS),
+        "hour": now - timedelta(days=ROLLUP_HOUR_RETENTION_DAYS),
+    }
+    deleted = 0
+    for table in ROLLUP_TABLES:
+        for granularity, cutoff in cutoffs.items():
+            result = conn.execute(
+                table.delete().where(
+                    and_(
+                        table.c.granularity == granularity,
+                        table.c.bucket_start < cutoff,
+                    )
+                )
+            )
+            deleted += result.rowcount or 0
+    return deleted
+
+
+def rebuild_rollups(engine: Engine, chunk_size: int = 5000) -> int:
+    """Recompute every rollup from resume_metadata (e.g. for rows logged
+    before the rollups existed). Returns the rows aggregated."""
+    raw = MetadataModel.__table__
+    columns = [
+        raw.c.id,
+        raw.c.file_type,
+        raw.c.processing_time_ms,
+        raw.c.missing_sections,
+        raw.c.file_size_bytes,
+        raw.c.log_timestamp,
+    ]
+    total = 0
+    with engine.begin() as conn:
+        for table in ROLLUP_TABLES:
+            conn.execute(table.delete())
+        last_id = 0
+        while True:
+            rows = [
+                dict(r._mapping)
+                for r in conn.execute(
+                    select(*columns)
+                    .where(raw.c.id > last_id)
+                    .order_by(raw.c.id)
+                    .limit(chunk_size)
+                )
+            ]
+            if not rows:
+                break
+            apply_rollups(conn, rows)
+            last_id = rows[-1]["id"]
+            total += len(rows)
+    return total
+
+
+def choose_granularity(start: datetime, end: datetime, now: datetime) -> str:
+    """Minute buckets for short, recent ranges; hour buckets otherwise."""
+    minute_retention = now - timedelta(hours=ROLLUP_MINUTE_RETENTION_HOURS)
+    if end - start <= MINUTE_QUERY_MAX_SPAN and start >= minute_retention:
+        return "minute"
+    return "hour"
+
+
+def histogram_percentile(
+    counts: Dict[int, int], quantile: float, max_ms: Optional[int] = None
+) -> Optional[float]:
+    """
+    Estimate a percentile from {le_ms: count} by interpolating linearly
+    inside the bucket it falls in. The overflow bucket ends at `max_ms`.
+    """
+    total = sum(counts.values())
+    if not total:
+        return None
+    rank = quantile * total
+    seen = 0
+    lower = 0
+    for bound in sorted(counts):
+        n = counts[bound]
+        upper = bound
+        if bound == OVERFLOW_BUCKET_MS:
+            upper = max(max_ms or lower, lower)
+        if n and seen + n >= rank:
+            return round(lower + (upper - lower) * (rank - seen) / n, 1)
+        seen += n
+        lower = upper
+    return float(lower)
+
+
+def _percentiles(counts: Dict[int, int], max_ms: Optional[int]) -> Dict[str, Any]:
+    return {
+        "p50": histogram_percentile(counts, 0.50, max_ms),
+        "p95": histogram_percentile(counts, 0.95, max_ms),
+        "p99": histogram_percentile(counts, 0.99, max_ms),
+    }
+
+
+def query_rollups(
+    conn: Connection,
+    start: datetime,
+    end: datetime,
+    granularity: str = "auto",
+    file_type: Optional[str] = None,
+    top_sections: int = 10,
+) -> Dict[str, Any]:
+    """
+    Dashboard summary for [start, end): totals, processing-time percentiles,
+    file-type mix, most often missing sections and a per-bucket series.
+    """
+    if granularity == "auto":
+        granularity = choose_granularity(start, end, utc_now())
+    if granularity not in GRANULARITIES:
+        raise ValueError(f"Unknown granularity '{granularity}'")
+
+    def scope(table):
+        conditions = [
+            table.c.granularity == granularity,
+            table.c.bucket_start >= bucket_start(start, granularity),
+            table.c.bucket_start < end,
+        ]
+        if file_type:
+            conditions.append(table.c.file_type == file_type)
+        return and_(*conditions)
+
+    totals = MetadataRollup.__table__
+    hist = MetadataLatencyHistogram.__table__
+    missing = MetadataMissingSection.__table__
+
+    series = []
+    for r in conn.execute(
+        select(
+            totals.c.bucket_start,
+            func.sum(totals.c.count),
+            func.sum(totals.c.total_processing_ms),
+            func.max(totals.c.max_processing_ms),
+        )
+        .where(scope(totals))
+        .group_by(totals.c.bucket_start)
+        .order_by(totals.c.bucket_start)
+    ):
+        series.append(
+            {
+                "bucket": r[0],
+                "count": int(r[1]),
+                "total_processing_ms": int(r[2]),
+                "max_processing_ms": int(r[3]),
+            }
+        )
+
+    per_bucket: Dict[datetime, Dict[int, int]] = defaultdict(dict)
+    overall: Dict[int, int] = defaultdict(int)
+    for bucket, le_ms, n in conn.execute(
+        select(hist.c.bucket_start, hist.c.le_ms, func.sum(hist.c.count))
+        .where(scope(hist))
+        .group_by(hist.c.bucket_start, hist.c.le_ms)
+    ):
+        per_bucket[bucket][le_ms] = int(n)
+        overall[le_ms] += int(n)
+
+    file_types = {
+        ft: int(n)
+        for ft, n in conn.execute(
+            select(totals.c.file_type, func.sum(totals.c.count))
+            .where(scope(totals))
+            .group_by(totals.c.file_type)
+        )
+    }
+
+    missing_total = func.sum(missing.c.count)
+    top_missing = conn.execute(
+        select(missing.c.section, missing_total)
+        .where(scope(missing))
+        .group_by(missing.c.section)
+        .order_by(missing_total.desc(), missing.c.section)
+        .limit(top_sections)
+    ).all()
+
+    count = sum(b["count"] for b in series)
+    total_ms = sum(b["total_processing_ms"] for b in series)
+    max_ms = max((b["max_processing_ms"] for b in series), default=None)
+
+    return {
+        "granularity": granularity,
+        "start": start.isoformat(),
+        "end": end.isoformat(),
+        "file_type": file_type,
+        "count": count,
+        "processing_time_ms": {
+            "avg": round(total_ms / count, 1) if count else None,
+            "max": max_ms,
+            **_percentiles(overall, max_ms),
+        },
+        "file_types": file_types,
+        "missing_sections": [
+            {
+                "section": section,
+                "count": int(n),
+                "rate": round(int(n) / count, 4) if count else 0.0,
+            }
+            for section, n in top_missing
+        ],
+        "series": [
+            {
+                "bucket": b["bucket"].isoformat(),
+                "count": b["count"],
+                "avg_processing_ms": round(b["total_processing_ms"] / b["count"], 1),
+                "p95_processing_ms": histogram_percentile(
+                    per_bucket[b["bucket"]], 0.95, b["max_processing_ms"]
+                ),
+            }
+            for b in series
+        ],
+    }
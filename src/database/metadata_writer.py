@@ -0,0 +1,297 @@
+"""
+Batched Metadata Writer (NFR-008)
+
+`log_metadata` used to open a session, insert one row and commit per
+resume. `MetadataWriter` instead queues rows in memory and a background
+thread writes them in bulk (one executemany INSERT per batch):
+
+- a batch is flushed when it reaches `batch_size` rows or when its oldest
+  row has waited `flush_interval` seconds
+- the queue is bounded: when the database is slow and the queue fills up,
+  `submit()` blocks the producer for up to `put_timeout` seconds and then
+  drops the row (counted in `dropped`)
+- a failed flush is retried with backoff, then the batch is dropped
+- `stop()` flushes whatever is queued (called at app shutdown)
+
+Each batch also updates the dashboard rollups (src/database/metadata_rollup.py)
+in the same transaction; expired rollup buckets are pruned every
+ROLLUP_PRUNE_INTERVAL seconds.
+
+Any SQLAlchemy engine works (SQLite is a local stand-in for Postgres). No
+migration ships the tables, so the raw and rollup tables are created if
+missing when the writer starts, or before its first batch if the database
+was unreachable then.
+
+Rows are only queued when metadata logging is enabled: METADATA_LOGGING=true,
+or by default when a database is configured (DATABASE_URL or POSTGRES_HOST).
+Otherwise `submit()` discards rows, so dev and CI runs without a database do
+not log a failed insert for every analysis.
+
+Configuration: METADATA_LOGGING, METADATA_BATCH_SIZE, METADATA_FLUSH_INTERVAL,
+METADATA_QUEUE_SIZE, METADATA_PUT_TIMEOUT, METADATA_MAX_RETRIES.
+"""
+
+import logging
+import os
+import queue
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy.engine import Engine
+
+from src.database.connection import get_engine
+from src.database.metadata_model import MetadataModel
+from src.database.metadata_rollup import (
+    apply_rollups,
+    create_rollup_tables,
+    prune_rollups,
+    utc_now,
+)
+
+logger = logging.getLogger(__name__)
+
+_DATABASE_CONFIGURED = bool(os.getenv("DATABASE_URL") or os.getenv("POSTGRES_HOST"))
+METADATA_LOGGING = (
+    os.getenv("METADATA_LOGGING", "true" if _DATABASE_CONFIGURED else "false").lower()
+    == "true"
+)
+METADATA_BATCH_SIZE = int(os.getenv("METADATA_BATCH_SIZE", "100"))
+METADATA_FLUSH_INTERVAL = float(os.getenv("METADATA_FLUSH_INTERVAL", "1.0"))
+METADATA_QUEUE_SIZE = int(os.getenv("METADATA_QUEUE_SIZE", "10000"))
+METADATA_PUT_TIMEOUT = float(os.getenv("METADATA_PUT_TIMEOUT", "0.5"))
+METADATA_MAX_RETRIES = int(os.getenv("METADATA_MAX_RETRIES", "3"))
+ROLLUP_PRUNE_INTERVAL = float(os.getenv("ROLLUP_PRUNE_INTERVAL", "3600"))
+
+_STOP = object()
+
+
+class _FlushRequest:
+    def __init__(self):
+        self.done = threading.Event()
+
+
+class MetadataWriter:
+    """
+    Queue metadata rows and insert them in batches from a background thread.
+
+    Args:
+        engine: SQLAlchemy engine to write to (default: the app engine).
+        batch_size: Rows per INSERT.
+        flush_interval: Max seconds a queued row waits for its batch.
+        max_queue: Rows that may wait in memory before producers block.
+        put_timeout: Seconds `submit()` blocks on a full queue before dropping.
+        max_retries: Attempts per batch before it is dropped.
+        retry_backoff: Seconds before the first retry (doubles each time).
+        enabled: False discards submitted rows (no database configured).
+    """
+
+    def __init__(
+        self,
+        engine: Optional[Engine] = None,
+        batch_size: int = METADATA_BATCH_SIZE,
+        flush_interval: float = METADATA_FLUSH_INTERVAL,
+        max_queue: int = METADATA_QUEUE_SIZE,
+        put_timeout: float = METADATA_PUT_TIMEOUT,
+        max_retries: int = METADATA_MAX_RETRIES,
+        retry_backoff: float = 0.2,
+        enabled: bool = True,
+    ):
+        self._engine = engine
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.put_timeout = put_timeout
+        self.max_retries = max(1, max_retries)
+        self.retry_backoff = retry_backoff
+        self.enabled = enabled
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=max_queue)
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self.written = 0
+        self.batches = 0
+        self.dropped = 0
+        self.failed = 0
+        self.last_error: Optional[str] = None
+        self._last_prune = time.monotonic()
+        self._tables_ready = False
+
+    @property
+    def engine(self) -> Engine:
+        if self._engine is None:
+            return get_engine()
+        return self._engine
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> "MetadataWriter":
+        """Start the writer thread (idempotent)."""
+        with self._lock:
+            if self.running:
+                return self
+            try:
+                self.ensure_tables()
+            except Exception as e:
+                logger.warning(
+                    f"Creating metadata tables failed (retried on write): {e}"
+                )
+            self._thread = threading.Thread(
+                target=self._run, name="metadata-writer", daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def ensure_tables(self) -> None:
+        """Create the raw and rollup tables if they do not exist yet."""
+        if not self._tables_ready:
+            create_rollup_tables(self.engine)
+            self._tables_ready = True
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """Flush everything queued and stop the writer thread."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is None:
+            return
+        self._queue.put(_STOP)
+        thread.join(timeout)
+        if thread.is_alive():
+            logger.warning("Metadata writer did not stop within %.1fs", timeout)
+
+    def submit(self, row: Dict[str, Any]) -> bool:
+        """
+        Queue one row. Blocks up to `put_timeout` while the queue is full
+        (backpressure); returns False if the row had to be dropped or
+        logging is disabled.
+        """
+        if not self.enabled:
+            return False
+        if not self.running:
+            self.start()
+        try:
+            self._queue.put(row, timeout=self.put_timeout)
+            return True
+        except queue.Full:
+            with self._lock:
+                self.dropped += 1
+            logger.warning("Metadata queue full; dropped one row")
+            return False
+
+    def flush(self, timeout: float = 10.0) -> bool:
+        """Write every row queued so far; True once they have been handled."""
+        if not self.running:
+            return self._queue.empty()
+        request = _FlushRequest()
+        self._queue.put(request)
+        return request.done.wait(timeout)
+
+    def _run(self) -> None:
+        batch: List[Dict[str, Any]] = []
+        oldest = 0.0
+        while True:
+            wait = None
+            if batch:
+                wait = max(0.0, oldest + self.flush_interval - time.monotonic())
+            try:
+                item = self._queue.get(timeout=wait)
+            except queue.Empty:
+                item = None
+
+            if item is _STOP:
+                self._write(batch)
+                return
+            if isinstance(item, _FlushRequest):
+                self._write(batch)
+                batch = []
+                item.done.set()
+                continue
+            if item is not None:
+                if not batch:
+                    oldest = time.monotonic()
+                batch.append(item)
+
+            if batch and (
+                len(batch) >= self.batch_size
+                or time.monotonic() - oldest >= self.flush_interval
+            ):
+                self._write(batch)
+                batch = []
+
+    def _write(self, batch: List[Dict[str, Any]]) -> None:
+        if not batch:
+            return
+        now = utc_now()
+        for row in batch:
+            # Raw row and rollup bucket must agree on the timestamp
+            row.setdefault("log_timestamp", now)
+        delay = self.retry_backoff
+        for attempt in range(1, self.max_retries + 1):
+            try:
+                self.ensure_tables()
+                with self.engine.begin() as conn:
+                    conn.execute(MetadataModel.__table__.insert(), batch)
+                    apply_rollups(conn, batch)
+                self.written += len(batch)
+                self.batches += 1
+                self._maybe_prune()
+                return
+            except Exception as e:
+                self.last_error = str(e)
+                logger.error(
+                    f"Metadata batch insert failed (attempt {attempt}/"
+                    f"{self.max_retries}, {len(batch)} rows): {e}"
+                )
+                if attempt < self.max_retries:
+                    time.sleep(delay)
+                    delay *= 2
+        self.failed += len(batch)
+
+    def _maybe_prune(self) -> None:
+        if time.monotonic() - self._last_prune < ROLLUP_PRUNE_INTERVAL:
+            return
+        self._last_prune = time.monotonic()
+        try:
+            with self.engine.begin() as conn:
+                prune_rollups(conn)
+        except Exception as e:
+            logger.warning(f"Pruning metadata rollups failed: {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "running": self.running,
+            "queued": self._queue.qsize(),
+            "written": self.written,
+            "batches": self.batches,
+            "dropped": self.dropped,
+            "failed": self.failed,
+            "last_error": self.last_error,
+        }
+
+
+_shared_writer: Optional[MetadataWriter] = None
+_shared_lock = threading.Lock()
+
+
+def get_metadata_writer() -> MetadataWriter:
+    """Process-wide writer bound to the app engine (started on first use)."""
+    global _shared_writer
+    with _shared_lock:
+        if _shared_writer is None:
+            _shared_writer = MetadataWriter(enabled=METADATA_LOGGING)
+        return _shared_writer
+
+
+def set_metadata_writer(writer: Optional[MetadataWriter]) -> Optional[MetadataWriter]:
+    """Replace the shared writer (tests, scripts); returns the previous one."""
+    global _shared_writer
+    with _shared_lock:
+        previous, _shared_writer = _shared_writer, writer
+        return previous
+
+
+def shutdown_metadata_writer() -> None:
+    """Flush and stop the shared writer if it was ever used."""
+    if _shared_writer is not None:
+        _shared_writer.stop()
@@ -0,0 +1,181 @@
+"""
+Result Snapshot Store
+
+Completed analyses are materialized once into an immutable JSON snapshot,
+keyed by (job_id, kind, version), in a local SQLite database. The GET
+endpoints serve the snapshot instead of re-extracting text, re-detecting
+sections and regenerating feedback on every request.
+
+`version` is a hash of the snapshot schema and the feedback engine versions
+(scoring weights, grammar backend, weak-verb table, skill dictionaries), so
+a snapshot is never reused after the engine changes: the next request
+re-analyzes and writes a snapshot under the new version. Snapshots are
+never updated in place (INSERT OR IGNORE).
+
+Snapshots hold resume content, so they live no longer than the upload
+they were computed from: the upload cleanup (NFR-002) deletes a job's
+snapshots, and snapshots older than RESULT_SNAPSHOT_TTL are neither served
+nor kept past the next prune.
+
+Configuration: RESULT_STORE_PATH (default resume-analyzer/results.db in
+the system temp directory, ":memory:" for a per-process store),
+RESULT_SNAPSHOT_TTL (seconds, default 3600; 0 keeps snapshots until the
+upload cleanup), RESULT_SNAPSHOTS=false
+disables snapshots.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Bump when the shape of stored results changes
+SNAPSHOT_SCHEMA_VERSION = "1"
+RESULT_STORE_PATH = os.getenv(
+    "RESULT_STORE_PATH",
+    str(Path(tempfile.gettempdir()) / "resume-analyzer" / "results.db"),
+)
+# Matches the upload retention of the cleanup scheduled on upload
+RESULT_SNAPSHOT_TTL = float(os.getenv("RESULT_SNAPSHOT_TTL", "3600"))
+RESULT_SNAPSHOTS = os.getenv("RESULT_SNAPSHOTS", "true").lower() == "true"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS result_snapshots (
+    job_id TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    version TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    payload TEXT NOT NULL,
+    PRIMARY KEY (job_id, kind, version)
+)
+"""
+
+
+def snapshot_version(engine_versions: Dict[str, Any]) -> str:
+    """Short stable hash of the schema and engine versions."""
+    payload = json.dumps(
+        {"schema": SNAPSHOT_SCHEMA_VERSION, "engine": engine_versions},
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+class ResultStore:
+    """Thread-safe SQLite store of immutable result snapshots."""
+
+    def __init__(self, path: str = RESULT_STORE_PATH, ttl: float = RESULT_SNAPSHOT_TTL):
+        self.path = path
+        self.ttl = ttl
+        if path != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        if path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(_SCHEMA)
+        self._conn.commit()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+
+    def get(self, job_id: str, kind: str, version: str) -> Optional[Dict[str, Any]]:
+        """A fresh copy of the snapshot, or None if there is none for `version`."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload FROM result_snapshots"
+                " WHERE job_id = ? AND kind = ? AND version = ? AND created_at >= ?",
+                (job_id, kind, version, self._oldest()),
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return json.loads(row[0])
+
+    def put(self, job_id: str, kind: str, version: str, result: Dict[str, Any]) -> bool:
+        """Store a snapshot; an existing one for the same version is kept."""
+        payload = json.dumps(result, default=str)
+        with self._lock:
+            cursor = self._conn.execute(
+                "INSERT OR IGNORE INTO result_snapshots"
+                " (job_id, kind, version, created_at, payload) VALUES (?, ?, ?, ?, ?)",
+                (job_id, kind, version, time.time(), payload),
+            )
+            self._conn.commit()
+            stored = cursor.rowcount == 1
+            if stored:
+                self.writes += 1
+        return stored
+
+    def delete(self, job_id: str) -> int:
+        """Drop every snapshot of a job (e.g. on a data deletion request)."""
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM result_snapshots WHERE job_id = ?", (job_id,)
+            )
+            self._conn.commit()
+            return cursor.rowcount
+
+    def prune(self, keep_version: str) -> int:
+        """Drop expired snapshots and those written by other engine versions."""
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM result_snapshots WHERE version != ? OR created_at < ?",
+                (keep_version, self._oldest()),
+            )
+            self._conn.commit()
+            return cursor.rowcount
+
+    def _oldest(self) -> float:
+        """Creation time of the oldest snapshot still within the TTL."""
+        return time.time() - self.ttl if self.ttl > 0 else float("-inf")
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            (count,) = self._conn.execute(
+                "SELECT COUNT(*) FROM result_snapshots"
+            ).fetchone()
+            lookups = self.hits + self.misses
+            return {
+                "snapshots": count,
+                "hits": self.hits,
+                "misses": self.misses,
+                "writes": self.writes,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+_shared_store: Optional[ResultStore] = None
+_shared_lock = threading.Lock()
+
+
+def get_result_store() -> Optional[ResultStore]:
+    """Process-wide store (RESULT_STORE_PATH), or None when disabled."""
+    global _shared_store
+    if not RESULT_SNAPSHOTS:
+        return None
+    with _shared_lock:
+        if _shared_store is None:
+            _shared_store = ResultStore(RESULT_STORE_PATH)
+        return _shared_store
+
+
+def set_result_store(store: Optional[ResultStore]) -> Optional[ResultStore]:
+    """Replace the shared store (tests, scripts); returns the previous one."""
+    global _shared_store
+    with _shared_lock:
+        previous, _shared_store = _shared_store, store
+        return previous
@@ -0,0 +1,194 @@
+"""
+Feedback Result Cache
+
+`generate_comprehensive_feedback_with_grammar` is called by /results,
+/download and /compare, and the frontend polls results repeatedly for the
+same finished job. This cache memoizes the feedback dictionary keyed by a
+hash of (sections, validation, include_grammar, engine versions), so a
+repeated request with unchanged input skips completeness, grammar and
+action-verb analysis.
+
+The engine versions fingerprint covers the scoring weights, the grammar
+backend, the weak-verb table and the skill dictionary files, so changing
+any of them produces new keys. `invalidate()` additionally drops every
+entry, for changes the fingerprint cannot see.
+
+`RenderCache` holds rendered PDF reports, keyed by a hash of the
+anonymized template context, and is bounded by total bytes.
+"""
+
+import copy
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_SIZE = int(os.getenv("FEEDBACK_CACHE_SIZE", "256"))
+SKILL_LISTS_DIR = Path("skill_lists")
+
+
+def skill_lists_signature(folder: Path = SKILL_LISTS_DIR) -> Tuple:
+    """(file name, mtime, size) of every skill dictionary file."""
+    if not folder.is_dir():
+        return ()
+    signature = []
+    for path in sorted(folder.glob("*.json")):
+        stat = path.stat()
+        signature.append((path.name, stat.st_mtime_ns, stat.st_size))
+    return tuple(signature)
+
+
+def feedback_key(
+    sections: Dict[str, Any],
+    validation: Dict[str, Any],
+    include_grammar: bool,
+    versions: Dict[str, Any],
+) -> str:
+    """Stable hash of everything a feedback result depends on."""
+    payload = json.dumps(
+        {
+            "sections": sections,
+            "validation": validation,
+            "include_grammar": include_grammar,
+            "versions": versions,
+        },
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def is_cacheable(feedback: Dict[str, Any]) -> bool:
+    """Degraded or failed grammar results are recomputed on the next call."""
+    grammar = feedback.get("grammar") or {}
+    return not grammar.get("degraded") and "error" not in grammar
+
+
+class FeedbackCache:
+    """Thread-safe bounded LRU of feedback key -> feedback dictionary."""
+
+    def __init__(self, max_entries: int = DEFAULT_CACHE_SIZE):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """A private copy of the cached feedback, or None on a miss."""
+        with self._lock:
+            feedback = self._entries.get(key)
+            if feedback is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        # Callers mutate the returned dict (suggestions, scores)
+        return copy.deepcopy(feedback)
+
+    def put(self, key: str, feedback: Dict[str, Any]) -> None:
+        stored = copy.deepcopy(feedback)
+        with self._lock:
+            self._entries[key] = stored
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, reason: str = "") -> None:
+        """Drop every entry (skill dictionaries, weights or engines changed)."""
+        with self._lock:
+            self._entries.clear()
+            self.invalidations += 1
+        logger.info("Feedback cache invalidated%s", f": {reason}" if reason else "")
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": len(self._entries),
+                "invalidations": self.invalidations,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+_shared_cache: Optional[FeedbackCache] = None
+
+
+def get_feedback_cache() -> FeedbackCache:
+    """Process-wide cache shared by the API routers (FEEDBACK_CACHE_SIZE)."""
+    global _shared_cache
+    if _shared_cache is None:
+        _shared_cache = FeedbackCache(DEFAULT_CACHE_SIZE)
+    return _shared_cache
+
+
+def invalidate_feedback_cache(reason: str = "") -> None:
+    """Invalidate the shared cache if it has been created."""
+    if _shared_cache is not None:
+        _shared_cache.invalidate(reason)
+
+
+DEFAULT_PDF_CACHE_BYTES = int(os.getenv("PDF_CACHE_MAX_BYTES", str(32 * 1024 * 1024)))
+
+
+class RenderCache:
+    """
+    Thread-safe LRU of render key -> PDF bytes, bounded by total size.
+    A single document larger than the whole budget is not cached.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_PDF_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, bytes]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            data = self._entries.get(key)
+            if data is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return data
+
+    def put(self, key: str, data: bytes) -> None:
+        if len(data) > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= len(previous)
+            self._entries[key] = data
+            self._size += len(data)
+            while self._size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": len(self._entries),
+                "bytes": self._size,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
@@ -6,32 +6,81 @@ Feedback Generator Module (Merged)
     much stricter and based on ALL suggestions.
 2.  All scoring weights are adjusted to 60% (Completeness),
     30% (Verbs), and 10% (Grammar).
+
+Feedback can be memoized in a FeedbackCache (see feedback_cache.py); the
+API routers share one process-wide cache.
 """
 
 import os
 import io
+import json
+import hashlib
 import logging
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 from xhtml2pdf import pisa
-from jinja2 import Template
+from jinja2 import Environment, FileSystemLoader
 
 from src.parser.section_detector import SectionDetector, SectionType
 from src.core.masking import mask_email, mask_phone
 from src.core.grammar_integration import enhance_feedback_with_grammar
-from src.core.action_verbs import ActionVerbEngine
+from src.core.action_verbs import WEAK_TO_STRONG, get_action_verb_engine
+from src.core.grammar_service import grammar_service
+from src.feedback.native_pdf import render_native_pdf
+from src.utils.tracing import span
+from src.feedback.feedback_cache import (
+    FeedbackCache,
+    RenderCache,
+    feedback_key,
+    is_cacheable,
+    skill_lists_signature,
+)
 
 logger = logging.getLogger(__name__)
 
+# Bump when scoring/feedback logic changes so cached results are not reused
+FEEDBACK_ENGINE_VERSION = "2"
+
+# Quality score weights (must sum to 1.0)
+SCORE_WEIGHTS = {"completeness": 0.60, "verbs": 0.30, "grammar": 0.10}
+PENALTY_PER_ISSUE = 15
+
 
 class FeedbackGenerator:
     """
     Generates resume feedback for completeness, structure, grammar, and style.
     """
 
-    def __init__(self):
+    def __init__(self, cache: Optional[FeedbackCache] = None):
         self.section_detector = SectionDetector()
+        self.cache = cache
+        self.weights = dict(SCORE_WEIGHTS)
+        self.penalty_per_issue = PENALTY_PER_ISSUE
         logger.info("Initialized FeedbackGenerator")
 
+    def set_weights(
+        self, weights: Optional[Dict[str, float]] = None, penalty_per_issue: int = None
+    ) -> None:
+        """Change scoring weights/penalty and invalidate cached feedback."""
+        if weights:
+            self.weights.update(weights)
+        if penalty_per_issue is not None:
+            self.penalty_per_issue = penalty_per_issue
+        if self.cache is not None:
+            self.cache.invalidate("scoring weights changed")
+
+    def engine_versions(self) -> Dict[str, Any]:
+        """Everything besides the input that a feedback result depends on."""
+        return {
+            "feedback": FEEDBACK_ENGINE_VERSION,
+            "weights": self.weights,
+            "penalty_per_issue": self.penalty_per_issue,
+            # The tool actually serving checks (e.g. the local checker when
+            # LanguageTool failed to start), not the configured one
+            "grammar_backend": grammar_service.status()["backend"],
+            "weak_verbs": sorted(WEAK_TO_STRONG.items()),
+            "skill_lists": skill_lists_signature(),
+        }
+
     # ----------------------------------------------------------------------
     # --- 🔴 MODIFIED FUNCTION (WEIGHTS) 🔴 ---
     # ----------------------------------------------------------------------
@@ -39,18 +88,17 @@ class FeedbackGenerator:
         self,
         penalized_completeness: int,
         validation: Dict,
-        grammar_score: float,
+        grammar_score: Optional[float],
         verb_score: int,
     ) -> int:
         """
         Calculates the final weighted score, integrating Quality and JD Match.
+        A grammar_score of None (unscored) leaves grammar out of the weights.
         """
         base_completeness = penalized_completeness
         jd_match_score = validation.get("keyword_match_score", 0)
-        grammar_score_scaled = int(grammar_score * 100)
 
         base_completeness = min(100, max(0, base_completeness))
-        grammar_score_scaled = min(100, max(0, grammar_score_scaled))
         verb_score = min(100, max(0, verb_score))
         jd_match_score = min(100, max(0, jd_match_score))
 
@@ -59,11 +107,15 @@ class FeedbackGenerator:
         # Completeness: 60%
         # Action Verbs: 30%
         # Grammar: 10%
-        quality_score = (
-            (base_completeness * 0.60)
-            + (verb_score * 0.30)
-            + (grammar_score_scaled * 0.10)
+        quality_score = (base_completeness * self.weights["completeness"]) + (
+            verb_score * self.weights["verbs"]
         )
+        if grammar_score is None:
+            scored_weight = self.weights["completeness"] + self.weights["verbs"]
+            quality_score = quality_score / scored_weight if scored_weight else 0
+        else:
+            grammar_score_scaled = min(100, max(0, int(grammar_score * 100)))
+            quality_score += grammar_score_scaled * self.weights["grammar"]
 
         if jd_match_score < 1:
             final_score = quality_score
@@ -175,7 +227,7 @@ class FeedbackGenerator:
         # which correctly includes BOTH missing and incomplete sections.
 
         num_issues = len(suggestions)
-        penalty_per_issue = 15  # Much stricter penalty
+        penalty_per_issue = self.penalty_per_issue  # Much stricter penalty
 
         completeness_penalty = num_issues * penalty_per_issue
 
@@ -248,6 +300,33 @@ class FeedbackGenerator:
         sections: Dict[str, str],
         validation: Dict,
         include_grammar: bool = True,
+    ) -> Dict:
+        """Full feedback, served from the cache when the input is unchanged."""
+        if self.cache is None:
+            return self._generate_feedback_with_grammar(
+                sections, validation, include_grammar
+            )
+
+        key = feedback_key(
+            sections, validation, include_grammar, self.engine_versions()
+        )
+        cached = self.cache.get(key)
+        if cached is not None:
+            logger.info("Feedback cache hit")
+            return cached
+
+        feedback = self._generate_feedback_with_grammar(
+            sections, validation, include_grammar
+        )
+        if is_cacheable(feedback):
+            self.cache.put(key, feedback)
+        return feedback
+
+    def _generate_feedback_with_grammar(
+        self,
+        sections: Dict[str, str],
+        validation: Dict,
+        include_grammar: bool = True,
     ) -> Dict:
         logger.info("Generating comprehensive feedback with grammar + verb analysis")
 
@@ -258,10 +337,11 @@ class FeedbackGenerator:
         if include_grammar:
             try:
                 # This external function *only* returns grammar data
-                enhanced_feedback = enhance_feedback_with_grammar(
-                    sections=sections,
-                    base_feedback=base_feedback,
-                )
+                with span("grammar", sections=len(sections)):
+                    enhanced_feedback = enhance_feedback_with_grammar(
+                        sections=sections,
+                        base_feedback=base_feedback,
+                    )
 
                 # --- 🐞 BUG FIX AREA START 🐞 ---
 
@@ -289,7 +369,12 @@ class FeedbackGenerator:
                     )
 
                 # --- FINAL SCORING LOGIC ---
-                grammar_score = grammar_data.get("score", 0)
+                # A degraded check is left out of the score, not counted
+                grammar_score = (
+                    None
+                    if grammar_data.get("degraded")
+                    else grammar_data.get("score", 0)
+                )
                 verb_score = verb_data.get("overall_score", 0)
 
                 final_overall_score = self._calculate_final_score(
@@ -376,21 +461,25 @@ class FeedbackGenerator:
     # ----------------------------------------------------------------------
     def _analyze_action_verbs(self, sections: dict) -> dict:
         """Analyze experience/project sections for weak verbs."""
-        engine = ActionVerbEngine()
+        engine = get_action_verb_engine()
         all_suggestions = []
         section_scores = {}
         total_weak = 0
         total_verbs = 0
-        for name, text in sections.items():
-            if name.lower() in ["experience", "projects"]:
-                result = engine.suggest(text)
-                section_scores[name] = result["score"]
-                total_weak += result["weak_verbs"]
-                total_verbs += result["total_verbs"]
-                for w, s in zip(result["found"], result["suggestions"]):
-                    all_suggestions.append(
-                        f"Replace weak verb '{w}' with stronger '{s}' in {name} section."
-                    )
+        verb_sections = {
+            name: text
+            for name, text in sections.items()
+            if name.lower() in ["experience", "projects"]
+        }
+        # One spaCy pass over all verb sections
+        for name, result in engine.analyze_sections(verb_sections).items():
+            section_scores[name] = result["score"]
+            total_weak += result["weak_verbs"]
+            total_verbs += result["total_verbs"]
+            for w, s in zip(result["found"], result["suggestions"]):
+                all_suggestions.append(
+                    f"Replace weak verb '{w}' with stronger '{s}' in {name} section."
+                )
 
         # --- 🔴 BUG FIX 🔴 ---
         # If total_verbs is 0, the score must be 0, not 100.
@@ -423,27 +512,30 @@ def anonymize_data(report: dict) -> dict:
     return anonymized_report
 
 
-def generate_pdf_report(report_json: dict) -> bytes:
-    """Implements PDF export using xhtml2pdf and Jinja2."""
+PROJECT_ROOT = os.path.abspath(
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..")
+)
+TEMPLATES_DIR = os.path.join(PROJECT_ROOT, "templates")
+REPORT_TEMPLATE = "report_template.html"
+# "html": Jinja template + xhtml2pdf; "native": direct reportlab drawing
+PDF_BACKEND = os.getenv("PDF_BACKEND", "html").lower()
+PDF_BACKENDS = ("html", "native")
 
-    # 1. FIX TEMPLATE PATH
-    try:
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        project_root = os.path.abspath(os.path.join(current_dir, "..", ".."))
-        template_path = os.path.join(project_root, "templates", "report_template.html")
-
-        if not os.path.exists(template_path):
-            logger.error(f"Template not found at path: {template_path}")
-            raise FileNotFoundError(
-                f"PDF Template not found. Looked in: {template_path}"
-            )
+# Compiled once; auto_reload recompiles only when the file's mtime changes
+_template_env = Environment(loader=FileSystemLoader(TEMPLATES_DIR), auto_reload=True)
+_pdf_cache = RenderCache()
 
-        with open(template_path, "r", encoding="utf-8") as f:
-            template_content = f.read()
-    except Exception as e:
-        logger.error(f"Error reading PDF template: {e}")
-        raise
 
+def _template_path() -> str:
+    template_path = os.path.join(TEMPLATES_DIR, REPORT_TEMPLATE)
+    if not os.path.exists(template_path):
+        logger.error(f"Template not found at path: {template_path}")
+        raise FileNotFoundError(f"PDF Template not found. Looked in: {template_path}")
+    return template_path
+
+
+def build_report_context(report_json: dict) -> dict:
+    """Map an analysis report onto the (anonymized) PDF template context."""
     # NEW ROBUST MAPPING
 
     # Get the nested dictionaries first, with fallbacks.
@@ -478,18 +570,73 @@ def generate_pdf_report(report_json: dict) -> bytes:
         },
     }
 
-    # 3. Anonymize the new, correctly-structured context
-    safe_report_context = anonymize_data(template_context)
+    # Anonymize the new, correctly-structured context
+    return anonymize_data(template_context)
+
+
+def report_fingerprint(report_json: dict) -> str:
+    """
+    Hash of the anonymized template context plus the template version and
+    PDF backend. Identical fingerprints render identical PDFs (used as cache
+    key and ETag).
+    """
+    stat = os.stat(_template_path())
+    payload = json.dumps(
+        {
+            "context": build_report_context(report_json),
+            "template": [stat.st_mtime_ns, stat.st_size],
+            "backend": PDF_BACKEND,
+        },
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def get_pdf_cache() -> RenderCache:
+    """The process-wide rendered PDF cache."""
+    return _pdf_cache
 
-    # 4. Render the template
-    template = Template(template_content)
-    html_content = template.render(report=safe_report_context)
 
-    # 5. Generate PDF
+def render_pdf_bytes(report_json: dict, backend: Optional[str] = None) -> bytes:
+    """
+    Render a report to PDF without consulting the cache. Module-level so it
+    can run in a worker process (see pdf_renderer.py).
+
+    Args:
+        backend: "html" or "native"; defaults to PDF_BACKEND.
+    """
+    backend = backend or PDF_BACKEND
+    if backend == "native":
+        return render_native_pdf(build_report_context(report_json))
+    if backend != "html":
+        raise ValueError(f"Unknown PDF backend {backend!r}; use one of {PDF_BACKENDS}")
+
+    template = _template_env.get_template(REPORT_TEMPLATE)
+    html_content = template.render(report=build_report_context(report_json))
+
     result = io.BytesIO()
     pdf = pisa.CreatePDF(io.StringIO(html_content), dest=result)
+    if pdf.err:
+        raise Exception(f"PDF Generation Error: {pdf.err}")
+    return result.getvalue()
+
+
+def generate_pdf_report(report_json: dict) -> bytes:
+    """Implements PDF export using xhtml2pdf and Jinja2."""
+    try:
+        key = report_fingerprint(report_json)
+    except Exception as e:
+        logger.error(f"Error reading PDF template: {e}")
+        raise
 
-    if not pdf.err:
-        return result.getvalue()
+    with span("pdf", backend=PDF_BACKEND) as current:
+        cached = _pdf_cache.get(key)
+        current.set(cache_hit=cached is not None)
+        if cached is not None:
+            return cached
 
-    raise Exception(f"PDF Generation Error: {pdf.err}")
+        pdf_bytes = render_pdf_bytes(report_json)
+        current.set(pdf_bytes=len(pdf_bytes))
+    _pdf_cache.put(key, pdf_bytes)
+    return pdf_bytes
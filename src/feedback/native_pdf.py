@@ -0,0 +1,214 @@
+"""
+Native PDF Report Writer
+
+Draws the content of `templates/report_template.html` straight onto a
+reportlab canvas. Our report is a fixed one-page layout, so the HTML/CSS
+parse and layout pass of xhtml2pdf is not needed: positions, font sizes and
+colors are precomputed below, and only the list items are wrapped at render
+time. Fonts are the Bitstream Vera TTFs bundled with reportlab, embedded
+(subset) in the output, so the PDF looks the same on every viewer.
+
+Select it with PDF_BACKEND=native (see feedback_generator.render_pdf_bytes).
+The input is the anonymized context from `build_report_context`.
+"""
+
+import io
+import logging
+import threading
+from typing import Any, Dict, List
+
+from reportlab.lib.colors import HexColor
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.units import mm
+from reportlab.lib.utils import simpleSplit
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfbase.ttfonts import TTFont
+from reportlab.pdfgen.canvas import Canvas
+
+logger = logging.getLogger(__name__)
+
+# --- Precomputed layout (points) ---
+PAGE_WIDTH, PAGE_HEIGHT = A4
+MARGIN = 20 * mm
+CONTENT_WIDTH = PAGE_WIDTH - 2 * MARGIN
+BULLET_INDENT = 8 * mm
+
+FONT_SIZES = {"h1": 20, "h2": 15, "h3": 12, "body": 10.5, "score": 12, "small": 8.5}
+LINE_HEIGHT = {"body": 14, "small": 11}
+HEADER_BOX_HEIGHT = 30 * mm
+
+COLORS = {
+    "text": HexColor("#000000"),
+    "header_bg": HexColor("#f0f0f0"),
+    "section": HexColor("#333333"),
+    "rule": HexColor("#cccccc"),
+    "score": HexColor("#4CAF50"),
+    "anonymized": HexColor("#8b0000"),
+    "muted": HexColor("#888888"),
+}
+
+FOOTER_TEXT = (
+    "This report ensures data privacy. The resume file is automatically "
+    "deleted after analysis."
+)
+
+# Embedded TTFs, with the built-in Type 1 fonts as fallback
+_VERA_FONTS = {
+    "regular": ("Vera", "Vera.ttf"),
+    "bold": ("Vera-Bold", "VeraBd.ttf"),
+    "italic": ("Vera-Italic", "VeraIt.ttf"),
+}
+_BUILTIN_FONTS = {
+    "regular": "Helvetica",
+    "bold": "Helvetica-Bold",
+    "italic": "Helvetica-Oblique",
+}
+_fonts: Dict[str, str] = {}
+_fonts_lock = threading.Lock()
+
+
+def report_fonts() -> Dict[str, str]:
+    """Register the report fonts once per process; style -> font name."""
+    with _fonts_lock:
+        if not _fonts:
+            try:
+                for style, (name, filename) in _VERA_FONTS.items():
+                    pdfmetrics.registerFont(TTFont(name, filename))
+                    _fonts[style] = name
+            except Exception as e:
+                logger.warning(f"Embedded report fonts unavailable: {e}")
+                _fonts.update(_BUILTIN_FONTS)
+        return dict(_fonts)
+
+
+class _ReportCanvas:
+    """Top-down cursor over a reportlab canvas with automatic page breaks."""
+
+    def __init__(self, buffer: io.BytesIO, fonts: Dict[str, str]):
+        self.canvas = Canvas(buffer, pagesize=A4, invariant=True, pageCompression=1)
+        self.canvas.setTitle("Dynamic Resume Analyzer Report")
+        self.fonts = fonts
+        self.y = PAGE_HEIGHT - MARGIN
+
+    def ensure_space(self, height: float) -> None:
+        if self.y - height < MARGIN:
+            self.canvas.showPage()
+            self.y = PAGE_HEIGHT - MARGIN
+
+    def header_box(self, context: Dict[str, Any]) -> None:
+        c = self.canvas
+        top = self.y
+        c.setFillColor(COLORS["header_bg"])
+        c.roundRect(
+            MARGIN, top - HEADER_BOX_HEIGHT, CONTENT_WIDTH, HEADER_BOX_HEIGHT, 5, 0, 1
+        )
+
+        x = MARGIN + 15
+        self.y = top - 15 - FONT_SIZES["h1"]
+        c.setFillColor(COLORS["text"])
+        c.setFont(self.fonts["bold"], FONT_SIZES["h1"])
+        c.drawString(x, self.y, "Resume Analysis Report")
+
+        self.y -= 8
+        for label in ("Candidate", "Email", "Phone"):
+            key = "name" if label == "Candidate" else label.lower()
+            self.y -= LINE_HEIGHT["body"]
+            self.labelled_line(x, f"{label}: ", str(context.get(key, "")))
+        self.y = top - HEADER_BOX_HEIGHT - 10
+
+    def labelled_line(self, x: float, label: str, value: str) -> None:
+        text = self.canvas.beginText(x, self.y)
+        text.setFont(self.fonts["regular"], FONT_SIZES["body"])
+        text.setFillColor(COLORS["text"])
+        text.textOut(label)
+        text.setFont(self.fonts["italic"], FONT_SIZES["body"])
+        text.setFillColor(COLORS["anonymized"])
+        text.textOut(value)
+        self.canvas.drawText(text)
+
+    def section_header(self, title: str) -> None:
+        size = FONT_SIZES["h2"]
+        self.ensure_space(25 + size + 12)
+        self.y -= 25 + size
+        self.canvas.setFillColor(COLORS["section"])
+        self.canvas.setFont(self.fonts["bold"], size)
+        self.canvas.drawString(MARGIN, self.y, title)
+        self.y -= 6
+        self.canvas.setStrokeColor(COLORS["rule"])
+        self.canvas.setLineWidth(2)
+        self.canvas.line(MARGIN, self.y, MARGIN + CONTENT_WIDTH, self.y)
+        self.y -= 4
+
+    def subheader(self, title: str) -> None:
+        size = FONT_SIZES["h3"]
+        self.ensure_space(14 + size)
+        self.y -= 14 + size
+        self.canvas.setFillColor(COLORS["text"])
+        self.canvas.setFont(self.fonts["bold"], size)
+        self.canvas.drawString(MARGIN, self.y, title)
+        self.y -= 4
+
+    def score_lines(self, score: Any, match: Any) -> None:
+        self.y -= 10 + LINE_HEIGHT["body"]
+        text = self.canvas.beginText(MARGIN, self.y)
+        text.setFont(self.fonts["regular"], FONT_SIZES["body"])
+        text.setFillColor(COLORS["text"])
+        text.textOut("**Quality Score:** ")
+        text.setFont(self.fonts["bold"], FONT_SIZES["score"])
+        text.setFillColor(COLORS["score"])
+        text.textOut(f"{score}/100")
+        self.canvas.drawText(text)
+
+        self.y -= LINE_HEIGHT["body"] + 4
+        self.canvas.setFillColor(COLORS["text"])
+        self.canvas.setFont(self.fonts["regular"], FONT_SIZES["body"])
+        self.canvas.drawString(MARGIN, self.y, f"**Job Match:** {match}%")
+
+    def bullets(self, items: List[Any]) -> None:
+        font, size = self.fonts["regular"], FONT_SIZES["body"]
+        width = CONTENT_WIDTH - BULLET_INDENT
+        self.y -= 4
+        for item in items:
+            lines = simpleSplit(str(item), font, size, width) or [""]
+            for i, line in enumerate(lines):
+                self.ensure_space(LINE_HEIGHT["body"])
+                self.y -= LINE_HEIGHT["body"]
+                self.canvas.setFillColor(COLORS["text"])
+                self.canvas.setFont(font, size)
+                if i == 0:
+                    self.canvas.drawString(MARGIN + BULLET_INDENT / 2, self.y, "•")
+                self.canvas.drawString(MARGIN + BULLET_INDENT, self.y, line)
+
+    def footer(self) -> None:
+        font, size = self.fonts["regular"], FONT_SIZES["small"]
+        lines = simpleSplit(FOOTER_TEXT, font, size, CONTENT_WIDTH)
+        self.ensure_space(40 + LINE_HEIGHT["small"] * len(lines))
+        self.y -= 40
+        self.canvas.setFillColor(COLORS["muted"])
+        self.canvas.setFont(font, size)
+        for line in lines:
+            self.y -= LINE_HEIGHT["small"]
+            self.canvas.drawString(MARGIN, self.y, line)
+
+    def finish(self) -> None:
+        self.canvas.showPage()
+        self.canvas.save()
+
+
+def render_native_pdf(context: Dict[str, Any]) -> bytes:
+    """Render a report template context (see build_report_context) to PDF."""
+    buffer = io.BytesIO()
+    page = _ReportCanvas(buffer, report_fonts())
+    feedback = context.get("feedback", {})
+
+    page.header_box(context)
+    page.section_header("Overall Fit")
+    page.score_lines(context.get("score", 0), context.get("match_percentage", 0))
+    page.section_header("Feedback and Gaps")
+    page.subheader("Missing Core Sections:")
+    page.bullets(feedback.get("missingSections", []))
+    page.subheader("Suggestions for Improvement:")
+    page.bullets(feedback.get("suggestions", []))
+    page.footer()
+    page.finish()
+    return buffer.getvalue()
@@ -0,0 +1,113 @@
+"""
+PDF Backend Benchmark
+
+Compares render time and memory per report of the PDF backends
+("html": Jinja + xhtml2pdf, "native": direct reportlab drawing). Rendering
+bypasses the PDF cache, so every run does the full work.
+
+Usage:
+    python -m src.feedback.pdf_benchmark --runs 50
+    python -m src.feedback.pdf_benchmark --backends native --json
+"""
+
+import argparse
+import copy
+import json
+import statistics
+import time
+import tracemalloc
+from typing import Any, Dict, List, Optional, Sequence
+
+from src.feedback.feedback_generator import PDF_BACKENDS, render_pdf_bytes
+from src.mock_data import MOCK_ANALYSIS_REPORT
+
+
+def sample_report(suggestions: int = 2) -> Dict[str, Any]:
+    """The mock report, optionally padded with extra suggestions."""
+    report = copy.deepcopy(MOCK_ANALYSIS_REPORT)
+    extra = [
+        f"Quantify the impact of project {i} with concrete metrics."
+        for i in range(max(0, suggestions - len(report["feedback"]["suggestions"])))
+    ]
+    report["feedback"]["suggestions"].extend(extra)
+    return report
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, round(pct / 100 * (len(ordered) - 1)))
+    return ordered[index]
+
+
+def benchmark_backend(
+    backend: str, report: Optional[dict] = None, runs: int = 20, warmup: int = 2
+) -> Dict[str, Any]:
+    """
+    Time `runs` renders of `report` with `backend`.
+
+    Returns:
+        Latency (mean/p50/p95 ms), peak traced memory per render (KiB) and
+        output size (bytes).
+    """
+    report = report or sample_report()
+    for _ in range(warmup):
+        render_pdf_bytes(report, backend)
+
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        pdf_bytes = render_pdf_bytes(report, backend)
+        timings.append((time.perf_counter() - start) * 1000)
+
+    # Measured separately: tracing slows allocation-heavy code down
+    peaks = []
+    for _ in range(min(runs, 5)):
+        tracemalloc.start()
+        render_pdf_bytes(report, backend)
+        peaks.append(tracemalloc.get_traced_memory()[1] / 1024)
+        tracemalloc.stop()
+
+    return {
+        "backend": backend,
+        "runs": runs,
+        "mean_ms": round(statistics.mean(timings), 2),
+        "p50_ms": round(_percentile(timings, 50), 2),
+        "p95_ms": round(_percentile(timings, 95), 2),
+        "peak_kib": round(max(peaks), 1),
+        "pdf_bytes": len(pdf_bytes),
+    }
+
+
+def run(
+    backends: Sequence[str] = PDF_BACKENDS, runs: int = 20, suggestions: int = 2
+) -> List[Dict[str, Any]]:
+    report = sample_report(suggestions)
+    return [benchmark_backend(backend, report, runs) for backend in backends]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark PDF report backends")
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--suggestions", type=int, default=2)
+    parser.add_argument("--backends", nargs="+", default=list(PDF_BACKENDS))
+    parser.add_argument("--json", action="store_true", help="print JSON results")
+    args = parser.parse_args()
+
+    results = run(args.backends, args.runs, args.suggestions)
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(
+        f"{'backend':<8} {'mean ms':>9} {'p50 ms':>9} {'p95 ms':>9} "
+        f"{'peak KiB':>10} {'bytes':>8}"
+    )
+    for r in results:
+        print(
+            f"{r['backend']:<8} {r['mean_ms']:>9} {r['p50_ms']:>9} {r['p95_ms']:>9} "
+            f"{r['peak_kib']:>10} {r['pdf_bytes']:>8}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,305 @@
+"""
+Off-loop PDF Rendering
+
+xhtml2pdf takes hundreds of milliseconds per report. Rendering inline in the
+download endpoint tied up a request worker for that long, so concurrent
+downloads starved every other request. `PdfRenderer` moves rendering into a
+bounded process pool:
+
+- at most `workers` renders run at once and at most `max_pending` more wait
+  in the queue; beyond that `render()` fails fast with RenderQueueFullError
+- callers await the render with a timeout (RenderTimeoutError); a render
+  that times out keeps running and still fills the cache for the retry
+- concurrent requests for the same report share one render
+
+With PDF_PRERENDER=true the report of a finished analysis is rendered by the
+job's final stage (src/api/jobs.py) and written to PDF_PRERENDER_DIR, keyed
+by report fingerprint, so the download is a file read. The files hold the
+candidate's details, so like result snapshots they are deleted with the
+job's upload (`discard_job`) and expire after RESULT_SNAPSHOT_TTL seconds
+(files left by an earlier process are pruned on start).
+
+Configuration: PDF_RENDER_WORKERS, PDF_RENDER_QUEUE, PDF_RENDER_TIMEOUT,
+PDF_RENDER_POOL ("process" or "thread"), PDF_PRERENDER, PDF_PRERENDER_DIR.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+import time
+from typing import Any, Callable, Dict, Optional, Set
+
+from src.database.result_store import RESULT_SNAPSHOT_TTL
+from src.feedback.feedback_generator import (
+    get_pdf_cache,
+    render_pdf_bytes,
+    report_fingerprint,
+)
+
+logger = logging.getLogger(__name__)
+
+PDF_RENDER_WORKERS = int(os.getenv("PDF_RENDER_WORKERS", "2"))
+PDF_RENDER_QUEUE = int(os.getenv("PDF_RENDER_QUEUE", "8"))
+PDF_RENDER_TIMEOUT = float(os.getenv("PDF_RENDER_TIMEOUT", "30"))
+PDF_RENDER_POOL = os.getenv("PDF_RENDER_POOL", "process").lower()
+PDF_PRERENDER = os.getenv("PDF_PRERENDER", "false").lower() == "true"
+PDF_PRERENDER_DIR = Path(os.getenv("PDF_PRERENDER_DIR", "reports/prerendered"))
+
+
+class RenderQueueFullError(Exception):
+    """Raised when every worker is busy and the wait queue is full."""
+
+
+class RenderTimeoutError(Exception):
+    """Raised when a render did not finish within the caller's timeout."""
+
+
+class PdfRenderer:
+    """
+    Bounded pool that renders report PDFs away from the event loop.
+
+    Args:
+        workers: Renders running at the same time.
+        max_pending: Renders allowed to wait for a free worker.
+        timeout: Default seconds `render()` waits for a result.
+        use_processes: Render in worker processes (False: threads, for
+            tests and platforms without multiprocessing).
+        store_dir: Directory for rendered PDFs that outlive the process
+            cache (pre-rendered reports); None keeps them in memory only.
+        ttl: Seconds a stored PDF is kept (0 keeps it until its job's
+            upload is deleted).
+        render_func: Picklable function turning a report into PDF bytes.
+    """
+
+    def __init__(
+        self,
+        workers: int = PDF_RENDER_WORKERS,
+        max_pending: int = PDF_RENDER_QUEUE,
+        timeout: float = PDF_RENDER_TIMEOUT,
+        use_processes: bool = PDF_RENDER_POOL == "process",
+        store_dir: Optional[Path] = None,
+        ttl: float = RESULT_SNAPSHOT_TTL,
+        render_func: Callable[[dict], bytes] = render_pdf_bytes,
+    ):
+        self.workers = max(1, workers)
+        self.max_pending = max(0, max_pending)
+        self.timeout = timeout
+        self.use_processes = use_processes
+        self.store_dir = Path(store_dir) if store_dir is not None else None
+        self.ttl = ttl
+        self.render_func = render_func
+        self._executor: Optional[Executor] = None
+        self._inflight: Dict[str, Future] = {}
+        # job_id -> fingerprints of its stored PDFs, for upload cleanup
+        self._job_keys: Dict[str, Set[str]] = {}
+        self._lock = threading.Lock()
+        self.rendered = 0
+        self.rejected = 0
+        self.timeouts = 0
+        self.failures = 0
+        self.file_hits = 0
+
+    @property
+    def running(self) -> bool:
+        return self._executor is not None
+
+    def start(self) -> "PdfRenderer":
+        """Create the worker pool (idempotent)."""
+        with self._lock:
+            if self._executor is None:
+                if self.use_processes:
+                    # spawn: forking a process that runs threads is unsafe
+                    self._executor = ProcessPoolExecutor(
+                        max_workers=self.workers,
+                        mp_context=multiprocessing.get_context("spawn"),
+                    )
+                else:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.workers, thread_name_prefix="pdf-render"
+                    )
+                logger.info(
+                    "PDF renderer started (%d %s workers)",
+                    self.workers,
+                    "process" if self.use_processes else "thread",
+                )
+                self.prune_store()
+        return self
+
+    def stop(self) -> None:
+        """Shut the pool down; queued renders that have not started are dropped."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+            self._inflight.clear()
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+            logger.info("PDF renderer stopped")
+
+    def lookup(self, key: str) -> Optional[bytes]:
+        """A rendered PDF from the memory cache or the store directory."""
+        cache = get_pdf_cache()
+        data = cache.get(key)
+        if data is not None:
+            return data
+        path = self._store_path(key)
+        if path is not None and path.is_file() and not self._expired(path):
+            data = path.read_bytes()
+            cache.put(key, data)
+            self.file_hits += 1
+            return data
+        return None
+
+    def submit(self, report_json: dict, key: Optional[str] = None) -> Future:
+        """
+        Queue a render and return its future. A render already in flight for
+        the same report is shared.
+
+        Raises:
+            RenderQueueFullError: every worker is busy and the queue is full.
+        """
+        key = key or report_fingerprint(report_json)
+        executor = self._executor or self.start()._executor
+        with self._lock:
+            future = self._inflight.get(key)
+            if future is not None:
+                return future
+            if len(self._inflight) >= self.workers + self.max_pending:
+                self.rejected += 1
+                raise RenderQueueFullError(
+                    f"{len(self._inflight)} PDF renders already queued"
+                )
+            future = executor.submit(self.render_func, report_json)
+            self._inflight[key] = future
+        future.add_done_callback(lambda f: self._finished(key, f))
+        return future
+
+    async def render(
+        self,
+        report_json: dict,
+        timeout: Optional[float] = None,
+        job_id: Optional[str] = None,
+    ) -> bytes:
+        """
+        PDF bytes for `report_json`, rendered in the pool unless cached.
+        With `job_id`, a stored copy is deleted by `discard_job(job_id)`.
+
+        Raises:
+            RenderQueueFullError: the render queue is full.
+            RenderTimeoutError: no result within `timeout` seconds.
+        """
+        key = report_fingerprint(report_json)
+        if job_id is not None and self.store_dir is not None:
+            with self._lock:
+                self._job_keys.setdefault(job_id, set()).add(key)
+        data = self.lookup(key)
+        if data is not None:
+            return data
+
+        future = asyncio.wrap_future(self.submit(report_json, key))
+        timeout = self.timeout if timeout is None else timeout
+        try:
+            # shield: a timed-out render finishes and fills the cache
+            return await asyncio.wait_for(asyncio.shield(future), timeout)
+        except asyncio.TimeoutError as e:
+            self.timeouts += 1
+            raise RenderTimeoutError(f"PDF render exceeded {timeout:.1f}s") from e
+
+    def _finished(self, key: str, future: Future) -> None:
+        with self._lock:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+        if future.cancelled():
+            return
+        error = future.exception()
+        if error is not None:
+            self.failures += 1
+            logger.error("PDF render failed: %s", error)
+            return
+        data = future.result()
+        self.rendered += 1
+        get_pdf_cache().put(key, data)
+        self._store(key, data)
+
+    def _store_path(self, key: str) -> Optional[Path]:
+        if self.store_dir is None:
+            return None
+        return self.store_dir / f"{key}.pdf"
+
+    def _store(self, key: str, data: bytes) -> None:
+        path = self._store_path(key)
+        if path is None:
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_bytes(data)
+            os.replace(tmp, path)
+        except OSError as e:
+            logger.warning("Could not store rendered PDF %s: %s", path, e)
+
+    def _expired(self, path: Path) -> bool:
+        if self.ttl <= 0:
+            return False
+        try:
+            return path.stat().st_mtime < time.time() - self.ttl
+        except OSError:
+            return True
+
+    def _unlink(self, path: Path) -> bool:
+        try:
+            path.unlink()
+            return True
+        except FileNotFoundError:
+            return False
+        except OSError as e:
+            logger.warning("Could not delete rendered PDF %s: %s", path, e)
+            return False
+
+    def discard_job(self, job_id: str) -> int:
+        """Delete the stored PDFs of a job whose upload is deleted."""
+        with self._lock:
+            keys = self._job_keys.pop(job_id, set())
+            # Identical reports share one file; keep it for the other jobs
+            for other in self._job_keys.values():
+                keys -= other
+        removed = 0
+        for key in keys:
+            path = self._store_path(key)
+            if path is not None and self._unlink(path):
+                removed += 1
+        return removed
+
+    def prune_store(self) -> int:
+        """Delete stored PDFs older than the TTL."""
+        if self.store_dir is None or self.ttl <= 0 or not self.store_dir.is_dir():
+            return 0
+        return sum(
+            self._unlink(path)
+            for path in self.store_dir.glob("*.pdf")
+            if self._expired(path)
+        )
+
+    def status(self) -> Dict[str, Any]:
+        with self._lock:
+            pending = len(self._inflight)
+        return {
+            "running": self.running,
+            "pool": "process" if self.use_processes else "thread",
+            "workers": self.workers,
+            "max_pending": self.max_pending,
+            "in_flight": pending,
+            "rendered": self.rendered,
+            "rejected": self.rejected,
+            "timeouts": self.timeouts,
+            "failures": self.failures,
+            "file_hits": self.file_hits,
+            "prerender": self.store_dir is not None,
+        }
+
+
+# The one renderer per process, started/stopped by src.main
+pdf_renderer = PdfRenderer(store_dir=PDF_PRERENDER_DIR if PDF_PRERENDER else None)
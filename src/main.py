@@ -7,7 +7,7 @@ using `MOCK_ANALYSIS_REPORT`.
 """
 
 import io
-from fastapi.responses import Response
+from fastapi.responses import PlainTextResponse, Response
 from fastapi import HTTPException
 
 # Import your new functions from their correct modules
@@ -15,10 +15,23 @@ from src.feedback.feedback_generator import generate_pdf_report
 from src.mock_data import MOCK_ANALYSIS_REPORT
 
 import json
+import uuid
 from src.utils.perf import time_execution
+from src.utils.metrics import REGISTRY
+from src.utils.tracing import span, tracer
+from src.utils.memory import MEMORY_TRACKING, memory_tracker
+from src.utils.profiler import (
+    ProfilerBusyError,
+    begin_profile,
+    end_profile,
+    profile_store,
+)
 from src.upload.service import delete_and_log
+
 # from src.database.connection import init_db  # For database initialization
 from src.database.metadata_model import Base  # For table creation
+from src.database.metadata_writer import shutdown_metadata_writer
+from src.database.connection import db_pool_status, dispose_engine
 from src.mock_data import MOCK_FILE_METADATA
 
 from fastapi import FastAPI
@@ -28,17 +41,28 @@ from fastapi import Request
 from fastapi.responses import RedirectResponse
 
 # Import your new functions from their correct modules
-from src.feedback.feedback_generator import generate_pdf_report
+from src.feedback.feedback_generator import generate_pdf_report, report_fingerprint
 
 # from src.mock_data import MOCK_ANALYSIS_REPORT # <-- BUG: We don't want this
 from src.api.data_service import get_analysis_data  # <-- FIX: Import the new function
+from src.api.data_service import prune_result_snapshots
 
 # Import routers
 from src.upload.routes import router as upload_router
 from src.api.results import router as results_router
 from src.api.compare import router as compare_router
+from src.api.export import router as export_router
+from src.api.jobs import router as jobs_router
+from src.api.dashboard import router as dashboard_router
+from src.api.admin import is_admin, router as admin_router
 from src.utils.error_handler import register_error_handlers
-
+from src.core.grammar_service import grammar_service
+from src.feedback.pdf_renderer import (
+    RenderQueueFullError,
+    RenderTimeoutError,
+    pdf_renderer,
+)
+from starlette.concurrency import run_in_threadpool
 
 app = FastAPI(
     title="Resume Analyzer API",
@@ -59,6 +83,10 @@ app.add_middleware(
 app.include_router(upload_router, prefix="/api/v1/parse", tags=["Upload"])
 app.include_router(results_router, prefix="/api/v1", tags=["Results"])
 app.include_router(compare_router)
+app.include_router(export_router, prefix="/api/v1", tags=["Export"])
+app.include_router(jobs_router, prefix="/api/v1", tags=["Jobs"])
+app.include_router(dashboard_router, prefix="/api/v1", tags=["Dashboard"])
+app.include_router(admin_router, prefix="/api/v1", tags=["Admin"])
 
 
 @app.get("/")
@@ -77,23 +105,80 @@ def health():
     return {"status": "healthy"}
 
 
+@app.get("/api/v1/health/grammar")
+def grammar_health():
+    """Grammar service lifecycle status (backend, restarts, last error)"""
+    return grammar_service.status()
+
+
+@app.get("/api/v1/health/pdf")
+def pdf_health():
+    """PDF render pool status (queue depth, timeouts, rejections)"""
+    return pdf_renderer.status()
+
+
+@app.get("/metrics", include_in_schema=False)
+def metrics(format: str = "prometheus"):
+    """Process metrics in the Prometheus text format (or JSON with percentiles)"""
+    if format == "json":
+        return REGISTRY.snapshot()
+    return PlainTextResponse(
+        REGISTRY.exposition(), media_type="text/plain; version=0.0.4"
+    )
+
+
+@app.get("/api/v1/health/db")
+def db_health():
+    """Database pool status (in-use connections, overflow, checkout latency)"""
+    return db_pool_status()
+
+
 # --- UPDATED DOWNLOAD ENDPOINT ---
 
 
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """RFC 9110 If-None-Match comparison (weak, list or '*')."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return any(tag.removeprefix("W/") == etag for tag in candidates)
+
+
 @app.get("/api/v1/download/{job_id}")
-def download_report(job_id: str):
+async def download_report(job_id: str, request: Request):
     """
     Implements the API endpoint for downloading the analysis report as PDF.
+
+    The response carries an ETag derived from the anonymized report content;
+    a repeat download with a matching If-None-Match gets 304 without
+    rendering. Rendering runs in the bounded PDF pool: a full queue answers
+    503 and a render slower than PDF_RENDER_TIMEOUT answers 504.
     """
     try:
         # --- THIS IS THE FIX ---
         # Get the REAL data for the job_id
-        report_data = get_analysis_data(job_id)
+        report_data = await run_in_threadpool(get_analysis_data, job_id)
         # ---------------------
 
-        # Call your function from the feedback_generator
-        pdf_output_bytes = generate_pdf_report(report_data)
+        etag = f'"{report_fingerprint(report_data)}"'
+        cache_headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+        if _etag_matches(request.headers.get("if-none-match"), etag):
+            return Response(status_code=304, headers=cache_headers)
 
+        # Rendered off the event loop (or read from the pre-render store)
+        with span("pdf_render", job_id) as current:
+            pdf_output_bytes = await pdf_renderer.render(report_data, job_id=job_id)
+            current.set(pdf_bytes=len(pdf_output_bytes))
+        tracer.export_job(job_id)
+
+    except RenderQueueFullError as e:
+        raise HTTPException(
+            status_code=503, detail=str(e), headers={"Retry-After": "5"}
+        )
+    except RenderTimeoutError as e:
+        raise HTTPException(status_code=504, detail=str(e))
     except Exception as e:
         # Use FastAPI's way of handling errors
         raise HTTPException(
@@ -102,7 +187,8 @@ def download_report(job_id: str):
 
     # Define the headers to tell the browser it's a file download
     headers = {
-        "Content-Disposition": f'attachment; filename="Analysis_Report_{job_id}.pdf"'
+        "Content-Disposition": f'attachment; filename="Analysis_Report_{job_id}.pdf"',
+        **cache_headers,
     }
 
     # This is the FastAPI way to send a file
@@ -126,6 +212,34 @@ async def startup_event():
     except Exception:
         print("Warning: failed to register error handlers")
 
+    # Opt-in per-stage memory accounting
+    if MEMORY_TRACKING:
+        memory_tracker.start()
+
+    # Start the shared grammar engine once per process (DRA-60)
+    try:
+        grammar_service.start()
+    except Exception as e:
+        print(f"Warning: grammar service failed to start: {e}")
+
+    pdf_renderer.start()
+
+    # Snapshots of older engine versions are never served again
+    try:
+        prune_result_snapshots()
+    except Exception as e:
+        print(f"Warning: result snapshot cleanup failed: {e}")
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Shut the shared grammar engine and PDF render pool down once per process"""
+    grammar_service.stop()
+    pdf_renderer.stop()
+    # Write out any queued metadata rows (NFR-008)
+    shutdown_metadata_writer()
+    dispose_engine()
+
 
 try:
     register_error_handlers(app)
@@ -145,3 +259,30 @@ async def https_redirect_middleware(request: Request, call_next):
             return RedirectResponse(url=str(url), status_code=307)
     response = await call_next(request)
     return response
+
+
+@app.middleware("http")
+async def profile_request(request: Request, call_next):
+    """
+    Profile one request when it carries `X-Profile` and a valid admin token.
+    All threads are sampled while it runs; the profile is kept under the
+    X-Profile-Id response header (GET /api/v1/admin/profiles/{id}).
+    """
+    if "x-profile" not in request.headers or not is_admin(
+        request.headers.get("x-admin-token")
+    ):
+        return await call_next(request)
+    try:
+        sampler = begin_profile()
+    except ProfilerBusyError:
+        response = await call_next(request)
+        response.headers["X-Profile-Error"] = "profiler busy"
+        return response
+    try:
+        response = await call_next(request)
+    finally:
+        end_profile(sampler)
+    profile_id = uuid.uuid4().hex
+    profile_store.put(profile_id, f"{request.method} {request.url.path}", sampler)
+    response.headers["X-Profile-Id"] = profile_id
+    return response
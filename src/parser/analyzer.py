@@ -5,6 +5,7 @@ It is triggered by the upload service.
 """
 
 analysis_results = {}
+import time
 from pathlib import Path
 
 # --- 1. Import BOTH logic modules ---
@@ -28,10 +29,43 @@ try:
 except Exception:  # pragma: no cover - defensive import fallback for tests
     validate_content = None
 
+from src.parser.entity_scanner import scan_entities
+
 # Global storage for analysis results (your teammate will replace with PostgreSQL)
 analysis_results = {}
 
+from src.database.metadata_model import log_metadata
 from src.feedback.suggestion_rules import get_template_suggestion
+from src.utils.job_events import job_events
+from src.utils.tracing import span
+
+
+def analysis_finished(job_id: str) -> bool:
+    """Both background stages (run_analysis and FR-009) have stored results."""
+    job = analysis_results.get(job_id) or {}
+    return "status" in job and "word_count" in job
+
+
+def finish_stage(job_id: str) -> None:
+    """Hand the job to the final feedback stage once both stages are done."""
+    if analysis_finished(job_id):
+        # Imported here: the jobs API imports the data service, which imports us
+        from src.api.jobs import on_analysis_finished
+
+        on_analysis_finished(job_id)
+
+
+def _file_size(path: Path) -> int:
+    try:
+        return path.stat().st_size
+    except OSError:
+        return 0
+
+
+def _count_skills(skill_report) -> int:
+    if not isinstance(skill_report, dict):
+        return 0
+    return sum(len(v) for v in skill_report.values() if isinstance(v, list))
 
 
 # --- FUNCTION FOR FR-011: SIMPLE INDUSTRY DETECTION ---
@@ -58,30 +92,54 @@ async def run_analysis(file_path_str: str, job_id: str):
     Runs all analysis and stores results in analysis_results dict.
     """
     print(f"🔍 Background Job Started: {job_id}")
+    started = time.perf_counter()
     try:
         p = Path(file_path_str)
 
-        # --- A. Parse Text ---
-        raw_text = get_text_from_parser(p)
-
-        if not raw_text.strip():
-            raise ValueError("Could not extract text from file.")
-
-        # --- B. Run Analyzers ---
-
-        # 1. Skill Parser (FR-004)
-        skill_report = extract_skills(raw_text)
-
-        # 2. Section Detector (FR-010 & FR-005)
-        detector = SectionDetector()
-        structure_report = detector.validate_resume_structure(raw_text)
-
-        # 3. Content Validator (FR-006)
-        validation_report = validate_content(raw_text)
-
-        # --- C. Industry Detection (FR-011) ---
-        primary_keywords = _detect_primary_keywords(skill_report)
-        template_suggestion = get_template_suggestion(primary_keywords)
+        with span("run_analysis", job_id, file_type=p.suffix.lstrip(".")):
+            # --- A. Parse Text ---
+            with span("extract_text", file_bytes=_file_size(p)) as current:
+                raw_text = get_text_from_parser(p)
+                current.set(characters=len(raw_text or ""))
+
+            if not raw_text.strip():
+                raise ValueError("Could not extract text from file.")
+            job_events.publish(job_id, "extracted", data={"characters": len(raw_text)})
+
+            # --- B. Run Analyzers ---
+
+            # 1. Skill Parser (FR-004)
+            with span("skills", characters=len(raw_text)) as current:
+                skill_report = extract_skills(raw_text)
+                current.set(skills=_count_skills(skill_report))
+            job_events.publish(
+                job_id, "skills", data={"skills": _count_skills(skill_report)}
+            )
+
+            # One entity sweep shared by the detector and the validator
+            with span("entity_scan", characters=len(raw_text)):
+                entities = scan_entities(raw_text)
+
+            # 2. Section Detector (FR-010 & FR-005)
+            with span("section_detection", characters=len(raw_text)):
+                detector = SectionDetector()
+                structure_report = detector.validate_resume_structure(
+                    raw_text, spans=entities
+                )
+
+            # 3. Content Validator (FR-006)
+            with span("content_validation", characters=len(raw_text)):
+                validation_report = validate_content(raw_text, spans=entities)
+            missing = (
+                structure_report.get("missing_sections", [])
+                if isinstance(structure_report, dict)
+                else []
+            )
+            job_events.publish(job_id, "structure", data={"missing_sections": missing})
+
+            # --- C. Industry Detection (FR-011) ---
+            primary_keywords = _detect_primary_keywords(skill_report)
+            template_suggestion = get_template_suggestion(primary_keywords)
 
         # --- D. Combine Results ---
         final_report = {
@@ -94,12 +152,25 @@ async def run_analysis(file_path_str: str, job_id: str):
         }
 
         # ✅ CRITICAL: Store results in global dict (for FR-009 to access)
-        analysis_results[job_id] = final_report
+        # Merged: the FR-009 task may already have stored its fields
+        analysis_results.setdefault(job_id, {}).update(final_report)
 
         # Print completion
         print(f"✅ Job {job_id} complete")
         print(final_report)
 
+        # Anonymous metadata for the dashboard (NFR-008); queued, not awaited
+        log_metadata(
+            {
+                "file_type": p.suffix.lstrip("."),
+                "processing_time_ms": int((time.perf_counter() - started) * 1000),
+                "missing_sections": missing,
+                "file_size_bytes": _file_size(p),
+            }
+        )
+
+        finish_stage(job_id)
+
         return final_report
 
     except Exception as e:
@@ -107,7 +178,8 @@ async def run_analysis(file_path_str: str, job_id: str):
         error_report = {"status": "failed", "error": str(e)}
 
         # ✅ CRITICAL: Store error in global dict
-        analysis_results[job_id] = error_report
+        analysis_results.setdefault(job_id, {}).update(error_report)
+        job_events.publish(job_id, "failed", status="failed", data={"error": str(e)})
 
         print(f"❌ Job {job_id} failed: {e}")
         return error_report
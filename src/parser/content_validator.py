@@ -5,56 +5,40 @@ Validates specific content formats within the resume text,
 such as date consistency and contact information.
 """
 
-import re
-from typing import Dict, List, Any
-
-# --- Regex Patterns for FR-006 ---
-
-# AC: Accept standard date patterns (MMM YYYY, MM/YYYY)
-# This will find "Jan 2020", "May 2022", "01/2020", "05/2022"
-DATE_PATTERN = re.compile(
-    # Group 1: MMM YYYY (e.g., "Jan 2020")
-    r"\b(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+(\d{4})\b"
-    # OR
-    r"|"
-    # Group 2: MM/YYYY (e.g., "05/2022")
-    r"(\b(0[1-9]|1[0-2])\/(\d{4})\b)"
+from typing import Dict, List, Any, Optional
+
+# Patterns live in the shared entity scanner; re-exported here so existing
+# imports of DATE_PATTERN / EMAIL_PATTERN / PHONE_PATTERN keep working.
+from src.parser.entity_scanner import (
+    DATE_PATTERN,
+    EMAIL_PATTERN,
+    PHONE_PATTERN,
+    EntitySpan,
+    first_of_kind,
+    scan_entities,
+    spans_of_kind,
 )
 
-# Regex for standard email
-EMAIL_PATTERN = re.compile(r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b")
 
-# Regex for common US/International phone formats
-PHONE_PATTERN = re.compile(
-    r"(\+?\d{1,3}[-.\s]?)?(\(?\d{3}\)?[-.\s]?)?(\d{3}[-.\s]?\d{4})\b"
-)
-
-
-def _check_date_consistency(dates_found: List[str]) -> Dict[str, Any]:
+def _check_date_consistency(date_spans: List[EntitySpan]) -> Dict[str, Any]:
     """
     Checks if all found dates use a consistent format.
     AC: Check date formats consistency
+
+    The format of each date is already known from the scanner group
+    that matched it, so no date is re-matched here.
     """
-    if not dates_found:
+    if not date_spans:
         return {
             "consistent": True,
             "format": None,
             "message": "No dates found to check.",
         }
 
-    # Check format of the first date
-    first_date = dates_found[0]
-    # Check if it matches "MMM YYYY"
-    is_mmm_yyyy = bool(re.match(r"^[A-Za-z]{3}\s+\d{4}$", first_date))
-
-    expected_format = "MMM YYYY" if is_mmm_yyyy else "MM/YYYY"
+    expected_format = date_spans[0].format
 
-    for date_str in dates_found[1:]:
-        is_current_mmm_yyyy = bool(re.match(r"^[A-Za-z]{3}\s+\d{4}$", date_str))
-
-        if (is_current_mmm_yyyy and not is_mmm_yyyy) or (
-            not is_current_mmm_yyyy and is_mmm_yyyy
-        ):
+    for span in date_spans[1:]:
+        if span.format != expected_format:
             # AC: Error messages include reason
             return {
                 "consistent": False,
@@ -69,25 +53,29 @@ def _check_date_consistency(dates_found: List[str]) -> Dict[str, Any]:
     }
 
 
-def validate_content(raw_text: str) -> Dict[str, Any]:
+def validate_content(
+    raw_text: str, spans: Optional[List[EntitySpan]] = None
+) -> Dict[str, Any]:
     """
     Runs all content validations for FR-006.
     - Checks date format consistency
     - Checks for email and phone
+
+    Args:
+        raw_text: Full resume text
+        spans: Output of `scan_entities(raw_text)` if the caller already
+            has it; otherwise the text is scanned once here.
     """
+    if spans is None:
+        spans = scan_entities(raw_text)
 
     # --- 1. Date Validation ---
-    all_date_matches = DATE_PATTERN.finditer(raw_text)
-
-    # Extract the full match, cleaning it up
-    dates_found = [match.group(0).strip() for match in all_date_matches]
-
-    date_report = _check_date_consistency(dates_found)
+    date_report = _check_date_consistency(spans_of_kind(spans, "date"))
 
     # --- 2. Contact Info Validation ---
     # AC: Flag invalid/missing email or phone number
-    email_match = EMAIL_PATTERN.search(raw_text)
-    phone_match = PHONE_PATTERN.search(raw_text)
+    email_match = first_of_kind(spans, "email")
+    phone_match = first_of_kind(spans, "phone")
 
     contact_issues = []
     # AC: Detect missing contact info fields
@@ -113,8 +101,8 @@ def validate_content(raw_text: str) -> Dict[str, Any]:
     return {
         "dates": date_report,
         "contact_info": {
-            "email_found": email_match.group(0) if email_match else None,
-            "phone_found": phone_match.group(0) if phone_match else None,
+            "email_found": email_match.text if email_match else None,
+            "phone_found": phone_match.text if phone_match else None,
             "issues": contact_issues,
         },
     }
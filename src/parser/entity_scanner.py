@@ -0,0 +1,97 @@
+"""
+Entity Scanner - shared single-sweep tokenizer for FR-006 / FR-010 / DRA-98
+
+Finds dates, emails, phone numbers and URLs in one `finditer` pass over the
+resume text and returns them as spans with offsets. The content validator,
+the section detector (CONTACT section) and the masking service all consume
+these spans instead of running their own regex searches over the full text.
+"""
+
+import re
+from typing import Iterable, List, NamedTuple, Optional
+
+# --- Individual patterns (kept importable for backward compatibility) ---
+
+# AC: Accept standard date patterns (MMM YYYY, MM/YYYY)
+DATE_PATTERN = re.compile(
+    # Group 1: MMM YYYY (e.g., "Jan 2020")
+    r"\b(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+(\d{4})\b"
+    # OR
+    r"|"
+    # Group 2: MM/YYYY (e.g., "05/2022")
+    r"(\b(0[1-9]|1[0-2])\/(\d{4})\b)"
+)
+
+# Regex for standard email
+EMAIL_PATTERN = re.compile(r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b")
+
+# Regex for common US/International phone formats
+PHONE_PATTERN = re.compile(
+    r"(\+?\d{1,3}[-.\s]?)?(\(?\d{3}\)?[-.\s]?)?(\d{3}[-.\s]?\d{4})\b"
+)
+
+# Regex for web links (portfolio, LinkedIn, GitHub)
+URL_PATTERN = re.compile(r"\b(?:https?://|www\.)[^\s<>\"'()]+[^\s<>\"'().,;:]")
+
+# --- Combined pattern ---
+# Alternatives are tried left to right at each position, so URLs win over
+# the emails/phones they may contain and emails win over digits in them.
+_ENTITY_ALTERNATIVES = [
+    ("url", URL_PATTERN.pattern),
+    ("email", EMAIL_PATTERN.pattern),
+    ("date_mmm", r"\b(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{4}\b"),
+    ("date_num", r"\b(?:0[1-9]|1[0-2])/\d{4}\b"),
+    ("phone", PHONE_PATTERN.pattern),
+]
+ENTITY_PATTERN = re.compile(
+    "|".join(f"(?P<{name}>{pattern})" for name, pattern in _ENTITY_ALTERNATIVES)
+)
+
+# Named group -> (entity kind, format label)
+_GROUP_KINDS = {
+    "url": ("url", None),
+    "email": ("email", None),
+    "date_mmm": ("date", "MMM YYYY"),
+    "date_num": ("date", "MM/YYYY"),
+    "phone": ("phone", None),
+}
+
+
+class EntitySpan(NamedTuple):
+    """A single entity found in the text."""
+
+    kind: str  # "date" | "email" | "phone" | "url"
+    start: int
+    end: int
+    text: str
+    format: Optional[str] = None  # date format label for kind == "date"
+
+
+def scan_entities(text: str) -> List[EntitySpan]:
+    """
+    Tokenize `text` once and return every date, email, phone and URL span,
+    in document order. Spans never overlap.
+    """
+    if not text:
+        return []
+
+    spans = []
+    for match in ENTITY_PATTERN.finditer(text):
+        kind, fmt = _GROUP_KINDS[match.lastgroup]
+        spans.append(
+            EntitySpan(kind, match.start(), match.end(), match.group(0), fmt)
+        )
+    return spans
+
+
+def spans_of_kind(spans: Iterable[EntitySpan], kind: str) -> List[EntitySpan]:
+    """Filter spans to a single entity kind."""
+    return [span for span in spans if span.kind == kind]
+
+
+def first_of_kind(spans: Iterable[EntitySpan], kind: str) -> Optional[EntitySpan]:
+    """Return the first span of the given kind, or None."""
+    for span in spans:
+        if span.kind == kind:
+            return span
+    return None
@@ -0,0 +1,273 @@
+"""
+Batch Gap Analyzer
+Vectorized FR-009 gap and tenure statistics over many resumes at once.
+
+`GapDetector` works on a single resume with Python datetime objects. For
+analytics runs over thousands of stored resumes, this module packs every
+parsed job interval into flat NumPy arrays (resume index, start month,
+end month) and computes per-resume gaps, tenure and distributions with
+array operations instead of a Python loop per job.
+
+Months are encoded as ``year * 12 + (month - 1)`` so that a month
+difference is a plain integer subtraction (the same value
+`GapDetector._calculate_month_difference` returns for first-of-month
+dates).
+"""
+
+import csv
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.parser.gap_detector import GapDetector
+
+# Column order used by GapBatchResult.to_csv / to_parquet
+RESULT_COLUMNS = [
+    "resume_id",
+    "job_count",
+    "tenure_months",
+    "span_months",
+    "gap_count",
+    "total_gap_months",
+    "longest_gap_months",
+]
+
+
+def _to_python(value: Any) -> Any:
+    """Unwrap NumPy scalars so rows serialize as plain Python values."""
+    return value.item() if isinstance(value, np.generic) else value
+
+
+def month_index(date: datetime) -> int:
+    """Encode a date as an absolute month number (year * 12 + month - 1)."""
+    return date.year * 12 + (date.month - 1)
+
+
+@dataclass
+class IntervalBatch:
+    """
+    Job intervals of many resumes packed into parallel arrays.
+
+    Attributes:
+        resume_ids: Original resume identifiers, one per resume (in order).
+        resume_index: int32 array, index into `resume_ids` for each job.
+        start_month: int32 array of encoded start months.
+        end_month: int32 array of encoded end months.
+    """
+
+    resume_ids: List[Any]
+    resume_index: np.ndarray
+    start_month: np.ndarray
+    end_month: np.ndarray
+
+    def __len__(self) -> int:
+        return int(self.resume_index.shape[0])
+
+
+@dataclass
+class GapBatchResult:
+    """
+    Columnar per-resume result of `analyze_gap_batch`.
+
+    Every column is a NumPy array of length ``len(resume_ids)``; `columns`
+    maps column name -> array and can be handed to pandas/pyarrow as is.
+    `distributions` holds batch-wide summaries (gap-count histogram and
+    tenure/gap percentiles).
+    """
+
+    columns: Dict[str, np.ndarray]
+    distributions: Dict[str, Any]
+
+    def __len__(self) -> int:
+        return int(self.columns["resume_id"].shape[0])
+
+    def rows(self) -> List[Dict[str, Any]]:
+        """Return the result as a list of row dictionaries."""
+        return [
+            {name: _to_python(self.columns[name][i]) for name in RESULT_COLUMNS}
+            for i in range(len(self))
+        ]
+
+    def to_csv(self, path: str) -> None:
+        """Write the per-resume columns to a CSV file."""
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(RESULT_COLUMNS)
+            for row in zip(*(self.columns[name] for name in RESULT_COLUMNS)):
+                writer.writerow([_to_python(value) for value in row])
+
+    def to_parquet(self, path: str) -> None:
+        """
+        Write the per-resume columns to a Parquet file.
+
+        Requires the optional `pyarrow` dependency.
+        """
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as exc:
+            raise ImportError(
+                "pyarrow is required for Parquet export. Run: pip install pyarrow"
+            ) from exc
+
+        table = pa.table({name: self.columns[name] for name in RESULT_COLUMNS})
+        pq.write_table(table, path)
+
+
+def pack_intervals(
+    resumes: Iterable[Tuple[Any, Sequence[Dict]]],
+    detector: Optional[GapDetector] = None,
+) -> IntervalBatch:
+    """
+    Parse experience entries of many resumes into an `IntervalBatch`.
+
+    Args:
+        resumes: Iterable of ``(resume_id, experience_data)`` pairs, where
+            experience_data has the same shape `GapDetector` accepts
+            (dicts with "start_date" and "end_date" strings).
+        detector: GapDetector used for date parsing (a default one is created).
+
+    Entries whose start or end date cannot be parsed are skipped, exactly
+    like `GapDetector.detect_employment_gaps` does. Resumes with no usable
+    entries still get a row in the result.
+    """
+    detector = detector or GapDetector()
+    resume_ids: List[Any] = []
+    index: List[int] = []
+    starts: List[int] = []
+    ends: List[int] = []
+    date_cache: Dict[str, Optional[int]] = {}
+
+    def encode(date_str: str) -> Optional[int]:
+        if date_str not in date_cache:
+            parsed = detector._parse_date(date_str)
+            date_cache[date_str] = month_index(parsed) if parsed else None
+        return date_cache[date_str]
+
+    for resume_id, experience_data in resumes:
+        position = len(resume_ids)
+        resume_ids.append(resume_id)
+        for exp in experience_data or []:
+            start = encode(exp.get("start_date", "") or "")
+            end = encode(exp.get("end_date", "") or "")
+            if start is None or end is None:
+                continue
+            index.append(position)
+            starts.append(start)
+            ends.append(end)
+
+    return IntervalBatch(
+        resume_ids=resume_ids,
+        resume_index=np.asarray(index, dtype=np.int32),
+        start_month=np.asarray(starts, dtype=np.int32),
+        end_month=np.asarray(ends, dtype=np.int32),
+    )
+
+
+def analyze_gap_batch(
+    batch: IntervalBatch,
+    threshold_months: int = GapDetector.GAP_THRESHOLD_MONTHS,
+    percentiles: Sequence[float] = (50, 90, 99),
+) -> GapBatchResult:
+    """
+    Compute per-resume gap and tenure statistics for a packed batch.
+
+    Gap semantics match `GapDetector.detect_employment_gaps`: jobs are
+    ordered by end date within each resume and a gap is the distance from
+    one job's end to the next job's start, counted when it exceeds
+    `threshold_months`.
+
+    Returns:
+        GapBatchResult with columns:
+            resume_id, job_count, tenure_months (sum of job lengths),
+            span_months (first start to last end), gap_count,
+            total_gap_months, longest_gap_months
+    """
+    n_resumes = len(batch.resume_ids)
+    idx = batch.resume_index.astype(np.int64)
+    start = batch.start_month.astype(np.int64)
+    end = batch.end_month.astype(np.int64)
+
+    # Sort jobs by (resume, end month); lexsort uses the last key as primary.
+    order = np.lexsort((end, idx))
+    idx, start, end = idx[order], start[order], end[order]
+
+    job_count = np.bincount(idx, minlength=n_resumes)
+    tenure = np.bincount(
+        idx, weights=np.maximum(end - start, 0), minlength=n_resumes
+    ).astype(np.int64)
+
+    span = np.zeros(n_resumes, dtype=np.int64)
+    if idx.size:
+        first_start = np.full(n_resumes, np.iinfo(np.int64).max, dtype=np.int64)
+        last_end = np.full(n_resumes, np.iinfo(np.int64).min, dtype=np.int64)
+        np.minimum.at(first_start, idx, start)
+        np.maximum.at(last_end, idx, end)
+        has_jobs = job_count > 0
+        span[has_jobs] = np.maximum(last_end[has_jobs] - first_start[has_jobs], 0)
+
+    # Consecutive pairs within the same resume
+    same_resume = idx[1:] == idx[:-1]
+    gap_months = start[1:] - end[:-1]
+    is_gap = same_resume & (gap_months > threshold_months)
+    gap_owner = idx[1:][is_gap]
+    gap_values = gap_months[is_gap]
+
+    gap_count = np.bincount(gap_owner, minlength=n_resumes)
+    total_gap = np.bincount(
+        gap_owner, weights=gap_values, minlength=n_resumes
+    ).astype(np.int64)
+    longest_gap = np.zeros(n_resumes, dtype=np.int64)
+    np.maximum.at(longest_gap, gap_owner, gap_values)
+
+    columns = {
+        "resume_id": np.asarray(batch.resume_ids, dtype=object),
+        "job_count": job_count.astype(np.int64),
+        "tenure_months": tenure,
+        "span_months": span,
+        "gap_count": gap_count.astype(np.int64),
+        "total_gap_months": total_gap,
+        "longest_gap_months": longest_gap,
+    }
+
+    return GapBatchResult(
+        columns=columns,
+        distributions=_summarize(columns, gap_values, percentiles),
+    )
+
+
+def _summarize(
+    columns: Dict[str, np.ndarray],
+    gap_values: np.ndarray,
+    percentiles: Sequence[float],
+) -> Dict[str, Any]:
+    """Batch-wide distributions derived from the per-resume columns."""
+    gap_count = columns["gap_count"]
+    tenure = columns["tenure_months"]
+
+    def pct(values: np.ndarray) -> Dict[str, float]:
+        if values.size == 0:
+            return {f"p{int(p)}": 0.0 for p in percentiles}
+        points = np.percentile(values, percentiles)
+        return {f"p{int(p)}": round(float(v), 2) for p, v in zip(percentiles, points)}
+
+    histogram = np.bincount(gap_count) if gap_count.size else np.zeros(1, np.int64)
+
+    return {
+        "resume_count": int(gap_count.size),
+        "resumes_with_gaps": int(np.count_nonzero(gap_count)),
+        "gap_count_histogram": {i: int(c) for i, c in enumerate(histogram)},
+        "tenure_months_percentiles": pct(tenure),
+        "gap_months_percentiles": pct(gap_values),
+        "mean_tenure_months": round(float(tenure.mean()), 2) if tenure.size else 0.0,
+    }
+
+
+def analyze_resume_batch(
+    resumes: Iterable[Tuple[Any, Sequence[Dict]]],
+    threshold_months: int = GapDetector.GAP_THRESHOLD_MONTHS,
+) -> GapBatchResult:
+    """Convenience wrapper: pack ``(resume_id, experience_data)`` pairs and analyze."""
+    return analyze_gap_batch(pack_intervals(resumes), threshold_months)
@@ -5,9 +5,10 @@ Implements FR-005: Detect and merge duplicate sections
 """
 
 import re
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 from enum import Enum
 from src.utils.perf import timeit
+from src.parser.entity_scanner import EntitySpan, scan_entities
 
 
 class SectionType(Enum):
@@ -51,6 +52,19 @@ SECTION_PATTERNS = {
 }
 
 
+# CONTACT detection: the keyword pattern is searched directly, while emails
+# and phones come from the shared entity sweep. Phone spans must still satisfy
+# the stricter header phone pattern (country code + 10 digits). The sweep's
+# email pattern is stricter than the original one (2+ letter TLD) and a phone
+# inside a URL is part of the URL span, so when the sweep finds nothing the
+# original email/phone patterns are searched as before.
+CONTACT_KEYWORD_PATTERN = re.compile(
+    SECTION_PATTERNS[SectionType.CONTACT][0], re.IGNORECASE
+)
+CONTACT_EMAIL_PATTERN = re.compile(SECTION_PATTERNS[SectionType.CONTACT][1])
+CONTACT_PHONE_PATTERN = re.compile(SECTION_PATTERNS[SectionType.CONTACT][2])
+
+
 # === LOGIC FOR FR-005 (New Merge Logic) ===
 # These patterns are for *merging* and MUST match headers,
 # not keywords.
@@ -99,9 +113,15 @@ class SectionDetector:
     # These methods use SECTION_PATTERNS (keyword search)
     # and are required for your original tests to pass.
 
-    def detect_sections(self, resume_text: str) -> Dict[str, bool]:
+    def detect_sections(
+        self, resume_text: str, spans: Optional[List[EntitySpan]] = None
+    ) -> Dict[str, bool]:
         """
         Detect which sections are present in resume (Keyword-based)
+
+        Args:
+            resume_text: Full resume text
+            spans: Output of `scan_entities(resume_text)` if already computed
         """
         if not resume_text or len(resume_text.strip()) == 0:
             return {section.value: False for section in SectionType}
@@ -110,6 +130,12 @@ class SectionDetector:
         detected = {}
 
         for section_type in SectionType:
+            if section_type is SectionType.CONTACT:
+                detected[section_type.value] = self._has_contact_info(
+                    resume_lower, resume_text, spans
+                )
+                continue
+
             patterns = SECTION_PATTERNS[section_type]
             section_found = False
 
@@ -122,6 +148,29 @@ class SectionDetector:
 
         return detected
 
+    def _has_contact_info(
+        self,
+        resume_lower: str,
+        resume_text: str,
+        spans: Optional[List[EntitySpan]] = None,
+    ) -> bool:
+        """CONTACT section: contact keyword, or an email/phone from the entity sweep."""
+        if CONTACT_KEYWORD_PATTERN.search(resume_lower):
+            return True
+
+        if spans is None:
+            spans = scan_entities(resume_text)
+
+        for span in spans:
+            if span.kind == "email":
+                return True
+            if span.kind == "phone" and CONTACT_PHONE_PATTERN.search(span.text):
+                return True
+        return bool(
+            CONTACT_EMAIL_PATTERN.search(resume_lower)
+            or CONTACT_PHONE_PATTERN.search(resume_lower)
+        )
+
     def find_missing_sections(
         self, resume_text: str, required_only: bool = True
     ) -> List[str]:
@@ -129,7 +178,12 @@ class SectionDetector:
         Find missing sections in resume (Keyword-based)
         """
         detected = self.detect_sections(resume_text)
+        return self._missing_from_detected(detected, required_only)
 
+    def _missing_from_detected(
+        self, detected: Dict[str, bool], required_only: bool = True
+    ) -> List[str]:
+        """Sorted list of section names not present in `detected`."""
         sections_to_check = (
             self.required_sections if required_only else set(SectionType)
         )
@@ -212,7 +266,9 @@ class SectionDetector:
 
     # --- UPDATED ORCHESTRATOR METHOD ---
 
-    def validate_resume_structure(self, resume_text: str) -> Dict:
+    def validate_resume_structure(
+        self, resume_text: str, spans: Optional[List[EntitySpan]] = None
+    ) -> Dict:
         """
         Comprehensive resume structure validation.
         (Runs FR-010 detection AND FR-005 merging)
@@ -221,8 +277,8 @@ class SectionDetector:
         # --- FR-010 Logic (Original) ---
         # This logic is for keyword detection and completeness score.
         # It uses the original, robust keyword-based methods.
-        detected = self.detect_sections(resume_text)
-        missing = self.find_missing_sections(resume_text, required_only=True)
+        detected = self.detect_sections(resume_text, spans=spans)
+        missing = self._missing_from_detected(detected, required_only=True)
         present = [section for section, found in detected.items() if found]
         total_required = len(self.required_sections)
         present_required = total_required - len(missing)
@@ -11,6 +11,8 @@ from pathlib import Path
 from typing import Dict, Any, List, Tuple, Set
 from spacy.matcher import PhraseMatcher
 
+from src.feedback.feedback_cache import invalidate_feedback_cache
+
 # --- 1. Setup spaCy Matcher ---
 
 # Load model (make sure you've run: python -m spacy download en_core_web_sm)
@@ -46,22 +48,39 @@ def load_skill_dictionaries(
     return technical_skills, soft_skills
 
 
-# Build the PhraseMatcher
-matcher = PhraseMatcher(nlp.vocab, attr="LOWER")
-skill_categories: Dict[str, str] = {}
+def _build_matcher(
+    technical: Dict[str, List[str]], soft: Dict[str, List[str]]
+) -> Tuple[PhraseMatcher, Dict[str, str]]:
+    """Build the PhraseMatcher and canonical name -> category map."""
+    phrase_matcher = PhraseMatcher(nlp.vocab, attr="LOWER")
+    categories: Dict[str, str] = {}
+    for canonical_name, variants in technical.items():
+        categories[canonical_name] = "technical"
+        patterns = [nlp.make_doc(variant) for variant in variants]
+        phrase_matcher.add(canonical_name, patterns)
+    for canonical_name, variants in soft.items():
+        categories[canonical_name] = "soft"
+        patterns = [nlp.make_doc(variant) for variant in variants]
+        phrase_matcher.add(canonical_name, patterns)
+    return phrase_matcher, categories
+
 
+# Build the PhraseMatcher
 technical_skills, soft_skills = load_skill_dictionaries()
 if not technical_skills and not soft_skills:
     print("Warning: No skill dictionaries loaded. Skill extractor will find 0 skills.")
-else:
-    for canonical_name, variants in technical_skills.items():
-        skill_categories[canonical_name] = "technical"
-        patterns = [nlp.make_doc(variant) for variant in variants]
-        matcher.add(canonical_name, patterns)
-    for canonical_name, variants in soft_skills.items():
-        skill_categories[canonical_name] = "soft"
-        patterns = [nlp.make_doc(variant) for variant in variants]
-        matcher.add(canonical_name, patterns)
+matcher, skill_categories = _build_matcher(technical_skills, soft_skills)
+
+
+def reload_skill_dictionaries(folder_path: str = "skill_lists") -> None:
+    """
+    Re-read the skill JSON files and rebuild the matcher.
+    Cached feedback computed with the old dictionaries is invalidated.
+    """
+    global technical_skills, soft_skills, matcher, skill_categories
+    technical_skills, soft_skills = load_skill_dictionaries(folder_path)
+    matcher, skill_categories = _build_matcher(technical_skills, soft_skills)
+    invalidate_feedback_cache("skill dictionaries reloaded")
 
 
 # --- 2. Core Skill Extraction Function (Your FR-004) ---
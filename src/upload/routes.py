@@ -5,7 +5,7 @@ Implements DRA-41: Upload endpoints
 
 from typing import List
 from fastapi import File, Depends
-from .service import process_batch_upload  # ✅ ONLY import this
+from .service import process_batch_upload, register_batch
 from .validators import validate_files
 
 from fastapi import (
@@ -117,6 +117,7 @@ async def upload_resume_batch(
 
         return {
             "message": f"Batch of {len(job_results)} resumes received for analysis.",
+            "batchId": register_batch(job_results),
             "jobs": job_results,
         }
 
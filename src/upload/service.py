@@ -7,16 +7,26 @@ import os
 import uuid
 import asyncio
 import threading
+from collections import OrderedDict
 from datetime import datetime
 from pathlib import Path
 from fastapi import UploadFile
-from typing import List
+from typing import Dict, List, Optional
 from src.utils.timeit import timeit
-from src.parser.analyzer import run_analysis
+from src.database.result_store import get_result_store
+from src.parser.analyzer import finish_stage, run_analysis
+from src.utils.job_events import job_events
+from src.utils.tracing import span
 
 # ✅ Required global constant — tests rely on this
-UPLOAD_DIR = Path("uploads")
-UPLOAD_DIR.mkdir(exist_ok=True)
+UPLOAD_DIR = Path(os.getenv("UPLOAD_DIR", "uploads"))
+UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
+
+# batch_id -> job ids of a batch upload (used by the batch export endpoint);
+# only the BATCH_JOBS_MAX most recent batches are kept
+BATCH_JOBS_MAX = int(os.getenv("BATCH_JOBS_MAX", "1000"))
+batch_jobs: "OrderedDict[str, List[str]]" = OrderedDict()
+_batch_lock = threading.Lock()
 
 
 async def analyze_resume_with_gaps(job_id: str, file_path: str):
@@ -35,23 +45,36 @@ async def analyze_resume_with_gaps(job_id: str, file_path: str):
         from src.parser.gap_detector import GapDetector
         from src.parser.analyzer import analysis_results
 
-        # Extract text
-        extractor = TextExtractor()
-        resume_text = extractor.extract_text(file_path)
-
-        if not resume_text:
-            print(f"❌ Could not extract text for job {job_id}")
-            return
-
-        # Parse experience
-        exp_parser = ExperienceParser()
-        experience_data = exp_parser.parse_experience_section(resume_text)
-
-        print(f"📄 Found {len(experience_data)} jobs for {job_id}")
-
-        # Detect gaps
-        gap_detector = GapDetector()
-        analysis = gap_detector.analyze_resume(resume_text, experience_data)
+        with span("gap_analysis", job_id):
+            # Extract text
+            with span("extract_text_fr009") as current:
+                extractor = TextExtractor()
+                resume_text = extractor.extract_text(file_path)
+                current.set(characters=len(resume_text or ""))
+
+            if not resume_text:
+                print(f"❌ Could not extract text for job {job_id}")
+                job_events.publish(
+                    job_id,
+                    "failed",
+                    status="failed",
+                    data={"stage": "gaps", "error": "Could not extract text"},
+                )
+                return
+
+            # Parse experience
+            with span("experience_parsing", characters=len(resume_text)) as current:
+                exp_parser = ExperienceParser()
+                experience_data = exp_parser.parse_experience_section(resume_text)
+                current.set(jobs=len(experience_data))
+
+            print(f"📄 Found {len(experience_data)} jobs for {job_id}")
+
+            # Detect gaps
+            with span("gap_detection", jobs=len(experience_data)) as current:
+                gap_detector = GapDetector()
+                analysis = gap_detector.analyze_resume(resume_text, experience_data)
+                current.set(gaps=analysis.get("gap_count"))
 
         # Store results
         if job_id not in analysis_results:
@@ -71,9 +94,21 @@ async def analyze_resume_with_gaps(job_id: str, file_path: str):
         print(
             f"✅ FR-009 complete: {analysis['word_count']} words, {analysis['gap_count']} gaps"
         )
+        job_events.publish(
+            job_id,
+            "gaps",
+            data={
+                "word_count": analysis["word_count"],
+                "gap_count": analysis["gap_count"],
+            },
+        )
+        finish_stage(job_id)
 
     except Exception as e:
         print(f"❌ FR-009 failed for {job_id}: {e}")
+        job_events.publish(
+            job_id, "failed", status="failed", data={"stage": "gaps", "error": str(e)}
+        )
         import traceback
 
         traceback.print_exc()
@@ -139,12 +174,27 @@ def delete_file(file_path: str) -> bool:
         return False
 
 
+def delete_result_snapshots(job_id: str) -> int:
+    """Drop the stored analysis results of a job whose upload is deleted."""
+    store = get_result_store()
+    return store.delete(job_id) if store is not None else 0
+
+
+def delete_prerendered_pdfs(job_id: str) -> int:
+    """Drop the pre-rendered report PDFs of a job whose upload is deleted."""
+    from src.feedback.pdf_renderer import pdf_renderer
+
+    return pdf_renderer.discard_job(job_id)
+
+
 def schedule_file_cleanup(file_path: str, delay_seconds: int = 30) -> None:
-    """Schedule file deletion after delay."""
+    """Schedule deletion of the file, its result snapshots and PDFs after delay."""
 
     def _del():
         try:
             delete_file(file_path)
+            delete_result_snapshots(Path(file_path).stem)
+            delete_prerendered_pdfs(Path(file_path).stem)
         except Exception:
             import logging
 
@@ -192,9 +242,27 @@ async def process_batch_upload(files: List[UploadFile]) -> List[dict]:
 
     return job_results
 
+
+def register_batch(job_results: List[dict]) -> str:
+    """Remember the job ids of a processed batch and return its batch id."""
+    batch_id = str(uuid.uuid4())
+    with _batch_lock:
+        batch_jobs[batch_id] = [job["jobId"] for job in job_results if job.get("jobId")]
+        while len(batch_jobs) > BATCH_JOBS_MAX:
+            batch_jobs.popitem(last=False)
+    return batch_id
+
+
+def get_batch_jobs(batch_id: str) -> Optional[List[str]]:
+    """Job ids of a batch upload, or None for an unknown batch id."""
+    return batch_jobs.get(batch_id)
+
+
 import logging
+
 logger = logging.getLogger(__name__)
 
+
 def delete_and_log(file_path: str) -> bool:
     """
     Delete a file and log the action.
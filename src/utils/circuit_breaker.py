@@ -0,0 +1,197 @@
+"""Circuit breaker for slow or failing external dependencies.
+
+Wraps calls to a remote service (LanguageTool) with a hard per-call timeout
+and an error-rate based breaker:
+
+- CLOSED: calls go through; outcomes are recorded in a rolling window.
+- OPEN: the error rate tripped the breaker; calls fail fast with
+  CircuitOpenError until the cooldown has passed.
+- HALF_OPEN: after the cooldown a single probe call is let through; success
+  closes the breaker, failure opens it again.
+"""
+
+import logging
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any, Callable, Deque, Dict, Optional
+
+LOG = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """Raised when a call is rejected because the breaker is open."""
+
+
+class CallTimeoutError(Exception):
+    """Raised when a guarded call exceeds its timeout."""
+
+
+class CircuitBreaker:
+    """Error-rate circuit breaker with per-call timeouts.
+
+    Args:
+        name: Label used in logs and status output.
+        timeout: Seconds a single call may take (None disables the timeout).
+        error_rate: Failure ratio in the window that trips the breaker.
+        min_calls: Minimum calls in the window before the rate is evaluated.
+        window: Number of most recent call outcomes kept.
+        cooldown: Seconds to stay open before allowing a half-open probe.
+        max_workers: Threads used to run calls that have a timeout.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        timeout: Optional[float] = 3.0,
+        error_rate: float = 0.5,
+        min_calls: int = 5,
+        window: int = 20,
+        cooldown: float = 30.0,
+        max_workers: int = 4,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.name = name
+        self.timeout = timeout
+        self.error_rate = error_rate
+        self.min_calls = min_calls
+        self.cooldown = cooldown
+        self._clock = clock
+        self._outcomes: Deque[bool] = deque(maxlen=window)
+        self._state = CLOSED
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix=f"{name}-breaker"
+        )
+        self.rejected = 0
+        self.timeouts = 0
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._current_state()
+
+    def _current_state(self) -> str:
+        if self._state == OPEN and self._clock() - self._opened_at >= self.cooldown:
+            self._state = HALF_OPEN
+            self._probe_in_flight = False
+        return self._state
+
+    def allow(self) -> bool:
+        """Whether a call may proceed right now (reserves the half-open probe)."""
+        with self._lock:
+            state = self._current_state()
+            if state == CLOSED:
+                return True
+            if state == HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return True
+            self.rejected += 1
+            return False
+
+    def call(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Run `func` through the breaker.
+
+        Raises:
+            CircuitOpenError: the breaker is open (no call was made).
+            CallTimeoutError: the call did not finish within `timeout`.
+            Exception: whatever `func` raised.
+        """
+        if not self.allow():
+            raise CircuitOpenError(f"{self.name} circuit is open")
+
+        try:
+            if self.timeout is None:
+                result = func(*args, **kwargs)
+            else:
+                future = self._executor.submit(func, *args, **kwargs)
+                try:
+                    result = future.result(timeout=self.timeout)
+                except FutureTimeoutError as exc:
+                    future.cancel()
+                    self.timeouts += 1
+                    raise CallTimeoutError(
+                        f"{self.name} call exceeded {self.timeout:.2f}s"
+                    ) from exc
+        except Exception:
+            self.record(False)
+            raise
+
+        self.record(True)
+        return result
+
+    def record(self, success: bool) -> None:
+        """Record a call outcome and update the state."""
+        with self._lock:
+            state = self._current_state()
+            if state == HALF_OPEN:
+                self._probe_in_flight = False
+                if success:
+                    LOG.info("%s circuit closed after successful probe", self.name)
+                    self._state = CLOSED
+                    self._outcomes.clear()
+                else:
+                    self._trip()
+                return
+
+            self._outcomes.append(success)
+            failures = self._outcomes.count(False)
+            if (
+                state == CLOSED
+                and len(self._outcomes) >= self.min_calls
+                and failures / len(self._outcomes) >= self.error_rate
+            ):
+                self._trip()
+
+    def _trip(self) -> None:
+        LOG.warning("%s circuit opened", self.name)
+        self._state = OPEN
+        self._opened_at = self._clock()
+        self._outcomes.clear()
+
+    def reset(self) -> None:
+        """Force the breaker closed and forget recorded outcomes."""
+        with self._lock:
+            self._state = CLOSED
+            self._outcomes.clear()
+            self._probe_in_flight = False
+
+    def status(self) -> Dict[str, Any]:
+        with self._lock:
+            state = self._current_state()
+            calls = len(self._outcomes)
+            failures = self._outcomes.count(False)
+            return {
+                "name": self.name,
+                "state": state,
+                "window_calls": calls,
+                "window_error_rate": round(failures / calls, 4) if calls else 0.0,
+                "rejected": self.rejected,
+                "timeouts": self.timeouts,
+            }
+
+
+def breaker_from_env(prefix: str, name: str) -> CircuitBreaker:
+    """Build a breaker configured by `<PREFIX>_TIMEOUT`, `_ERROR_RATE`, etc."""
+
+    def env(key: str, default: str) -> str:
+        return os.getenv(f"{prefix}_{key}", default)
+
+    timeout = float(env("TIMEOUT", "3"))
+    return CircuitBreaker(
+        name,
+        timeout=timeout if timeout > 0 else None,
+        error_rate=float(env("ERROR_RATE", "0.5")),
+        min_calls=int(env("MIN_CALLS", "5")),
+        window=int(env("WINDOW", "20")),
+        cooldown=float(env("COOLDOWN", "30")),
+    )
@@ -52,4 +52,5 @@ def register_error_handlers(app: FastAPI) -> None:
         return JSONResponse(
             status_code=exc.status_code or 500,
             content={"error": detail, "detail": detail},
+            headers=getattr(exc, "headers", None),
         )
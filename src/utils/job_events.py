@@ -0,0 +1,157 @@
+"""
+Job progress events
+
+Background analysis publishes one event per finished stage (extracted,
+skills, structure, gaps, grammar, feedback, pdf) and a terminal event
+("result" or "failed"). The SSE endpoint (src/api/jobs.py) streams them to
+clients, so a client waits on one connection instead of polling /results.
+
+Events carry a process-wide increasing `id`. A reconnecting client passes the
+last id it saw and only gets what it missed. The bus keeps the latest events
+of the most recently active jobs in memory. A stream whose job's events
+are evicted before it finished ends with a synthetic "unknown" event.
+Publishing is thread-safe and may happen off the event loop.
+"""
+
+import asyncio
+import itertools
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+STAGES = ("extracted", "skills", "structure", "gaps", "grammar", "feedback", "pdf")
+TERMINAL_STAGES = ("result", "failed", "unknown")
+
+
+class JobEventBus:
+    """
+    In-memory per-job event history plus live subscribers.
+
+    Args:
+        max_jobs: Jobs whose history is kept (least recently updated dropped).
+        max_events: Events kept per job.
+    """
+
+    def __init__(self, max_jobs: int = 1000, max_events: int = 50):
+        self.max_jobs = max_jobs
+        self.max_events = max_events
+        self._history: "OrderedDict[str, List[Dict[str, Any]]]" = OrderedDict()
+        self._subscribers: Dict[
+            str, List[Tuple[asyncio.AbstractEventLoop, asyncio.Queue]]
+        ] = {}
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def publish(
+        self,
+        job_id: str,
+        stage: str,
+        status: str = "done",
+        data: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Record an event and hand it to every subscriber of the job."""
+        with self._lock:
+            event = {
+                "id": next(self._ids),
+                "job_id": job_id,
+                "stage": stage,
+                "status": status,
+                "data": data or {},
+                "ts": time.time(),
+            }
+            events = self._history.setdefault(job_id, [])
+            events.append(event)
+            del events[: -self.max_events]
+            self._history.move_to_end(job_id)
+            while len(self._history) > self.max_jobs:
+                self._history.popitem(last=False)
+            subscribers = list(self._subscribers.get(job_id, ()))
+
+        for loop, queue in subscribers:
+            try:
+                loop.call_soon_threadsafe(queue.put_nowait, event)
+            except RuntimeError:  # subscriber's loop already closed
+                pass
+        return event
+
+    def _unknown_event(self, job_id: str) -> Dict[str, Any]:
+        """Terminal event for a job whose history is gone (not recorded)."""
+        with self._lock:
+            event_id = next(self._ids)
+        return {
+            "id": event_id,
+            "job_id": job_id,
+            "stage": "unknown",
+            "status": "failed",
+            "data": {"error": "Unknown job: its events have expired"},
+            "ts": time.time(),
+        }
+
+    def history(self, job_id: str, after: int = 0) -> List[Dict[str, Any]]:
+        with self._lock:
+            return [e for e in self._history.get(job_id, ()) if e["id"] > after]
+
+    def is_finished(self, job_id: str) -> bool:
+        with self._lock:
+            events = self._history.get(job_id) or []
+            return bool(events) and events[-1]["stage"] in TERMINAL_STAGES
+
+    def knows(self, job_id: str) -> bool:
+        with self._lock:
+            return job_id in self._history
+
+    def subscriber_count(self, job_id: str) -> int:
+        with self._lock:
+            return len(self._subscribers.get(job_id, ()))
+
+    async def stream(
+        self, job_id: str, after: int = 0, heartbeat: float = 15.0
+    ) -> AsyncIterator[Optional[Dict[str, Any]]]:
+        """
+        Yield the job's events after id `after`, then live ones, until a
+        terminal event. Yields None every `heartbeat` seconds of silence;
+        once a job that had events is evicted, yields a final "unknown"
+        event instead of heartbeats that would never end.
+        """
+        queue: asyncio.Queue = asyncio.Queue()
+        entry = (asyncio.get_running_loop(), queue)
+        with self._lock:
+            self._subscribers.setdefault(job_id, []).append(entry)
+        try:
+            last_id = after
+            seen = self.knows(job_id)
+            # Subscribed first, so nothing published meanwhile is lost
+            for event in self.history(job_id, after):
+                last_id = event["id"]
+                yield event
+                if event["stage"] in TERMINAL_STAGES:
+                    return
+            while True:
+                try:
+                    event = await asyncio.wait_for(queue.get(), heartbeat)
+                except asyncio.TimeoutError:
+                    if seen and not self.knows(job_id):
+                        yield self._unknown_event(job_id)
+                        return
+                    seen = seen or self.knows(job_id)
+                    yield None
+                    continue
+                if event["id"] <= last_id:
+                    continue
+                last_id = event["id"]
+                seen = True
+                yield event
+                if event["stage"] in TERMINAL_STAGES:
+                    return
+        finally:
+            with self._lock:
+                subscribers = self._subscribers.get(job_id, [])
+                if entry in subscribers:
+                    subscribers.remove(entry)
+                if not subscribers:
+                    self._subscribers.pop(job_id, None)
+
+
+# The one event bus per process
+job_events = JobEventBus()
@@ -0,0 +1,288 @@
+"""
+Per-stage memory accounting
+
+Opt-in (MEMORY_TRACKING=true, or POST /api/v1/admin/memory/tracking at run
+time) because tracemalloc slows allocations down. While it is on, every
+tracing span (src/utils/tracing.py) takes a tracemalloc snapshot before and
+after its stage and adds to the span:
+
+- net_kb: memory still allocated when the stage ends
+- peak_kb: highest allocation above the start level during the stage
+- top: the allocation sites that grew most (MEMORY_TOP_SITES)
+
+A stage whose peak exceeds its budget (MEMORY_STAGE_BUDGET_MB, per stage
+overrides in MEMORY_BUDGETS="grammar=300,pdf=150") logs a warning, counts
+memory_budget_exceeded_total{stage} and is listed in `alerts()`.
+
+tracemalloc is process-wide: stages of concurrent jobs see each other's
+allocations, so per-stage numbers are exact only for a single job at a time.
+"""
+
+import contextvars
+import gc
+import logging
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter, deque
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.utils.metrics import REGISTRY
+
+logger = logging.getLogger(__name__)
+
+MEMORY_TRACKING = os.getenv("MEMORY_TRACKING", "false").lower() == "true"
+MEMORY_TRACE_FRAMES = int(os.getenv("MEMORY_TRACE_FRAMES", "1"))
+MEMORY_TOP_SITES = int(os.getenv("MEMORY_TOP_SITES", "5"))
+MEMORY_STAGE_BUDGET_MB = float(os.getenv("MEMORY_STAGE_BUDGET_MB", "256"))
+
+
+def _parse_budgets(value: str) -> Dict[str, float]:
+    budgets = {}
+    for item in value.split(","):
+        stage, _, mb = item.partition("=")
+        try:
+            budgets[stage.strip()] = float(mb)
+        except ValueError:
+            continue
+    return budgets
+
+
+MEMORY_BUDGETS = _parse_budgets(os.getenv("MEMORY_BUDGETS", ""))
+
+BUDGET_EXCEEDED = REGISTRY.counter(
+    "memory_budget_exceeded_total",
+    "Pipeline stages whose peak allocation exceeded their budget",
+    ["stage"],
+)
+
+# Keep the accounting's own allocations out of the reports
+_IGNORED = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<unknown>"),
+)
+
+
+class _Stage:
+    __slots__ = ("start_current", "snapshot", "seen_peak")
+
+    def __init__(self, start_current: int, snapshot, seen_peak: int):
+        self.start_current = start_current
+        self.snapshot = snapshot
+        self.seen_peak = seen_peak
+
+
+_stage: contextvars.ContextVar[Optional[_Stage]] = contextvars.ContextVar(
+    "memory_stage", default=None
+)
+
+
+def _site(stat) -> str:
+    frame = stat.traceback[0]
+    return f"{frame.filename}:{frame.lineno}"
+
+
+class MemoryTracker:
+    """
+    Stage memory accounting on top of tracemalloc.
+
+    Args:
+        top_sites: Allocation sites reported per stage (0: no snapshots).
+        default_budget_mb: Peak budget for stages without their own.
+        budgets: Per-stage peak budgets in MB.
+    """
+
+    def __init__(
+        self,
+        top_sites: int = MEMORY_TOP_SITES,
+        default_budget_mb: float = MEMORY_STAGE_BUDGET_MB,
+        budgets: Optional[Dict[str, float]] = None,
+    ):
+        self.top_sites = top_sites
+        self.default_budget_mb = default_budget_mb
+        self.budgets = dict(MEMORY_BUDGETS if budgets is None else budgets)
+        self._alerts: deque = deque(maxlen=100)
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return tracemalloc.is_tracing()
+
+    def start(self, frames: int = MEMORY_TRACE_FRAMES) -> None:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(frames)
+            logger.info("Memory tracking started (%d frames)", frames)
+
+    def stop(self) -> None:
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+            logger.info("Memory tracking stopped")
+
+    def budget_mb(self, stage: str) -> float:
+        return self.budgets.get(stage, self.default_budget_mb)
+
+    def begin(self) -> Optional[Tuple[_Stage, contextvars.Token]]:
+        """Called when a stage starts; None (and no cost) while tracking is off."""
+        if not tracemalloc.is_tracing():
+            return None
+        current, peak = tracemalloc.get_traced_memory()
+        parent = _stage.get()
+        if parent is not None:
+            parent.seen_peak = max(parent.seen_peak, peak)
+        # Peaks are process-wide; enclosing stages keep theirs in seen_peak
+        tracemalloc.reset_peak()
+        snapshot = None
+        if self.top_sites:
+            snapshot = tracemalloc.take_snapshot().filter_traces(_IGNORED)
+        state = _Stage(current, snapshot, current)
+        return state, _stage.set(state)
+
+    def end(
+        self, started: Optional[Tuple[_Stage, contextvars.Token]], stage: str, job_id
+    ) -> Optional[Dict[str, Any]]:
+        """Called when the stage ends; returns its memory report."""
+        if started is None:
+            return None
+        state, token = started
+        _stage.reset(token)
+        if not tracemalloc.is_tracing():  # stopped mid-stage
+            return None
+        current, peak = tracemalloc.get_traced_memory()
+        peak = max(peak, state.seen_peak)
+        parent = _stage.get()
+        if parent is not None:
+            parent.seen_peak = max(parent.seen_peak, peak)
+
+        report: Dict[str, Any] = {
+            "net_kb": round((current - state.start_current) / 1024, 1),
+            "peak_kb": round((peak - state.start_current) / 1024, 1),
+        }
+        if state.snapshot is not None:
+            after = tracemalloc.take_snapshot().filter_traces(_IGNORED)
+            report["top"] = [
+                {
+                    "site": _site(stat),
+                    "size_kb": round(stat.size_diff / 1024, 1),
+                    "count": stat.count_diff,
+                }
+                for stat in after.compare_to(state.snapshot, "lineno")[: self.top_sites]
+                if stat.size_diff > 0
+            ]
+
+        budget = self.budget_mb(stage)
+        peak_mb = report["peak_kb"] / 1024
+        if budget and peak_mb > budget:
+            self._alert(job_id, stage, peak_mb, budget)
+        return report
+
+    def _alert(self, job_id, stage: str, peak_mb: float, budget_mb: float) -> None:
+        BUDGET_EXCEEDED.labels(stage).inc()
+        alert = {
+            "job_id": job_id,
+            "stage": stage,
+            "peak_mb": round(peak_mb, 1),
+            "budget_mb": budget_mb,
+            "ts": time.time(),
+        }
+        with self._lock:
+            self._alerts.append(alert)
+        logger.warning(
+            f"Stage {stage} of job {job_id} peaked at {peak_mb:.1f} MB "
+            f"(budget {budget_mb:g} MB)"
+        )
+
+    def alerts(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            return list(self._alerts)
+
+    def status(self) -> Dict[str, Any]:
+        status: Dict[str, Any] = {
+            "tracking": self.enabled,
+            "rss_mb": rss_mb(),
+            "default_budget_mb": self.default_budget_mb,
+            "budgets_mb": self.budgets,
+            "alerts": self.alerts(),
+        }
+        if self.enabled:
+            current, peak = tracemalloc.get_traced_memory()
+            status["traced_mb"] = round(current / 2**20, 1)
+        return status
+
+
+def rss_mb() -> Optional[float]:
+    """Current resident set size (Linux), else None."""
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+        return round(pages * os.sysconf("SC_PAGE_SIZE") / 2**20, 1)
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+
+def largest_allocation_sites(limit: int = 20) -> List[Dict[str, Any]]:
+    """Where the memory still allocated was allocated (needs tracking on)."""
+    if not tracemalloc.is_tracing():
+        return []
+    snapshot = tracemalloc.take_snapshot().filter_traces(_IGNORED)
+    return [
+        {
+            "site": _site(stat),
+            "size_kb": round(stat.size / 1024, 1),
+            "count": stat.count,
+        }
+        for stat in snapshot.statistics("lineno")[:limit]
+    ]
+
+
+def largest_objects(limit: int = 20) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    The biggest live objects known to the garbage collector (shallow size)
+    and the object types holding the most memory.
+    """
+    sizes: List[Tuple[int, Any]] = []
+    per_type: Counter = Counter()
+    per_type_count: Counter = Counter()
+    for obj in gc.get_objects():
+        try:
+            size = sys.getsizeof(obj)
+        except Exception:
+            continue
+        name = type(obj).__qualname__
+        per_type[name] += size
+        per_type_count[name] += 1
+        sizes.append((size, obj))
+    sizes.sort(key=lambda item: item[0], reverse=True)
+
+    def describe(obj) -> str:
+        if isinstance(obj, (dict, list, set, tuple)):
+            return f"{type(obj).__name__} of {len(obj)} items"
+        text = repr(obj) if not isinstance(obj, type) else obj.__qualname__
+        return text[:120]
+
+    objects = [
+        {
+            "type": type(obj).__qualname__,
+            "size_kb": round(size / 1024, 1),
+            "summary": describe(obj),
+        }
+        for size, obj in sizes[:limit]
+    ]
+    del sizes
+    return {
+        "objects": objects,
+        "types": [
+            {
+                "type": name,
+                "size_kb": round(size / 1024, 1),
+                "count": per_type_count[name],
+            }
+            for name, size in per_type.most_common(limit)
+        ],
+    }
+
+
+# The one tracker per process
+memory_tracker = MemoryTracker()
@@ -0,0 +1,428 @@
+"""
+Metrics registry
+
+Counters, gauges and fixed-bucket histograms shared by the whole process and
+exposed at GET /metrics in the Prometheus text format (`?format=json` adds
+p50/p95/p99 estimated from the histogram buckets).
+
+Hot-path updates take no lock: every thread writes to its own cell of a
+metric (created once per thread), and collection sums the cells. Timings are
+taken with `time.perf_counter_ns()`.
+
+Usage:
+    requests = REGISTRY.counter("uploads_total", "Uploaded files", ["type"])
+    requests.labels(type="pdf").inc()
+    with REGISTRY.histogram("parse_seconds", "Parse time").time():
+        ...
+"""
+
+import math
+import re
+from bisect import bisect_left
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+# Seconds; covers sub-millisecond cache hits up to slow PDF renders
+DEFAULT_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+)
+
+METRIC_PREFIX = "resume_analyzer_"
+PERCENTILES = (0.5, 0.95, 0.99)
+
+_NAME_RE = re.compile(r"^[a-zA-Z_:][a-zA-Z0-9_:]*$")
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", r"\\").replace("\n", r"\n").replace('"', r"\"")
+
+
+def _label_text(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class _PerThread:
+    """One mutable cell per thread; readers sum over all cells."""
+
+    def __init__(self, factory: Callable[[], list]):
+        self._factory = factory
+        self._local = threading.local()
+        self._cells: List[list] = []
+        self._lock = threading.Lock()
+
+    def cell(self) -> list:
+        try:
+            return self._local.cell
+        except AttributeError:
+            cell = self._factory()
+            with self._lock:  # once per thread
+                self._cells.append(cell)
+            self._local.cell = cell
+            return cell
+
+    def cells(self) -> List[list]:
+        with self._lock:
+            return list(self._cells)
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        if not _NAME_RE.match(name):
+            raise ValueError(f"Invalid metric name '{name}'")
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[Tuple[str, ...], Any] = {}
+        self._lock = threading.Lock()
+
+    def labels(self, *values: Any, **kwargs: Any):
+        """The child series for one combination of label values."""
+        if kwargs:
+            values = tuple(kwargs[name] for name in self.labelnames)
+        key = tuple(str(v) for v in values)
+        if len(key) != len(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}")
+        child = self._children.get(key)
+        if child is None:
+            with self._lock:
+                child = self._children.setdefault(key, self._new_child())
+        return child
+
+    def _default(self):
+        if self.labelnames:
+            raise ValueError(f"{self.name} needs labels {self.labelnames}")
+        return self.labels()
+
+    def _series(self) -> List[Tuple[Tuple[str, ...], Any]]:
+        with self._lock:
+            return sorted(self._children.items())
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def expose(self) -> List[str]:
+        raise NotImplementedError
+
+    def snapshot(self) -> Dict[str, Any]:
+        raise NotImplementedError
+
+
+class _CounterChild:
+    def __init__(self):
+        self._cells = _PerThread(lambda: [0.0])
+
+    def inc(self, amount: float = 1.0) -> None:
+        if amount < 0:
+            raise ValueError("Counters only go up")
+        self._cells.cell()[0] += amount
+
+    def value(self) -> float:
+        return sum(cell[0] for cell in self._cells.cells())
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def _new_child(self):
+        return _CounterChild()
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._default().inc(amount)
+
+    def value(self) -> float:
+        return self._default().value()
+
+    def expose(self) -> List[str]:
+        return [
+            f"{self.name}{_label_text(self.labelnames, key)} "
+            f"{_format_value(child.value())}"
+            for key, child in self._series()
+        ]
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {",".join(key): child.value() for key, child in self._series()}
+
+
+class _GaugeChild:
+    def __init__(self):
+        self._value = 0.0
+        self._function: Optional[Callable[[], float]] = None
+        self._lock = threading.Lock()
+
+    def set(self, value: float) -> None:
+        self._value = float(value)
+
+    def inc(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self._value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        self.inc(-amount)
+
+    def set_function(self, function: Callable[[], float]) -> None:
+        """Read the value from `function` at collection time."""
+        self._function = function
+
+    def value(self) -> float:
+        if self._function is not None:
+            try:
+                return float(self._function())
+            except Exception:
+                return math.nan
+        return self._value
+
+
+class Gauge(_Metric):
+    kind = "gauge"
+
+    def _new_child(self):
+        return _GaugeChild()
+
+    def set(self, value: float) -> None:
+        self._default().set(value)
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._default().inc(amount)
+
+    def dec(self, amount: float = 1.0) -> None:
+        self._default().dec(amount)
+
+    def set_function(self, function: Callable[[], float]) -> None:
+        self._default().set_function(function)
+
+    def value(self) -> float:
+        return self._default().value()
+
+    def expose(self) -> List[str]:
+        lines = []
+        for key, child in self._series():
+            value = child.value()
+            text = "NaN" if math.isnan(value) else _format_value(value)
+            lines.append(f"{self.name}{_label_text(self.labelnames, key)} {text}")
+        return lines
+
+    def snapshot(self) -> Dict[str, Any]:
+        values = {",".join(key): child.value() for key, child in self._series()}
+        # NaN (failed callback) is not valid JSON
+        return {k: None if math.isnan(v) else v for k, v in values.items()}
+
+
+class _HistogramChild:
+    def __init__(self, bounds: Tuple[float, ...]):
+        self.bounds = bounds
+        # per thread: one count per bucket, +Inf bucket, then the sum
+        self._cells = _PerThread(lambda: [0] * (len(bounds) + 1) + [0.0])
+
+    def observe(self, value: float) -> None:
+        cell = self._cells.cell()
+        cell[bisect_left(self.bounds, value)] += 1
+        cell[-1] += value
+
+    @contextmanager
+    def time(self) -> Iterator[None]:
+        started = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.observe((time.perf_counter_ns() - started) / 1e9)
+
+    def totals(self) -> Tuple[List[int], float]:
+        """Per-bucket counts (not cumulative, +Inf last) and the sum."""
+        counts = [0] * (len(self.bounds) + 1)
+        total = 0.0
+        for cell in self._cells.cells():
+            for i in range(len(counts)):
+                counts[i] += cell[i]
+            total += cell[-1]
+        return counts, total
+
+    def percentile(self, quantile: float) -> Optional[float]:
+        """Estimate by linear interpolation inside the matching bucket."""
+        counts, _ = self.totals()
+        total = sum(counts)
+        if not total:
+            return None
+        rank = quantile * total
+        seen = 0
+        lower = 0.0
+        for bound, n in zip(self.bounds, counts):
+            if n and seen + n >= rank:
+                return lower + (bound - lower) * (rank - seen) / n
+            seen += n
+            lower = bound
+        # Only the +Inf bucket is left; report its lower edge
+        return self.bounds[-1]
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(float(b) for b in buckets if b != math.inf))
+        if not self.buckets:
+            raise ValueError("Histogram needs at least one finite bucket")
+
+    def _new_child(self):
+        return _HistogramChild(self.buckets)
+
+    def observe(self, value: float) -> None:
+        self._default().observe(value)
+
+    def time(self):
+        return self._default().time()
+
+    def percentile(self, quantile: float) -> Optional[float]:
+        return self._default().percentile(quantile)
+
+    def expose(self) -> List[str]:
+        lines = []
+        for key, child in self._series():
+            counts, total = child.totals()
+            cumulative = 0
+            for bound, n in zip(self.buckets + (math.inf,), counts):
+                cumulative += n
+                le = f'le="{_format_value(bound)}"'
+                lines.append(
+                    f"{self.name}_bucket{_label_text(self.labelnames, key, le)} "
+                    f"{cumulative}"
+                )
+            labels = _label_text(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+    def snapshot(self) -> Dict[str, Any]:
+        series = {}
+        for key, child in self._series():
+            counts, total = child.totals()
+            count = sum(counts)
+            series[",".join(key)] = {
+                "count": count,
+                "sum": total,
+                **{
+                    f"p{int(q * 100)}": child.percentile(q) if count else None
+                    for q in PERCENTILES
+                },
+            }
+        return series
+
+
+class MetricsRegistry:
+    """Named metrics of the process; registering a name twice returns the first."""
+
+    def __init__(self, prefix: str = METRIC_PREFIX):
+        self.prefix = prefix
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, cls, name: str, documentation: str, labelnames, **kwargs):
+        full_name = self.prefix + name
+        with self._lock:
+            metric = self._metrics.get(full_name)
+            if metric is None:
+                metric = cls(full_name, documentation, labelnames, **kwargs)
+                self._metrics[full_name] = metric
+            elif not isinstance(metric, cls) or metric.labelnames != tuple(labelnames):
+                raise ValueError(f"Metric '{full_name}' already registered")
+        return metric
+
+    def counter(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ) -> Counter:
+        return self._register(Counter, name, documentation, labelnames)
+
+    def gauge(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ) -> Gauge:
+        return self._register(Gauge, name, documentation, labelnames)
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self._register(
+            Histogram, name, documentation, labelnames, buckets=buckets
+        )
+
+    def get(self, name: str) -> Optional[_Metric]:
+        return self._metrics.get(self.prefix + name)
+
+    def _sorted(self) -> List[_Metric]:
+        with self._lock:
+            return [self._metrics[name] for name in sorted(self._metrics)]
+
+    def exposition(self) -> str:
+        """All metrics in the Prometheus text format (version 0.0.4)."""
+        lines = []
+        for metric in self._sorted():
+            lines.append(f"# HELP {metric.name} {_escape(metric.documentation)}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(metric.expose())
+        return "\n".join(lines) + "\n"
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            metric.name: {"type": metric.kind, "series": metric.snapshot()}
+            for metric in self._sorted()
+        }
+
+
+# The one registry per process
+REGISTRY = MetricsRegistry()
+
+OPERATION_SECONDS = REGISTRY.histogram(
+    "operation_duration_seconds",
+    "Duration of operations timed with @timeit",
+    ["operation"],
+)
+OPERATION_ERRORS = REGISTRY.counter(
+    "operation_errors_total",
+    "Operations timed with @timeit that raised",
+    ["operation"],
+)
+
+
+def record_operation(operation: str, elapsed_ns: int, failed: bool = False) -> None:
+    """Feed one timed call into the operation histogram (and error count)."""
+    OPERATION_SECONDS.labels(operation).observe(elapsed_ns / 1e9)
+    if failed:
+        OPERATION_ERRORS.labels(operation).inc()
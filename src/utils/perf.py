@@ -7,6 +7,8 @@ import functools
 import logging
 from typing import Callable, Any
 
+from src.utils.metrics import record_operation
+
 logger = logging.getLogger(__name__)
 
 
@@ -14,6 +16,9 @@ def timeit(operation_name: str) -> Callable:
     """
     Decorator to measure execution time of async/sync functions.
 
+    Every call is recorded in the metrics registry
+    (operation_duration_seconds{operation=...}, served at /metrics).
+
     Args:
         operation_name: Name of the operation being timed
 
@@ -24,28 +29,36 @@ def timeit(operation_name: str) -> Callable:
     def decorator(func: Callable) -> Callable:
         @functools.wraps(func)
         async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
-            start_time = time.time()
+            start_ns = time.perf_counter_ns()
             try:
                 result = await func(*args, **kwargs)
-                elapsed = time.time() - start_time
-                logger.info(f"{operation_name} completed in {elapsed:.2f}s")
+                elapsed_ns = time.perf_counter_ns() - start_ns
+                record_operation(operation_name, elapsed_ns)
+                logger.info(f"{operation_name} completed in {elapsed_ns / 1e9:.2f}s")
                 return result
             except Exception as e:
-                elapsed = time.time() - start_time
-                logger.error(f"{operation_name} failed after {elapsed:.2f}s: {e}")
+                elapsed_ns = time.perf_counter_ns() - start_ns
+                record_operation(operation_name, elapsed_ns, failed=True)
+                logger.error(
+                    f"{operation_name} failed after {elapsed_ns / 1e9:.2f}s: {e}"
+                )
                 raise
 
         @functools.wraps(func)
         def sync_wrapper(*args: Any, **kwargs: Any) -> Any:
-            start_time = time.time()
+            start_ns = time.perf_counter_ns()
             try:
                 result = func(*args, **kwargs)
-                elapsed = time.time() - start_time
-                logger.info(f"{operation_name} completed in {elapsed:.2f}s")
+                elapsed_ns = time.perf_counter_ns() - start_ns
+                record_operation(operation_name, elapsed_ns)
+                logger.info(f"{operation_name} completed in {elapsed_ns / 1e9:.2f}s")
                 return result
             except Exception as e:
-                elapsed = time.time() - start_time
-                logger.error(f"{operation_name} failed after {elapsed:.2f}s: {e}")
+                elapsed_ns = time.perf_counter_ns() - start_ns
+                record_operation(operation_name, elapsed_ns, failed=True)
+                logger.error(
+                    f"{operation_name} failed after {elapsed_ns / 1e9:.2f}s: {e}"
+                )
                 raise
 
         # Detect if function is async
@@ -67,5 +80,6 @@ def timeit(operation_name: str) -> Callable:
 
     return decorator
 
+
 def time_execution(operation_name: str):
-    return timeit(operation_name)
\ No newline at end of file
+    return timeit(operation_name)
@@ -0,0 +1,199 @@
+"""
+Sampling profiler
+
+`StackSampler` takes the Python stack of every thread of the worker every
+`interval` seconds (sys._current_frames) from a background thread, and
+counts identical stacks. Nothing runs while no profile is being taken, so
+the idle overhead is zero; while sampling, the cost is one stack walk per
+thread per interval.
+
+Profiles are exported as collapsed stacks ("outer;inner;leaf count" lines,
+for flamegraph.pl / speedscope) or as a speedscope JSON document
+(https://www.speedscope.app).
+
+Only one profile runs at a time per process (`profile_lock`). The admin API
+(src/api/admin.py) exposes it, and a request sent with an `X-Profile`
+header is profiled on its own (see `profile_request` in src/main.py).
+"""
+
+import os
+import sys
+import threading
+import time
+from collections import Counter, OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+PROFILE_MAX_SECONDS = float(os.getenv("PROFILE_MAX_SECONDS", "60"))
+PROFILE_DEFAULT_INTERVAL = 0.005
+# Profiles kept for GET /api/v1/admin/profiles/{id}
+PROFILE_KEEP = 20
+
+Frame = Tuple[str, str, int]  # function, file, first line
+
+
+class ProfilerBusyError(Exception):
+    """Another profile is already running in this process."""
+
+
+class StackSampler:
+    """
+    Sample all thread stacks until stopped.
+
+    Args:
+        interval: Seconds between samples.
+        max_depth: Frames kept per stack (innermost ones win).
+    """
+
+    def __init__(
+        self, interval: float = PROFILE_DEFAULT_INTERVAL, max_depth: int = 128
+    ):
+        self.interval = max(0.001, interval)
+        self.max_depth = max_depth
+        self.stacks: Counter = Counter()
+        self.samples = 0
+        self.started_at = 0.0
+        self.duration = 0.0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> "StackSampler":
+        self.started_at = time.time()
+        self._thread = threading.Thread(
+            target=self._run, name="stack-sampler", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> "StackSampler":
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self.duration = time.time() - self.started_at
+        return self
+
+    def _run(self) -> None:
+        own = threading.get_ident()
+        names = {}
+        while not self._stop.wait(self.interval):
+            if len(names) != threading.active_count():
+                names = {t.ident: t.name for t in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():
+                if ident == own:
+                    continue
+                stack: List[Frame] = []
+                while frame is not None and len(stack) < self.max_depth:
+                    code = frame.f_code
+                    stack.append((code.co_name, code.co_filename, code.co_firstlineno))
+                    frame = frame.f_back
+                stack.append((f"thread:{names.get(ident, ident)}", "", 0))
+                stack.reverse()
+                self.stacks[tuple(stack)] += 1
+            self.samples += 1
+
+    def collapsed(self) -> str:
+        """One "root;...;leaf count" line per distinct stack."""
+        lines = []
+        for stack, count in self.stacks.most_common():
+            names = ";".join(_frame_label(f).replace(";", ":") for f in stack)
+            lines.append(f"{names} {count}")
+        return "\n".join(lines) + ("\n" if lines else "")
+
+    def speedscope(self, name: str = "profile") -> Dict[str, Any]:
+        """Sampled profile in the speedscope file format (weights in ms)."""
+        frames: List[Dict[str, Any]] = []
+        index: Dict[Frame, int] = {}
+        samples, weights = [], []
+        for stack, count in self.stacks.items():
+            ids = []
+            for frame in stack:
+                if frame not in index:
+                    index[frame] = len(frames)
+                    function, file, line = frame
+                    entry: Dict[str, Any] = {"name": function}
+                    if file:
+                        entry.update(file=file, line=line)
+                    frames.append(entry)
+                ids.append(index[frame])
+            samples.append(ids)
+            weights.append(round(count * self.interval * 1000, 3))
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "shared": {"frames": frames},
+            "profiles": [
+                {
+                    "type": "sampled",
+                    "name": name,
+                    "unit": "milliseconds",
+                    "startValue": 0,
+                    "endValue": round(sum(weights), 3),
+                    "samples": samples,
+                    "weights": weights,
+                }
+            ],
+            "name": name,
+            "exporter": "resume-analyzer",
+        }
+
+
+def _frame_label(frame: Frame) -> str:
+    function, file, line = frame
+    if not file:
+        return function
+    return f"{function} ({os.path.basename(file)}:{line})"
+
+
+profile_lock = threading.Lock()
+
+
+def begin_profile(interval: float = PROFILE_DEFAULT_INTERVAL) -> StackSampler:
+    """Start the process-wide sampler; raises ProfilerBusyError if running."""
+    if not profile_lock.acquire(blocking=False):
+        raise ProfilerBusyError("A profile is already running")
+    try:
+        return StackSampler(interval).start()
+    except Exception:
+        profile_lock.release()
+        raise
+
+
+def end_profile(sampler: StackSampler) -> StackSampler:
+    try:
+        return sampler.stop()
+    finally:
+        profile_lock.release()
+
+
+class ProfileStore:
+    """The most recent finished profiles, by id."""
+
+    def __init__(self, keep: int = PROFILE_KEEP):
+        self.keep = keep
+        self._profiles: "OrderedDict[str, Tuple[str, StackSampler]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def put(self, profile_id: str, name: str, sampler: StackSampler) -> None:
+        with self._lock:
+            self._profiles[profile_id] = (name, sampler)
+            while len(self._profiles) > self.keep:
+                self._profiles.popitem(last=False)
+
+    def get(self, profile_id: str) -> Optional[Tuple[str, StackSampler]]:
+        with self._lock:
+            return self._profiles.get(profile_id)
+
+    def list(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            return [
+                {
+                    "id": profile_id,
+                    "name": name,
+                    "samples": sampler.samples,
+                    "duration_s": round(sampler.duration, 3),
+                    "started_at": sampler.started_at,
+                }
+                for profile_id, (name, sampler) in reversed(self._profiles.items())
+            ]
+
+
+# Finished per-request profiles of this process
+profile_store = ProfileStore()
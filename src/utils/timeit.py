@@ -2,17 +2,26 @@ import time
 import functools
 import logging
 
+from src.utils.metrics import record_operation
+
 logger = logging.getLogger(__name__)
 
 
 def timeit(label="Execution"):
+    """Log a call's duration and record it in the metrics registry."""
+
     def decorator(func):
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            start = time.time()
-            result = func(*args, **kwargs)
-            duration = (time.time() - start) * 1000  # ms
-            logger.info(f"{label} took {duration:.2f} ms")
+            start = time.perf_counter_ns()
+            try:
+                result = func(*args, **kwargs)
+            except Exception:
+                record_operation(label, time.perf_counter_ns() - start, failed=True)
+                raise
+            elapsed = time.perf_counter_ns() - start
+            record_operation(label, elapsed)
+            logger.info(f"{label} took {elapsed / 1e6:.2f} ms")
             return result
 
         return wrapper
@@ -0,0 +1,218 @@
+"""
+Pipeline tracing spans
+
+`span()` wraps one stage of a job (text extraction, skill parsing, section
+detection, grammar, PDF rendering, ...) and records its duration, input
+size and outcome. Spans are attached to the job: nested spans and code run
+via asyncio.to_thread inherit the job from the enclosing span. A job's spans
+are served at GET /api/v1/jobs/{job_id}/trace.
+
+`export_job()` writes a sampled share of jobs (TRACE_SAMPLE_RATE, decided
+per job id so every process agrees) to TRACE_DIR/<job_id>.json in the
+Chrome trace event format. Open the file in chrome://tracing or
+https://ui.perfetto.dev to see the stages on a timeline.
+
+Span durations also feed the stage_duration_seconds{stage} histogram at
+/metrics. With memory tracking on, spans also carry a "memory" attribute
+(src/utils/memory.py).
+
+Usage:
+    with span("skills", job_id, chars=len(text)) as s:
+        report = extract_skills(text)
+        s.set(skills=len(report))
+"""
+
+import contextvars
+import json
+import logging
+import os
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from src.utils.memory import memory_tracker
+from src.utils.metrics import REGISTRY
+
+logger = logging.getLogger(__name__)
+
+TRACE_SAMPLE_RATE = float(os.getenv("TRACE_SAMPLE_RATE", "0.1"))
+TRACE_DIR = Path(os.getenv("TRACE_DIR", "reports/traces"))
+
+STAGE_SECONDS = REGISTRY.histogram(
+    "stage_duration_seconds", "Duration of traced pipeline stages", ["stage"]
+)
+
+_current: contextvars.ContextVar[Optional["Span"]] = contextvars.ContextVar(
+    "current_span", default=None
+)
+
+
+class Span:
+    """One timed stage; `set()` adds attributes such as output sizes."""
+
+    __slots__ = (
+        "name",
+        "job_id",
+        "parent",
+        "attrs",
+        "status",
+        "error",
+        "start_us",
+        "duration_us",
+        "thread_id",
+    )
+
+    def __init__(self, name: str, job_id: Optional[str], parent: Optional[str]):
+        self.name = name
+        self.job_id = job_id
+        self.parent = parent
+        self.attrs: Dict[str, Any] = {}
+        self.status = "ok"
+        self.error: Optional[str] = None
+        self.start_us = time.time_ns() // 1000
+        self.duration_us = 0
+        self.thread_id = threading.get_ident()
+
+    def set(self, **attrs: Any) -> None:
+        self.attrs.update(attrs)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "parent": self.parent,
+            "start_us": self.start_us,
+            "duration_ms": round(self.duration_us / 1000, 3),
+            "status": self.status,
+            "error": self.error,
+            "attrs": self.attrs,
+        }
+
+    def to_chrome_event(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "cat": "pipeline",
+            "ph": "X",
+            "ts": self.start_us,
+            "dur": self.duration_us,
+            "pid": os.getpid(),
+            "tid": self.thread_id,
+            "args": {
+                "job_id": self.job_id,
+                "status": self.status,
+                "error": self.error,
+                **self.attrs,
+            },
+        }
+
+
+class Tracer:
+    """
+    Spans of the most recently active jobs, kept in memory.
+
+    Args:
+        max_jobs: Jobs whose spans are kept (least recently updated dropped).
+        max_spans: Spans kept per job.
+        sample_rate: Share of jobs written to trace files by `export_job`.
+        trace_dir: Where trace files go.
+    """
+
+    def __init__(
+        self,
+        max_jobs: int = 500,
+        max_spans: int = 200,
+        sample_rate: float = TRACE_SAMPLE_RATE,
+        trace_dir: Path = TRACE_DIR,
+    ):
+        self.max_jobs = max_jobs
+        self.max_spans = max_spans
+        self.sample_rate = sample_rate
+        self.trace_dir = Path(trace_dir)
+        self._jobs: "OrderedDict[str, List[Span]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def span(
+        self, name: str, job_id: Optional[str] = None, **attrs: Any
+    ) -> Iterator[Span]:
+        parent = _current.get()
+        if job_id is None and parent is not None:
+            job_id = parent.job_id
+        current = Span(name, job_id, parent.name if parent else None)
+        current.attrs.update(attrs)
+        token = _current.set(current)
+        memory = memory_tracker.begin()
+        started = time.perf_counter_ns()
+        try:
+            yield current
+        except BaseException as e:
+            current.status = "error"
+            current.error = getattr(e, "detail", None) or str(e) or type(e).__name__
+            raise
+        finally:
+            elapsed = time.perf_counter_ns() - started
+            report = memory_tracker.end(memory, name, job_id)
+            if report is not None:
+                current.attrs["memory"] = report
+            _current.reset(token)
+            current.duration_us = elapsed // 1000
+            STAGE_SECONDS.labels(name).observe(elapsed / 1e9)
+            if job_id is not None:
+                self._record(current)
+
+    def _record(self, span: Span) -> None:
+        with self._lock:
+            spans = self._jobs.setdefault(span.job_id, [])
+            spans.append(span)
+            del spans[: -self.max_spans]
+            self._jobs.move_to_end(span.job_id)
+            while len(self._jobs) > self.max_jobs:
+                self._jobs.popitem(last=False)
+
+    def spans(self, job_id: str) -> List[Dict[str, Any]]:
+        """The job's spans in start order."""
+        with self._lock:
+            spans = list(self._jobs.get(job_id, ()))
+        return [s.to_dict() for s in sorted(spans, key=lambda s: s.start_us)]
+
+    def is_sampled(self, job_id: str) -> bool:
+        """Stable per job id, so every stage of a job agrees."""
+        if self.sample_rate <= 0:
+            return False
+        bucket = zlib.crc32(job_id.encode()) % 10000
+        return bucket < self.sample_rate * 10000
+
+    def export_job(self, job_id: str, force: bool = False) -> Optional[Path]:
+        """
+        Write the job's spans as a Chrome trace file if the job is sampled
+        (or `force`). Rewritten on each call, so later stages are added.
+        """
+        if not (force or self.is_sampled(job_id)):
+            return None
+        with self._lock:
+            spans = list(self._jobs.get(job_id, ()))
+        if not spans:
+            return None
+        trace = {
+            "traceEvents": [s.to_chrome_event() for s in spans],
+            "displayTimeUnit": "ms",
+            "otherData": {"job_id": job_id},
+        }
+        try:
+            self.trace_dir.mkdir(parents=True, exist_ok=True)
+            path = self.trace_dir / f"{job_id}.json"
+            tmp = path.with_suffix(".tmp")
+            tmp.write_text(json.dumps(trace, default=str))
+            tmp.replace(path)
+            return path
+        except OSError as e:
+            logger.warning(f"Could not write trace for job {job_id}: {e}")
+            return None
+
+
+# The one tracer per process
+tracer = Tracer()
+span = tracer.span
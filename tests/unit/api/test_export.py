@@ -0,0 +1,128 @@
+"""
+Unit tests for the batch report export (streamed ZIP)
+"""
+
+import asyncio
+import io
+import json
+import zipfile
+
+import pytest
+from fastapi.testclient import TestClient
+
+import src.api.export as export_module
+from src.main import app
+from src.upload.service import batch_jobs, register_batch
+
+client = TestClient(app)
+
+
+@pytest.fixture
+def fake_pipeline(monkeypatch):
+    """Fake analysis + rendering; records peak render concurrency."""
+    state = {"active": 0, "peak": 0}
+
+    def fake_analysis(job_id):
+        if job_id == "broken":
+            raise ValueError("no such resume")
+        return {"job_id": job_id}
+
+    async def fake_render(report_data, job_id=None):
+        state["active"] += 1
+        state["peak"] = max(state["peak"], state["active"])
+        await asyncio.sleep(0.01)
+        state["active"] -= 1
+        return f"%PDF {report_data['job_id']}".encode()
+
+    monkeypatch.setattr(export_module, "get_analysis_data", fake_analysis)
+    monkeypatch.setattr(
+        export_module, "job_exists", lambda job_id: not job_id.startswith("gone")
+    )
+    monkeypatch.setattr(export_module.pdf_renderer, "render", fake_render)
+    return state
+
+
+def read_zip(response) -> zipfile.ZipFile:
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/zip"
+    return zipfile.ZipFile(io.BytesIO(response.content))
+
+
+def test_export_streams_every_report(fake_pipeline):
+    job_ids = [f"job-{i}" for i in range(12)]
+    response = client.post("/api/v1/export", json={"job_ids": job_ids})
+
+    archive = read_zip(response)
+    assert archive.testzip() is None
+    for job_id in job_ids:
+        assert (
+            archive.read(f"Analysis_Report_{job_id}.pdf") == f"%PDF {job_id}".encode()
+        )
+    manifest = json.loads(archive.read("manifest.json"))
+    assert sorted(manifest["exported"]) == sorted(job_ids)
+    assert fake_pipeline["peak"] <= export_module.pdf_renderer.workers
+
+
+def test_export_by_batch_id_reports_failures(fake_pipeline):
+    batch_id = register_batch([{"jobId": "job-a"}, {"jobId": "broken"}])
+    try:
+        response = client.post("/api/v1/export", json={"batch_id": batch_id})
+    finally:
+        batch_jobs.pop(batch_id, None)
+
+    archive = read_zip(response)
+    assert batch_id in response.headers["content-disposition"]
+    assert archive.namelist() == ["Analysis_Report_job-a.pdf", "manifest.json"]
+    manifest = json.loads(archive.read("manifest.json"))
+    assert manifest["failed"] == {"broken": "no such resume"}
+
+
+def test_export_lists_unknown_jobs_as_not_found(fake_pipeline):
+    response = client.post("/api/v1/export", json={"job_ids": ["job-a", "gone-1"]})
+
+    archive = read_zip(response)
+    assert archive.namelist() == ["Analysis_Report_job-a.pdf", "manifest.json"]
+    manifest = json.loads(archive.read("manifest.json"))
+    assert manifest == {"exported": ["job-a"], "failed": {"gone-1": "not found"}}
+
+
+def test_job_exists_needs_an_upload_or_snapshot(tmp_path, monkeypatch):
+    from src.api import data_service
+
+    monkeypatch.setattr(data_service, "UPLOAD_DIR", tmp_path)
+    (tmp_path / "uploaded.pdf").write_bytes(b"%PDF")
+
+    assert data_service.job_exists("uploaded")
+    assert not data_service.job_exists("typo")
+
+
+def test_batch_registry_is_bounded(monkeypatch):
+    from src.upload import service
+
+    monkeypatch.setattr(service, "BATCH_JOBS_MAX", 2)
+    ids = [register_batch([{"jobId": f"job-{i}"}]) for i in range(3)]
+    try:
+        assert service.get_batch_jobs(ids[0]) is None
+        assert service.get_batch_jobs(ids[2]) == ["job-2"]
+        assert len(batch_jobs) <= 2
+    finally:
+        for batch_id in ids:
+            batch_jobs.pop(batch_id, None)
+
+
+@pytest.mark.parametrize(
+    "body, status_code",
+    [
+        ({}, 400),
+        ({"job_ids": ["../etc/passwd"]}, 400),
+        ({"batch_id": "unknown"}, 404),
+    ],
+)
+def test_export_rejects_bad_requests(body, status_code, fake_pipeline):
+    assert client.post("/api/v1/export", json=body).status_code == status_code
+
+
+def test_export_limits_batch_size(fake_pipeline, monkeypatch):
+    monkeypatch.setattr(export_module, "EXPORT_MAX_JOBS", 2)
+    response = client.post("/api/v1/export", json={"job_ids": ["a", "b", "c"]})
+    assert response.status_code == 413
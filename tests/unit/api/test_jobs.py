@@ -0,0 +1,207 @@
+"""
+Unit tests for job progress events and the SSE endpoint
+"""
+
+import asyncio
+import json
+import threading
+
+import pytest
+from fastapi.testclient import TestClient
+
+import src.api.jobs as jobs_module
+from src.main import app
+from src.parser.analyzer import analysis_results
+from src.utils.job_events import JobEventBus
+
+client = TestClient(app)
+
+
+@pytest.fixture
+def bus(monkeypatch):
+    """A fresh event bus wherever events are published or streamed."""
+    fresh = JobEventBus()
+    for module in ("src.api.jobs", "src.parser.analyzer", "src.upload.service"):
+        monkeypatch.setattr(f"{module}.job_events", fresh)
+    return fresh
+
+
+def parse_sse(body: str):
+    events = []
+    for block in body.strip().split("\n\n"):
+        fields = dict(
+            line.split(": ", 1) for line in block.splitlines() if ": " in line
+        )
+        if "data" in fields:
+            events.append(json.loads(fields["data"]))
+    return events
+
+
+def test_stream_replays_history_and_stops_at_result(bus):
+    for stage in ("extracted", "skills", "structure", "gaps"):
+        bus.publish("job-1", stage)
+    bus.publish("job-1", "result", data={"overallScore": 70})
+
+    response = client.get("/api/v1/jobs/job-1/events")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = parse_sse(response.text)
+    assert [e["stage"] for e in events] == [
+        "extracted",
+        "skills",
+        "structure",
+        "gaps",
+        "result",
+    ]
+    assert events[-1]["data"] == {"overallScore": 70}
+
+
+def test_last_event_id_resumes_after_seen_events(bus):
+    seen = bus.publish("job-2", "extracted")
+    bus.publish("job-2", "skills")
+    bus.publish("job-2", "failed", status="failed", data={"error": "boom"})
+
+    response = client.get(
+        "/api/v1/jobs/job-2/events", headers={"Last-Event-ID": str(seen["id"])}
+    )
+
+    assert [e["stage"] for e in parse_sse(response.text)] == ["skills", "failed"]
+
+
+def test_unknown_job_is_404(bus):
+    assert client.get("/api/v1/jobs/no-such-job/events").status_code == 404
+
+
+def test_snapshot_only_job_streams_its_result(bus, isolated_result_store):
+    from src.api.data_service import feedback_gen
+    from src.database.result_store import snapshot_version
+
+    version = snapshot_version(feedback_gen.engine_versions())
+    isolated_result_store.put("old-job", "report", version, {"overallScore": 55})
+
+    events = parse_sse(client.get("/api/v1/jobs/old-job/events").text)
+    assert [e["stage"] for e in events] == ["result"]
+    assert events[0]["data"] == {"overallScore": 55}
+
+
+def test_live_events_from_other_threads_reach_subscribers(bus):
+    async def scenario():
+        received = []
+
+        async def consume():
+            async for event in bus.stream("job-3", heartbeat=5):
+                received.append(event["stage"])
+
+        consumer = asyncio.create_task(consume())
+        await asyncio.sleep(0.01)
+        assert bus.subscriber_count("job-3") == 1
+
+        def worker():
+            bus.publish("job-3", "grammar")
+            bus.publish("job-3", "result")
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        await asyncio.wait_for(consumer, 2)
+        thread.join()
+        return received
+
+    assert asyncio.run(scenario()) == ["grammar", "result"]
+    assert bus.subscriber_count("job-3") == 0
+
+
+def test_finalize_publishes_remaining_stages(bus, monkeypatch):
+    report = {"overallScore": 81, "feedback": {"grammar": {"score": 90}}}
+    monkeypatch.setattr(jobs_module, "get_analysis_data", lambda job_id: report)
+    monkeypatch.setattr(jobs_module, "PDF_PRERENDER", False)
+
+    asyncio.run(jobs_module.finalize_job("job-4"))
+
+    events = bus.history("job-4")
+    assert [e["stage"] for e in events] == ["grammar", "feedback", "pdf", "result"]
+    assert events[2]["status"] == "skipped"
+    assert events[3]["data"] == report
+
+
+def test_finalize_failure_is_terminal(bus, monkeypatch):
+    def broken(job_id):
+        raise RuntimeError("feedback crashed")
+
+    monkeypatch.setattr(jobs_module, "get_analysis_data", broken)
+    asyncio.run(jobs_module.finalize_job("job-5"))
+
+    assert bus.is_finished("job-5")
+    assert bus.history("job-5")[-1]["data"]["error"] == "feedback crashed"
+
+
+def test_second_finished_stage_starts_finalize(bus, monkeypatch):
+    from src.parser.analyzer import finish_stage
+
+    monkeypatch.setattr(
+        jobs_module, "get_analysis_data", lambda job_id: {"overallScore": 1}
+    )
+    monkeypatch.setattr(jobs_module, "PDF_PRERENDER", False)
+    monkeypatch.setattr(jobs_module, "JOB_FINALIZE_EAGER", True)
+
+    async def scenario():
+        analysis_results["job-6"] = {"status": "complete"}
+        finish_stage("job-6")  # FR-009 still running
+        assert not jobs_module._tasks
+        analysis_results["job-6"]["word_count"] = 120
+        finish_stage("job-6")
+        await asyncio.gather(*jobs_module._tasks)
+
+    try:
+        asyncio.run(scenario())
+    finally:
+        analysis_results.pop("job-6", None)
+    assert bus.is_finished("job-6")
+
+
+def test_unwatched_jobs_are_not_finalized_eagerly(bus, monkeypatch):
+    from src.parser.analyzer import finish_stage
+
+    monkeypatch.setattr(jobs_module, "JOB_FINALIZE_EAGER", False)
+    monkeypatch.setattr(
+        jobs_module, "get_analysis_data", lambda job_id: {"overallScore": 1}
+    )
+    monkeypatch.setattr(jobs_module, "PDF_PRERENDER", False)
+
+    async def scenario():
+        analysis_results["job-7"] = {"status": "complete", "word_count": 120}
+        finish_stage("job-7")
+        assert not jobs_module._tasks  # nobody is waiting for the report
+
+        stream = jobs_module._event_stream("job-8", 0)
+        analysis_results["job-8"] = {"status": "complete"}
+        assert (await stream.__anext__()).startswith("retry")  # now watched
+        analysis_results["job-8"]["word_count"] = 120
+        finish_stage("job-8")
+        await asyncio.gather(*jobs_module._tasks)
+        await stream.aclose()
+
+    try:
+        asyncio.run(scenario())
+    finally:
+        analysis_results.pop("job-7", None)
+        analysis_results.pop("job-8", None)
+    assert not bus.knows("job-7")
+    assert bus.is_finished("job-8")
+    assert not jobs_module._watchers
+
+
+def test_stream_of_evicted_job_ends_with_unknown_event():
+    bus = JobEventBus(max_jobs=1)
+
+    async def scenario():
+        bus.publish("old", "extracted")
+        stages = []
+        async for event in bus.stream("old", heartbeat=0.01):
+            if event is None:
+                bus.publish("new", "extracted")  # evicts "old"
+                continue
+            stages.append(event["stage"])
+        return stages
+
+    assert asyncio.run(asyncio.wait_for(scenario(), 2)) == ["extracted", "unknown"]
@@ -0,0 +1,151 @@
+"""
+Unit tests for the metadata rollups and the dashboard stats endpoint
+"""
+
+import json
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+
+from src.database.metadata_rollup import (
+    OVERFLOW_BUCKET_MS,
+    histogram_percentile,
+    prune_rollups,
+    query_rollups,
+    rebuild_rollups,
+)
+from src.database.metadata_writer import MetadataWriter
+from src.main import app
+
+client = TestClient(app)
+
+NOW = datetime.now(timezone.utc).replace(tzinfo=None).replace(second=30, microsecond=0)
+
+
+def row(ms: int, file_type: str = "pdf", missing=(), minutes_ago: int = 0) -> dict:
+    return {
+        "file_type": file_type,
+        "processing_time_ms": ms,
+        "missing_sections": json.dumps(list(missing)),
+        "file_size_bytes": 1000,
+        "log_timestamp": NOW - timedelta(minutes=minutes_ago),
+    }
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'metadata.db'}")
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def writer(engine, monkeypatch):
+    writer = MetadataWriter(engine, batch_size=3, flush_interval=60).start()
+    monkeypatch.setattr("src.api.dashboard.get_metadata_writer", lambda: writer)
+    yield writer
+    writer.stop()
+
+
+def write(writer, rows):
+    for r in rows:
+        assert writer.submit(dict(r))
+    assert writer.flush(timeout=5)
+
+
+def test_batches_update_rollups_incrementally(engine, writer):
+    write(writer, [row(80, missing=["skills"]), row(120, "docx")])
+    write(writer, [row(400, missing=["skills", "projects"])])
+
+    with engine.connect() as conn:
+        stats = query_rollups(conn, NOW - timedelta(hours=1), NOW + timedelta(hours=1))
+        buckets = conn.execute(
+            text("SELECT COUNT(*) FROM resume_metadata_rollup WHERE file_type='pdf'")
+        ).scalar()
+
+    assert buckets == 2  # one minute and one hour bucket, updated in place
+    assert stats["granularity"] == "minute"
+    assert stats["count"] == 3
+    assert stats["file_types"] == {"docx": 1, "pdf": 2}
+    assert stats["processing_time_ms"]["max"] == 400
+    assert stats["missing_sections"][0] == {
+        "section": "skills",
+        "count": 2,
+        "rate": 0.6667,
+    }
+
+
+def test_hour_buckets_and_file_type_filter(engine, writer):
+    write(writer, [row(100, minutes_ago=0), row(200, minutes_ago=90)])
+    write(writer, [row(300, "txt", minutes_ago=90)])
+
+    with engine.connect() as conn:
+        all_types = query_rollups(
+            conn, NOW - timedelta(hours=12), NOW + timedelta(minutes=1), "hour"
+        )
+        pdf_only = query_rollups(
+            conn,
+            NOW - timedelta(hours=12),
+            NOW + timedelta(minutes=1),
+            "hour",
+            file_type="pdf",
+        )
+
+    assert [b["count"] for b in all_types["series"]] == [2, 1]
+    assert pdf_only["count"] == 2
+    assert pdf_only["file_types"] == {"pdf": 2}
+
+
+def test_percentiles_interpolate_inside_histogram_buckets():
+    counts = {100: 50, 250: 40, 500: 10}
+    assert histogram_percentile(counts, 0.5) == 100.0
+    assert histogram_percentile(counts, 0.7) == 175.0
+    assert histogram_percentile({OVERFLOW_BUCKET_MS: 2}, 0.5, max_ms=90000) == 45000.0
+    assert histogram_percentile({}, 0.5) is None
+
+
+def test_rebuild_matches_incremental_rollups(engine, writer):
+    write(writer, [row(90, missing=["education"]), row(700), row(3000, "docx")])
+    window = (NOW - timedelta(hours=1), NOW + timedelta(hours=1))
+    with engine.connect() as conn:
+        incremental = query_rollups(conn, *window)
+
+    assert rebuild_rollups(engine, chunk_size=2) == 3
+    with engine.connect() as conn:
+        assert query_rollups(conn, *window) == incremental
+
+
+def test_prune_drops_expired_minute_buckets(engine, writer):
+    write(writer, [row(100, missing=["skills"], minutes_ago=60 * 72)])
+    with engine.begin() as conn:
+        assert prune_rollups(conn, now=NOW) == 3  # minute buckets of all three tables
+        stats = query_rollups(
+            conn, NOW - timedelta(days=4), NOW, "hour", top_sections=5
+        )
+    assert stats["count"] == 1
+
+
+def test_stats_endpoint(writer):
+    write(writer, [row(150, missing=["projects"]), row(260, "docx")])
+
+    response = client.get("/api/v1/metadata/stats")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["count"] == 2
+    assert body["granularity"] == "hour"  # default range is the last 24h
+    assert body["missing_sections"][0]["section"] == "projects"
+    assert body["processing_time_ms"]["p50"] is not None
+
+
+def test_stats_endpoint_rejects_inverted_range(writer):
+    response = client.get(
+        "/api/v1/metadata/stats",
+        params={
+            "start": NOW.isoformat(),
+            "end": (NOW - timedelta(hours=1)).isoformat(),
+        },
+    )
+    assert response.status_code == 400
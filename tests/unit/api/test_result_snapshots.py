@@ -0,0 +1,156 @@
+"""
+Unit tests for result snapshot persistence (GET /results and downloads)
+"""
+
+import time
+from unittest.mock import patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+import src.api.data_service as data_service
+import src.api.results as results_module
+from src.database.result_store import ResultStore, snapshot_version
+from src.main import app
+from src.parser.analyzer import analysis_results
+
+client = TestClient(app)
+
+RESUME = """JOHN DOE
+EDUCATION
+BS Computer Science MIT
+SKILLS
+Python FastAPI Docker
+EXPERIENCE
+Software Engineer Google
+PROJECTS
+Resume Analyzer
+"""
+
+
+@pytest.fixture
+def finished_job(tmp_path, monkeypatch):
+    """An uploaded resume whose background analysis has finished."""
+    job_id = "snapshot-job"
+    (tmp_path / f"{job_id}.txt").write_text(RESUME, encoding="utf-8")
+    monkeypatch.setattr(data_service, "UPLOAD_DIR", tmp_path)
+    monkeypatch.setattr(results_module, "UPLOAD_DIR", tmp_path)
+    monkeypatch.setattr(
+        data_service.feedback_gen,
+        "generate_comprehensive_feedback_with_grammar",
+        lambda **kwargs: {"overall_score": 70, "strengths": [], "suggestions": []},
+    )
+    analysis_results[job_id] = {"status": "complete", "word_count": 21}
+    yield job_id
+    analysis_results.pop(job_id, None)
+
+
+def test_store_keeps_first_snapshot_per_version():
+    store = ResultStore(":memory:")
+
+    assert store.put("job", "report", "v1", {"score": 1})
+    assert not store.put("job", "report", "v1", {"score": 2})
+    assert store.get("job", "report", "v1") == {"score": 1}
+    assert store.get("job", "report", "v2") is None
+
+    store.put("job", "report", "v2", {"score": 3})
+    assert store.prune(keep_version="v2") == 1
+    assert store.stats()["snapshots"] == 1
+
+
+def test_snapshot_version_tracks_engine_versions():
+    base = {"feedback": "2", "weights": {"grammar": 0.1}}
+    assert snapshot_version(base) == snapshot_version(dict(base))
+    assert snapshot_version(base) != snapshot_version({**base, "feedback": "3"})
+
+
+def test_finished_job_is_served_from_snapshot(finished_job, isolated_result_store):
+    first = data_service.get_analysis_data(finished_job)
+    assert isolated_result_store.stats()["writes"] == 1
+
+    with patch.object(
+        data_service, "extract_text_from_file", side_effect=AssertionError
+    ) as extract:
+        second = data_service.get_analysis_data(finished_job)
+
+    assert second == first
+    extract.assert_not_called()
+
+
+def test_engine_change_triggers_reanalysis(finished_job, isolated_result_store):
+    data_service.get_analysis_data(finished_job)
+    original = dict(data_service.feedback_gen.weights)
+    try:
+        data_service.feedback_gen.set_weights({"grammar": 0.2})
+        data_service.get_analysis_data(finished_job)
+    finally:
+        data_service.feedback_gen.set_weights(original)
+
+    assert isolated_result_store.stats()["writes"] == 2
+
+
+def test_pending_analysis_is_not_snapshotted(finished_job, isolated_result_store):
+    analysis_results[finished_job] = {"status": "complete"}  # FR-009 still running
+
+    data_service.get_analysis_data(finished_job)
+    assert isolated_result_store.stats()["snapshots"] == 0
+
+
+def test_results_endpoint_uses_its_own_snapshot(finished_job, isolated_result_store):
+    first = client.get(f"/api/v1/results/{finished_job}")
+    assert first.status_code == 200
+
+    with patch.object(results_module, "extract_text_from_file") as extract:
+        second = client.get(f"/api/v1/results/{finished_job}")
+
+    assert second.json() == first.json()
+    extract.assert_not_called()
+    assert isolated_result_store.stats()["snapshots"] == 1
+
+
+def test_degraded_grammar_is_not_snapshotted(
+    finished_job, isolated_result_store, monkeypatch
+):
+    monkeypatch.setattr(
+        data_service.feedback_gen,
+        "generate_comprehensive_feedback_with_grammar",
+        lambda **kwargs: {
+            "overall_score": 70,
+            "grammar": {"score": 0, "degraded": True},
+        },
+    )
+
+    data_service.get_analysis_data(finished_job)
+    assert isolated_result_store.stats()["snapshots"] == 0
+
+
+def test_expired_snapshots_are_not_served():
+    store = ResultStore(":memory:", ttl=60)
+    store.put("job", "report", "v1", {"score": 1})
+    store._conn.execute("UPDATE result_snapshots SET created_at = created_at - 120")
+
+    assert store.get("job", "report", "v1") is None
+    assert store.prune(keep_version="v1") == 1
+
+
+def test_upload_cleanup_deletes_snapshots_and_pdfs(
+    tmp_path, isolated_result_store, monkeypatch
+):
+    from src.feedback.pdf_renderer import pdf_renderer
+    from src.upload.service import schedule_file_cleanup
+
+    upload = tmp_path / "cleaned-job.txt"
+    upload.write_text(RESUME)
+    isolated_result_store.put("cleaned-job", "report", "v1", {"score": 1})
+    discarded = []
+    monkeypatch.setattr(pdf_renderer, "discard_job", discarded.append)
+
+    schedule_file_cleanup(str(upload), delay_seconds=0)
+    for _ in range(50):
+        if discarded:
+            break
+        time.sleep(0.02)
+
+    assert not upload.exists()
+    assert isolated_result_store.stats()["snapshots"] == 0
+    assert discarded == ["cleaned-job"]
@@ -0,0 +1,127 @@
+"""
+Unit Tests for the feedback result cache
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from src.core.grammar_service import grammar_service
+from src.feedback.feedback_cache import FeedbackCache, feedback_key, is_cacheable
+from src.feedback.feedback_generator import FeedbackGenerator
+
+SECTIONS = {"education": "BS Computer Science MIT", "experience": "Engineer"}
+VALIDATION = {"completeness_score": 50, "missing_sections": ["skills"]}
+VERBS = {"overall_score": 80, "total_weak_verbs": 0, "suggestions": []}
+GRAMMAR = {"grammar": {"score": 90, "total_errors": 0}}
+
+
+@pytest.fixture
+def generator():
+    return FeedbackGenerator(cache=FeedbackCache(max_entries=4))
+
+
+@pytest.fixture
+def counted_pipeline():
+    """Patch the expensive stages and count how often they run."""
+    with (
+        patch(
+            "src.feedback.feedback_generator.enhance_feedback_with_grammar",
+            return_value=GRAMMAR,
+        ) as grammar,
+        patch.object(FeedbackGenerator, "_analyze_action_verbs", return_value=VERBS),
+    ):
+        yield grammar
+
+
+def _generate(generator, sections=SECTIONS, validation=VALIDATION):
+    return generator.generate_comprehensive_feedback_with_grammar(
+        sections=sections, validation=validation, include_grammar=True
+    )
+
+
+def test_repeated_request_is_served_from_cache(generator, counted_pipeline):
+    first = _generate(generator)
+    second = _generate(generator)
+
+    assert first == second
+    assert counted_pipeline.call_count == 1
+    assert generator.cache.stats()["hits"] == 1
+
+
+def test_cached_result_is_a_private_copy(generator, counted_pipeline):
+    _generate(generator)["suggestions"].append("mutated by caller")
+    assert "mutated by caller" not in _generate(generator)["suggestions"]
+
+
+def test_changed_input_misses(generator, counted_pipeline):
+    _generate(generator)
+    _generate(generator, sections={**SECTIONS, "experience": "Senior Engineer"})
+    _generate(generator, validation={**VALIDATION, "keyword_match_score": 40})
+    assert counted_pipeline.call_count == 3
+
+
+def test_weight_change_invalidates(generator, counted_pipeline):
+    before = _generate(generator)
+    generator.set_weights({"completeness": 0.2, "verbs": 0.7, "grammar": 0.1})
+    after = _generate(generator)
+
+    assert counted_pipeline.call_count == 2
+    assert generator.cache.stats()["invalidations"] == 1
+    assert after["overall_score"] != before["overall_score"]
+
+
+def test_degraded_grammar_is_not_cached(generator):
+    degraded = {"grammar": {"score": 0, "degraded": True}}
+    with (
+        patch(
+            "src.feedback.feedback_generator.enhance_feedback_with_grammar",
+            return_value=degraded,
+        ) as grammar,
+        patch.object(FeedbackGenerator, "_analyze_action_verbs", return_value=VERBS),
+    ):
+        _generate(generator)
+        _generate(generator)
+    assert grammar.call_count == 2
+    assert not is_cacheable({"grammar": {"error": "timeout"}})
+
+
+def test_cache_is_bounded():
+    cache = FeedbackCache(max_entries=2)
+    for name in "abc":
+        cache.put(name, {"v": name})
+    assert cache.get("a") is None
+    assert cache.get("c") == {"v": "c"}
+    assert cache.stats()["entries"] == 2
+
+
+def test_key_depends_on_engine_versions():
+    key = feedback_key(SECTIONS, VALIDATION, True, {"skill_lists": (("a.json", 1, 2),)})
+    changed = feedback_key(
+        SECTIONS, VALIDATION, True, {"skill_lists": (("a.json", 3, 2),)}
+    )
+    assert key != changed
+    assert key == feedback_key(
+        dict(reversed(SECTIONS.items())),
+        VALIDATION,
+        True,
+        {"skill_lists": (("a.json", 1, 2),)},
+    )
+
+
+def test_engine_versions_name_the_running_grammar_backend(generator):
+    class LocalTool:
+        pass
+
+    engine = type("Engine", (), {"tool": LocalTool()})()
+    with patch.object(grammar_service, "_engine", engine):
+        versions = generator.engine_versions()
+    assert versions["grammar_backend"] == "LocalTool"
+    assert generator.engine_versions() != versions
+
+
+def test_generator_without_cache_always_recomputes(counted_pipeline):
+    generator = FeedbackGenerator()
+    _generate(generator)
+    _generate(generator)
+    assert counted_pipeline.call_count == 2
@@ -0,0 +1,64 @@
+"""
+Unit tests for the native (reportlab) PDF backend and the backend benchmark
+"""
+
+import pytest
+
+import src.feedback.feedback_generator as feedback_generator
+from src.feedback.feedback_generator import render_pdf_bytes, report_fingerprint
+from src.feedback.native_pdf import report_fonts
+from src.feedback.pdf_benchmark import benchmark_backend, sample_report
+from src.mock_data import MOCK_ANALYSIS_REPORT
+from tests.helpers import extract_text_from_pdf_bytes
+
+
+def test_native_backend_renders_template_content():
+    pdf_text = extract_text_from_pdf_bytes(
+        render_pdf_bytes(MOCK_ANALYSIS_REPORT, backend="native")
+    )
+
+    assert "**Quality Score:** 82/100" in pdf_text
+    assert "**Job Match:** 76%" in pdf_text
+    assert "Missing Core Sections:" in pdf_text
+    assert "Certifications" in pdf_text
+    assert "Use stronger action verbs." in pdf_text
+    # Anonymized like the HTML report
+    assert "a*****j@example.com" in pdf_text
+    assert "alex.j@example.com" not in pdf_text
+
+
+def test_native_backend_embeds_fonts_and_is_deterministic():
+    first = render_pdf_bytes(MOCK_ANALYSIS_REPORT, backend="native")
+    second = render_pdf_bytes(MOCK_ANALYSIS_REPORT, backend="native")
+
+    assert first == second
+    assert report_fonts()["regular"] == "Vera"
+    assert b"/FontFile2" in first
+
+
+def test_long_reports_wrap_onto_more_pages():
+    pdf_bytes = render_pdf_bytes(sample_report(suggestions=80), backend="native")
+    pdf_text = extract_text_from_pdf_bytes(pdf_bytes)
+
+    assert "Quantify the impact of project 77 with concrete metrics." in pdf_text
+    assert pdf_bytes.count(b"/Type /Page\n") >= 2
+
+
+def test_backend_is_part_of_the_fingerprint(monkeypatch):
+    html_key = report_fingerprint(MOCK_ANALYSIS_REPORT)
+    monkeypatch.setattr(feedback_generator, "PDF_BACKEND", "native")
+    assert report_fingerprint(MOCK_ANALYSIS_REPORT) != html_key
+
+
+def test_unknown_backend_is_rejected():
+    with pytest.raises(ValueError, match="Unknown PDF backend"):
+        render_pdf_bytes(MOCK_ANALYSIS_REPORT, backend="latex")
+
+
+def test_benchmark_reports_time_and_memory():
+    result = benchmark_backend("native", runs=2, warmup=0)
+
+    assert result["backend"] == "native"
+    assert result["mean_ms"] > 0
+    assert result["peak_kib"] > 0
+    assert result["pdf_bytes"] > 0
@@ -0,0 +1,160 @@
+"""
+Unit tests for the bounded off-loop PDF renderer
+"""
+
+import asyncio
+import copy
+import os
+import threading
+import time
+
+import pytest
+
+from src.feedback.feedback_generator import get_pdf_cache, report_fingerprint
+from src.feedback.pdf_renderer import (
+    PdfRenderer,
+    RenderQueueFullError,
+    RenderTimeoutError,
+)
+from src.mock_data import MOCK_ANALYSIS_REPORT
+
+release = threading.Event()
+
+
+def fake_render(report_json: dict) -> bytes:
+    return f"%PDF {report_json.get('score')}".encode()
+
+
+def blocking_render(report_json: dict) -> bytes:
+    release.wait(5)
+    return fake_render(report_json)
+
+
+def report(score: int) -> dict:
+    data = copy.deepcopy(MOCK_ANALYSIS_REPORT)
+    data["score"] = score
+    return data
+
+
+@pytest.fixture(autouse=True)
+def clean_state():
+    get_pdf_cache().clear()
+    release.clear()
+    yield
+    release.set()
+    get_pdf_cache().clear()
+
+
+def make_renderer(**kwargs) -> PdfRenderer:
+    kwargs.setdefault("use_processes", False)
+    kwargs.setdefault("render_func", fake_render)
+    return PdfRenderer(**kwargs)
+
+
+def test_render_runs_in_pool_and_caches():
+    renderer = make_renderer()
+    try:
+        first = asyncio.run(renderer.render(report(11)))
+        second = asyncio.run(renderer.render(report(11)))
+    finally:
+        renderer.stop()
+
+    assert first == second == b"%PDF 11"
+    assert renderer.status()["rendered"] == 1
+
+
+def test_concurrent_requests_share_one_render():
+    renderer = make_renderer(render_func=blocking_render)
+
+    async def scenario():
+        tasks = [asyncio.create_task(renderer.render(report(12))) for _ in range(3)]
+        await asyncio.sleep(0.05)
+        assert renderer.status()["in_flight"] == 1
+        release.set()
+        return await asyncio.gather(*tasks)
+
+    try:
+        results = asyncio.run(scenario())
+    finally:
+        renderer.stop()
+    assert results == [b"%PDF 12"] * 3
+    assert renderer.rendered == 1
+
+
+def test_full_queue_is_rejected():
+    renderer = make_renderer(workers=1, max_pending=1, render_func=blocking_render)
+    try:
+        renderer.submit(report(1))
+        renderer.submit(report(2))
+        with pytest.raises(RenderQueueFullError):
+            renderer.submit(report(3))
+        assert renderer.rejected == 1
+    finally:
+        release.set()
+        renderer.stop()
+
+
+def test_timed_out_render_still_fills_cache():
+    renderer = make_renderer(render_func=blocking_render)
+    data = report(13)
+    try:
+        with pytest.raises(RenderTimeoutError):
+            asyncio.run(renderer.render(data, timeout=0.05))
+        release.set()
+        renderer.submit(data).result(timeout=5)
+        assert get_pdf_cache().get(report_fingerprint(data)) == b"%PDF 13"
+    finally:
+        renderer.stop()
+    assert renderer.timeouts == 1
+
+
+def test_prerendered_pdf_is_read_from_store(tmp_path):
+    data = report(14)
+    writer = make_renderer(store_dir=tmp_path)
+    try:
+        writer.submit(data).result(timeout=5)
+    finally:
+        writer.stop()
+    assert (tmp_path / f"{report_fingerprint(data)}.pdf").read_bytes() == b"%PDF 14"
+
+    get_pdf_cache().clear()
+
+    def fail_render(report_json):
+        raise AssertionError("should be served from the store")
+
+    reader = make_renderer(store_dir=tmp_path, render_func=fail_render)
+    assert asyncio.run(reader.render(data)) == b"%PDF 14"
+    assert reader.file_hits == 1
+    assert not reader.running
+
+
+def test_discard_job_deletes_its_stored_pdfs(tmp_path):
+    renderer = make_renderer(store_dir=tmp_path)
+    try:
+        asyncio.run(renderer.render(report(15), job_id="job-a"))
+        asyncio.run(renderer.render(report(16), job_id="job-a"))
+        asyncio.run(renderer.render(report(16), job_id="job-b"))
+    finally:
+        renderer.stop()
+    shared = tmp_path / f"{report_fingerprint(report(16))}.pdf"
+
+    # The report job-b shares with job-a stays until job-b is discarded
+    assert renderer.discard_job("job-a") == 1
+    assert [p.name for p in tmp_path.glob("*.pdf")] == [shared.name]
+    assert renderer.discard_job("job-b") == 1
+    assert not any(tmp_path.glob("*.pdf"))
+
+
+def test_expired_pdfs_are_pruned_on_start(tmp_path):
+    stale = tmp_path / "stale.pdf"
+    stale.write_bytes(b"%PDF old")
+    fresh = tmp_path / "fresh.pdf"
+    fresh.write_bytes(b"%PDF new")
+    os.utime(stale, (time.time() - 120, time.time() - 120))
+
+    renderer = make_renderer(store_dir=tmp_path, ttl=60).start()
+    renderer.stop()
+
+    assert not stale.exists()
+    assert fresh.exists()
+    assert renderer.lookup("stale") is None
@@ -2,8 +2,16 @@
 Unit tests for the report generation logic.
 """
 
+import copy
+import os
+from unittest.mock import patch
+
+from jinja2 import Environment, FileSystemLoader
+
 # NEW, FIXED IMPORTS
-from src.feedback.feedback_generator import generate_pdf_report
+import src.feedback.feedback_generator as feedback_generator
+from src.feedback.feedback_cache import RenderCache
+from src.feedback.feedback_generator import generate_pdf_report, report_fingerprint
 from src.mock_data import MOCK_ANALYSIS_REPORT
 from tests.helpers import extract_text_from_pdf_bytes
 
@@ -28,3 +36,65 @@ def test_pdf_contains_key_report_data():
     # Assertion 3: Check for a missing section (robust check)
     assert "Missing Core Sections:" in pdf_text
     assert "Certifications" in pdf_text
+
+
+# --- PDF render caching ---
+
+
+def test_repeat_render_is_served_from_cache(monkeypatch):
+    monkeypatch.setattr(feedback_generator, "_pdf_cache", RenderCache())
+    with patch.object(
+        feedback_generator.pisa, "CreatePDF", wraps=feedback_generator.pisa.CreatePDF
+    ) as create_pdf:
+        first = generate_pdf_report(MOCK_ANALYSIS_REPORT)
+        second = generate_pdf_report(copy.deepcopy(MOCK_ANALYSIS_REPORT))
+
+    assert first == second
+    assert create_pdf.call_count == 1
+
+
+def test_fingerprint_ignores_masked_pii_but_not_content():
+    report = copy.deepcopy(MOCK_ANALYSIS_REPORT)
+    renamed = dict(report, name="Someone Else")
+    rescored = dict(report, overall_score=12)
+
+    assert report_fingerprint(report) == report_fingerprint(renamed)
+    assert report_fingerprint(report) != report_fingerprint(rescored)
+
+
+def test_template_change_is_picked_up(tmp_path, monkeypatch):
+    template = tmp_path / "report_template.html"
+    template.write_text("<p>Score v1 {{ report.score }}</p>", encoding="utf-8")
+    monkeypatch.setattr(feedback_generator, "TEMPLATES_DIR", str(tmp_path))
+    monkeypatch.setattr(
+        feedback_generator,
+        "_template_env",
+        Environment(loader=FileSystemLoader(str(tmp_path)), auto_reload=True),
+    )
+    monkeypatch.setattr(feedback_generator, "_pdf_cache", RenderCache())
+
+    before = report_fingerprint(MOCK_ANALYSIS_REPORT)
+    assert "Score v1" in extract_text_from_pdf_bytes(
+        generate_pdf_report(MOCK_ANALYSIS_REPORT)
+    )
+
+    template.write_text("<p>Score v2 {{ report.score }}</p>", encoding="utf-8")
+    stat = template.stat()
+    os.utime(template, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert report_fingerprint(MOCK_ANALYSIS_REPORT) != before
+    assert "Score v2" in extract_text_from_pdf_bytes(
+        generate_pdf_report(MOCK_ANALYSIS_REPORT)
+    )
+
+
+def test_render_cache_is_bounded_by_bytes():
+    cache = RenderCache(max_bytes=10)
+    cache.put("a", b"12345")
+    cache.put("b", b"67890")
+    cache.put("c", b"abc")
+    cache.put("huge", b"x" * 11)
+
+    assert cache.get("a") is None
+    assert cache.get("huge") is None
+    assert cache.stats()["bytes"] == 8
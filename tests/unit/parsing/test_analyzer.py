@@ -4,8 +4,11 @@ import pytest
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
+from sqlalchemy import text
+
 # Import the function we are testing
 from src.parser.analyzer import run_analysis
+from src.parser.entity_scanner import scan_entities
 
 
 @pytest.mark.asyncio
@@ -48,10 +51,15 @@ async def test_run_analysis_orchestration(
     # 4. Check that the correct functions were called
     mock_get_text_from_parser.assert_called_once_with(Path(test_file_path))
     mock_extract_skills.assert_called_once_with("This is a resume with python")
-    mock_SectionDetector.return_value.validate_resume_structure.assert_called_once()
+    entities = scan_entities("This is a resume with python")
+    mock_SectionDetector.return_value.validate_resume_structure.assert_called_once_with(
+        "This is a resume with python", spans=entities
+    )
 
     # --- ADD ASSERTION FOR NEW VALIDATOR ---
-    mock_validate_content.assert_called_once_with("This is a resume with python")
+    mock_validate_content.assert_called_once_with(
+        "This is a resume with python", spans=entities
+    )
     # --- ---
 
     # 5. Check the final print output (using single quotes)
@@ -72,3 +80,33 @@ async def test_run_analysis_orchestration(
         "'validation': {'dates': {'consistent': True, 'format': 'MMM YYYY'}}" in output
     )
     # --- ---
+
+
+@pytest.mark.asyncio
+@patch("src.parser.analyzer.get_text_from_parser")
+@patch("src.parser.analyzer.extract_skills")
+@patch("src.parser.analyzer.SectionDetector")
+@patch("src.parser.analyzer.validate_content")
+async def test_run_analysis_logs_anonymous_metadata(
+    mock_validate_content,
+    mock_SectionDetector,
+    mock_extract_skills,
+    mock_get_text_from_parser,
+    isolated_metadata_writer,
+):
+    mock_get_text_from_parser.return_value = "This is a resume with python"
+    mock_extract_skills.return_value = {"technical_skills": ["Python"]}
+    mock_SectionDetector.return_value.validate_resume_structure.return_value = {
+        "missing_sections": ["projects"]
+    }
+    mock_validate_content.return_value = {}
+
+    await run_analysis("dummy/path.pdf", "test-job-metadata")
+
+    writer = isolated_metadata_writer
+    assert writer.flush(timeout=5)
+    with writer.engine.connect() as conn:
+        rows = conn.execute(
+            text("SELECT file_type, missing_sections FROM resume_metadata")
+        ).all()
+    assert rows == [("pdf", '["projects"]')]
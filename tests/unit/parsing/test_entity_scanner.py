@@ -0,0 +1,65 @@
+"""
+Unit tests for the shared entity scanner (FR-006 / FR-010 single sweep)
+"""
+
+from src.parser.entity_scanner import (
+    EMAIL_PATTERN,
+    PHONE_PATTERN,
+    first_of_kind,
+    scan_entities,
+    spans_of_kind,
+)
+from src.parser.content_validator import validate_content
+from src.parser.section_detector import SectionDetector
+
+SAMPLE = (
+    "Jane Roe | jane.roe@example.com | (123) 456-7890 | https://github.com/jroe\n"
+    "Engineer, Jan 2020 - May 2022\n"
+    "Intern, 08/2018 - 12/2019\n"
+)
+
+
+class TestScanEntities:
+    def test_emits_all_kinds_with_offsets(self):
+        spans = scan_entities(SAMPLE)
+
+        kinds = [s.kind for s in spans]
+        assert kinds == ["email", "phone", "url", "date", "date", "date", "date"]
+        for span in spans:
+            assert SAMPLE[span.start : span.end] == span.text
+
+    def test_date_formats_labelled(self):
+        dates = spans_of_kind(scan_entities(SAMPLE), "date")
+        assert [d.format for d in dates] == ["MMM YYYY"] * 2 + ["MM/YYYY"] * 2
+
+    def test_matches_individual_patterns(self):
+        spans = scan_entities(SAMPLE)
+        assert first_of_kind(spans, "email").text == EMAIL_PATTERN.search(SAMPLE).group(0)
+        assert first_of_kind(spans, "phone").text == PHONE_PATTERN.search(SAMPLE).group(0)
+
+    def test_url_wins_over_embedded_email(self):
+        spans = scan_entities("see https://user@host.example.com/page.")
+        assert [s.kind for s in spans] == ["url"]
+        assert spans[0].text == "https://user@host.example.com/page"
+
+    def test_empty_text(self):
+        assert scan_entities("") == []
+
+
+class TestSpanConsumers:
+    def test_validator_accepts_precomputed_spans(self):
+        spans = scan_entities(SAMPLE)
+        assert validate_content(SAMPLE, spans=spans) == validate_content(SAMPLE)
+
+    def test_validator_mixed_dates(self):
+        report = validate_content(SAMPLE)
+        assert report["dates"]["format"] == "mixed"
+
+    def test_section_detector_contact_from_email(self):
+        detected = SectionDetector().detect_sections("reach me at jane@example.org")
+        assert detected["contact"] is True
+
+    def test_section_detector_short_phone_not_contact(self):
+        # Only the stricter country-code phone form counts for CONTACT
+        detected = SectionDetector().detect_sections("worked 2019-2020 there")
+        assert detected["contact"] is False
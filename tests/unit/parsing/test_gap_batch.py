@@ -0,0 +1,116 @@
+"""
+Unit tests for Batch Gap Analyzer (FR-009 analytics)
+"""
+
+import csv
+
+import numpy as np
+import pytest
+
+from src.parser.gap_batch import (
+    RESULT_COLUMNS,
+    analyze_gap_batch,
+    analyze_resume_batch,
+    pack_intervals,
+)
+from src.parser.gap_detector import GapDetector
+
+
+def _job(company, start, end):
+    return {"title": "Engineer", "company": company, "start_date": start, "end_date": end}
+
+
+RESUMES = [
+    (
+        "r1",
+        [
+            _job("A", "01/2018", "06/2018"),
+            _job("B", "03/2019", "12/2019"),  # 9-month gap
+            _job("C", "09/2020", "12/2022"),  # 9-month gap
+        ],
+    ),
+    ("r2", [_job("A", "01/2020", "06/2020"), _job("B", "09/2020", "12/2021")]),
+    ("r3", []),
+    ("r4", [_job("A", "Jan 2015", "Dec 2016"), _job("B", "invalid", "2019")]),
+]
+
+
+class TestPackIntervals:
+    def test_packs_parsed_jobs_only(self):
+        batch = pack_intervals(RESUMES)
+
+        assert batch.resume_ids == ["r1", "r2", "r3", "r4"]
+        assert len(batch) == 6  # unparseable r4 entry skipped
+        assert batch.resume_index.dtype == np.int32
+        assert list(batch.resume_index) == [0, 0, 0, 1, 1, 3]
+
+    def test_month_encoding(self):
+        batch = pack_intervals([("x", [_job("A", "01/2020", "03/2021")])])
+        assert batch.end_month[0] - batch.start_month[0] == 14
+
+
+class TestAnalyzeGapBatch:
+    def test_matches_single_resume_detector(self):
+        result = analyze_resume_batch(RESUMES)
+        detector = GapDetector()
+
+        for row, (_, experience) in zip(result.rows(), RESUMES):
+            if not experience:
+                continue
+            expected = detector.detect_employment_gaps(experience)
+            assert row["gap_count"] == expected["gap_count"]
+            expected_months = [g["gap_months"] for g in expected["employment_gaps"]]
+            assert row["total_gap_months"] == sum(expected_months)
+            assert row["longest_gap_months"] == max(expected_months, default=0)
+
+    def test_tenure_and_span(self):
+        result = analyze_resume_batch(RESUMES)
+        rows = {r["resume_id"]: r for r in result.rows()}
+
+        assert rows["r1"]["job_count"] == 3
+        assert rows["r1"]["tenure_months"] == 5 + 9 + 27
+        assert rows["r1"]["span_months"] == 59
+        assert rows["r3"]["job_count"] == 0
+        assert rows["r3"]["tenure_months"] == 0
+
+    def test_unsorted_input_is_ordered_by_end_date(self):
+        jobs = [_job("C", "09/2020", "12/2022"), _job("A", "01/2018", "06/2018")]
+        result = analyze_resume_batch([("r", jobs)])
+        assert result.columns["gap_count"][0] == 1
+        assert result.columns["longest_gap_months"][0] == 27
+
+    def test_custom_threshold(self):
+        result = analyze_gap_batch(pack_intervals(RESUMES), threshold_months=2)
+        assert result.columns["gap_count"][1] == 1  # 3-month gap now counts
+
+    def test_distributions(self):
+        dist = analyze_resume_batch(RESUMES).distributions
+
+        assert dist["resume_count"] == 4
+        assert dist["resumes_with_gaps"] == 1
+        assert dist["gap_count_histogram"] == {0: 3, 1: 0, 2: 1}
+        assert dist["gap_months_percentiles"]["p50"] == 9.0
+
+    def test_empty_batch(self):
+        result = analyze_resume_batch([])
+        assert len(result) == 0
+        assert result.distributions["resume_count"] == 0
+
+
+class TestExport:
+    def test_to_csv(self, tmp_path):
+        path = tmp_path / "gaps.csv"
+        analyze_resume_batch(RESUMES).to_csv(str(path))
+
+        with open(path, newline="", encoding="utf-8") as f:
+            rows = list(csv.reader(f))
+
+        assert rows[0] == RESULT_COLUMNS
+        assert rows[1][0] == "r1"
+        assert len(rows) == 5
+
+    def test_to_parquet(self, tmp_path):
+        pq = pytest.importorskip("pyarrow.parquet")
+        path = tmp_path / "gaps.parquet"
+        analyze_resume_batch(RESUMES).to_parquet(str(path))
+        assert pq.read_table(str(path)).num_rows == 4
@@ -9,6 +9,7 @@ Requirements:
 """
 
 import pytest
+from src.parser.entity_scanner import scan_entities
 from src.parser.section_detector import SectionDetector, SectionType
 
 
@@ -386,3 +387,15 @@ class TestSectionDetection:
         assert "skills" in report["merged_sections"]
         assert "Python, Java, C++" in report["merged_sections"]["skills"]
         assert "SQL, Docker, Git" in report["merged_sections"]["skills"]
+
+    def test_contact_detection_keeps_original_patterns(self, detector):
+        """
+        The entity sweep misses short-TLD emails and phones inside URLs;
+        CONTACT detection still finds them like the original patterns did.
+        """
+        for text in ("Jane Doe\nreach me: x@y.z", "https://x.com/+1-555-123-4567"):
+            spans = scan_entities(text)
+            assert not any(s.kind in ("email", "phone") for s in spans)
+            assert detector.detect_sections(text, spans=spans)["contact"] is True
+
+        assert detector.detect_sections("Jane Doe, Engineer")["contact"] is False
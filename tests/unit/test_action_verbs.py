@@ -4,6 +4,7 @@ Validates detection of weak verbs, suggestions, and scoring.
 """
 
 import pytest
+import spacy
 from src.core.action_verbs import ActionVerbEngine
 
 
@@ -68,3 +69,63 @@ def test_empty_text_returns_full_score(engine):
     result = engine.suggest("")
     assert result["score"] == 100.0
     assert result["weak_verbs"] == 0
+
+
+# ----------------------------------------------------------------------
+# Batched analysis (no trained model needed: blank pipeline + tiny tagger)
+# ----------------------------------------------------------------------
+_TEST_VERBS = {"did": "do", "helped": "help", "built": "build", "focused": "focus"}
+
+
+@spacy.Language.component("test_verb_tagger")
+def _test_verb_tagger(doc):
+    for token in doc:
+        if token.lower_ in _TEST_VERBS:
+            token.pos_ = "VERB"
+            token.lemma_ = _TEST_VERBS[token.lower_]
+    return doc
+
+
+@pytest.fixture(scope="module")
+def blank_engine():
+    nlp = spacy.blank("en")
+    nlp.add_pipe("test_verb_tagger")
+    return ActionVerbEngine(nlp=nlp)
+
+
+def test_fallback_matches_whole_tokens_only(blank_engine):
+    """'used' inside 'focused' is not a weak verb."""
+    result = blank_engine.suggest("Focused on reliability.")
+    assert result["found"] == []
+
+    result = blank_engine.suggest("Tools used daily.")
+    assert result["found"] == ["used"]
+
+
+def test_analyze_sections_matches_per_section_suggest(blank_engine):
+    sections = {
+        "experience": "I did backend work and helped build a project.",
+        "projects": "Built a CLI. Focused on tests; made docs.",
+        "empty": "",
+    }
+    batched = blank_engine.analyze_sections(sections)
+
+    assert list(batched) == list(sections)
+    for name, text in sections.items():
+        assert batched[name] == blank_engine.suggest(text)
+
+
+def test_analyze_sections_uses_one_pipe_pass(blank_engine):
+    calls = []
+    original = blank_engine.nlp.pipe
+
+    def counting_pipe(texts, **kwargs):
+        calls.append(1)
+        return original(texts, **kwargs)
+
+    blank_engine.nlp.pipe = counting_pipe
+    try:
+        blank_engine.analyze_sections({"a": "Did it.", "b": "Helped out."})
+    finally:
+        blank_engine.nlp.pipe = original
+    assert calls == [1]
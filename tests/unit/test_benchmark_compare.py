@@ -0,0 +1,140 @@
+"""
+Unit tests for the benchmark result store and the regression check
+"""
+
+import random
+
+import pytest
+
+from src.benchmarks.compare import compare_runs, main, mann_whitney_greater
+from src.benchmarks.store import ResultStore
+from src.benchmarks.suite import summarize
+
+
+def stage(mean_ms, n=30, spread=0.03, seed=0, peak_kib=1000.0):
+    rng = random.Random(seed)
+    samples = [rng.gauss(mean_ms, mean_ms * spread) for _ in range(n)]
+    return {**summarize(samples), "samples_ms": samples, "peak_kib": peak_kib}
+
+
+def run(stages, commit="abc1234", created_at="2026-01-01T00:00:00+00:00", **config):
+    return {
+        "schema": 1,
+        "created_at": created_at,
+        "environment": {"commit": commit, "python": "3.13", "cpus": 8},
+        "config": {"count": 12, "seed": 42, **config},
+        "stages": stages,
+    }
+
+
+def test_mann_whitney_detects_shifted_samples():
+    low = [float(v) for v in range(10)]
+    high = [v + 100 for v in low]
+
+    assert mann_whitney_greater(high, low) < 0.001
+    assert mann_whitney_greater(low, high) > 0.999
+    assert mann_whitney_greater(low, list(low)) == pytest.approx(0.5, abs=0.1)
+    assert mann_whitney_greater([5.0] * 4, [5.0] * 4) == 1.0
+
+
+def test_slowdown_past_threshold_is_flagged():
+    baseline = run({"skills": stage(30, seed=1), "sections": stage(9, seed=2)})
+    current = run({"skills": stage(39, seed=3), "sections": stage(9, seed=4)})
+
+    report = compare_runs(baseline, current, threshold=0.10)
+
+    assert report["regressed"] == ["skills"]
+    skills = report["stages"]["skills"]
+    assert skills["change"] == pytest.approx(0.30, abs=0.05)
+    assert skills["p_value"] < 0.001
+    assert report["stages"]["sections"]["status"] == "unchanged"
+
+
+def test_small_or_noisy_differences_are_not_regressions():
+    baseline = run({"gaps": stage(10, seed=1), "pdf": stage(16, n=3, seed=2)})
+    current = run(
+        # Significant but below the threshold
+        {"gaps": stage(10.4, seed=3), "pdf": stage(19, n=3, spread=0.3, seed=4)}
+    )
+
+    report = compare_runs(baseline, current, threshold=0.10)
+
+    assert report["regressed"] == []
+    assert report["stages"]["gaps"]["status"] == "unchanged"
+    assert report["stages"]["pdf"]["status"] == "unchanged"
+
+
+def test_improvements_memory_growth_and_changed_stages():
+    baseline = run(
+        {
+            "grammar": stage(20, seed=1),
+            "verbs": stage(50, seed=2),
+            "feedback": stage(5, seed=3),
+            "old": stage(1, seed=4),
+        }
+    )
+    current = run(
+        {
+            "grammar": stage(10, seed=5),
+            "verbs": stage(50, seed=6, peak_kib=2000.0),
+            "feedback": {"error": "spaCy model not found"},
+            "new": stage(1, seed=7),
+        },
+        count=6,
+    )
+
+    report = compare_runs(baseline, current)
+    statuses = {name: diff["status"] for name, diff in report["stages"].items()}
+
+    assert statuses == {
+        "grammar": "improved",
+        "verbs": "unchanged",
+        "feedback": "error",
+        "old": "removed",
+        "new": "added",
+    }
+    assert report["memory_regressed"] == ["verbs"]
+    assert report["regressed"] == []
+    assert any("settings" in w for w in report["warnings"])
+
+
+def test_store_keeps_history_and_resolves_runs(tmp_path):
+    store = ResultStore(tmp_path)
+    first = store.save(
+        run({}, commit="aaa1111", created_at="2026-01-01T10:00:00+00:00")
+    )
+    second = store.save(
+        run({}, commit="bbb2222", created_at="2026-01-02T10:00:00+00:00"), "branch"
+    )
+
+    assert store.runs() == [first, second]
+    assert store.resolve("latest") == second
+    assert store.resolve("aaa") == first
+    assert store.load(second.stem)["label"] == "branch"
+    assert [e["commit"] for e in store.history()] == ["aaa1111", "bbb2222"]
+
+    with pytest.raises(FileNotFoundError):
+        store.resolve("baseline")
+    store.set_baseline("aaa")
+    assert store.load("baseline")["environment"]["commit"] == "aaa1111"
+    assert store.runs() == [first, second]  # the baseline copy is not a run
+
+
+def test_cli_fails_on_regression(tmp_path, capsys):
+    store = ResultStore(tmp_path)
+    store.save(run({"skills": stage(30, seed=1)}, commit="main111"))
+    store.set_baseline("latest")
+    store.save(
+        run(
+            {"skills": stage(40, seed=2)},
+            commit="feat222",
+            created_at="2026-01-02T00:00:00+00:00",
+        )
+    )
+
+    assert main(["--results-dir", str(tmp_path)]) == 1
+    out = capsys.readouterr().out
+    assert "skills" in out and "regressed" in out
+    assert "REGRESSED" in out
+
+    assert main(["--results-dir", str(tmp_path), "--threshold", "0.5"]) == 0
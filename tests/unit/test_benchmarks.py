@@ -0,0 +1,101 @@
+"""
+Unit tests for the synthetic corpus generator and the benchmark suite
+"""
+
+import json
+import random
+
+import pytest
+
+from src.benchmarks.corpus import (
+    generate_corpus,
+    generate_job_descriptions,
+    generate_resume,
+)
+from src.benchmarks.suite import run_suite, summarize
+from src.core import grammar_engine
+from src.parser.gap_detector import GapDetector
+from src.parser.jd_parser import JDParser
+from src.parser.skill_parser import get_text_from_parser
+
+QUICK_STAGES = ["extract_txt", "extract_pdf", "sections", "gaps", "grammar", "pdf"]
+
+
+def test_corpus_is_reproducible_per_seed():
+    first = generate_resume(random.Random(7), pages=3)
+    again = generate_resume(random.Random(7), pages=3)
+    other = generate_resume(random.Random(8), pages=3)
+
+    assert first.text == again.text
+    assert first.text != other.text
+
+
+def test_resume_length_follows_page_count():
+    short = generate_resume(random.Random(1), pages=1)
+    long = generate_resume(random.Random(1), pages=10)
+
+    assert len(long.text.split()) > 5 * len(short.text.split())
+    assert long.jobs > short.jobs or "experience" not in long.sections
+
+
+def test_corpus_files_cover_formats_and_page_range(tmp_path):
+    files = generate_corpus(tmp_path, count=3, seed=3, min_pages=1, max_pages=4)
+
+    assert [f.format for f in files] == ["txt", "docx", "pdf"]
+    assert [f.pages for f in files[:2]] == [1, 4]
+    for f in files:
+        text = get_text_from_parser(f.path)
+        assert f.resume.name.split()[0] in text
+
+
+def test_corpus_rejects_unknown_format(tmp_path):
+    with pytest.raises(ValueError):
+        generate_corpus(tmp_path, count=1, formats=["rtf"])
+
+
+def test_job_descriptions_state_requirements():
+    jd = JDParser().parse_job_description(generate_job_descriptions(1, seed=5)[0])
+
+    assert jd["required_skills"]
+    assert jd["required_experience_years"] >= 1
+
+
+def test_summarize_reports_percentiles():
+    summary = summarize([float(v) for v in range(1, 101)])
+
+    assert summary["count"] == 100
+    assert summary["p50_ms"] == 51.0
+    assert summary["p99_ms"] == 99.0
+    assert summary["max_ms"] == 100.0
+
+
+def test_suite_reports_every_requested_stage_as_json():
+    results = run_suite(count=3, max_pages=2, repeat=2, stages=QUICK_STAGES)
+
+    json.dumps(results)  # machine-readable as is
+    assert results["corpus"]["files"] == 3
+    assert list(results["stages"]) == QUICK_STAGES
+    for name, stage in results["stages"].items():
+        assert len(stage["samples_ms"]) == stage["items"] * 2, name
+        assert stage["p95_ms"] >= stage["p50_ms"] > 0
+        assert stage["throughput_per_s"] > 0
+        assert stage["peak_kib"] >= 0
+    assert results["stages"]["extract_pdf"]["items"] == 1
+    # The grammar stub is gone again
+    assert grammar_engine._language_tool is None
+
+
+def test_failing_stage_is_reported_not_fatal(monkeypatch):
+    def broken(self, text, experience):
+        raise RuntimeError("detector exploded")
+
+    monkeypatch.setattr(GapDetector, "analyze_resume", broken)
+    results = run_suite(count=1, max_pages=1, repeat=1, stages=["sections", "gaps"])
+
+    assert results["stages"]["gaps"] == {"error": "detector exploded"}
+    assert results["stages"]["sections"]["count"] == 1
+
+
+def test_unknown_stage_is_rejected():
+    with pytest.raises(ValueError, match="Unknown stages"):
+        run_suite(count=1, max_pages=1, repeat=1, stages=["telepathy"])
@@ -0,0 +1,113 @@
+import threading
+
+import pytest
+
+from src.utils.circuit_breaker import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    CallTimeoutError,
+    CircuitBreaker,
+    CircuitOpenError,
+    breaker_from_env,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _fail():
+    raise RuntimeError("backend down")
+
+
+def _breaker(clock, **kwargs):
+    options = dict(timeout=None, error_rate=0.5, min_calls=4, window=10, cooldown=30)
+    options.update(kwargs)
+    return CircuitBreaker("test", clock=clock, **options)
+
+
+def test_stays_closed_below_min_calls():
+    breaker = _breaker(FakeClock())
+    for _ in range(3):
+        with pytest.raises(RuntimeError):
+            breaker.call(_fail)
+    assert breaker.state == CLOSED
+
+
+def test_trips_on_error_rate_and_fails_fast():
+    breaker = _breaker(FakeClock())
+    breaker.call(lambda: "ok")
+    for _ in range(3):
+        with pytest.raises(RuntimeError):
+            breaker.call(_fail)
+    assert breaker.state == OPEN
+
+    calls = []
+    with pytest.raises(CircuitOpenError):
+        breaker.call(lambda: calls.append(1))
+    assert calls == []
+    assert breaker.status()["rejected"] == 1
+
+
+def test_half_open_probe_success_closes():
+    clock = FakeClock()
+    breaker = _breaker(clock, min_calls=1)
+    with pytest.raises(RuntimeError):
+        breaker.call(_fail)
+    assert breaker.state == OPEN
+
+    clock.now = 31
+    assert breaker.state == HALF_OPEN
+    assert breaker.call(lambda: "ok") == "ok"
+    assert breaker.state == CLOSED
+
+
+def test_half_open_probe_failure_reopens():
+    clock = FakeClock()
+    breaker = _breaker(clock, min_calls=1)
+    with pytest.raises(RuntimeError):
+        breaker.call(_fail)
+
+    clock.now = 31
+    with pytest.raises(RuntimeError):
+        breaker.call(_fail)
+    assert breaker.state == OPEN
+
+    clock.now = 40  # cooldown restarts from the failed probe
+    assert breaker.state == OPEN
+
+
+def test_half_open_allows_single_probe():
+    clock = FakeClock()
+    breaker = _breaker(clock, min_calls=1)
+    with pytest.raises(RuntimeError):
+        breaker.call(_fail)
+
+    clock.now = 31
+    assert breaker.allow() is True
+    assert breaker.allow() is False
+
+
+def test_timeout_counts_as_failure():
+    release = threading.Event()
+    breaker = CircuitBreaker("slow", timeout=0.05, min_calls=1)
+    try:
+        with pytest.raises(CallTimeoutError):
+            breaker.call(release.wait, 5)
+        assert breaker.state == OPEN
+        assert breaker.status()["timeouts"] == 1
+    finally:
+        release.set()
+
+
+def test_breaker_from_env(monkeypatch):
+    monkeypatch.setenv("LT_TEST_TIMEOUT", "0")
+    monkeypatch.setenv("LT_TEST_MIN_CALLS", "2")
+    breaker = breaker_from_env("LT_TEST", "lt")
+    assert breaker.timeout is None
+    assert breaker.min_calls == 2
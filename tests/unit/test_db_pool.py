@@ -0,0 +1,102 @@
+"""
+Unit tests for the lazily created, instrumented database pool
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import exc, text
+from sqlalchemy.pool import QueuePool
+
+import src.database.connection as connection
+from src.main import app
+
+client = TestClient(app)
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    """App engine on a temporary SQLite file with a 1 + 1 connection pool."""
+    monkeypatch.setattr(connection, "DATABASE_URL", f"sqlite:///{tmp_path / 'db'}")
+    monkeypatch.setattr(connection, "DB_POOL_SIZE", 1)
+    monkeypatch.setattr(connection, "DB_MAX_OVERFLOW", 1)
+    monkeypatch.setattr(connection, "DB_POOL_TIMEOUT", 0.05)
+    monkeypatch.setattr(connection, "pool_metrics", connection.PoolMetrics())
+    monkeypatch.setattr(connection, "_engine", None)
+    yield connection
+    connection.dispose_engine()
+
+
+def test_engine_is_created_on_first_use(db):
+    assert not db.db_pool_status()["initialized"]
+
+    engine = db.get_engine()
+
+    assert engine is db.get_engine() is db.Engine
+    assert isinstance(engine.pool, QueuePool)
+    assert engine.pool.size() == 1
+    assert db.db_pool_status()["initialized"]
+
+
+def test_checkouts_overflow_and_timeouts_are_counted(db):
+    first = db.connect()
+    second = db.connect()  # beyond pool_size: an overflow connection
+    try:
+        status = db.db_pool_status()
+        assert status["in_use"] == 2
+        assert status["overflow"] == 1
+        assert status["overflow_connects"] == 1
+
+        with pytest.raises(exc.TimeoutError):
+            db.connect()
+    finally:
+        first.close()
+        second.close()
+
+    status = db.db_pool_status()
+    assert status["timeouts"] == 1
+    assert status["checkouts"] == status["checkins"] == 2
+    assert status["connects"] == 2
+    assert status["checkout_ms_max"] >= 0
+
+
+def test_direct_engine_use_is_timed_by_the_pool(db):
+    engine = db.get_engine()
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+    with engine.begin():
+        pass
+
+    status = db.db_pool_status()
+    assert status["checkouts"] == 2
+    assert db.pool_metrics.waits == 2
+    assert status["connects"] == 1  # the second checkout reused it
+    assert status["overflow_connects"] == 0
+
+    held = [engine.connect(), engine.connect()]
+    try:
+        with pytest.raises(exc.TimeoutError):
+            with engine.begin():
+                pass
+    finally:
+        for conn in held:
+            conn.close()
+    assert db.db_pool_status()["timeouts"] == 1
+
+
+def test_session_uses_lazy_engine(db):
+    with db.get_db_session() as session:
+        assert session.execute(text("SELECT 1")).scalar() == 1
+    assert db.db_pool_status()["checkouts"] == 1
+
+
+def test_memory_sqlite_keeps_its_default_pool(db, monkeypatch):
+    monkeypatch.setattr(db, "DATABASE_URL", "sqlite://")
+    engine = db.get_engine()
+    assert not isinstance(engine.pool, QueuePool)
+
+
+def test_db_health_endpoint(db):
+    response = client.get("/api/v1/health/db")
+    assert response.status_code == 200
+    assert response.json()["initialized"] is False
+    assert response.json()["pool_size"] == 1
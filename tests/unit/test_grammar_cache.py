@@ -0,0 +1,123 @@
+"""
+Unit tests for the sentence-level grammar cache (DRA-60 performance).
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from src.core.grammar_cache import (
+    GrammarCache,
+    normalize_sentence,
+    sentence_key,
+    split_sentences,
+)
+from src.core.grammar_client import GrammarMatch
+from src.core.grammar_engine import GrammarEngine
+
+
+class CountingTool:
+    """Flags every occurrence of 'teh' and records what was sent."""
+
+    def __init__(self):
+        self.calls = []
+
+    def check(self, text):
+        self.calls.append(text)
+        matches = []
+        start = text.find("teh")
+        while start != -1:
+            matches.append(
+                SimpleNamespace(
+                    offset=start,
+                    errorLength=3,
+                    message="Possible typo",
+                    replacements=["the"],
+                    ruleIssueType="misspelling",
+                    context="",
+                )
+            )
+            start = text.find("teh", start + 1)
+        return matches
+
+
+class TestHelpers:
+    def test_split_sentences(self):
+        text = "Led teh team. Shipped code!\nResponsible for ops"
+        spans = [text[s:e] for s, e in split_sentences(text)]
+        assert spans == ["Led teh team.", "Shipped code!", "Responsible for ops"]
+
+    def test_normalize_maps_offsets(self):
+        normalized, index_map = normalize_sentence("  Led   teh\tteam ")
+        assert normalized == "Led teh team"
+        assert index_map[normalized.index("teh")] == 8
+
+    def test_key_ignores_spacing_not_case(self):
+        a, _ = normalize_sentence("Led  the team")
+        b, _ = normalize_sentence("Led the team")
+        c, _ = normalize_sentence("led the team")
+        assert sentence_key(a) == sentence_key(b) != sentence_key(c)
+
+
+class TestGrammarCache:
+    def test_lru_eviction(self):
+        cache = GrammarCache(max_entries=2)
+        cache.put("a", [])
+        cache.put("b", [])
+        cache.get("a")
+        cache.put("c", [])
+        assert cache.get("b") is None
+        assert cache.get("a") == []
+
+    def test_sqlite_tier_survives_new_instance(self, tmp_path):
+        db = str(tmp_path / "grammar.db")
+        match = GrammarMatch(offset=4, errorLength=3, message="typo", replacements=["the"])
+        first = GrammarCache(max_entries=10, db_path=db)
+        first.put("k", [match])
+        first.close()
+
+        second = GrammarCache(max_entries=10, db_path=db)
+        assert second.get("k") == [match]
+        assert second.stats()["hits"] == 1
+        second.close()
+
+
+class TestEngineCache:
+    @pytest.fixture
+    def engine(self):
+        engine = GrammarEngine(cache=GrammarCache(max_entries=100))
+        engine._tool = CountingTool()
+        return engine
+
+    def test_only_uncached_sentences_sent(self, engine):
+        engine.analyze_text("Responsible for teh budget. Led the team.")
+        result = engine.analyze_text("Responsible  for teh budget. Built new tools.")
+
+        assert engine.tool.calls[-1] == "Built new tools."
+        assert result["cache"]["hits"] == 1
+        assert result["cache"]["misses"] == 1
+        assert result["cache"]["hit_ratio"] == 0.5
+
+    def test_offsets_mapped_to_original_text(self, engine):
+        text = "Intro line.\nResponsible   for teh budget."
+        engine.analyze_text(text)
+        result = engine.analyze_text(text)
+
+        error = result["errors"][0]
+        assert text[error["offset"] : error["offset"] + error["length"]] == "teh"
+        assert result["cache"]["hit_ratio"] == 1.0
+
+    def test_sections_share_cache(self, engine):
+        sections = {"experience": "Fixed teh bug.", "projects": "Fixed teh bug."}
+        result = engine.analyze_sections(sections)
+
+        assert len(engine.tool.calls) == 1
+        assert result["total_errors"] == 2
+        assert result["cache"]["misses"] == 1
+
+    def test_engine_without_cache_unchanged(self):
+        engine = GrammarEngine()
+        engine._tool = CountingTool()
+        result = engine.analyze_text("Fixed teh bug.")
+        assert "cache" not in result
+        assert result["total_errors"] == 1
@@ -0,0 +1,171 @@
+"""
+Unit tests for the batched grammar client (DRA-60 performance).
+"""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+
+from src.core.grammar_client import (
+    SECTION_SEPARATOR,
+    AsyncGrammarClient,
+    GrammarMatch,
+    check_sections,
+    chunk_sections,
+    join_sections,
+    remap_matches,
+)
+from src.core.grammar_engine import GrammarEngine
+
+
+SECTIONS = {
+    "experience": "I has experience in Python.",
+    "projects": "We build a sistem.",
+}
+
+
+def _match(offset, length, message="issue"):
+    return SimpleNamespace(
+        offset=offset,
+        errorLength=length,
+        message=message,
+        replacements=["fix"],
+        ruleIssueType="grammar",
+        context="",
+    )
+
+
+class TestJoinAndRemap:
+    def test_join_records_segments(self):
+        joined, segments = join_sections(SECTIONS)
+        for name, start, end in segments:
+            assert joined[start:end] == SECTIONS[name]
+        assert SECTION_SEPARATOR in joined
+
+    def test_remap_rebases_offsets(self):
+        joined, segments = join_sections(SECTIONS)
+        start = joined.index("sistem")
+        result = remap_matches([_match(2, 3), _match(start, 6)], segments)
+
+        assert [m.offset for m in result["experience"]] == [2]
+        assert [m.offset for m in result["projects"]] == [SECTIONS["projects"].index("sistem")]
+
+    def test_length_falls_back_to_the_end_offset(self):
+        joined, segments = join_sections(SECTIONS)
+        start = joined.index("sistem")
+        match = SimpleNamespace(fromPos=start, toPos=start + 6, message="typo")
+
+        assert GrammarMatch.from_tool_match(match).errorLength == 6
+        (remapped,) = remap_matches([match], segments)["projects"]
+        end = remapped.offset + remapped.errorLength
+        assert SECTIONS["projects"][remapped.offset : end] == "sistem"
+
+    def test_remap_drops_matches_across_sections(self):
+        joined, segments = join_sections(SECTIONS)
+        boundary = len(SECTIONS["experience"]) - 2
+        result = remap_matches([_match(boundary, 6)], segments)
+        assert result == {"experience": [], "projects": []}
+
+    def test_single_tool_call(self):
+        tool = MagicMock()
+        tool.check.return_value = []
+        check_sections(tool, SECTIONS)
+        assert tool.check.call_count == 1
+
+    def test_chunking_respects_limit(self):
+        chunks = chunk_sections({"a": "x" * 10, "b": "y" * 10, "c": "z" * 30}, max_chars=25)
+        assert [list(c) for c in chunks] == [["a", "b"], ["c"]]
+
+
+class TestEngineBatching:
+    def test_analyze_sections_one_round_trip(self):
+        engine = GrammarEngine()
+        tool = MagicMock()
+        joined, _ = join_sections(SECTIONS)
+        tool.check.return_value = [_match(joined.index("sistem"), 6)]
+        engine._tool = tool
+
+        result = engine.analyze_sections({**SECTIONS, "skills": ""})
+
+        assert tool.check.call_count == 1
+        assert result["total_errors"] == 1
+        assert result["section_results"]["projects"]["errors"][0]["offset"] == 11
+        assert result["section_results"]["skills"]["score"] == 0
+
+    @pytest.mark.asyncio
+    async def test_async_budget_marks_timed_out(self):
+        engine = GrammarEngine()
+
+        class SlowTool:
+            def check(self, text):
+                import time
+
+                time.sleep(0.3)
+                return []
+
+        engine._tool = SlowTool()
+        result = await engine.analyze_sections_async(SECTIONS, budget_seconds=0.05)
+        assert sorted(result["timed_out_sections"]) == sorted(SECTIONS)
+
+
+def _lt_handler(request):
+    text = dict(httpx.QueryParams(request.content.decode()))["text"]
+    matches = []
+    if "sistem" in text:
+        matches.append(
+            {
+                "offset": text.index("sistem"),
+                "length": 6,
+                "message": "Possible spelling mistake",
+                "replacements": [{"value": "system"}],
+                "rule": {"id": "MORFOLOGIK", "issueType": "misspelling"},
+                "context": {"text": text},
+            }
+        )
+    return httpx.Response(200, json={"matches": matches})
+
+
+class TestAsyncClient:
+    @pytest.mark.asyncio
+    async def test_concurrent_chunks_remapped(self):
+        transport = httpx.MockTransport(_lt_handler)
+        http = httpx.AsyncClient(transport=transport)
+        client = AsyncGrammarClient(base_url="http://lt.local", chunk_chars=30, http_client=http)
+
+        result = await client.check_sections(SECTIONS)
+        await http.aclose()
+
+        assert result.requests == 2
+        assert result.complete
+        match = result.matches["projects"][0]
+        assert isinstance(match, GrammarMatch)
+        assert match.offset == SECTIONS["projects"].index("sistem")
+        assert match.replacements == ["system"]
+
+    @pytest.mark.asyncio
+    async def test_failed_requests_reported(self):
+        transport = httpx.MockTransport(lambda request: httpx.Response(503))
+        async with AsyncGrammarClient(
+            base_url="http://lt.local",
+            http_client=httpx.AsyncClient(transport=transport),
+        ) as client:
+            result = await client.check_sections(SECTIONS)
+
+        assert sorted(result.failed_sections) == sorted(SECTIONS)
+        assert result.matches["experience"] == []
+
+    @pytest.mark.asyncio
+    async def test_budget_cancels_slow_chunks(self):
+        async def slow(request):
+            await asyncio.sleep(1)
+            return httpx.Response(200, json={"matches": []})
+
+        http = httpx.AsyncClient(transport=httpx.MockTransport(slow))
+        client = AsyncGrammarClient(base_url="http://lt.local", http_client=http)
+        result = await client.check_sections(SECTIONS, budget_seconds=0.05)
+        await http.aclose()
+
+        assert sorted(result.timed_out_sections) == sorted(SECTIONS)
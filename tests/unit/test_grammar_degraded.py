@@ -0,0 +1,154 @@
+"""Failure modes of the grammar path, exercised against the local LT stub."""
+
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.core.grammar_cache import GrammarCache
+from src.core.grammar_client import HttpGrammarTool
+from src.core.grammar_engine import GrammarEngine
+from src.core.grammar_integration import enhance_feedback_with_grammar
+from src.core.languagetool_stub import LanguageToolStub, stub_matches
+from src.utils.circuit_breaker import OPEN, CircuitBreaker
+
+
+@pytest.fixture
+def stub():
+    with LanguageToolStub(seed=1) as server:
+        yield server
+
+
+def _engine(stub, cache=None, **breaker_options):
+    options = dict(timeout=0.5, error_rate=0.5, min_calls=2, cooldown=60)
+    options.update(breaker_options)
+    engine = GrammarEngine(cache=cache, breaker=CircuitBreaker("lt", **options))
+    engine._tool = HttpGrammarTool(stub.url, timeout=5)
+    return engine
+
+
+def test_stub_flags_misspellings_and_repeats():
+    matches = stub_matches("I recieved the the award")
+    assert [m["rule"]["id"] for m in matches] == [
+        "MORFOLOGIK_RULE_EN_US",
+        "ENGLISH_WORD_REPEAT_RULE",
+    ]
+    assert matches[0]["offset"] == 2
+
+
+def test_healthy_stub_is_not_degraded(stub):
+    result = _engine(stub).analyze_text("I recieved an award.")
+    assert result["total_errors"] == 1
+    assert "degraded" not in result
+
+
+def test_server_errors_trip_breaker(stub):
+    stub.failure_rate = 1.0
+    engine = _engine(stub)
+
+    first = engine.analyze_text("Managed a team.")
+    assert first["degraded"] is True
+    assert first["degraded_reason"] == "error"
+
+    engine.analyze_text("Managed a team.")
+    assert engine.breaker.state == OPEN
+
+    requests = stub.requests
+    result = engine.analyze_text("Managed a team.")
+    assert result["degraded_reason"] == "circuit_open"
+    assert stub.requests == requests  # failed fast, no round trip
+
+
+def test_slow_backend_times_out(stub):
+    stub.latency = 0.5
+    engine = _engine(stub, timeout=0.05)
+
+    started = time.perf_counter()
+    result = engine.analyze_sections({"experience": "Led teh project."})
+    assert time.perf_counter() - started < 0.4
+    assert result["degraded_reason"] == "timeout"
+
+
+def test_degraded_mode_keeps_cached_sentences(stub):
+    engine = _engine(stub, cache=GrammarCache(max_entries=100))
+    engine.analyze_text("I recieved an award.")
+
+    stub.drop_connections = True
+    result = engine.analyze_text("I recieved an award. Wrote teh docs.")
+
+    assert result["degraded"] is True
+    assert result["total_errors"] == 1  # only the cached sentence
+    assert result["errors"][0]["offset"] == 2
+    assert result["cache"]["unchecked"] == 1
+
+
+@patch("src.core.grammar_integration.grammar_service")
+def test_feedback_budget_returns_degraded_block(mock_service):
+    engine = MagicMock()
+    engine.analyze_sections.side_effect = lambda sections: time.sleep(1) or {}
+    mock_service.borrow.return_value.__enter__.return_value = engine
+
+    started = time.perf_counter()
+    result = enhance_feedback_with_grammar(
+        sections={"experience": "text"},
+        base_feedback={"overall_score": 80},
+        budget_seconds=0.05,
+    )
+
+    assert time.perf_counter() - started < 0.5
+    assert result["grammar"]["degraded_reason"] == "budget_exceeded"
+    assert result["grammar"]["score"] is None
+    assert result["grammar"]["unchecked_sections"] == ["experience"]
+    assert result["overall_score"] == 80
+
+
+def test_unchecked_sections_are_unscored_not_error_free(stub):
+    stub.failure_rate = 1.0
+    engine = _engine(stub)
+
+    result = engine.analyze_sections({"experience": "Wrote teh docs.", "skills": ""})
+
+    assert result["degraded"] is True
+    assert result["unchecked_sections"] == ["experience"]
+    assert result["section_results"]["experience"]["score"] is None
+    assert result["overall_score"] is None
+
+
+@patch("src.core.grammar_integration.grammar_service")
+def test_degraded_grammar_keeps_base_score(mock_service, stub):
+    stub.failure_rate = 1.0
+    mock_service.borrow.return_value.__enter__.return_value = _engine(stub)
+
+    result = enhance_feedback_with_grammar(
+        sections={"experience": "Wrote the docs."},
+        base_feedback={"overall_score": 60},
+        budget_seconds=0,
+    )
+
+    assert result["grammar"]["degraded"] is True
+    assert result["grammar"]["score"] is None
+    assert result["overall_score"] == 60
+
+
+def test_unscored_grammar_is_left_out_of_final_score():
+    from src.feedback.feedback_generator import FeedbackGenerator
+
+    generator = FeedbackGenerator()
+    validation = {"keyword_match_score": 0}
+
+    without = generator._calculate_final_score(90, validation, None, 60)
+    assert without == round((90 * 0.6 + 60 * 0.3) / 0.9)
+    assert without < generator._calculate_final_score(90, validation, 1, 60)
+
+
+def test_fallback_checks_what_the_backend_could_not(stub):
+    from src.core.local_grammar import get_local_tool
+
+    stub.failure_rate = 1.0
+    engine = _engine(stub)
+    engine.fallback = get_local_tool()
+
+    result = engine.analyze_text("Wrote teh docs.")
+    assert result["degraded"] is True
+    assert result["fallback"] == "LocalGrammarTool"
+    assert result["total_errors"] == 1
@@ -38,14 +38,19 @@ def fake_analysis():
     }
 
 
+def _lend(mock_service, engine):
+    """Make the patched grammar service lend `engine` from borrow()."""
+    mock_service.borrow.return_value.__enter__.return_value = engine
+
+
 # ----------------------------------------------------------------------
 # 1. Normal flow – ensure grammar block is added
 # ----------------------------------------------------------------------
-@patch("src.core.grammar_integration.GrammarEngine")
-def test_integration_adds_grammar_block(mock_engine_cls):
+@patch("src.core.grammar_integration.grammar_service")
+def test_integration_adds_grammar_block(mock_service):
     mock_engine = MagicMock()
     mock_engine.analyze_sections.return_value = fake_analysis()
-    mock_engine_cls.return_value = mock_engine
+    _lend(mock_service, mock_engine)
 
     sections = {"experience": "I has experience"}
     base_feedback = {"overall_score": 90, "suggestions": ["Improve structure"]}
@@ -63,11 +68,11 @@ def test_integration_adds_grammar_block(mock_engine_cls):
 # ----------------------------------------------------------------------
 # 2. Ensure backward-compatibility fields work (parsed_sections + feedback)
 # ----------------------------------------------------------------------
-@patch("src.core.grammar_integration.GrammarEngine")
-def test_integration_accepts_legacy_kwargs(mock_engine_cls):
+@patch("src.core.grammar_integration.grammar_service")
+def test_integration_accepts_legacy_kwargs(mock_service):
     mock_engine = MagicMock()
     mock_engine.analyze_sections.return_value = fake_analysis()
-    mock_engine_cls.return_value = mock_engine
+    _lend(mock_service, mock_engine)
 
     result = enhance_feedback_with_grammar(
         parsed_sections={"projects": "We build system"},
@@ -81,11 +86,11 @@ def test_integration_accepts_legacy_kwargs(mock_engine_cls):
 # ----------------------------------------------------------------------
 # 3. Missing base feedback fields should not crash
 # ----------------------------------------------------------------------
-@patch("src.core.grammar_integration.GrammarEngine")
-def test_missing_base_feedback_safe(mock_engine_cls):
+@patch("src.core.grammar_integration.grammar_service")
+def test_missing_base_feedback_safe(mock_service):
     mock_engine = MagicMock()
     mock_engine.analyze_sections.return_value = fake_analysis()
-    mock_engine_cls.return_value = mock_engine
+    _lend(mock_service, mock_engine)
 
     result = enhance_feedback_with_grammar(sections={"exp": "Hello"}, base_feedback={})
 
@@ -97,11 +102,11 @@ def test_missing_base_feedback_safe(mock_engine_cls):
 # ----------------------------------------------------------------------
 # 4. When GrammarEngine raises an exception → graceful fallback
 # ----------------------------------------------------------------------
-@patch("src.core.grammar_integration.GrammarEngine")
-def test_integration_handles_engine_exception(mock_engine_cls):
+@patch("src.core.grammar_integration.grammar_service")
+def test_integration_handles_engine_exception(mock_service):
     mock_engine = MagicMock()
     mock_engine.analyze_sections.side_effect = RuntimeError("Engine fail")
-    mock_engine_cls.return_value = mock_engine
+    _lend(mock_service, mock_engine)
 
     result = enhance_feedback_with_grammar(sections={"exp": "Hello"})
 
@@ -111,23 +116,24 @@ def test_integration_handles_engine_exception(mock_engine_cls):
 
 
 # ----------------------------------------------------------------------
-# 5. GrammarEngine.close() is always attempted (finally block)
+# 5. The shared engine is borrowed, never closed per call
 # ----------------------------------------------------------------------
-@patch("src.core.grammar_integration.GrammarEngine")
-def test_engine_close_is_called(mock_engine_cls):
+@patch("src.core.grammar_integration.grammar_service")
+def test_engine_is_borrowed_not_closed(mock_service):
     mock_engine = MagicMock()
     mock_engine.analyze_sections.return_value = fake_analysis()
-    mock_engine_cls.return_value = mock_engine
+    _lend(mock_service, mock_engine)
 
     enhance_feedback_with_grammar(sections={"a": "b"})
-    assert mock_engine.close.called
+    assert mock_service.borrow.called
+    assert not mock_engine.close.called
 
 
 # ----------------------------------------------------------------------
 # 6. Ensure top errors flattening only picks 5 max
 # ----------------------------------------------------------------------
-@patch("src.core.grammar_integration.GrammarEngine")
-def test_top_errors_limit(mock_engine_cls):
+@patch("src.core.grammar_integration.grammar_service")
+def test_top_errors_limit(mock_service):
     mock_engine = MagicMock()
     # Create 10 fake errors
     big_analysis = {
@@ -143,7 +149,7 @@ def test_top_errors_limit(mock_engine_cls):
         },
     }
     mock_engine.analyze_sections.return_value = big_analysis
-    mock_engine_cls.return_value = mock_engine
+    _lend(mock_service, mock_engine)
 
     result = enhance_feedback_with_grammar(sections={"experience": "abc"})
 
@@ -153,15 +159,15 @@ def test_top_errors_limit(mock_engine_cls):
 # ----------------------------------------------------------------------
 # 7. Weighted score merge is correct
 # ----------------------------------------------------------------------
-@patch("src.core.grammar_integration.GrammarEngine")
-def test_score_merge_logic(mock_engine_cls):
+@patch("src.core.grammar_integration.grammar_service")
+def test_score_merge_logic(mock_service):
     mock_engine = MagicMock()
     mock_engine.analyze_sections.return_value = {
         "overall_score": 100,
         "total_errors": 0,
         "section_results": {},
     }
-    mock_engine_cls.return_value = mock_engine
+    _lend(mock_service, mock_engine)
 
     base_feedback = {"overall_score": 50}
     result = enhance_feedback_with_grammar(
@@ -0,0 +1,93 @@
+"""
+Unit tests for the managed grammar service lifecycle (DRA-60).
+"""
+
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.core import grammar_engine
+from src.core.grammar_service import GrammarService
+from src.utils.circuit_breaker import CircuitBreaker
+
+
+@pytest.fixture
+def tools(monkeypatch):
+    """Every `_get_tool()` call hands out a fresh mock tool."""
+    created = []
+
+    def factory():
+        tool = MagicMock()
+        tool.check.return_value = []
+        created.append(tool)
+        return tool
+
+    def fake_get_tool():
+        if grammar_engine._language_tool is None:
+            grammar_engine._language_tool = factory()
+        return grammar_engine._language_tool
+
+    monkeypatch.setattr(grammar_engine, "_language_tool", None)
+    monkeypatch.setattr(grammar_engine, "_get_tool", fake_get_tool)
+    return created
+
+
+@pytest.fixture
+def service(tools):
+    svc = GrammarService(health_interval=0)
+    yield svc
+    svc.stop()
+
+
+def test_start_is_idempotent(service, tools):
+    first = service.start()
+    second = service.start()
+    assert first is second
+    assert len(tools) == 1
+    assert service.status()["running"] is True
+
+
+def test_borrow_reuses_engine_without_closing(service, tools):
+    with service.borrow() as a:
+        a.analyze_text("Hello world.")
+    with service.borrow() as b:
+        pass
+    assert a is b
+    assert not tools[0].close.called
+
+
+def test_health_check_restarts_failed_backend(service, tools):
+    service.start()
+    tools[0].check.side_effect = RuntimeError("server died")
+
+    assert service.health_check() is False
+    assert tools[0].close.called
+    assert len(tools) == 2
+    assert service.restarts == 1
+    assert service.health_check() is True
+
+
+def test_health_check_restarts_hung_backend(tools):
+    service = GrammarService(
+        health_interval=0, breaker=CircuitBreaker("languagetool", timeout=0.1)
+    )
+    release = threading.Event()
+    try:
+        service.start()
+        tools[0].check.side_effect = lambda text: release.wait(5)
+
+        assert service.health_check() is False
+        assert service.restarts == 1
+        assert "exceeded" in service.last_error
+    finally:
+        release.set()
+        service.stop()
+
+
+def test_stop_shuts_down_tool_once(service, tools):
+    service.start()
+    service.stop()
+    assert tools[0].close.call_count == 1
+    assert grammar_engine._language_tool is None
+    assert service.status()["running"] is False
@@ -0,0 +1,109 @@
+"""
+Unit tests for the HTTP load test harness
+"""
+
+import asyncio
+import json
+from pathlib import Path
+
+import pytest
+
+from src.benchmarks.loadtest import (
+    Recorder,
+    find_saturation,
+    in_process_client,
+    parse_mix,
+    run_load,
+)
+from src.core import grammar_engine
+from src.database.result_store import get_result_store
+
+
+def step(rate, throughput, error_rate=0.0, dropped=0):
+    return {
+        "rate_rps": rate,
+        "throughput_rps": throughput,
+        "error_rate": error_rate,
+        "dropped": dropped,
+    }
+
+
+def test_parse_mix():
+    assert parse_mix("upload=2, poll=5,download") == {
+        "upload": 2.0,
+        "poll": 5.0,
+        "download": 1.0,
+    }
+    with pytest.raises(ValueError, match="Unknown endpoint"):
+        parse_mix("upload=1,delete=3")
+    with pytest.raises(ValueError, match="positive weight"):
+        parse_mix("poll=0")
+
+
+def test_recorder_summarizes_per_endpoint():
+    recorder = Recorder()
+    for ms in (10.0, 20.0, 30.0):
+        recorder.record("poll", ms, "200", False)
+    recorder.record("upload", 50.0, "500", True)
+    recorder.record("upload", 70.0, "ConnectTimeout", True)
+    recorder.drop("compare")
+
+    summary = recorder.summary(rate=5, elapsed=2.0)
+
+    assert summary["requests"] == 5
+    assert summary["error_rate"] == 0.4
+    assert summary["throughput_rps"] == 1.5
+    assert summary["dropped"] == 1
+    assert summary["endpoints"]["poll"]["p50_ms"] == 20.0
+    assert summary["endpoints"]["upload"]["statuses"] == {
+        "500": 1,
+        "ConnectTimeout": 1,
+    }
+    assert summary["endpoints"]["compare"]["requests"] == 0
+    assert "download" not in summary["endpoints"]
+
+
+def test_saturation_is_the_first_step_that_falls_behind():
+    steps = [step(1, 1.0), step(2, 1.98), step(4, 3.1), step(8, 3.2)]
+    assert find_saturation(steps) == {
+        "saturated_at_rps": 4,
+        "reason": "throughput",
+        "max_sustained_rps": 1.98,
+    }
+
+    errors = [step(1, 1.0), step(2, 2.0, error_rate=0.05)]
+    assert find_saturation(errors)["reason"] == "errors"
+
+    assert find_saturation([step(1, 1.0), step(2, 2.0)]) == {
+        "saturated_at_rps": None,
+        "reason": None,
+        "max_sustained_rps": 2.0,
+    }
+
+
+def test_in_process_run_reports_each_endpoint():
+    async def scenario():
+        async with in_process_client() as client:
+            return await run_load(
+                client,
+                rates=[8],
+                duration=1.0,
+                mix={"upload": 1, "poll": 3},
+                seed_jobs=1,
+            )
+
+    store = get_result_store()
+    results, jobs = asyncio.run(scenario())
+
+    json.dumps(results)
+    assert len(jobs) >= 2
+    # Uploads and snapshots went to a temporary directory
+    assert not any(Path("uploads").glob(f"{jobs[0]}.*"))
+    assert get_result_store() is store
+    assert store.stats()["writes"] == 0
+    (only,) = results["steps"]
+    assert set(only["endpoints"]) == {"upload", "poll"}
+    assert only["error_rate"] == 0.0
+    assert only["endpoints"]["poll"]["statuses"].keys() == {"200"}
+    assert results["saturation"]["saturated_at_rps"] in (None, 8)
+    assert grammar_engine._language_tool is None
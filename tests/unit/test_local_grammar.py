@@ -0,0 +1,112 @@
+"""Unit tests for the local rule-based grammar checker (DRA-60 offline backend)."""
+
+import pytest
+
+from src.core.grammar_client import GrammarMatch
+from src.core.grammar_engine import GrammarEngine
+from src.core.local_grammar import (
+    LocalGrammarTool,
+    SymSpellIndex,
+    edit_distance,
+    get_local_tool,
+)
+
+
+@pytest.fixture(scope="module")
+def tool():
+    return get_local_tool()
+
+
+def _flagged(tool, text):
+    return [
+        (text[m.offset : m.offset + m.errorLength], m.ruleId) for m in tool.check(text)
+    ]
+
+
+def test_edit_distance_counts_transposition_once():
+    assert edit_distance("teh", "the", 2) == 1
+    assert edit_distance("kitten", "sitting", 5) == 3
+    assert edit_distance("abcdef", "uvwxyz", 2) == 3  # capped at limit + 1
+
+
+def test_symspell_lookup_prefers_closest_then_most_common():
+    index = SymSpellIndex(["manage", "manager", "management"])
+    assert index.lookup("managment") == "management"
+    assert index.lookup("manger", 1) == "manager"
+    assert index.lookup("zzzz") is None
+
+
+def test_returns_languagetool_shaped_matches(tool):
+    matches = tool.check("Recieved the award.")
+    assert len(matches) == 1
+    match = matches[0]
+    assert isinstance(match, GrammarMatch)
+    assert (match.offset, match.errorLength) == (0, 8)
+    assert match.replacements == ["Received"]
+    assert match.ruleIssueType == "misspelling"
+    assert match.sentence == "Recieved the award."
+
+
+def test_flags_misspelled_inflections(tool):
+    flagged = _flagged(tool, "Implmented a langauge model in pyhton.")
+    assert [word for word, _ in flagged] == ["Implmented", "langauge", "pyhton"]
+
+
+def test_known_words_names_and_links_are_not_flagged(tool):
+    text = (
+        "Architected microservices at Accenture, reduced latency by 40% and "
+        "mentored engineers. Contact john.doe@gmail.com or https://github.com/jdoe."
+    )
+    assert tool.check(text) == []
+
+
+def test_common_technical_terms_are_not_flagged(tool):
+    text = (
+        "Improved throughput and scalability of the backend; added failover, "
+        "sharding and telemetry to the Kubernetes deployments via a CI/CD "
+        "pipeline, and spearheaded the rollout of hotfixes."
+    )
+    assert _flagged(tool, text) == []
+
+
+@pytest.mark.parametrize(
+    "text,expected",
+    [
+        ("Worked with with stakeholders.", ("with with", "ENGLISH_WORD_REPEAT_RULE")),
+        ("Led a engineering team.", ("a", "EN_A_VS_AN")),
+        ("Built an dashboard.", ("an", "EN_A_VS_AN")),
+        ("Then i shipped it.", ("i", "I_LOWERCASE")),
+        ("We could of shipped sooner.", ("could of", "COULD_OF")),
+        ("Managed budgets , forecasts.", (" ,", "COMMA_PARENTHESIS_WHITESPACE")),
+        ("Shipped the release,, on time.", (",,", "DOUBLE_PUNCTUATION")),
+    ],
+)
+def test_resume_rules(tool, text, expected):
+    assert expected in _flagged(tool, text)
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "Joined a university team.",
+        "Earned an MBA and an hour award.",
+        "Hired a UX designer... done.",
+    ],
+)
+def test_article_exceptions(tool, text):
+    assert not [r for _, r in _flagged(tool, text) if r == "EN_A_VS_AN"]
+
+
+def test_usable_as_grammar_engine_backend(tool):
+    engine = GrammarEngine()
+    engine._tool = tool
+    result = engine.analyze_sections(
+        {"experience": "Managed teh budget.", "summary": "Experienced engineer."}
+    )
+    assert result["total_errors"] == 1
+    assert result["section_results"]["experience"]["errors"][0]["offset"] == 8
+
+
+def test_shared_tool_is_built_once():
+    assert get_local_tool() is get_local_tool()
+    assert isinstance(get_local_tool(), LocalGrammarTool)
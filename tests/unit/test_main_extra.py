@@ -59,3 +59,59 @@ def test_register_error_handlers(monkeypatch):
     except ValueError:
         # If exception bubbles up → test still passes
         pass
+
+
+def test_download_supports_etag_revalidation(monkeypatch):
+    """A matching If-None-Match returns 304 without rendering the PDF."""
+    from src.mock_data import MOCK_ANALYSIS_REPORT
+    import src.main as main_module
+
+    monkeypatch.setattr(
+        main_module, "get_analysis_data", lambda job_id: dict(MOCK_ANALYSIS_REPORT)
+    )
+    first = client.get("/api/v1/download/etag-job")
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+
+    calls = []
+
+    async def fake_render(data, job_id=None):
+        calls.append(data)
+        return b""
+
+    monkeypatch.setattr(main_module.pdf_renderer, "render", fake_render)
+    second = client.get(
+        "/api/v1/download/etag-job", headers={"If-None-Match": f"W/{etag}"}
+    )
+    assert second.status_code == 304
+    assert second.headers["etag"] == etag
+    assert calls == []
+
+    stale = client.get("/api/v1/download/etag-job", headers={"If-None-Match": '"old"'})
+    assert stale.status_code == 200
+    assert len(calls) == 1
+
+
+def test_download_maps_render_pool_errors(monkeypatch):
+    """A full render queue answers 503, a slow render 504."""
+    from src.feedback.pdf_renderer import RenderQueueFullError, RenderTimeoutError
+    from src.mock_data import MOCK_ANALYSIS_REPORT
+    import src.main as main_module
+
+    monkeypatch.setattr(
+        main_module, "get_analysis_data", lambda job_id: dict(MOCK_ANALYSIS_REPORT)
+    )
+
+    async def queue_full(data, job_id=None):
+        raise RenderQueueFullError("busy")
+
+    monkeypatch.setattr(main_module.pdf_renderer, "render", queue_full)
+    busy = client.get("/api/v1/download/busy-job")
+    assert busy.status_code == 503
+    assert busy.headers["retry-after"] == "5"
+
+    async def too_slow(data, job_id=None):
+        raise RenderTimeoutError("slow")
+
+    monkeypatch.setattr(main_module.pdf_renderer, "render", too_slow)
+    assert client.get("/api/v1/download/slow-job").status_code == 504
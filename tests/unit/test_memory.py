@@ -0,0 +1,111 @@
+"""
+Unit tests for per-stage memory accounting and the admin memory endpoints
+"""
+
+import tracemalloc
+
+import pytest
+from fastapi.testclient import TestClient
+
+import src.api.admin as admin
+from src.main import app
+from src.utils.memory import MemoryTracker, largest_objects, memory_tracker
+from src.utils.tracing import Tracer
+
+client = TestClient(app)
+
+TOKEN = {"X-Admin-Token": "s3cret"}
+
+
+@pytest.fixture
+def tracking():
+    was_tracing = tracemalloc.is_tracing()
+    memory_tracker.start()
+    yield
+    if not was_tracing:
+        memory_tracker.stop()
+
+
+def allocate(kb: int) -> bytes:
+    return bytes(kb * 1024)
+
+
+def test_spans_carry_stage_memory_reports(tracking):
+    local = Tracer()
+    kept = []
+    with local.span("grammar", "job-m1"):
+        kept.append(allocate(512))
+        transient = allocate(2048)
+        del transient
+
+    report = local.spans("job-m1")[0]["attrs"]["memory"]
+    assert 500 <= report["net_kb"] < 1500
+    assert report["peak_kb"] >= 2048
+    assert any("test_memory.py" in site["site"] for site in report["top"])
+
+
+def test_nested_stage_peak_counts_for_the_parent(tracking):
+    local = Tracer()
+    with local.span("report", "job-m2"):
+        with local.span("pdf"):
+            transient = allocate(4096)
+            del transient
+
+    spans = {s["name"]: s for s in local.spans("job-m2")}
+    assert spans["pdf"]["attrs"]["memory"]["peak_kb"] >= 4096
+    assert spans["report"]["attrs"]["memory"]["peak_kb"] >= 4096
+
+
+def test_budget_overrun_raises_alert(tracking):
+    tracker = MemoryTracker(top_sites=0, default_budget_mb=100, budgets={"pdf": 1})
+    started = tracker.begin()
+    transient = allocate(2048)
+    del transient
+    report = tracker.end(started, "pdf", "job-m3")
+
+    assert "top" not in report
+    alert = tracker.alerts()[0]
+    assert alert["stage"] == "pdf"
+    assert alert["job_id"] == "job-m3"
+    assert alert["peak_mb"] >= 2
+
+
+def test_tracking_off_costs_nothing():
+    if tracemalloc.is_tracing():
+        pytest.skip("tracemalloc enabled for the whole run")
+    tracker = MemoryTracker()
+    assert tracker.begin() is None
+    assert tracker.end(None, "skills", "job-m4") is None
+
+
+def test_largest_objects_lists_big_containers():
+    big = list(range(200_000))
+    dump = largest_objects(limit=5)
+    assert any(o["summary"] == "list of 200000 items" for o in dump["objects"])
+    assert dump["types"][0]["size_kb"] > 0
+    del big
+
+
+def test_admin_memory_endpoints(monkeypatch):
+    monkeypatch.setattr(admin, "ADMIN_TOKEN", "s3cret")
+    was_tracing = tracemalloc.is_tracing()
+    try:
+        enabled = client.post(
+            "/api/v1/admin/memory/tracking", params={"enabled": True}, headers=TOKEN
+        )
+        assert enabled.json() == {"tracking": True}
+
+        status = client.get("/api/v1/admin/memory", headers=TOKEN).json()
+        assert status["tracking"] is True
+        assert "traced_mb" in status
+
+        top = client.get(
+            "/api/v1/admin/memory/top", params={"limit": 3}, headers=TOKEN
+        ).json()
+        assert len(top["objects"]) == 3
+        assert top["sites"]
+    finally:
+        if not was_tracing:
+            memory_tracker.stop()
+
+    assert client.get("/api/v1/admin/memory").status_code == 401
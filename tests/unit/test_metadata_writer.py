@@ -0,0 +1,212 @@
+"""
+Unit tests for the batched metadata writer (NFR-008)
+"""
+
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import create_engine, text
+
+from src.database import metadata_model
+from src.database.metadata_writer import MetadataWriter
+
+
+def row(i: int = 0) -> dict:
+    return {
+        "file_type": "pdf",
+        "processing_time_ms": 100 + i,
+        "missing_sections": "[]",
+        "file_size_bytes": 2048,
+    }
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'metadata.db'}")
+    yield engine
+    engine.dispose()
+
+
+def count_rows(engine) -> int:
+    with engine.connect() as conn:
+        return conn.execute(text("SELECT COUNT(*) FROM resume_metadata")).scalar()
+
+
+def test_full_batch_is_written_in_one_insert(engine):
+    writer = MetadataWriter(engine, batch_size=5, flush_interval=60)
+    try:
+        for i in range(10):
+            assert writer.submit(row(i))
+        deadline = time.monotonic() + 5
+        while writer.written < 10 and time.monotonic() < deadline:
+            time.sleep(0.01)
+    finally:
+        writer.stop()
+
+    assert count_rows(engine) == 10
+    assert writer.batches == 2
+
+
+def test_partial_batch_is_written_after_interval(engine):
+    writer = MetadataWriter(engine, batch_size=100, flush_interval=0.05)
+    try:
+        writer.submit(row())
+        deadline = time.monotonic() + 5
+        while writer.written < 1 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert count_rows(engine) == 1
+    finally:
+        writer.stop()
+
+
+def test_stop_writes_queued_rows(engine):
+    writer = MetadataWriter(engine, batch_size=100, flush_interval=60)
+    for i in range(3):
+        writer.submit(row(i))
+    writer.stop()
+
+    assert count_rows(engine) == 3
+    assert not writer.running
+
+
+def test_flush_waits_for_queued_rows(engine):
+    writer = MetadataWriter(engine, batch_size=100, flush_interval=60)
+    try:
+        writer.submit(row())
+        assert writer.flush(timeout=5)
+        assert count_rows(engine) == 1
+    finally:
+        writer.stop()
+
+
+class SlowEngine:
+    """Wraps an engine so every transaction waits for `release`."""
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.release = threading.Event()
+
+    def __getattr__(self, name):
+        return getattr(self.engine, name)
+
+    def begin(self):
+        self.release.wait(5)
+        return self.engine.begin()
+
+
+def test_full_queue_blocks_then_drops(engine):
+    slow = SlowEngine(engine)
+    writer = MetadataWriter(
+        slow, batch_size=1, flush_interval=60, max_queue=2, put_timeout=0.05
+    )
+    try:
+        writer.submit(row(0))  # taken by the writer, stuck on the database
+        time.sleep(0.05)
+        assert writer.submit(row(1))
+        assert writer.submit(row(2))
+
+        started = time.monotonic()
+        assert not writer.submit(row(3))
+        assert time.monotonic() - started >= 0.05
+        assert writer.stats()["dropped"] == 1
+    finally:
+        slow.release.set()
+        writer.stop()
+    assert count_rows(engine) == 3
+
+
+class FailingEngine:
+    def __init__(self, engine):
+        self.engine = engine
+        self.attempts = 0
+
+    def __getattr__(self, name):
+        return getattr(self.engine, name)
+
+    def begin(self):
+        self.attempts += 1
+        raise RuntimeError("database unavailable")
+
+
+def test_failed_batch_is_retried_then_counted(engine):
+    failing = FailingEngine(engine)
+    writer = MetadataWriter(failing, max_retries=3, retry_backoff=0.001)
+    writer.submit(row())
+    writer.stop()
+
+    assert failing.attempts == 3
+    assert writer.failed == 1
+    assert writer.last_error == "database unavailable"
+
+
+class NonSqliteEngine:
+    """A file-backed engine that does not identify as SQLite."""
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.dialect = SimpleNamespace(name="postgresql")
+
+    def __getattr__(self, name):
+        return getattr(self.engine, name)
+
+
+def test_tables_are_created_on_any_dialect(engine):
+    writer = MetadataWriter(NonSqliteEngine(engine), batch_size=2).start()
+    try:
+        assert writer.submit(row(0))
+        assert writer.submit(row(1))
+        assert writer.flush(timeout=5)
+    finally:
+        writer.stop()
+
+    assert writer.failed == 0
+    assert count_rows(engine) == 2
+    with engine.connect() as conn:
+        rollups = conn.execute(
+            text("SELECT COUNT(*) FROM resume_metadata_rollup")
+        ).scalar()
+    assert rollups > 0
+
+
+def test_disabled_writer_discards_rows_without_touching_the_database():
+    failing = FailingEngine(None)
+    writer = MetadataWriter(failing, enabled=False)
+
+    assert not writer.submit(row())
+    assert not writer.running
+    assert failing.attempts == 0
+    assert writer.stats()["enabled"] is False
+
+
+def test_log_metadata_queues_serialized_row(monkeypatch):
+    queued = []
+
+    class RecordingWriter:
+        def submit(self, row):
+            queued.append(row)
+            return True
+
+    monkeypatch.setattr(
+        "src.database.metadata_writer.get_metadata_writer", lambda: RecordingWriter()
+    )
+
+    assert metadata_model.log_metadata(
+        {
+            "file_type": "docx",
+            "processing_time_ms": 250,
+            "missing_sections": ["projects"],
+            "file_size_bytes": 4096,
+        }
+    )
+    assert queued[0]["missing_sections"] == '["projects"]'
+    assert queued[0]["log_timestamp"] is not None
+
+
+def test_log_metadata_rejects_incomplete_payload(monkeypatch):
+    monkeypatch.setattr(
+        "src.database.metadata_writer.get_metadata_writer",
+        lambda: pytest.fail("invalid payload must not be queued"),
+    )
+    assert not metadata_model.log_metadata({"file_type": "pdf"})
@@ -0,0 +1,113 @@
+"""
+Unit tests for the metrics registry, the @timeit decorators and /metrics
+"""
+
+import asyncio
+import threading
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.main import app
+from src.utils import perf, timeit
+from src.utils.metrics import OPERATION_ERRORS, OPERATION_SECONDS, MetricsRegistry
+
+client = TestClient(app)
+
+
+def test_counter_sums_updates_from_all_threads():
+    registry = MetricsRegistry(prefix="test_")
+    counter = registry.counter("events_total", "Events", ["kind"])
+
+    def work():
+        for _ in range(1000):
+            counter.labels(kind="a").inc()
+
+    threads = [threading.Thread(target=work) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert counter.labels("a").value() == 4000
+    assert registry.counter("events_total", "Events", ["kind"]) is counter
+    with pytest.raises(ValueError):
+        counter.labels("a").inc(-1)
+
+
+def test_histogram_percentiles_and_exposition():
+    registry = MetricsRegistry(prefix="test_")
+    histogram = registry.histogram("latency_seconds", "Latency", buckets=(0.1, 1.0))
+    for value in (0.05, 0.05, 0.5, 5.0):
+        histogram.observe(value)
+
+    assert histogram.percentile(0.5) == pytest.approx(0.1)
+    assert histogram.percentile(0.75) == pytest.approx(1.0)
+
+    text = registry.exposition()
+    assert "# TYPE test_latency_seconds histogram" in text
+    assert 'test_latency_seconds_bucket{le="0.1"} 2' in text
+    assert 'test_latency_seconds_bucket{le="1"} 3' in text
+    assert 'test_latency_seconds_bucket{le="+Inf"} 4' in text
+    assert "test_latency_seconds_count 4" in text
+    assert "test_latency_seconds_sum 5.6" in text
+
+
+def test_gauge_function_is_read_at_collection():
+    registry = MetricsRegistry(prefix="test_")
+    depth = [3]
+    registry.gauge("queue_depth", "Depth").set_function(lambda: depth[0])
+    depth[0] = 7
+    assert "test_queue_depth 7" in registry.exposition()
+
+    registry.gauge("broken", "Broken").set_function(lambda: 1 / 0)
+    assert "test_broken NaN" in registry.exposition()
+    assert registry.snapshot()["test_broken"]["series"] == {"": None}
+
+
+def test_both_timeit_decorators_feed_the_registry():
+    @perf.timeit("test_perf_sync")
+    def sync_op():
+        return 1
+
+    @perf.timeit("test_perf_async")
+    async def async_op():
+        return 2
+
+    @timeit.timeit("test_timeit_failing")
+    def failing():
+        raise RuntimeError("boom")
+
+    assert sync_op() == 1
+    assert asyncio.run(async_op()) == 2
+    with pytest.raises(RuntimeError):
+        failing()
+
+    def counts(op):
+        return sum(OPERATION_SECONDS.labels(op).totals()[0])
+
+    assert counts("test_perf_sync") == 1
+    assert counts("test_perf_async") == 1
+    assert counts("test_timeit_failing") == 1
+    assert OPERATION_ERRORS.labels("test_timeit_failing").value() == 1
+
+
+def test_metrics_endpoint():
+    @perf.timeit("test_endpoint_op")
+    def op():
+        return None
+
+    op()
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert (
+        'resume_analyzer_operation_duration_seconds_count{operation="test_endpoint_op"} 1'
+        in response.text
+    )
+    assert "resume_analyzer_db_pool_connections" in response.text
+
+    data = client.get("/metrics", params={"format": "json"}).json()
+    series = data["resume_analyzer_operation_duration_seconds"]["series"]
+    assert series["test_endpoint_op"]["count"] == 1
+    assert series["test_endpoint_op"]["p95"] is not None
@@ -0,0 +1,102 @@
+"""
+Unit tests for the sampling profiler and the admin profile endpoints
+"""
+
+import threading
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+import src.api.admin as admin
+from src.main import app
+from src.utils.profiler import ProfilerBusyError, begin_profile, end_profile
+
+client = TestClient(app)
+
+TOKEN = {"X-Admin-Token": "s3cret"}
+
+
+@pytest.fixture
+def admin_token(monkeypatch):
+    monkeypatch.setattr(admin, "ADMIN_TOKEN", "s3cret")
+
+
+def busy_loop(stop: threading.Event) -> None:
+    while not stop.is_set():
+        sum(range(1000))
+
+
+def test_sampler_sees_other_threads():
+    stop = threading.Event()
+    worker = threading.Thread(target=busy_loop, args=(stop,), name="busy")
+    worker.start()
+    sampler = begin_profile(interval=0.002)
+    try:
+        time.sleep(0.1)
+    finally:
+        end_profile(sampler)
+        stop.set()
+        worker.join()
+
+    assert sampler.samples > 0
+    collapsed = sampler.collapsed()
+    assert "thread:busy;" in collapsed
+    assert "busy_loop (test_profiler.py:" in collapsed
+
+    profile = sampler.speedscope("test")
+    frames = profile["shared"]["frames"]
+    sampled = profile["profiles"][0]
+    assert sampled["type"] == "sampled"
+    assert len(sampled["samples"]) == len(sampled["weights"])
+    assert any(f["name"] == "busy_loop" for f in frames)
+
+
+def test_only_one_profile_at_a_time():
+    sampler = begin_profile()
+    try:
+        with pytest.raises(ProfilerBusyError):
+            begin_profile()
+    finally:
+        end_profile(sampler)
+    end_profile(begin_profile())
+
+
+def test_admin_api_requires_token(monkeypatch):
+    monkeypatch.setattr(admin, "ADMIN_TOKEN", "")
+    assert client.get("/api/v1/admin/profile").status_code == 403
+
+    monkeypatch.setattr(admin, "ADMIN_TOKEN", "s3cret")
+    response = client.get("/api/v1/admin/profile", headers={"X-Admin-Token": "nope"})
+    assert response.status_code == 401
+
+
+def test_profile_endpoint_returns_collapsed_stacks(admin_token):
+    response = client.get(
+        "/api/v1/admin/profile", params={"seconds": 0.1}, headers=TOKEN
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert response.text.strip()
+    assert all(line.rsplit(" ", 1)[1].isdigit() for line in response.text.splitlines())
+
+
+def test_request_with_profile_header_is_profiled(admin_token):
+    response = client.get("/api/v1/health", headers={**TOKEN, "X-Profile": "1"})
+    assert response.status_code == 200
+    profile_id = response.headers["X-Profile-Id"]
+
+    listed = client.get("/api/v1/admin/profiles", headers=TOKEN).json()["profiles"]
+    assert listed[0]["id"] == profile_id
+    assert listed[0]["name"] == "GET /api/v1/health"
+
+    profile = client.get(f"/api/v1/admin/profiles/{profile_id}", headers=TOKEN)
+    assert profile.status_code == 200
+    assert profile.json()["profiles"][0]["type"] == "sampled"
+
+
+def test_profile_header_without_token_is_ignored(admin_token):
+    response = client.get("/api/v1/health", headers={"X-Profile": "1"})
+    assert response.status_code == 200
+    assert "X-Profile-Id" not in response.headers
@@ -0,0 +1,119 @@
+"""
+Unit tests for pipeline tracing spans
+"""
+
+import asyncio
+import json
+import uuid
+
+import pytest
+from fastapi.testclient import TestClient
+
+import src.parser.analyzer as analyzer
+from src.main import app
+from src.utils.tracing import Tracer, tracer
+
+client = TestClient(app)
+
+
+def test_nested_spans_inherit_the_job_and_record_errors(tmp_path):
+    local = Tracer(trace_dir=tmp_path)
+
+    with local.span("report", "job-1", chars=120):
+        with local.span("extract_text") as current:
+            current.set(characters=100)
+        with pytest.raises(ValueError):
+            with local.span("grammar"):
+                raise ValueError("LanguageTool down")
+    with local.span("no_job"):
+        pass
+
+    spans = {s["name"]: s for s in local.spans("job-1")}
+    assert set(spans) == {"report", "extract_text", "grammar"}
+    assert spans["extract_text"]["parent"] == "report"
+    assert spans["extract_text"]["attrs"] == {"characters": 100}
+    assert spans["grammar"]["status"] == "error"
+    assert spans["grammar"]["error"] == "LanguageTool down"
+    assert spans["report"]["attrs"] == {"chars": 120}
+
+
+def test_worker_threads_keep_the_job():
+    local = Tracer()
+
+    def work():
+        with local.span("feedback"):
+            pass
+
+    async def scenario():
+        with local.span("finalize", "job-2"):
+            await asyncio.to_thread(work)
+
+    asyncio.run(scenario())
+    assert [s["name"] for s in local.spans("job-2")] == ["finalize", "feedback"]
+
+
+def test_sampled_jobs_are_exported_as_chrome_trace(tmp_path):
+    local = Tracer(sample_rate=1.0, trace_dir=tmp_path)
+    with local.span("skills", "job-3", characters=10):
+        pass
+
+    path = local.export_job("job-3")
+
+    trace = json.loads(path.read_text())
+    event = trace["traceEvents"][0]
+    assert event["ph"] == "X"
+    assert event["name"] == "skills"
+    assert event["args"]["job_id"] == "job-3"
+    assert event["args"]["characters"] == 10
+    assert event["dur"] >= 0
+
+
+def test_unsampled_jobs_are_not_written(tmp_path):
+    local = Tracer(sample_rate=0.0, trace_dir=tmp_path)
+    with local.span("skills", "job-4"):
+        pass
+
+    assert local.export_job("job-4") is None
+    assert local.export_job("job-4", force=True).exists()
+    assert Tracer(sample_rate=0.5).is_sampled("x") == Tracer(
+        sample_rate=0.5
+    ).is_sampled("x")
+
+
+def test_run_analysis_records_stage_spans(monkeypatch, tmp_path):
+    resume = tmp_path / "resume.txt"
+    resume.write_text("Experience\nEngineer at Acme")
+
+    class Detector:
+        def validate_resume_structure(self, text, spans=None):
+            return {"missing_sections": ["skills"]}
+
+    monkeypatch.setattr(analyzer, "get_text_from_parser", lambda p: p.read_text())
+    monkeypatch.setattr(analyzer, "extract_skills", lambda text: {"hard_skills": []})
+    monkeypatch.setattr(analyzer, "SectionDetector", Detector)
+    monkeypatch.setattr(analyzer, "validate_content", lambda text, spans=None: {})
+    job_id = str(uuid.uuid4())
+
+    try:
+        asyncio.run(analyzer.run_analysis(str(resume), job_id))
+    finally:
+        analyzer.analysis_results.pop(job_id, None)
+
+    spans = {s["name"]: s for s in tracer.spans(job_id)}
+    assert {
+        "run_analysis",
+        "extract_text",
+        "skills",
+        "entity_scan",
+        "section_detection",
+        "content_validation",
+    } <= set(spans)
+    assert spans["extract_text"]["attrs"]["file_bytes"] == resume.stat().st_size
+
+    response = client.get(f"/api/v1/jobs/{job_id}/trace")
+    assert response.status_code == 200
+    assert response.json()["spans"][0]["name"] == "run_analysis"
+
+
+def test_trace_endpoint_unknown_job():
+    assert client.get("/api/v1/jobs/never-traced/trace").status_code == 404